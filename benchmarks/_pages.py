@@ -0,0 +1,130 @@
+"""Synthetic HTML pages for the CPU benchmarks.
+
+``build_page(target_kb)`` returns a deterministic, content-heavy page in the
+shape of a real marketing/blog page: meta tags, JSON-LD ``@graph``, nav,
+sections with headings, paragraphs, lists, tables, quotes, images, FAQ
+``<details>`` and a link-heavy footer. Repeats sections until the target
+size is reached.
+"""
+
+from __future__ import annotations
+
+import json
+
+_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Acme Analytics - Data Platform for Growing Teams</title>
+<meta name="description" content="Acme Analytics helps teams collect, model and explain product data with a privacy-first pipeline.">
+<meta name="author" content="Jane Doe">
+<meta name="robots" content="index, follow">
+<meta property="og:title" content="Acme Analytics">
+<meta property="og:description" content="Privacy-first product analytics.">
+<meta property="og:url" content="https://example.com/">
+<meta property="og:image" content="https://example.com/og.png">
+<meta property="article:published_time" content="2026-01-10T08:00:00Z">
+<meta property="article:modified_time" content="2026-09-01T08:00:00Z">
+<meta name="twitter:card" content="summary_large_image">
+<link rel="canonical" href="https://example.com/">
+<link rel="alternate" hreflang="it" href="https://example.com/it/">
+<script type="application/ld+json">{jsonld}</script>
+<style>body {{ font-family: sans-serif; }} .hero {{ padding: 2rem; }}</style>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){{dataLayer.push(arguments);}}</script>
+</head>
+<body>
+<header><nav aria-label="Main"><ul>
+<li><a href="/">Home</a></li><li><a href="/pricing">Pricing</a></li>
+<li><a href="/about">About us</a></li><li><a href="/blog">Blog</a></li>
+<li><a href="/contact">Contact</a></li></ul></nav></header>
+<main>
+<h1>Acme Analytics is a privacy-first product analytics platform</h1>
+<p>Acme Analytics is a data platform that helps product teams understand how customers use their software,
+without third-party cookies. Founded in 2019, it serves 4,200 companies in 38 countries.</p>
+"""
+
+_SECTION = """<section id="s{i}">
+<h2>What is event modelling in section {i}?</h2>
+<p>Event modelling is the practice of describing user actions as structured records. According to
+<a href="https://www.nature.com/articles/s{i}">a 2024 study</a>, teams that model events up front cut
+reporting errors by 37% and ship dashboards 2.1x faster than teams that instrument ad hoc.</p>
+<p>Our research across 1,250 customers shows a median time-to-insight of 4.5 days, compared with
+12 days for the industry average reported by <cite>Gartner</cite> in 2025. However, results vary
+with data volume and team size, so we recommend starting with a pilot.</p>
+<h3>How does it compare to session replay?</h3>
+<p>Session replay records what happened on screen; event modelling records why it mattered.
+In our benchmark of 300 sites, event data required 94% less storage.</p>
+<ul><li>Structured events with typed properties</li><li>Schema validation at ingest</li>
+<li>Warehouse-native export to BigQuery and Snowflake</li><li>GDPR-compliant retention controls</li></ul>
+<table><thead><tr><th>Plan</th><th>Events/month</th><th>Price</th></tr></thead>
+<tbody><tr><td>Starter</td><td>1M</td><td>$49</td></tr><tr><td>Growth</td><td>10M</td><td>$299</td></tr>
+<tr><td>Scale</td><td>100M</td><td>$1,499</td></tr></tbody></table>
+<blockquote><p>"Acme cut our reporting backlog in half within a quarter." — Maria Rossi, Head of Data</p></blockquote>
+<figure><img src="/img/chart-{i}.png" alt="Bar chart of time-to-insight by team size, section {i}" width="640" height="360">
+<figcaption>Figure {i}: median time-to-insight by team size.</figcaption></figure>
+<details><summary>Does Acme work with single-page apps?</summary>
+<p>Yes. The SDK hooks into the history API and records virtual page views automatically.</p></details>
+<p>For the full methodology, see <a href="/research/method-{i}">our methodology notes</a> and the
+<a href="https://arxiv.org/abs/2311.{i:05d}">original paper</a>. Code samples use <code>acme.track()</code>.</p>
+</section>
+"""
+
+_FOOTER = """</main>
+<footer><div class="author-bio"><p>Written by Jane Doe, PhD, Head of Research at Acme since 2019.</p></div>
+<ul>{links}</ul>
+<p>&copy; 2026 Acme Analytics Inc. All rights reserved.</p>
+<a href="https://www.linkedin.com/company/acme">LinkedIn</a> <a href="https://github.com/acme">GitHub</a>
+<a href="https://twitter.com/acme">Twitter</a> <a href="https://www.youtube.com/@acme">YouTube</a>
+</footer>
+</body>
+</html>
+"""
+
+
+def _jsonld() -> str:
+    graph = {
+        "@context": "https://schema.org",
+        "@graph": [
+            {
+                "@type": "Organization",
+                "name": "Acme Analytics",
+                "url": "https://example.com/",
+                "logo": "https://example.com/logo.png",
+                "sameAs": ["https://www.linkedin.com/company/acme", "https://github.com/acme"],
+            },
+            {"@type": "WebSite", "name": "Acme Analytics", "url": "https://example.com/"},
+            {
+                "@type": "Article",
+                "headline": "Acme Analytics is a privacy-first product analytics platform",
+                "author": {"@type": "Person", "name": "Jane Doe"},
+                "datePublished": "2026-01-10",
+                "dateModified": "2026-09-01",
+            },
+            {
+                "@type": "FAQPage",
+                "mainEntity": [
+                    {
+                        "@type": "Question",
+                        "name": "Does Acme work with single-page apps?",
+                        "acceptedAnswer": {"@type": "Answer", "text": "Yes."},
+                    }
+                ],
+            },
+        ],
+    }
+    return json.dumps(graph)
+
+
+def build_page(target_kb: int = 300) -> str:
+    """Return a synthetic HTML page of roughly ``target_kb`` kilobytes."""
+    head = _HEAD.format(jsonld=_jsonld())
+    footer = _FOOTER.format(links="".join(f'<li><a href="/docs/page-{n}">Docs page {n}</a></li>' for n in range(40)))
+    sections = []
+    size = len(head) + len(footer)
+    i = 0
+    while size < target_kb * 1024:
+        section = _SECTION.format(i=i)
+        sections.append(section)
+        size += len(section)
+        i += 1
+    return head + "".join(sections) + footer
@@ -0,0 +1,89 @@
+"""Local keep-alive HTTP stub used by the benchmarks.
+
+Counts accepted TCP connections, so a benchmark can report how many
+handshakes an audit actually paid for. Loopback is normally rejected by the
+anti-SSRF validator: ``allow_loopback()`` lifts the block for the duration of
+a benchmark only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+_HOMEPAGE = (
+    "<html lang='en'><head><title>Stub site</title>"
+    "<meta name='description' content='Local stub used by benchmarks'></head>"
+    "<body><h1>Stub</h1><p>" + "Benchmark content sentence. " * 200 + "</p></body></html>"
+)
+
+_ROUTES = {
+    "/": ("text/html; charset=utf-8", _HOMEPAGE),
+    "/robots.txt": ("text/plain", "User-agent: *\nAllow: /\n"),
+    "/llms.txt": ("text/plain", "# Stub\n\n> Stub site\n\n## Docs\n- [Home](/): home\n"),
+}
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 server recording connection and request counts."""
+
+    daemon_threads = True
+
+    def __init__(self, routes: dict[str, tuple[str, str]] | None = None):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.routes = routes if routes is not None else dict(_ROUTES)
+        self.connections = 0
+        self.requests = 0
+        self._counter_lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset_counters(self) -> None:
+        with self._counter_lock:
+            self.connections = 0
+            self.requests = 0
+
+    def __enter__(self) -> StubServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server._counter_lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:  # noqa: N802
+        with self.server._counter_lock:
+            self.server.requests += 1
+        content_type, body = self.server.routes.get(self.path.split("?")[0], ("text/plain", "Not found"))
+        status = 200 if self.path.split("?")[0] in self.server.routes else 404
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def allow_loopback():
+    """Let the anti-SSRF validator accept 127.0.0.1 (benchmarks only)."""
+    with patch("geo_optimizer.utils.validators._check_ip_blocked", return_value=(False, None)):
+        yield
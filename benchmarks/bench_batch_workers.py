@@ -0,0 +1,100 @@
+"""Benchmark: sitemap batch throughput with the CPU stage in-process vs in a process pool.
+
+Audits ``--pages`` synthetic pages through ``run_batch_audit_async``. The
+network is simulated: every page fetch sleeps ``--latency-ms`` on the event
+loop and then returns the page, so only the CPU side differs between modes:
+
+- ``workers=0``: parse + analysis run on the event-loop thread, one page at
+  a time, while the other fetches wait (the in-process batch path).
+- ``workers=N``: fetches stay on the event loop, parse + analysis run in a
+  ``ProcessPoolExecutor`` of N processes.
+
+Throughput can only scale up to the number of cores the machine has.
+
+Usage:
+    python benchmarks/bench_batch_workers.py [--pages 24] [--size-kb 150] [--workers 1 2 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from _pages import build_page  # noqa: E402
+
+from geo_optimizer.core import batch_audit  # noqa: E402
+from geo_optimizer.core.audit import _SIDECAR_PATHS, AuditInputs, analyze_audit_inputs  # noqa: E402
+from geo_optimizer.models.results import CachedResponse, CdnAiCrawlerResult, SitemapUrl  # noqa: E402
+
+
+def _make_fetch(html: str, latency: float):
+    response = CachedResponse(status_code=200, text=html, content=b"", headers={"Content-Type": "text/html"})
+
+    async def fetch_inputs(url: str, *, use_cache: bool) -> AuditInputs:
+        await asyncio.sleep(latency)
+        return AuditInputs(
+            base_url=url, response=response, sidecars=dict.fromkeys(_SIDECAR_PATHS), cdn_result=CdnAiCrawlerResult()
+        )
+
+    return fetch_inputs
+
+
+def _run(urls: list[str], html: str, latency: float, workers: int, concurrency: int) -> float:
+    fetch_inputs = _make_fetch(html, latency)
+
+    async def in_process_audit(url: str, **kwargs):
+        # Same work as run_full_audit_async: fetch, then parse + analyze on the loop thread
+        return analyze_audit_inputs(await fetch_inputs(url, use_cache=False))
+
+    sitemap = [SitemapUrl(url=url) for url in urls]
+    with (
+        patch.object(batch_audit, "fetch_sitemap", return_value=sitemap),
+        patch.object(batch_audit, "_fetch_inputs", fetch_inputs),
+        patch.object(batch_audit, "run_full_audit_async", in_process_audit),
+    ):
+        t0 = time.perf_counter()
+        result = asyncio.run(
+            batch_audit.run_batch_audit_async(
+                "https://example.com/sitemap.xml", max_urls=len(urls), concurrency=concurrency, workers=workers
+            )
+        )
+        elapsed = time.perf_counter() - t0
+    if result.successful_urls != len(urls):
+        raise SystemExit(f"workers={workers}: {result.failed_urls} pages failed")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=24, help="pages per batch (default: 24)")
+    parser.add_argument("--size-kb", type=int, default=150, help="synthetic page size (default: 150)")
+    parser.add_argument("--latency-ms", type=int, default=200, help="simulated fetch latency (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=8, help="pages fetched concurrently (default: 8)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="pool sizes to compare")
+    args = parser.parse_args()
+
+    html = build_page(args.size_kb)
+    urls = [f"https://example.com/page-{i}" for i in range(args.pages)]
+    latency = args.latency_ms / 1000
+
+    print(f"{args.pages} pages of {len(html) / 1024:.0f} KB, {args.latency_ms} ms fetch latency, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'wall s':>8} {'pages/s':>8}")
+    baseline = None
+    for workers in [0, *args.workers]:
+        elapsed = _run(urls, html, latency, workers, args.concurrency)
+        baseline = baseline or elapsed
+        speedup = f"{baseline / elapsed:.1f}x" if workers else ""
+        print(f"{workers:>8} {elapsed:>8.1f} {args.pages / elapsed:>8.1f} {speedup}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
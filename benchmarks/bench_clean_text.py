@@ -0,0 +1,134 @@
+"""Benchmark: peak RSS and wall time of an audit with copied vs viewed clean text.
+
+Runs the parse + analyze stages of the audit engine (every sub-audit, zero
+HTTP) on synthetic pages of several sizes, each audit in a fresh child process
+so its peak RSS is measured in isolation:
+
+- ``copy``: the behaviour before the clean-text view — the parse stage keeps a
+  script/style-free ``copy.deepcopy`` of the soup alive for the whole audit and
+  every text read that skips script/style/nav/... deep-copies the subtree and
+  decomposes the excluded tags.
+- ``view``: what ``run_full_audit`` does now — the ``PageIndex`` skips those
+  nodes while traversing, nothing is copied.
+
+Both modes must produce the same ``AuditResult``; the script checks it.
+
+``tests/fixtures`` holds no HTML pages, so the inputs are the deterministic
+pages of ``_pages.build_page``.
+
+Usage:
+    python benchmarks/bench_clean_text.py [--sizes-kb 50 300 1000] [--rounds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import dataclasses
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from _pages import build_page  # noqa: E402
+
+from geo_optimizer.core import audit as audit_mod  # noqa: E402
+from geo_optimizer.core.page_index import NON_CONTENT_TAGS, PageIndex  # noqa: E402
+from geo_optimizer.models.results import CdnAiCrawlerResult  # noqa: E402
+
+
+class CopyingIndex(PageIndex):
+    """PageIndex whose excluded-tag text comes from a decomposed deep copy."""
+
+    def text(self, tag=None, separator="", strip=False, exclude=()):
+        if not exclude:
+            return super().text(tag, separator, strip)
+        clean = copy.deepcopy(self.soup if tag is None else tag)
+        for hidden in clean.find_all(list(exclude)):
+            hidden.decompose()
+        return clean.get_text(separator=separator, strip=strip)
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode()
+        self.status_code = 200
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+
+def _peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux, in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _child(mode: str, size_kb: int) -> None:
+    """One audit in this process; prints wall time, peak RSS and a result digest."""
+    html = build_page(size_kb)
+    sidecars = dict.fromkeys(audit_mod._SIDECAR_PATHS)
+    t0 = time.perf_counter()
+    page = audit_mod._parse_homepage(_Response(html))
+    if mode == "copy":
+        soup_clean = copy.deepcopy(page.soup)
+        for tag in soup_clean(list(NON_CONTENT_TAGS)):
+            tag.decompose()
+        page.index = CopyingIndex(page.soup)
+    result = audit_mod._analyze("https://example.com", page, sidecars, CdnAiCrawlerResult(), {})
+    wall = time.perf_counter() - t0
+    data = dataclasses.asdict(result)
+    data.pop("timestamp", None)
+    digest = hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+    print(json.dumps({"wall": wall, "rss_mb": _peak_rss_mb(), "digest": digest}))
+
+
+def _measure(mode: str, size_kb: int) -> dict:
+    # A fixed hash seed keeps set iteration order (and so the digest) stable across children
+    env = {**os.environ, "PYTHONHASHSEED": os.environ.get("PYTHONHASHSEED", "0")}
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(size_kb)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[50, 300, 1000], help="page sizes")
+    parser.add_argument("--rounds", type=int, default=3, help="audits per mode and size; the best is kept")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "SIZE_KB"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child[0], int(args.child[1]))
+        return 0
+
+    same = True
+    print(f"best of {args.rounds}, one child process per audit")
+    print(f"{'page':>8} {'mode':<6} {'wall ms':>9} {'peak RSS MB':>12}")
+    for size_kb in args.sizes_kb:
+        digests = set()
+        for mode in ("copy", "view"):
+            runs = [_measure(mode, size_kb) for _ in range(args.rounds)]
+            digests.update(run["digest"] for run in runs)
+            wall = min(run["wall"] for run in runs)
+            rss = min(run["rss_mb"] for run in runs)
+            print(f"{size_kb:>6}KB {mode:<6} {wall * 1000:>9.0f} {rss:>12.1f}")
+        same = same and len(digests) == 1
+    print(f"identical results: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Benchmark: put/get latency of the HTTP cache backends at 10k and 100k entries.
+
+Fills a fresh cache directory with ``--entries`` responses, then times
+``--ops`` gets of random cached URLs and ``--ops`` puts of new URLs:
+
+- ``FileCache``: one JSON file per URL; every ``put`` globs, ``stat()``s and
+  sorts the whole directory to decide on eviction.
+- ``SqliteCache``: one SQLite file, indexed lookups, size kept by triggers.
+
+The ``FileCache`` directory is filled by writing its JSON files directly
+(``put`` at these sizes would take hours, which is the point), the SQLite
+cache through ``put``.
+
+Usage:
+    python benchmarks/bench_http_cache.py [--entries 10000 100000] [--ops 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from geo_optimizer.utils.cache import FileCache, SqliteCache  # noqa: E402
+
+_HEADERS = {"Content-Type": "text/html; charset=utf-8", "ETag": '"v1"'}
+
+
+def _body(i: int, size: int) -> str:
+    paragraph = f"<p>Page {i}: cached response body for the cache benchmark.</p>\n"
+    return "<html><body>\n" + paragraph * (size // len(paragraph)) + "</body></html>"
+
+
+def _fill_file_cache(cache: FileCache, entries: int, size: int) -> None:
+    cache.cache_dir.mkdir(parents=True, exist_ok=True)
+    now = time.time()
+    for i in range(entries):
+        url = f"https://example.com/page/{i}"
+        data = {"url": url, "status_code": 200, "text": _body(i, size), "headers": _HEADERS, "cached_at": now}
+        cache._path(url).write_text(json.dumps(data), encoding="utf-8")
+
+
+def _fill_sqlite_cache(cache: SqliteCache, entries: int, size: int) -> None:
+    for i in range(entries):
+        cache.put(f"https://example.com/page/{i}", 200, _body(i, size), _HEADERS)
+
+
+def _time_ops(cache, entries: int, ops: int, size: int) -> tuple[list[float], list[float]]:
+    rng = random.Random(0)
+    gets, puts = [], []
+    for n in range(ops):
+        url = f"https://example.com/page/{rng.randrange(entries)}"
+        t0 = time.perf_counter()
+        hit = cache.get(url)
+        gets.append(time.perf_counter() - t0)
+        if hit is None:
+            raise SystemExit(f"{type(cache).__name__}: miss for {url}")
+
+        t0 = time.perf_counter()
+        cache.put(f"https://example.com/new/{n}", 200, _body(n, size), _HEADERS)
+        puts.append(time.perf_counter() - t0)
+    return gets, puts
+
+
+def _ms(samples: list[float]) -> str:
+    p95 = statistics.quantiles(samples, n=20)[-1]
+    return f"{statistics.median(samples) * 1000:>8.2f} {p95 * 1000:>8.2f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[10_000, 100_000], help="cache sizes")
+    parser.add_argument("--ops", type=int, default=50, help="timed gets and puts per cache (default: 50)")
+    parser.add_argument("--body-kb", type=int, default=2, help="cached body size (default: 2)")
+    args = parser.parse_args()
+    size = args.body_kb * 1024
+
+    print(f"{args.ops} gets + {args.ops} puts, {args.body_kb} KB bodies; milliseconds")
+    print(f"{'entries':>8} {'backend':<12} {'get p50':>8} {'get p95':>8} {'put p50':>8} {'put p95':>8} {'on disk':>9}")
+    for entries in args.entries:
+        for backend in (FileCache, SqliteCache):
+            with tempfile.TemporaryDirectory() as tmp:
+                cache = backend(cache_dir=Path(tmp) / "cache")
+                fill = _fill_file_cache if backend is FileCache else _fill_sqlite_cache
+                fill(cache, entries, size)
+                gets, puts = _time_ops(cache, entries, args.ops, size)
+                disk = sum(path.stat().st_size for path in Path(tmp).rglob("*") if path.is_file())
+                print(f"{entries:>8} {backend.__name__:<12} {_ms(gets)} {_ms(puts)} {disk / 2**20:>7.0f}MB")
+                if isinstance(cache, SqliteCache):
+                    cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Benchmark: TCP handshakes per audit with and without the shared HTTP pool.
+
+Replays the eight ``fetch_url`` calls issued by ``run_full_audit`` (homepage,
+robots.txt, llms.txt, llms-full.txt, ai.txt and the three /ai/*.json files)
+against a local keep-alive stub server, first unpooled (one session per fetch,
+the behaviour before ``http_pool()``), then inside ``http_pool()``.
+
+Usage:
+    python benchmarks/bench_http_pool.py [--audits 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from _stub_server import StubServer, allow_loopback  # noqa: E402
+
+from geo_optimizer.utils.http import fetch_url, http_pool  # noqa: E402
+
+AUDIT_PATHS = [
+    "/",
+    "/robots.txt",
+    "/llms.txt",
+    "/llms-full.txt",
+    "/.well-known/ai.txt",
+    "/ai/summary.json",
+    "/ai/faq.json",
+    "/ai/service.json",
+]
+
+
+def _one_audit(base_url: str) -> None:
+    for path in AUDIT_PATHS:
+        fetch_url(urljoin(base_url, path))
+
+
+def _measure(server: StubServer, audits: int, pooled: bool) -> tuple[float, float]:
+    server.reset_counters()
+    t0 = time.perf_counter()
+    for _ in range(audits):
+        if pooled:
+            with http_pool():
+                _one_audit(server.base_url)
+        else:
+            _one_audit(server.base_url)
+    elapsed = time.perf_counter() - t0
+    return server.connections / audits, elapsed * 1000 / audits
+
+
+def _measure_batch(server: StubServer, audits: int) -> float:
+    """Connections per audit when a batch pool wraps every audit."""
+    server.reset_counters()
+    with http_pool():
+        for _ in range(audits):
+            with http_pool():
+                _one_audit(server.base_url)
+    return server.connections / audits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--audits", type=int, default=20)
+    args = parser.parse_args()
+
+    with allow_loopback(), StubServer() as server:
+        before_conns, before_ms = _measure(server, args.audits, pooled=False)
+        after_conns, after_ms = _measure(server, args.audits, pooled=True)
+        batch_conns = _measure_batch(server, args.audits)
+
+    print(f"{'mode':<22}{'handshakes/audit':>18}{'ms/audit':>12}")
+    print(f"{'unpooled (before)':<22}{before_conns:>18.2f}{before_ms:>12.1f}")
+    print(f"{'http_pool per audit':<22}{after_conns:>18.2f}{after_ms:>12.1f}")
+    print(f"{'http_pool per batch':<22}{batch_conns:>18.2f}{'':>12}")
+
+
+if __name__ == "__main__":
+    main()
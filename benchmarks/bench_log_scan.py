@@ -0,0 +1,185 @@
+"""Benchmark: lines/s of the server log analyzer with and without the bot prefilter.
+
+Writes synthetic combined-format access logs in which ``--bot-share`` of
+the requests (1% by default) come from AI crawlers, then analyzes each one
+three ways. Two traffic mixes are measured, because generic crawlers
+(bingbot, AhrefsBot, SemrushBot...) also match the prefilter's ``bot``
+anchor and are decoded and parsed like AI crawlers:
+
+- ``best case``: the rest is browsers and 1% generic crawlers;
+- ``realistic``: ``--crawler-share`` of the requests (30% by default, the
+  20-40% commonly reported for public sites) come from generic crawlers,
+  some of them fetching ``/robots.txt``.
+
+The three ways:
+
+- ``per-line``: the behaviour before the prefilter — every line is decoded,
+  matched against ``_COMBINED_RE`` and its user agent checked.
+- ``prefilter``: what ``analyze_log_file(..., workers=0)`` does now — the log
+  is memory-mapped, a bytes search for the prefilter anchors finds the
+  candidate lines and only those are decoded and parsed.
+- ``parallel``: ``analyze_log_file`` with the default worker processes
+  (one per core; the same as ``prefilter`` on a single core).
+
+All three must produce the same ``LogAnalysisResult``; the script checks it.
+
+The default logs are 256 MB so a run takes about a minute; ``--size-mb 5120``
+reproduces the 5 GB case (it needs that much free space in ``--dir``).
+
+Usage:
+    python benchmarks/bench_log_scan.py [--size-mb 256] [--bot-share 0.01] [--crawler-share 0.3] [--dir /tmp]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from geo_optimizer.core.log_analyzer import _LogAggregate, analyze_log_file  # noqa: E402
+
+_AI_AGENTS = [
+    "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; GPTBot/1.2; +https://openai.com/gptbot)",
+    "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; ClaudeBot/1.0; +claudebot@anthropic.com)",
+    "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; PerplexityBot/1.0)",
+    "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; ChatGPT-User/1.0; +https://openai.com/bot)",
+    "meta-externalagent/1.1 (+https://developers.facebook.com/docs/sharing/webmasters/crawler)",
+]
+_BROWSER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari",
+]
+_BROWSER_WEIGHTS = [60, 25, 15]
+# Search engine and SEO crawlers that are not in AI_BOTS; all but Baiduspider contain "bot"
+_CRAWLER_AGENTS = [
+    "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; bingbot/2.0; +http://www.bing.com/bingbot.htm)",
+    "Mozilla/5.0 (compatible; AhrefsBot/7.0; +http://ahrefs.com/robot/)",
+    "Mozilla/5.0 (compatible; SemrushBot/7~bl; +http://www.semrush.com/bot.html)",
+    "Mozilla/5.0 (compatible; YandexBot/3.0; +http://yandex.com/bots)",
+    "Mozilla/5.0 (compatible; DotBot/1.2; +https://opensiteexplorer.org/dotbot; help@moz.com)",
+    "Mozilla/5.0 (compatible; MJ12bot/v1.4.8; http://mj12bot.com/)",
+    "Mozilla/5.0 (compatible; Baiduspider/2.0; +http://www.baidu.com/search/spider.html)",
+]
+_CRAWLER_WEIGHTS = [30, 20, 15, 10, 10, 10, 5]
+# Share of generic crawler requests that fetch robots.txt instead of a page
+_ROBOTS_SHARE = 0.05
+
+# (name, share of generic crawlers or None for --crawler-share)
+_SCENARIOS = [("best case", 0.01), ("realistic", None)]
+
+
+def _write_log(path: Path, size: int, bot_share: float, crawler_share: float) -> int:
+    """Write about ``size`` bytes of log lines; returns the number of lines."""
+    rng = random.Random(42)
+    written = lines = 0
+    with path.open("w", encoding="utf-8") as f:
+        while written < size:
+            batch = []
+            for _ in range(10_000):
+                draw = rng.random()
+                request = f"/blog/post-{rng.randrange(20_000)}"
+                if draw < bot_share:
+                    agent = rng.choice(_AI_AGENTS)
+                elif draw < bot_share + crawler_share:
+                    agent = rng.choices(_CRAWLER_AGENTS, _CRAWLER_WEIGHTS)[0]
+                    if rng.random() < _ROBOTS_SHARE:
+                        request = "/robots.txt"
+                else:
+                    agent = rng.choices(_BROWSER_AGENTS, _BROWSER_WEIGHTS)[0]
+                batch.append(
+                    f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)} - - "
+                    f"[{rng.randrange(1, 29):02d}/Apr/2026:{rng.randrange(24):02d}:{rng.randrange(60):02d}:00 +0000] "
+                    f'"GET {request} HTTP/1.1" 200 {rng.randrange(500, 90_000)} '
+                    f'"https://example.com/" "{agent}"\n'
+                )
+            chunk = "".join(batch)
+            f.write(chunk)
+            written += len(chunk)
+            lines += len(batch)
+    return lines
+
+
+def _per_line(path: Path):
+    aggregate = _LogAggregate()
+    with path.open("rb") as f:
+        aggregate.scan(f)
+    return aggregate.to_result(str(path))
+
+
+def _summary(result):
+    return (
+        result.total_lines,
+        result.ai_requests,
+        result.date_range_start,
+        result.date_range_end,
+        [(b.bot_name, b.visits, b.unique_pages, b.first_seen, b.last_seen) for b in result.bots],
+        sorted((p.path, p.total_visits, tuple(p.bots)) for p in result.top_pages),
+    )
+
+
+def _run_scenario(path: Path, size: int, bot_share: float, crawler_share: float) -> bool:
+    """Write one log, time the three modes and return whether their results match."""
+    started = time.perf_counter()
+    lines = _write_log(path, size, bot_share, crawler_share)
+    size_mb = path.stat().st_size / 2**20
+    print(
+        f"{lines:,} lines, {size_mb:,.0f} MB, {bot_share:.1%} AI crawlers, {crawler_share:.1%} other crawlers "
+        f"({time.perf_counter() - started:.0f}s)"
+    )
+    print(f"{'mode':<10} {'seconds':>8} {'lines/s':>12} {'MB/s':>8}")
+
+    results = {}
+    modes = [
+        ("per-line", lambda: _per_line(path)),
+        ("prefilter", lambda: analyze_log_file(path, workers=0)),
+        ("parallel", lambda: analyze_log_file(path)),
+    ]
+    for name, run in modes:
+        started = time.perf_counter()
+        results[name] = run()
+        elapsed = time.perf_counter() - started
+        print(f"{name:<10} {elapsed:>8.2f} {lines / elapsed:>12,.0f} {size_mb / elapsed:>8.0f}")
+
+    reference = _summary(results["per-line"])
+    return all(_summary(result) == reference for result in results.values())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256, help="synthetic log size (default: 256)")
+    parser.add_argument("--bot-share", type=float, default=0.01, help="share of AI crawler requests (default: 0.01)")
+    parser.add_argument(
+        "--crawler-share",
+        type=float,
+        default=0.3,
+        help="share of generic crawler requests in the realistic mix (default: 0.3)",
+    )
+    parser.add_argument("--dir", default=None, help="directory for the synthetic logs (default: system temp)")
+    args = parser.parse_args()
+
+    identical = True
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        path = Path(tmp) / "access.log"
+        for name, crawler_share in _SCENARIOS:
+            print(f"\n== {name} ==")
+            share = args.crawler_share if crawler_share is None else crawler_share
+            identical &= _run_scenario(path, args.size_mb * 1024 * 1024, args.bot_share, share)
+            path.unlink()
+
+    print(f"\nworkers available: {os.cpu_count()}")
+    if not identical:
+        print("MISMATCH: the modes produced different results")
+        return 1
+    print("identical results: yes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
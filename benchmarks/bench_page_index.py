@@ -0,0 +1,127 @@
+"""Benchmark: CPU per audit with and without the shared single-pass PageIndex.
+
+Runs the analyze stage of the audit engine (every sub-audit, zero HTTP) on a
+synthetic ~300 KB page twice:
+
+- ``walking``: every ``find_all``/``get_text`` the sub-audits issue walks the
+  tree again, nothing is memoized and text that skips script/style/nav/...
+  comes from a decomposed deep copy — the behaviour before ``PageIndex``.
+- ``indexed``: one ``PageIndex`` built in a single traversal and shared by all
+  sub-audits (what ``run_full_audit`` does).
+
+Both modes must produce the same ``AuditResult``; the script checks it.
+
+Usage:
+    python benchmarks/bench_page_index.py [--size-kb 300] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import dataclasses
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from _pages import build_page  # noqa: E402
+
+from geo_optimizer.core import audit as audit_mod  # noqa: E402
+from geo_optimizer.core.page_index import PageIndex  # noqa: E402
+from geo_optimizer.models.results import CdnAiCrawlerResult  # noqa: E402
+
+
+class WalkingIndex(PageIndex):
+    """PageIndex interface answered by fresh BeautifulSoup walks, nothing cached."""
+
+    def __init__(self, soup):  # no single pass: every query walks the tree
+        self.soup = soup
+
+    def find_all(self, name=None, attrs=None, within=None, limit=None, **kwargs):
+        return list((within or self.soup).find_all(name, attrs or {}, limit=limit, **kwargs))
+
+    def contains(self, ancestor, tag):
+        return ancestor is None or any(parent is ancestor for parent in tag.parents)
+
+    def text(self, tag=None, separator="", strip=False, exclude=()):
+        tag = self.soup if tag is None else tag
+        if exclude:
+            tag = copy.deepcopy(tag)
+            for hidden in tag.find_all(list(exclude)):
+                hidden.decompose()
+        return tag.get_text(separator=separator, strip=strip)
+
+    def sections(self, within=None):
+        self._sections = {}
+        return super().sections(within)
+
+    @property
+    def clean_text(self):
+        return self.text(separator=" ", strip=True, exclude=("script", "style", "nav", "footer", "header"))
+
+    @property
+    def jsonld(self):
+        self._jsonld = None
+        return super().jsonld
+
+    @property
+    def html(self):
+        return str(self.soup)
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode()
+        self.status_code = 200
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+
+def _run(html: str, walking: bool):
+    """One audit analyze stage; returns (cpu_seconds, result)."""
+    sidecars = dict.fromkeys(audit_mod._SIDECAR_PATHS)
+    page = audit_mod._parse_homepage(_Response(html))
+    t0 = time.process_time()
+    page.index = WalkingIndex(page.soup) if walking else PageIndex(page.soup)
+    result = audit_mod._analyze("https://example.com", page, sidecars, CdnAiCrawlerResult(), {})
+    return time.process_time() - t0, result
+
+
+def _comparable(result) -> dict:
+    data = dataclasses.asdict(result)
+    data.pop("timestamp", None)
+    return data
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-kb", type=int, default=300, help="synthetic page size (default: 300)")
+    parser.add_argument("--rounds", type=int, default=5, help="audits per mode; the best is kept (default: 5)")
+    args = parser.parse_args()
+
+    html = build_page(args.size_kb)
+    _run(html, walking=False)  # warm-up: imports, regex compilation
+
+    timings = {}
+    results = {}
+    for mode in ("walking", "indexed"):
+        best = None
+        for _ in range(args.rounds):
+            cpu, results[mode] = _run(html, walking=mode == "walking")
+            best = cpu if best is None else min(best, cpu)
+        timings[mode] = best
+
+    same = _comparable(results["walking"]) == _comparable(results["indexed"])
+    print(f"page: {len(html) / 1024:.0f} KB, best of {args.rounds}")
+    print(f"{'mode':<10} {'CPU ms/audit':>13}")
+    for mode, cpu in timings.items():
+        print(f"{mode:<10} {cpu * 1000:>13.0f}")
+    print(f"speedup: {timings['walking'] / timings['indexed']:.1f}x   identical results: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
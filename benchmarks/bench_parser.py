@@ -0,0 +1,74 @@
+"""Benchmark: parse time per page with the html.parser and lxml backends.
+
+Parses synthetic pages of several sizes with each BeautifulSoup tree builder
+that ``utils.html_parser`` accepts, then runs the analyze stage on both trees
+and checks the ``AuditResult`` is identical.
+
+Usage:
+    python benchmarks/bench_parser.py [--sizes-kb 50 300 1000] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from _pages import build_page  # noqa: E402
+
+from geo_optimizer.core import audit as audit_mod  # noqa: E402
+from geo_optimizer.models.results import CdnAiCrawlerResult  # noqa: E402
+from geo_optimizer.utils.html_parser import HTML_PARSERS, parse_html  # noqa: E402
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode()
+        self.status_code = 200
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+
+def _comparable(html: str, parser: str) -> dict:
+    page = audit_mod._parse_homepage(_Response(html), parser)
+    result = audit_mod._analyze(
+        "https://example.com", page, dict.fromkeys(audit_mod._SIDECAR_PATHS), CdnAiCrawlerResult(), {}
+    )
+    data = dataclasses.asdict(result)
+    data.pop("timestamp", None)
+    return data
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[50, 300, 1000], help="page sizes")
+    parser.add_argument("--rounds", type=int, default=5, help="parses per backend and size; the best is kept")
+    args = parser.parse_args()
+
+    same = True
+    print(f"best of {args.rounds}")
+    print(f"{'page':>8} " + " ".join(f"{name:>12}" for name in HTML_PARSERS) + f" {'speedup':>8}")
+    for size_kb in args.sizes_kb:
+        html = build_page(size_kb)
+        best = {}
+        for name in HTML_PARSERS:
+            times = []
+            for _ in range(args.rounds):
+                t0 = time.perf_counter()
+                parse_html(html, name)
+                times.append(time.perf_counter() - t0)
+            best[name] = min(times)
+        row = " ".join(f"{best[name] * 1000:>10.0f}ms" for name in HTML_PARSERS)
+        print(f"{size_kb:>6}KB {row} {best['html.parser'] / best['lxml']:>7.1f}x")
+        same = same and _comparable(html, "lxml") == _comparable(html, "html.parser")
+    print(f"identical results: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ Runs the full GEO audit on a website and displays results.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import sys
 from pathlib import Path
@@ -17,11 +18,14 @@ from geo_optimizer.cli.formatters import (
     format_audit_text,
     format_batch_audit_json,
     format_batch_audit_text,
+    format_batch_page_ndjson,
+    format_batch_summary_ndjson,
 )
 from geo_optimizer.core.audit import run_full_audit
-from geo_optimizer.core.batch_audit import run_batch_audit
+from geo_optimizer.core.batch_audit import BatchAuditStats, iter_batch_audit, run_batch_audit
 from geo_optimizer.core.history import HistoryStore, summarize_history
 from geo_optimizer.models.config import DEFAULT_HISTORY_RETENTION_DAYS
+from geo_optimizer.models.results import BatchAuditResult
 from geo_optimizer.utils.validators import validate_public_url
 
 
@@ -33,18 +37,35 @@ from geo_optimizer.utils.validators import validate_public_url
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["text", "json", "rich", "html", "pdf", "github", "sarif", "junit"]),
+    type=click.Choice(["text", "json", "ndjson", "rich", "html", "pdf", "github", "sarif", "junit"]),
     default=None,
-    help="Output format: text (default), json, rich, html, pdf, github, sarif, or junit",
+    help="Output format: text (default), json, ndjson (sitemap mode), rich, html, pdf, github, sarif, or junit",
 )
 @click.option("--output", "output_file", default=None, help="Output file path (optional)")
 @click.option("--verbose", is_flag=True, help="Show detailed check output")
-@click.option("--cache", is_flag=True, help="Use local HTTP cache for faster repeated audits")
-@click.option("--clear-cache", is_flag=True, help="Clear the local HTTP cache and exit")
+@click.option("--cache", is_flag=True, help="Use local HTTP and audit result caches for faster repeated audits")
+@click.option("--clear-cache", is_flag=True, help="Clear the local HTTP and audit result caches and exit")
 @click.option("--config", "config_file", default=None, help="Path to .geo-optimizer.yml config file")
 @click.option("--no-plugins", is_flag=True, help="Disable loading of third-party check plugins")
 @click.option("--max-urls", default=50, type=int, show_default=True, help="Maximum number of sitemap URLs to audit")
-@click.option("--concurrency", default=5, type=int, show_default=True, help="Concurrent page audits in sitemap mode")
+@click.option("--concurrency", default=10, type=int, show_default=True, help="Concurrent page fetches in sitemap mode")
+@click.option(
+    "--workers",
+    default=0,
+    type=click.IntRange(0),
+    show_default=True,
+    help="Processes that parse and analyze pages in sitemap mode (0 = in-process)",
+)
+@click.option(
+    "--sitemap-order",
+    is_flag=True,
+    help="Audit the first --max-urls URLs in sitemap order, starting while the sitemap is still being read",
+)
+@click.option(
+    "--changed-only",
+    is_flag=True,
+    help="Sitemap mode: re-audit only new or changed pages, reuse the stored result of the others",
+)
 @click.option("--save-history", is_flag=True, help="Save the audit result in local GEO history")
 @click.option("--regression", is_flag=True, help="Exit with code 1 if score regressed vs the previous saved snapshot")
 @click.option(
@@ -73,6 +94,9 @@ def audit(
     no_plugins,
     max_urls,
     concurrency,
+    workers,
+    sitemap_order,
+    changed_only,
     save_history,
     regression,
     retention_days,
@@ -119,14 +143,20 @@ def audit(
         raise click.UsageError("Use either '--url' or '--sitemap', not both")
     if sitemap and (save_history or regression):
         raise click.UsageError("'--save-history' and '--regression' are supported only with '--url'")
+    if changed_only and not sitemap:
+        raise click.UsageError("'--changed-only' is supported only with '--sitemap'")
 
     # Handle --clear-cache
     if clear_cache:
-        from geo_optimizer.utils.cache import FileCache
-
-        fc = FileCache()
-        count = fc.clear()
-        click.echo(f"✅ Cache cleared ({count} files removed)")
+        from geo_optimizer.utils.cache import FileCache, get_http_cache, get_result_cache
+
+        count = 0
+        for store in (get_http_cache(), get_result_cache()):
+            count += store.clear()
+            store.close()
+        # JSON files left by the file cache of older versions (removes the cache directory)
+        count += FileCache().clear()
+        click.echo(f"✅ Cache cleared ({count} entries removed)")
         return
 
     # Load plugins (if not disabled)
@@ -135,8 +165,12 @@ def audit(
 
         CheckRegistry.load_entry_points()
 
-    if sitemap and output_format not in {"text", "json"}:
-        raise click.UsageError("Batch audit via '--sitemap' supports only '--format text' or '--format json'")
+    if sitemap and output_format not in {"text", "json", "ndjson"}:
+        raise click.UsageError(
+            "Batch audit via '--sitemap' supports only '--format text', '--format json' or '--format ndjson'"
+        )
+    if output_format == "ndjson" and not sitemap:
+        raise click.UsageError("'--format ndjson' is supported only with '--sitemap'")
 
     target_url = sitemap or url
     safe, reason = validate_public_url(
@@ -152,7 +186,19 @@ def audit(
         sys.exit(1)
 
     try:
-        if sitemap:
+        if sitemap and output_format == "ndjson":
+            result = _stream_batch_audit_ndjson(
+                sitemap,
+                output_file,
+                use_cache=cache,
+                project_config=project_config,
+                max_urls=max_urls,
+                concurrency=concurrency,
+                workers=workers,
+                sitemap_order=sitemap_order,
+                changed_only=changed_only,
+            )
+        elif sitemap:
             if output_format != "json":
                 click.echo("⏳ Starting GEO batch analysis from sitemap...", err=True)
                 click.echo("⏳ Discovering URLs and aggregating category scores...", err=True)
@@ -162,6 +208,9 @@ def audit(
                 project_config=project_config,
                 max_urls=max_urls,
                 concurrency=concurrency,
+                workers=workers,
+                sitemap_order=sitemap_order,
+                changed_only=changed_only,
             )
             if output_format != "json":
                 click.echo("✅ Batch analysis complete.\n", err=True)
@@ -178,21 +227,20 @@ def audit(
                     _use_spinner = False
 
             _use_async = False
-            if not cache:
-                try:
-                    import httpx  # noqa: F401
+            try:
+                import httpx  # noqa: F401
 
-                    from geo_optimizer.core.audit import run_full_audit_async
+                from geo_optimizer.core.audit import run_full_audit_async
 
-                    _use_async = True
-                except ImportError:
-                    pass
+                _use_async = True
+            except ImportError:
+                pass
 
             if _use_spinner:
                 _stderr = _RichConsole(stderr=True)
                 with _stderr.status("[bold bright_blue]  Analyzing...[/]", spinner="dots"):
                     if _use_async:
-                        result = asyncio.run(run_full_audit_async(url, project_config=project_config))
+                        result = asyncio.run(run_full_audit_async(url, use_cache=cache, project_config=project_config))
                     else:
                         result = run_full_audit(url, use_cache=cache, project_config=project_config)
             else:
@@ -201,7 +249,7 @@ def audit(
                     click.echo("⏳ Checking robots.txt and AI bot access...", err=True)
                     click.echo("⏳ Analyzing llms.txt...", err=True)
                 if _use_async:
-                    result = asyncio.run(run_full_audit_async(url, project_config=project_config))
+                    result = asyncio.run(run_full_audit_async(url, use_cache=cache, project_config=project_config))
                 else:
                     result = run_full_audit(url, use_cache=cache, project_config=project_config)
                 if output_format != "json":
@@ -210,13 +258,16 @@ def audit(
     except SystemExit:
         raise
     except Exception as e:
-        if output_format == "json":
+        if output_format in {"json", "ndjson"}:
             import json
 
             # Fix #431: sanitize exception message (don't leak internal details)
             error_msg = type(e).__name__ if not str(e) else str(e).split("\n")[0][:200]
             error_data = {"error": error_msg, "url": target_url}
-            click.echo(json.dumps(error_data, indent=2))
+            if output_format == "ndjson":
+                click.echo(json.dumps({"type": "error", **error_data}))
+            else:
+                click.echo(json.dumps(error_data, indent=2))
         else:
             click.echo(f"\n❌ ERROR: {type(e).__name__}", err=True)
         sys.exit(1)
@@ -234,7 +285,10 @@ def audit(
         history_entry = store.save_audit_result(result, retention_days=retention_days)
         history_result = store.build_history_result(result.url, retention_days=retention_days)
 
-    if sitemap and output_format == "json":
+    if sitemap and output_format == "ndjson":
+        # Already streamed line by line, summary included
+        output = None
+    elif sitemap and output_format == "json":
         output = format_batch_audit_json(result)
     elif sitemap:
         output = format_batch_audit_text(result)
@@ -310,7 +364,9 @@ def audit(
             elif history_entry:
                 output += f"\n  Delta vs previous snapshot: {history_entry.delta:+d}"
 
-    if output_file:
+    if output is None:
+        pass
+    elif output_file:
         with open(output_file, "w", encoding="utf-8") as f:
             f.write(output)
         click.echo(f"✅ Report written to: {output_file}")
@@ -340,3 +396,35 @@ def audit(
         sys.exit(exit_code)
 
     return result_score
+
+
+def _stream_batch_audit_ndjson(sitemap: str, output_file: str | None, **options) -> BatchAuditResult:
+    """Run a batch audit writing one NDJSON line per page as it finishes, then a summary line.
+
+    Nothing is buffered: each line is flushed to stdout (or ``output_file``)
+    as soon as its page is done, so consumers can process results while the
+    batch is still running.
+    """
+    import asyncio
+
+    stats = BatchAuditStats()
+    with open(output_file, "w", encoding="utf-8") if output_file else contextlib.nullcontext() as f:
+
+        def emit(line: str) -> None:
+            if f is None:
+                click.echo(line)
+            else:
+                f.write(line + "\n")
+                f.flush()
+
+        async def _stream() -> None:
+            async for page in iter_batch_audit(sitemap, stats=stats, **options):
+                emit(format_batch_page_ndjson(page))
+
+        asyncio.run(_stream())
+        result = stats.to_result()
+        emit(format_batch_summary_ndjson(result))
+
+    if output_file:
+        click.echo(f"✅ Report written to: {output_file}")
+    return result
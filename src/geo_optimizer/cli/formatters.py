@@ -39,6 +39,7 @@ from geo_optimizer.models.results import (
     AnswerSnapshotArchive,
     AuditDiffResult,
     AuditResult,
+    BatchAuditPageResult,
     BatchAuditResult,
     CitationQualityReport,
     HistoryResult,
@@ -604,6 +605,20 @@ def format_audit_text(result: AuditResult) -> str:
 
 def format_batch_audit_json(result: BatchAuditResult) -> str:
     """Formatta BatchAuditResult come JSON."""
+    return json.dumps(_batch_audit_data(result, include_pages=True), indent=2)
+
+
+def format_batch_page_ndjson(page: BatchAuditPageResult) -> str:
+    """Formatta una pagina del batch come riga NDJSON (``"type": "page"``)."""
+    return json.dumps({"type": "page", **asdict(page)})
+
+
+def format_batch_summary_ndjson(result: BatchAuditResult) -> str:
+    """Formatta il riepilogo del batch come riga NDJSON finale (``"type": "summary"``, senza ``pages``)."""
+    return json.dumps({"type": "summary", **_batch_audit_data(result, include_pages=False)})
+
+
+def _batch_audit_data(result: BatchAuditResult, *, include_pages: bool) -> dict:
     data = {
         "mode": "batch",
         "sitemap_url": result.sitemap_url,
@@ -618,12 +633,16 @@ def format_batch_audit_json(result: BatchAuditResult) -> str:
         "average_score_breakdown": result.average_score_breakdown,
         "top_pages": [asdict(page) for page in result.top_pages],
         "worst_pages": [asdict(page) for page in result.worst_pages],
-        "pages": [asdict(page) for page in result.pages],
     }
+    if include_pages:
+        data["pages"] = [asdict(page) for page in result.pages]
     # gap #6: include truncation warning when present
     if result.truncated_warning:
         data["truncated_warning"] = result.truncated_warning
-    return json.dumps(data, indent=2)
+    # --changed-only: pages whose stored result was reused
+    if result.unchanged_urls:
+        data["unchanged_urls"] = result.unchanged_urls
+    return data
 
 
 def format_batch_audit_text(result: BatchAuditResult) -> str:
@@ -643,6 +662,8 @@ def format_batch_audit_text(result: BatchAuditResult) -> str:
         f"Success: {result.successful_urls} | "
         f"Failed: {result.failed_urls}"
     )
+    if result.unchanged_urls:
+        lines.append(f"   Unchanged since last run (stored result reused): {result.unchanged_urls}")
     # gap #6: show truncation warning in text output
     if result.truncated_warning:
         lines.append(f"   WARNING: {result.truncated_warning}")
@@ -946,6 +967,10 @@ def format_monitor_text(result: MonitorResult) -> str:
     lines.append("")
     lines.append(_section_header("1. PASSIVE SIGNALS"))
     for signal in result.signals:
+        if signal.key == "crawler_activity":
+            total, days = signal.details.get("total_hits", 0), signal.details.get("days", 0)
+            lines.append(f"  • {signal.label}: {total:,} in {days} days [{signal.status.upper()}]")
+            continue
         lines.append(f"  • {signal.label}: {signal.score}/{signal.max_score} [{signal.status.upper()}]")
 
     lines.append("")
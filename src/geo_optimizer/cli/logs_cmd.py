@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import json
 from dataclasses import asdict
+from pathlib import Path
 
 import click
 
 from geo_optimizer.core.log_analyzer import analyze_log_file
+from geo_optimizer.core.log_ingest import CrawlerLogStore, ingest_log_file
 
 
-@click.command(name="logs")
-@click.option("--file", "log_file", required=True, type=click.Path(exists=True), help="Path to server access log")
+@click.group(name="logs", invoke_without_command=True)
+@click.option("--file", "log_file", default=None, type=click.Path(exists=True), help="Path to server access log")
 @click.option(
     "--format",
     "output_format",
@@ -20,9 +22,23 @@ from geo_optimizer.core.log_analyzer import analyze_log_file
     show_default=True,
     help="Output format",
 )
-def logs(log_file: str, output_format: str) -> None:
-    """Analyze server logs for AI crawler activity."""
-    result = analyze_log_file(log_file)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Processes parsing a plain log in parallel (default: one per core for large files; 0 = in-process)",
+)
+@click.pass_context
+def logs(ctx: click.Context, log_file: str | None, output_format: str, workers: int | None) -> None:
+    """Analyze server logs for AI crawler activity (plain, .gz or .zst).
+
+    Use 'geo logs ingest' to keep a persistent, incremental store instead.
+    """
+    if ctx.invoked_subcommand:
+        return
+    if not log_file:
+        raise click.UsageError("Missing option '--file'.")
+    result = analyze_log_file(log_file, workers=workers)
 
     if output_format == "json":
         click.echo(json.dumps(asdict(result), indent=2))
@@ -30,6 +46,102 @@ def logs(log_file: str, output_format: str) -> None:
         _print_text(result)
 
 
+@logs.command(name="ingest")
+@click.option(
+    "--file",
+    "log_files",
+    required=True,
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Server access log to ingest (repeatable)",
+)
+@click.option(
+    "--site",
+    default=None,
+    help="Site the logs belong to, e.g. example.com (used by 'geo monitor --crawler-days')",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format",
+)
+@click.option("--tracking-db", default=None, hidden=True, help="Override local tracking DB path")
+def ingest(log_files: tuple[str, ...], site: str | None, output_format: str, tracking_db: str | None) -> None:
+    """Ingest only the new lines of server logs into the local AI-crawler store."""
+    store = CrawlerLogStore(Path(tracking_db) if tracking_db else None)
+    results = [ingest_log_file(log_file, store, site=site) for log_file in log_files]
+
+    if output_format == "json":
+        click.echo(json.dumps([asdict(result) for result in results], indent=2))
+        return
+    for result in results:
+        rotated = (
+            f" (rotated; drained {result.rotated_file})"
+            if result.rotated_file
+            else " (rotated)"
+            if result.rotated
+            else ""
+        )
+        click.echo(
+            f"  {result.log_file}: {result.lines_read:,} new lines, {result.ai_requests:,} AI requests"
+            f" [bytes {result.start_offset:,} → {result.end_offset:,}]{rotated}"
+        )
+
+
+@logs.command(name="hits")
+@click.option("--site", default=None, help="Site given to 'geo logs ingest --site' (default: all sites)")
+@click.option("--bot", default=None, help="AI bot name, e.g. GPTBot (default: all bots)")
+@click.option("--path", "page_path", default=None, help="Exact request path, e.g. /pricing (default: all paths)")
+@click.option("--days", default=30, show_default=True, type=click.IntRange(min=1), help="Window ending today (UTC)")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Output format",
+)
+@click.option("--tracking-db", default=None, hidden=True, help="Override local tracking DB path")
+def hits(
+    site: str | None,
+    bot: str | None,
+    page_path: str | None,
+    days: int,
+    output_format: str,
+    tracking_db: str | None,
+) -> None:
+    """Query AI crawler hits stored by 'geo logs ingest'."""
+    store = CrawlerLogStore(Path(tracking_db) if tracking_db else None)
+    if bot:
+        total = store.count_hits(site=site, bot=bot, path=page_path, days=days)
+        by_bot = {bot: total} if total else {}
+    else:
+        by_bot = store.bot_hits(site=site, path=page_path, days=days)
+
+    if output_format == "json":
+        click.echo(
+            json.dumps(
+                {
+                    "site": site,
+                    "bot": bot,
+                    "path": page_path,
+                    "days": days,
+                    "hits": sum(by_bot.values()),
+                    "bots": by_bot,
+                }
+            )
+        )
+        return
+    scope = f"{bot or 'AI crawler'} hits on {page_path or 'all paths'}{f' of {site}' if site else ''} in the last {days} days"
+    click.echo(f"  {scope}: {sum(by_bot.values()):,}")
+    if not bot:
+        for name, count in by_bot.items():
+            click.echo(f"    {name:<25} {count:>8,}")
+
+
 def _print_text(result) -> None:
     """Format log analysis as human-readable text."""
     click.echo("")
@@ -51,7 +163,9 @@ def _print_text(result) -> None:
         click.echo("\n  📄 Top crawled pages:")
         for i, page in enumerate(result.top_pages[:10], 1):
             bots_str = ", ".join(page.bots[:3])
-            click.echo(f"  {i:>3}. {page.path} ({page.total_visits} visits — {bots_str})")
+            # Past the page tracking limit the counts are upper bounds
+            visits = f"{page.total_visits} visits" if not page.visits_error else f"≤{page.total_visits} visits"
+            click.echo(f"  {i:>3}. {page.path} ({visits} — {bots_str})")
 
     if not result.bots:
         click.echo("\n  No AI crawler activity found in this log file.")
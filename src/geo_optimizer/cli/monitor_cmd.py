@@ -40,8 +40,16 @@ from geo_optimizer.utils.validators import validate_public_url
     type=int,
     help="Retention window for local snapshots",
 )
+@click.option(
+    "--crawler-days",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Include AI crawler hits from the last N days ingested with 'geo logs ingest --site' for this domain",
+)
 @click.option("--history-db", default=None, hidden=True, help="Override local tracking DB path")
-def monitor(domain, output_format, output_file, cache, config_file, save_history, retention_days, history_db):
+def monitor(
+    domain, output_format, output_file, cache, config_file, save_history, retention_days, crawler_days, history_db
+):
     """Run passive AI visibility monitoring for a domain."""
     normalized = normalize_monitor_domain(domain)
     safe, reason = validate_public_url(normalized)
@@ -60,6 +68,7 @@ def monitor(domain, output_format, output_file, cache, config_file, save_history
         save_history=save_history,
         retention_days=retention_days,
         history_db=history_path,
+        crawler_days=crawler_days,
     )
     output = format_monitor_json(result) if output_format == "json" else format_monitor_text(result)
 
@@ -34,7 +34,7 @@ from geo_optimizer.utils.validators import validate_public_url
     help="Output format",
 )
 @click.option("--output", "output_file", default=None, help="Output file path (optional)")
-@click.option("--cache", is_flag=True, help="Use local HTTP cache for the audit step")
+@click.option("--cache", is_flag=True, help="Use local HTTP and audit result caches for the audit step")
 @click.option("--config", "config_file", default=None, help="Path to .geo-optimizer.yml config file")
 @click.option("--limit", default=DEFAULT_HISTORY_LIMIT, show_default=True, type=int, help="Maximum snapshots to show")
 @click.option(
@@ -12,6 +12,7 @@ from geo_optimizer.core.audit_js import audit_js_rendering
 from geo_optimizer.core.audit_meta import audit_meta_tags
 from geo_optimizer.core.audit_robots import audit_robots_txt
 from geo_optimizer.models.results import AgentAccessResult
+from geo_optimizer.utils.html_parser import parse_html
 from geo_optimizer.utils.http import fetch_url
 
 
@@ -30,10 +31,8 @@ def run_agent_access_audit(base_url: str) -> AgentAccessResult:
     try:
         resp, err = fetch_url(base_url)
         if resp is not None and not err:
-            from bs4 import BeautifulSoup
-
             raw_html = resp.text or ""
-            soup = BeautifulSoup(raw_html, "html.parser")
+            soup = parse_html(raw_html)
 
             # #512: TTFB proxy — requests' `elapsed` is measured between sending
             # the request and finishing parsing response headers, unaffected by
@@ -8,9 +8,19 @@ instead of printing — the CLI layer handles display and formatting.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
+import hashlib
+import json
 import logging
+import threading
 import time
-from urllib.parse import urljoin
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 # ─── Re-exports from split modules (backward compatibility, #402) ────────────
 from geo_optimizer.core.audit_ai_discovery import (
@@ -18,7 +28,7 @@ from geo_optimizer.core.audit_ai_discovery import (
     audit_ai_discovery,  # noqa: F401
 )
 from geo_optimizer.core.audit_brand import audit_brand_entity  # noqa: F401
-from geo_optimizer.core.audit_cdn import audit_cdn_ai_crawler  # noqa: F401
+from geo_optimizer.core.audit_cdn import audit_cdn_ai_crawler, audit_cdn_ai_crawler_async  # noqa: F401
 from geo_optimizer.core.audit_content import audit_content_quality  # noqa: F401
 from geo_optimizer.core.audit_js import audit_js_rendering  # noqa: F401
 from geo_optimizer.core.audit_llms import (
@@ -36,6 +46,7 @@ from geo_optimizer.core.audit_schema import audit_schema  # noqa: F401
 from geo_optimizer.core.audit_signals import audit_signals  # noqa: F401
 from geo_optimizer.core.audit_webmcp import _extract_actions, audit_webmcp_readiness  # noqa: F401
 from geo_optimizer.core.intent_mapping import audit_intent_mapping
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.core.scoring import (  # noqa: F401 (re-exported for backward compatibility)
     compute_geo_score,
     compute_score_breakdown,
@@ -46,12 +57,14 @@ from geo_optimizer.models.config import (  # noqa: F401 (VALUABLE_SCHEMAS re-exp
     AI_BOTS,
     AUDIT_TIMEOUT_SECONDS,
     CATEGORY_MAX,
+    CDN_PROBE_WORKERS,
     CITATION_BOTS,
     CONTENT_MIN_WORDS,
     KEYWORD_STUFFING_THRESHOLD,
     ROBOTS_KEY_BOTS_DISPLAY,
     SCORE_BANDS,
     SCORING,
+    SIDECAR_FETCH_WORKERS,
     VALUABLE_SCHEMAS,
 )
 from geo_optimizer.models.results import (
@@ -73,7 +86,9 @@ from geo_optimizer.models.results import (
     SignalsResult,
     WebMcpResult,
 )
-from geo_optimizer.utils.http import fetch_url
+from geo_optimizer.utils.html_parser import parse_html, resolve_html_parser
+from geo_optimizer.utils.http import fetch_url, http_pool
+from geo_optimizer.utils.politeness import queued
 
 
 def build_recommendations(
@@ -391,7 +406,7 @@ def _build_audit_result(
     http_status: int,
     page_size: int,
     soup=None,
-    soup_clean=None,  # Fix #285: pre-cleaned soup (without script/style) to avoid re-parsing
+    soup_clean=None,  # Fix #285: pre-cleaned soup; only used when the caller passes no index
     extra_checks: dict | None = None,
     signals: SignalsResult | None = None,  # v4.0: segnali tecnici
     ai_discovery=None,  # Standard AI discovery endpoints (.well-known/ai.txt, ecc.)
@@ -411,6 +426,7 @@ def _build_audit_result(
     instruction_readiness=None,  # v4.9: Instruction Following Readiness (#371)
     intent_mapping=None,  # v4.10: AI Search Intent Mapping (#385)
     hallucination_bait=None,  # v4.10: Hallucination Bait Detection (#377)
+    index: PageIndex | None = None,  # Single-pass DOM index of soup, shared by sub-audits
 ) -> AuditResult:
     """Build AuditResult from sub-audits (fix #97: shared sync/async logic).
 
@@ -429,12 +445,18 @@ def _build_audit_result(
         soup: BeautifulSoup of the homepage (optional, passed to plugins).
         extra_checks: Dict with pre-computed results (not used internally).
         signals: Technical signals v4.0 (lang, RSS, freshness).
+        index: PageIndex of ``soup`` built by the caller; built here from
+            ``soup`` when omitted so the remaining sub-audits share one walk.
+            It also carries the page's parsed JSON-LD graph (``index.jsonld``).
 
     Returns:
         Complete AuditResult with score, band, recommendations and plugins.
     """
     from geo_optimizer.core.registry import CheckRegistry
 
+    if soup is not None:
+        index = get_page_index(soup, index)
+
     # Use empty SignalsResult if not provided
     effective_signals = signals if signals is not None else SignalsResult()
 
@@ -454,7 +476,7 @@ def _build_audit_result(
     elif soup is not None:
         from geo_optimizer.core.audit_multimodal import audit_multimodal_readiness
 
-        effective_multimodal = audit_multimodal_readiness(soup, schema)
+        effective_multimodal = audit_multimodal_readiness(soup, schema, index=index)
     else:
         effective_multimodal = MultimodalResult()
 
@@ -477,7 +499,7 @@ def _build_audit_result(
     elif soup is not None:
         from geo_optimizer.core.audit_rag import audit_rag_readiness
 
-        effective_rag_chunk = audit_rag_readiness(soup, soup_clean)
+        effective_rag_chunk = audit_rag_readiness(soup, soup_clean, index=index)
     else:
         from geo_optimizer.models.results import RagChunkResult
 
@@ -489,7 +511,7 @@ def _build_audit_result(
     elif soup is not None:
         from geo_optimizer.core.audit_embedding import audit_embedding_proximity
 
-        effective_embedding = audit_embedding_proximity(soup, soup_clean)
+        effective_embedding = audit_embedding_proximity(soup, soup_clean, index=index)
     else:
         from geo_optimizer.models.results import EmbeddingProximityResult
 
@@ -501,7 +523,7 @@ def _build_audit_result(
     elif soup is not None:
         from geo_optimizer.core.audit_decay import audit_content_decay
 
-        effective_decay = audit_content_decay(soup)
+        effective_decay = audit_content_decay(soup, index=index)
     else:
         from geo_optimizer.models.results import ContentDecayResult
 
@@ -513,7 +535,7 @@ def _build_audit_result(
     elif soup is not None:
         from geo_optimizer.core.audit_context_window import audit_context_window
 
-        effective_context_window = audit_context_window(soup, soup_clean)
+        effective_context_window = audit_context_window(soup, soup_clean, index=index)
     else:
         from geo_optimizer.models.results import ContextWindowResult
 
@@ -525,7 +547,7 @@ def _build_audit_result(
     elif soup is not None:
         from geo_optimizer.core.audit_instruction import audit_instruction_readiness
 
-        effective_instruction = audit_instruction_readiness(soup)
+        effective_instruction = audit_instruction_readiness(soup, index=index)
     else:
         from geo_optimizer.models.results import InstructionReadinessResult
 
@@ -535,7 +557,7 @@ def _build_audit_result(
     if intent_mapping is not None:
         effective_intent = intent_mapping
     elif soup is not None:
-        effective_intent = audit_intent_mapping(soup, "", content, meta, schema)
+        effective_intent = audit_intent_mapping(soup, "", content, meta, schema, index=index)
     else:
         from geo_optimizer.models.results import IntentMappingResult
 
@@ -547,7 +569,7 @@ def _build_audit_result(
     elif soup is not None:
         from geo_optimizer.core.hallucination_bait import audit_hallucination_bait
 
-        effective_hallucination = audit_hallucination_bait(soup, "", content, meta, schema)
+        effective_hallucination = audit_hallucination_bait(soup, "", content, meta, schema, index=index)
     else:
         from geo_optimizer.models.results import HallucinationBaitResult
 
@@ -616,10 +638,10 @@ def _build_audit_result(
         }
 
     # Citability Score: content analysis with 47 methods (fix #31)
-    # Fix #285: pass pre-computed soup_clean to avoid re-parsing in citability
+    # Fix #285: citability reads clean text from the shared index, never from a copy
     from geo_optimizer.core.citability import audit_citability
 
-    citability = audit_citability(soup, base_url, soup_clean=soup_clean) if soup else CitabilityResult()
+    citability = audit_citability(soup, base_url, soup_clean=soup_clean, index=index) if soup else CitabilityResult()
 
     # v4.2: CDN + JS rendering checks (#225, #226)
     effective_cdn = cdn_check if cdn_check is not None else CdnAiCrawlerResult()
@@ -695,51 +717,355 @@ def _build_audit_result(
     return result
 
 
-def run_full_audit(url: str, use_cache: bool = False, project_config=None) -> AuditResult:
-    """Run complete audit and return AuditResult with all sub-results, score, band, and recommendations.
+# ─── Staged audit engine ─────────────────────────────────────────────────────
+#
+# One pipeline for run_full_audit and run_full_audit_async:
+#   fetch    → homepage + sidecar files + CDN probes (pluggable: requests pool or httpx)
+#   parse    → BeautifulSoup of the homepage, computed once
+#   analyze  → every sub-audit + _build_audit_result (pure CPU, no I/O)
+# The two public functions only choose the fetcher and drive the stages;
+# the disk cache is a property of the fetcher, so it works in both modes.
+
+# Site-level resources fetched next to the homepage, in the order the audit consumes them
+_SIDECAR_PATHS = (
+    "/robots.txt",
+    "/llms.txt",
+    "/llms-full.txt",
+    "/.well-known/ai.txt",
+    "/ai/summary.json",
+    "/ai/faq.json",
+    "/ai/service.json",
+)
+
+
+@dataclass
+class _ParsedPage:
+    """Output of the parse stage: the homepage response and its DOM."""
+
+    response: Any
+    soup: Any
+    headers: dict = field(default_factory=dict)
+    index: PageIndex | None = None
+
+
+def _fetch_cached(url: str, cache=None):
+    """``fetch_url`` through the HTTP cache when one is set (revalidated with ETag/Last-Modified).
+
+    Looks up ``fetch_url`` at call time so ``patch("geo_optimizer.core.audit.fetch_url")``
+    keeps working for the threaded fetch.
+    """
+    if cache is None:
+        return fetch_url(url)
+    return fetch_url(url, cache=cache)
+
+
+def _fetch_response(url: str, cache=None):
+    """Fetch one sidecar URL, discarding the error (a missing file is a valid outcome)."""
+    r, _ = _fetch_cached(url, cache)
+    return r
+
+
+class SidecarMemo:
+    """Sidecar responses of one crawl, fetched once per host and shared by its pages.
+
+    The ``_SIDECAR_PATHS`` files are site-level: every page of a host gets
+    the same robots.txt and llms.txt. A batch activates one memo with
+    ``use_sidecar_memo()`` and both fetchers ask it before going to the
+    network; a fetch still in flight is awaited, not repeated. Waiting for
+    a fetch started by another page counts as queued time for
+    ``wait_for_excluding_queue``, like a wait in the scheduler.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def fetch(self, url: str, cache=None):
+        """``_fetch_response(url, cache)`` for the first caller, its response for the others."""
+        with self._lock:
+            future = self._futures.get(url)
+            owner = future is None
+            if owner:
+                future = self._futures[url] = Future()
+        if not owner:
+            with queued():
+                return future.result()
+        try:
+            r = _fetch_response(url, cache)
+        except BaseException as exc:
+            # Not memoized: the next page tries again
+            with self._lock:
+                self._futures.pop(url, None)
+            future.set_exception(exc)
+            raise
+        future.set_result(r)
+        return r
+
+    async def fetch_async(self, url: str, fetch: Callable[[str], Awaitable[tuple]]) -> tuple:
+        """``await fetch(url)`` once per URL; returns its ``(response, error)``."""
+        task = self._tasks.get(url)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = self._tasks[url] = asyncio.ensure_future(fetch(url))
+            # Shielded: the page that started the fetch may time out, the others still need it
+            return await asyncio.shield(task)
+        with queued():
+            return await asyncio.shield(task)
+
+    async def aclose(self) -> None:
+        """Cancel the async fetches still in flight (the crawl stopped early)."""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = {}
+        self._futures = {}
+
+
+# Fetch-stage inputs of the audits run in this context (see capture_audit_inputs)
+_inputs_sink: contextvars.ContextVar[dict[str, AuditInputs] | None] = contextvars.ContextVar(
+    "_inputs_sink", default=None
+)
+
+
+@contextlib.contextmanager
+def capture_audit_inputs() -> Iterator[dict[str, AuditInputs]]:
+    """Collect ``{base_url: AuditInputs}`` for every audit in this context whose homepage was fetched.
+
+    Lets a caller fingerprint what an audit saw (``audit_fingerprint``)
+    without fetching it a second time. Audits whose homepage failed are not
+    recorded.
+    """
+    sink: dict[str, AuditInputs] = {}
+    token = _inputs_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _inputs_sink.reset(token)
+
+
+def _record_audit_inputs(inputs: AuditInputs) -> None:
+    sink = _inputs_sink.get()
+    if sink is not None:
+        sink[inputs.base_url] = inputs
+
+
+_active_sidecars: contextvars.ContextVar[SidecarMemo | None] = contextvars.ContextVar("_active_sidecars", default=None)
+
+
+@contextlib.contextmanager
+def use_sidecar_memo(memo: SidecarMemo) -> Iterator[SidecarMemo]:
+    """Share the sidecar fetches of every audit in this context through ``memo``.
+
+    Nested calls keep the outer memo, like ``use_fetch_scheduler``.
+    """
+    current = _active_sidecars.get()
+    if current is not None:
+        yield current
+        return
+
+    token = _active_sidecars.set(memo)
+    try:
+        yield memo
+    finally:
+        _active_sidecars.reset(token)
+
+
+class SyncAuditFetcher:
+    """Fetch stage over ``requests``: keep-alive ``http_pool()`` + bounded sidecar threads.
 
     Args:
-        url: URL of the site to analyze.
-        use_cache: If True, use disk cache for HTTP requests.
-        project_config: Optional ProjectConfig — if it has extra_bots, merges them with AI_BOTS (fix #120).
+        cache: Optional HTTP cache (``SqliteCache``) for the homepage and sidecar files
+            (``use_cache=True``); stale entries are revalidated, not refetched.
+        max_workers: Threads fetching the sidecar files concurrently.
+        cdn_workers: CDN/WAF bot probes sent concurrently (see ``audit_cdn_ai_crawler``).
+        cdn_stop_on_challenge: Stop the bot probes at the first WAF challenge page.
     """
-    _t0 = time.perf_counter()
-    from bs4 import BeautifulSoup
 
-    # Fix #120: if config has extra_bots, merge with AI_BOTS for this audit
-    effective_bots = dict(AI_BOTS)
-    if project_config is not None and project_config.extra_bots:
-        effective_bots.update(project_config.extra_bots)
+    def __init__(
+        self,
+        cache=None,
+        max_workers: int = SIDECAR_FETCH_WORKERS,
+        cdn_workers: int = CDN_PROBE_WORKERS,
+        cdn_stop_on_challenge: bool = False,
+    ):
+        self.cache = cache
+        self.max_workers = max_workers
+        self.cdn_workers = cdn_workers
+        self.cdn_stop_on_challenge = cdn_stop_on_challenge
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[str, Any] = {}
+
+    def fetch_homepage(self, base_url: str):
+        """Return (response, error) for the homepage, served from the cache when possible."""
+        return _fetch_cached(base_url, self.cache)
+
+    def start_sidecars(self, base_url: str) -> None:
+        """Submit the sidecar fetches; they run while the homepage is parsed.
+
+        Each task runs in a copy of the caller's context, so the active
+        ``http_pool()`` (DNS-pinned keep-alive sessions) is shared by every worker.
+        """
+        memo = _active_sidecars.get()
+        fetch = _fetch_response if memo is None else memo.fetch
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="geo-sidecar")
+        self._futures = {
+            path: self._executor.submit(contextvars.copy_context().run, fetch, urljoin(base_url, path), self.cache)
+            for path in _SIDECAR_PATHS
+        }
+
+    def sidecars(self) -> dict[str, Any]:
+        """Wait for the sidecar fetches and return {path: response | None}."""
+        try:
+            return {path: future.result() for path, future in self._futures.items()}
+        finally:
+            self.close()
+
+    def cdn_check(self, base_url: str) -> CdnAiCrawlerResult:
+        return audit_cdn_ai_crawler(
+            base_url, max_workers=self.cdn_workers, stop_on_challenge=self.cdn_stop_on_challenge
+        )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+class AsyncAuditFetcher:
+    """Fetch stage over ``httpx``: homepage and sidecar files fetched in parallel.
+
+    All eight requests start together in ``fetch_homepage`` and share one
+    ``httpx.AsyncClient``; ``sidecars()`` collects the ones still in flight.
+    Use as ``async with`` so the client is closed and leftover tasks cancelled.
+
+    Args:
+        cache: Optional HTTP cache (``SqliteCache``) for the homepage and sidecar files
+            (``use_cache=True``); stale entries are revalidated, not refetched.
+        cdn_workers: CDN/WAF bot probes in flight at the same time (see ``audit_cdn_ai_crawler_async``).
+        cdn_stop_on_challenge: Cancel the bot probes at the first WAF challenge page.
+
+    Requires: pip install geo-optimizer-skill[async]
+    """
+
+    def __init__(
+        self,
+        cache=None,
+        timeout: int = 10,
+        cdn_workers: int = CDN_PROBE_WORKERS,
+        cdn_stop_on_challenge: bool = False,
+    ):
+        self.cache = cache
+        self.timeout = timeout
+        self.cdn_workers = cdn_workers
+        self.cdn_stop_on_challenge = cdn_stop_on_challenge
+        self._client = None
+        self._owns_client = False
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    async def __aenter__(self) -> AsyncAuditFetcher:
+        from geo_optimizer.utils.http_async import _active_client, create_async_client
+
+        # A batch shares one pooled client (use_async_client); otherwise own one
+        self._client = _active_client.get()
+        self._owns_client = self._client is None
+        if self._owns_client:
+            self._client = create_async_client(self.timeout)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks = {}
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+
+    async def _fetch(self, url: str):
+        from geo_optimizer.utils.http_async import fetch_url_async
+
+        try:
+            if self.cache is None:
+                return await fetch_url_async(url, client=self._client, timeout=self.timeout)
+            return await fetch_url_async(url, client=self._client, timeout=self.timeout, cache=self.cache)
+        except Exception as exc:
+            return None, str(exc)
+
+    async def _fetch_sidecar(self, url: str):
+        memo = _active_sidecars.get()
+        # An owned client closes with this fetcher: its fetches cannot serve other pages
+        if memo is None or self._owns_client:
+            return await self._fetch(url)
+        return await memo.fetch_async(url, self._fetch)
+
+    async def fetch_homepage(self, base_url: str):
+        """Start the homepage and sidecar fetches together; return (response, error) for the homepage."""
+        self._tasks = {
+            path: asyncio.ensure_future(self._fetch_sidecar(urljoin(base_url, path))) for path in _SIDECAR_PATHS
+        }
+        return await self._fetch(base_url)
+
+    def start_sidecars(self, base_url: str) -> None:
+        """No-op: sidecar fetches already started with the homepage."""
+
+    async def sidecars(self) -> dict[str, Any]:
+        """Wait for the sidecar fetches and return {path: response | None}."""
+        responses = await asyncio.gather(*self._tasks.values())
+        return {path: r for path, (r, _err) in zip(self._tasks.keys(), responses)}
+
+    async def cdn_check(self, base_url: str) -> CdnAiCrawlerResult:
+        # Async-native probes: no thread offload needed for the event loop
+        return await audit_cdn_ai_crawler_async(
+            base_url, max_concurrency=self.cdn_workers, stop_on_challenge=self.cdn_stop_on_challenge
+        )
+
 
-    # Normalize URL
+def _normalize_base_url(url: str) -> str:
+    """Strip the trailing slash and default to https://."""
     base_url = url.rstrip("/")
     if not base_url.startswith(("http://", "https://")):
         base_url = "https://" + base_url
+    return base_url
 
-    # Fetch homepage (with optional cache)
-    # r is CachedResponse (disk cache hit) or requests.Response (live fetch)
-    err: str | None
-    if use_cache:
-        from geo_optimizer.utils.cache import FileCache
-
-        cache = FileCache()
-        cached = cache.get(base_url)
-        if cached:
-            # Build response-like object from cache (fix #83: use dataclass)
-            status_code, text, headers = cached
-            r = CachedResponse(
-                status_code=status_code,
-                text=text,
-                content=text.encode("utf-8"),
-                headers=headers,
-            )
-            err = None
-        else:
-            r, err = fetch_url(base_url)  # type: ignore[assignment]
-            if r and not err:
-                cache.put(base_url, r.status_code, r.text, dict(r.headers))
-    else:
-        r, err = fetch_url(base_url)  # type: ignore[assignment]
+
+def audit_url_key(url: str) -> str:
+    """Identity of the page an audit of ``url`` covers: URLs with the same key get the same audit.
+
+    Normalized like the audit itself (default https://, no trailing slash),
+    with scheme and host lowercased and the fragment dropped.
+    """
+    parts = urlsplit(_normalize_base_url(url.strip()))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, "")).rstrip("/")
+
+
+def _effective_bots(project_config) -> dict:
+    """Fix #120: if config has extra_bots, merge with AI_BOTS for this audit."""
+    effective_bots = dict(AI_BOTS)
+    if project_config is not None and project_config.extra_bots:
+        effective_bots.update(project_config.extra_bots)
+    return effective_bots
+
+
+def _html_parser(project_config) -> str | None:
+    """HTML parser backend set in the project config (``audit.parser``), if any."""
+    return getattr(getattr(project_config, "audit", None), "parser", None)
+
+
+def cdn_probe_options(project_config) -> dict:
+    """Fetcher keyword arguments for the CDN/WAF bot probes set in the project config.
+
+    ``audit.cdn_workers`` and ``audit.cdn_stop_on_challenge``; defaults when unset.
+    """
+    audit_config = getattr(project_config, "audit", None)
+    return {
+        "cdn_workers": getattr(audit_config, "cdn_workers", CDN_PROBE_WORKERS),
+        "cdn_stop_on_challenge": getattr(audit_config, "cdn_stop_on_challenge", False),
+    }
+
+
+def _homepage_failure(base_url: str, r, err: str | None) -> AuditResult | None:
+    """Return the error AuditResult when the homepage cannot be audited, else None."""
     # `r is None`, not `not r`: requests.Response.__bool__ is `ok`, so any 4xx/5xx
     # is falsy and would land here — reporting "Connection failed" for a request
     # that succeeded, and skipping the status branch below that exists to name the
@@ -750,7 +1076,6 @@ def run_full_audit(url: str, use_cache: bool = False, project_config=None) -> Au
             error=str(err) if err else "Connection failed",
         )
         result.recommendations = [f"Unable to reach {base_url}: {err or 'connection failed'}"]
-        result.audit_duration_ms = int((time.perf_counter() - _t0) * 1000)
         return result
 
     # Fix #337: if homepage returns HTTP error, report it and skip analysis of the error page
@@ -763,98 +1088,103 @@ def run_full_audit(url: str, use_cache: bool = False, project_config=None) -> Au
         result.recommendations = [
             f"Site returned HTTP {r.status_code}. Check for Cloudflare/WAF blocks or server errors."
         ]
-        result.audit_duration_ms = int((time.perf_counter() - _t0) * 1000)
         return result
 
-    import copy
-
-    soup = BeautifulSoup(r.text, "html.parser")
-
-    # Fix #285: compute soup_clean once and pass it to all sub-audits
-    # Avoids 3-4 re-parses of the same HTML (saves 50-200ms per page)
-    soup_clean = copy.deepcopy(soup)
-    for tag in soup_clean(["script", "style"]):
-        tag.decompose()
-
-    # Fetch robots.txt, llms.txt, llms-full.txt and AI discovery with local fetch_url
-    # (identical pattern to the async version — allows mocking with patch on audit.fetch_url)
-    robots_url_full = urljoin(base_url, "/robots.txt")
-    llms_url_full = urljoin(base_url, "/llms.txt")
-    llms_full_url = urljoin(base_url, "/llms-full.txt")
-    ai_txt_url = urljoin(base_url, "/.well-known/ai.txt")
-    ai_summary_url = urljoin(base_url, "/ai/summary.json")
-    ai_faq_url = urljoin(base_url, "/ai/faq.json")
-    ai_service_url = urljoin(base_url, "/ai/service.json")
-
-    r_robots, _ = fetch_url(robots_url_full)
-    r_llms, _ = fetch_url(llms_url_full)
-    r_llms_full, _ = fetch_url(llms_full_url)
-    r_ai_txt, _ = fetch_url(ai_txt_url)
-    r_ai_summary, _ = fetch_url(ai_summary_url)
-    r_ai_faq, _ = fetch_url(ai_faq_url)
-    r_ai_service, _ = fetch_url(ai_service_url)
+    return None
+
+
+def _parse_homepage(r, parser: str | None = None) -> _ParsedPage:
+    """Parse stage: build the homepage soup and its DOM index once.
+
+    No script/style-free copy of the soup is made any more (fix #285 used a
+    deepcopy): the index serves clean text as a view that skips those nodes.
+
+    Args:
+        r: Homepage response.
+        parser: HTML parser backend (see ``utils.html_parser``); None uses
+            ``GEO_HTML_PARSER`` or the default.
+    """
+    soup = parse_html(r.text, parser)
+
+    try:
+        headers = dict(r.headers)
+    except (TypeError, AttributeError):
+        headers = {}
+
+    return _ParsedPage(response=r, soup=soup, headers=headers, index=PageIndex(soup))
+
+
+def _analyze(
+    base_url: str,
+    page: _ParsedPage,
+    sidecars: dict[str, Any],
+    cdn_result: CdnAiCrawlerResult,
+    effective_bots: dict,
+) -> AuditResult:
+    """Analyze stage: run every sub-audit on pre-fetched data (zero HTTP requests)."""
+    r = page.response
+    soup = page.soup
+    index = page.index
 
     # Run all sub-audits using the pre-downloaded responses
     # Fix #120: pass effective_bots which includes any extra_bots from project_config
-    robots = _audit_robots_from_response(r_robots, bots=effective_bots)
-    llms = _audit_llms_from_response(r_llms, r_full=r_llms_full)
-    schema = audit_schema(soup, base_url)
-    meta = audit_meta_tags(soup, base_url)
+    robots = _audit_robots_from_response(sidecars["/robots.txt"], bots=effective_bots)
+    llms = _audit_llms_from_response(sidecars["/llms.txt"], r_full=sidecars["/llms-full.txt"])
+    schema = audit_schema(soup, base_url, index=index)
+    meta = audit_meta_tags(soup, base_url, index=index)
     # gap #2: X-Robots-Tag HTTP header — blocks AI indexing even when robots.txt allows it
-    try:
-        _x_robots = dict(r.headers).get("x-robots-tag") or dict(r.headers).get("X-Robots-Tag") or ""
-    except (TypeError, AttributeError):
-        _x_robots = ""
+    _x_robots = page.headers.get("x-robots-tag") or page.headers.get("X-Robots-Tag") or ""
     if _x_robots:
         meta.x_robots_tag = _x_robots
         if "noindex" in _x_robots.lower():
             meta.x_robots_noindex = True
-    content = audit_content_quality(soup, base_url, soup_clean=soup_clean)
+    content = audit_content_quality(soup, base_url, index=index)
 
     # v4.1: AI discovery endpoints audit (usa risposte pre-scaricate)
-    ai_disc = _audit_ai_discovery_from_responses(r_ai_txt, r_ai_summary, r_ai_faq, r_ai_service)
+    ai_disc = _audit_ai_discovery_from_responses(
+        sidecars["/.well-known/ai.txt"],
+        sidecars["/ai/summary.json"],
+        sidecars["/ai/faq.json"],
+        sidecars["/ai/service.json"],
+    )
 
-    # v4.2: CDN AI Crawler check (#225) + JS Rendering check (#226)
-    cdn_result = audit_cdn_ai_crawler(base_url)
-    js_result = audit_js_rendering(soup, r.text)
+    # v4.2: JS Rendering check (#226)
+    js_result = audit_js_rendering(soup, r.text, index=index)
 
     # Fix #281: compute technical signals (lang, RSS, freshness)
-    signals = audit_signals(soup, schema)
+    signals = audit_signals(soup, schema, index=index)
 
     # v4.3: Brand & Entity signals (zero HTTP requests, uses pre-fetched data only)
-    brand_entity_result = audit_brand_entity(soup, schema, meta, content)
+    brand_entity_result = audit_brand_entity(soup, schema, meta, content, index=index)
 
     # v4.3: WebMCP Readiness check (#233) — zero HTTP fetch
-    webmcp_result = audit_webmcp_readiness(soup, r.text, schema)
+    webmcp_result = audit_webmcp_readiness(soup, r.text, schema, index=index)
 
     # v4.3: Negative Signals detection — zero HTTP fetch
-    negative_signals_result = audit_negative_signals(soup, r.text, content, meta, schema)
+    negative_signals_result = audit_negative_signals(soup, r.text, content, meta, schema, index=index)
 
     # v4.4: Prompt Injection Pattern Detection (#276) — zero HTTP fetch
     from geo_optimizer.core.injection_detector import audit_prompt_injection
 
-    prompt_injection_result = audit_prompt_injection(soup, r.text)
+    prompt_injection_result = audit_prompt_injection(soup, r.text, index=index)
 
     # v4.5: Trust Stack Score (#273) — 5-layer aggregation, zero HTTP fetch
     from geo_optimizer.core.trust_stack import audit_trust_stack
 
-    try:
-        resp_headers = dict(r.headers)
-    except (TypeError, AttributeError):
-        resp_headers = {}
     trust_stack_result = audit_trust_stack(
         soup=soup,
         base_url=base_url,
-        response_headers=resp_headers,
+        response_headers=page.headers,
         brand_entity=brand_entity_result,
         schema=schema,
         meta=meta,
         content=content,
         negative_signals=negative_signals_result,
+        index=index,
     )
 
     # Fix #97 + #104: use _build_audit_result for shared logic and plugin integration
-    result = _build_audit_result(
+    return _build_audit_result(
         base_url=base_url,
         robots=robots,
         llms=llms,
@@ -864,7 +1194,6 @@ def run_full_audit(url: str, use_cache: bool = False, project_config=None) -> Au
         http_status=r.status_code,
         page_size=len(r.text),
         soup=soup,
-        soup_clean=soup_clean,
         ai_discovery=ai_disc,
         cdn_check=cdn_result,
         js_rendering=js_result,
@@ -874,225 +1203,370 @@ def run_full_audit(url: str, use_cache: bool = False, project_config=None) -> Au
         negative_signals=negative_signals_result,
         prompt_injection=prompt_injection_result,
         trust_stack=trust_stack_result,
+        index=index,
     )
 
-    # gap #10: brand sentiment analysis — opt-in, requires project_config.brand_name
-    _brand_name = getattr(project_config, "brand_name", None)
-    if _brand_name:
-        from geo_optimizer.core.audit_sentiment import audit_brand_sentiment
 
-        result.brand_sentiment = audit_brand_sentiment(
-            _brand_name,
-            provider=getattr(project_config, "llm_provider", None),
-            api_key=getattr(project_config, "llm_api_key", None),
-            model=getattr(project_config, "llm_model", None),
-        )
+def _brand_sentiment(project_config):
+    """gap #10: brand sentiment analysis — opt-in, requires project_config.brand_name."""
+    from geo_optimizer.core.audit_sentiment import audit_brand_sentiment
+
+    return audit_brand_sentiment(
+        getattr(project_config, "brand_name", None),
+        provider=getattr(project_config, "llm_provider", None),
+        api_key=getattr(project_config, "llm_api_key", None),
+        model=getattr(project_config, "llm_model", None),
+    )
+
 
-    result.audit_duration_ms = int((time.perf_counter() - _t0) * 1000)
-    if result.audit_duration_ms > AUDIT_TIMEOUT_SECONDS * 1000:
+def _finish(result: AuditResult, base_url: str, t0: float) -> AuditResult:
+    """Record the audit duration and warn when the performance budget is exceeded (#290)."""
+    result.audit_duration_ms = int((time.perf_counter() - t0) * 1000)
+    if result.error is None and result.audit_duration_ms > AUDIT_TIMEOUT_SECONDS * 1000:
         logging.getLogger(__name__).warning(
             "Audit exceeded %ds budget: %dms for %s", AUDIT_TIMEOUT_SECONDS, result.audit_duration_ms, base_url
         )
     return result
 
 
-async def run_full_audit_async(url: str, project_config=None) -> AuditResult:
-    """Async variant of the full audit with parallel fetch (httpx).
+def run_audit_pipeline(url: str, fetcher: SyncAuditFetcher, project_config=None, result_cache=None) -> AuditResult:
+    """Drive the fetch → parse → analyze stages with a synchronous fetcher.
 
-    Runs homepage, robots.txt and llms.txt in parallel for a
-    2-3x speedup compared to the synchronous version.
+    With ``result_cache`` the fetch stage completes first and parse + analyze
+    are skipped when the fingerprint of the fetched content is cached.
+    """
+    if result_cache is not None:
+        inputs = fetch_audit_inputs(url, fetcher)
+        if isinstance(inputs, AuditResult):
+            return inputs
+        result = _analyze_with_cache(inputs, result_cache, project_config)
+        if getattr(project_config, "brand_name", None):
+            result.brand_sentiment = _brand_sentiment(project_config)
+        return result
 
-    Note: disk cache (``use_cache``) is not supported in the async path.
-    Use ``run_full_audit(url, use_cache=True)`` when caching is needed.
+    t0 = time.perf_counter()
+    base_url = _normalize_base_url(url)
 
-    Args:
-        url: URL of the site to analyze.
-        project_config: Optional ProjectConfig — if it has extra_bots, merges them with AI_BOTS.
-
-    Requires: pip install geo-optimizer-skill[async]
-    """
-    _t0 = time.perf_counter()
-    from bs4 import BeautifulSoup
+    r, err = fetcher.fetch_homepage(base_url)
+    failure = _homepage_failure(base_url, r, err)
+    if failure is not None:
+        return _finish(failure, base_url, t0)
 
-    from geo_optimizer.utils.http_async import fetch_urls_async
+    try:
+        # Sidecar files download while the homepage is parsed
+        fetcher.start_sidecars(base_url)
+        page = _parse_homepage(r, _html_parser(project_config))
+        sidecars = fetcher.sidecars()
+    finally:
+        fetcher.close()
 
-    # Merge extra_bots from config, same as in the synchronous version
-    effective_bots = dict(AI_BOTS)
-    if project_config is not None and project_config.extra_bots:
-        effective_bots.update(project_config.extra_bots)
+    cdn_result = fetcher.cdn_check(base_url)
+    if _inputs_sink.get() is not None:
+        _record_audit_inputs(_audit_inputs(base_url, r, sidecars, cdn_result, t0))
+    result = _analyze(base_url, page, sidecars, cdn_result, _effective_bots(project_config))
 
-    # Normalize URL
-    base_url = url.rstrip("/")
-    if not base_url.startswith(("http://", "https://")):
-        base_url = "https://" + base_url
+    if getattr(project_config, "brand_name", None):
+        result.brand_sentiment = _brand_sentiment(project_config)
+    return _finish(result, base_url, t0)
 
-    # Parallel fetch: homepage + robots.txt + llms.txt + llms-full.txt + AI discovery
-    robots_url = urljoin(base_url, "/robots.txt")
-    llms_url = urljoin(base_url, "/llms.txt")
-    llms_full_url = urljoin(base_url, "/llms-full.txt")
-    # v4.1: AI discovery endpoints (geo-checklist.dev)
-    ai_txt_url = urljoin(base_url, "/.well-known/ai.txt")
-    ai_summary_url = urljoin(base_url, "/ai/summary.json")
-    ai_faq_url = urljoin(base_url, "/ai/faq.json")
-    ai_service_url = urljoin(base_url, "/ai/service.json")
-
-    responses = await fetch_urls_async(
-        [
-            base_url,
-            robots_url,
-            llms_url,
-            llms_full_url,
-            ai_txt_url,
-            ai_summary_url,
-            ai_faq_url,
-            ai_service_url,
-        ]
-    )
 
-    # Extract responses
-    r_home, err_home = responses.get(base_url, (None, "URL not requested"))
-    r_robots, _ = responses.get(robots_url, (None, None))
-    r_llms, _ = responses.get(llms_url, (None, None))
-    r_llms_full, _ = responses.get(llms_full_url, (None, None))
-    # AI discovery responses
-    r_ai_txt, _ = responses.get(ai_txt_url, (None, None))
-    r_ai_summary, _ = responses.get(ai_summary_url, (None, None))
-    r_ai_faq, _ = responses.get(ai_faq_url, (None, None))
-    r_ai_service, _ = responses.get(ai_service_url, (None, None))
-
-    if err_home or not r_home:
-        result = AuditResult(
-            url=base_url,
-            error=str(err_home) if err_home else "Connection failed",
-        )
-        result.recommendations = [f"Unable to reach {base_url}: {err_home}"]
-        result.audit_duration_ms = int((time.perf_counter() - _t0) * 1000)
+async def run_audit_pipeline_async(
+    url: str, fetcher: AsyncAuditFetcher, project_config=None, result_cache=None
+) -> AuditResult:
+    """Drive the fetch → parse → analyze stages with an async fetcher (same stages as the sync driver)."""
+    if result_cache is not None:
+        inputs = await fetch_audit_inputs_async(url, fetcher)
+        if isinstance(inputs, AuditResult):
+            return inputs
+        # SQLite lookups and the analysis are blocking: keep them off the event loop
+        result = await asyncio.to_thread(_analyze_with_cache, inputs, result_cache, project_config)
+        if getattr(project_config, "brand_name", None):
+            result.brand_sentiment = await asyncio.to_thread(_brand_sentiment, project_config)
         return result
 
-    # Fix #337: if homepage returns HTTP error, report it and skip analysis of the error page
-    if r_home.status_code not in (200, 203):
-        result = AuditResult(
-            url=base_url,
-            http_status=r_home.status_code,
-            error=f"HTTP {r_home.status_code}",
-        )
-        result.recommendations = [
-            f"Site returned HTTP {r_home.status_code}. Check for Cloudflare/WAF blocks or server errors."
-        ]
-        result.audit_duration_ms = int((time.perf_counter() - _t0) * 1000)
-        return result
+    t0 = time.perf_counter()
+    base_url = _normalize_base_url(url)
 
-    import copy
+    r, err = await fetcher.fetch_homepage(base_url)
+    failure = _homepage_failure(base_url, r, err)
+    if failure is not None:
+        return _finish(failure, base_url, t0)
 
-    soup = BeautifulSoup(r_home.text, "html.parser")
+    fetcher.start_sidecars(base_url)
+    page = _parse_homepage(r, _html_parser(project_config))
+    sidecars = await fetcher.sidecars()
 
-    # Fix #285: compute soup_clean once for the async path
-    soup_clean = copy.deepcopy(soup)
-    for tag in soup_clean(["script", "style"]):
-        tag.decompose()
+    cdn_result = await fetcher.cdn_check(base_url)
+    if _inputs_sink.get() is not None:
+        _record_audit_inputs(_audit_inputs(base_url, r, sidecars, cdn_result, t0))
+    result = _analyze(base_url, page, sidecars, cdn_result, _effective_bots(project_config))
 
-    # Sub-audit robots.txt (uses pre-fetched response with extra_bots)
-    robots = _audit_robots_from_response(r_robots, bots=effective_bots)
+    if getattr(project_config, "brand_name", None):
+        result.brand_sentiment = await asyncio.to_thread(_brand_sentiment, project_config)
+    return _finish(result, base_url, t0)
 
-    # Sub-audit llms.txt (uses pre-fetched response)
-    llms = _audit_llms_from_response(r_llms, r_full=r_llms_full)
 
-    # Sub-audits that work on the DOM (no additional fetch required)
-    schema = audit_schema(soup, base_url)
-    meta = audit_meta_tags(soup, base_url)
-    # gap #2: X-Robots-Tag HTTP header — blocks AI indexing even when robots.txt allows it
+# ─── Detached stages (process pools) ─────────────────────────────────────────
+#
+# The same fetch and analyze stages, split at the process boundary: the fetch
+# stage returns AuditInputs (plain, picklable data), and analyze_audit_inputs()
+# can run in a ProcessPoolExecutor worker, away from the event loop and the GIL
+# of the process that does the I/O. Used by the batch audit with --workers.
+
+
+@dataclass
+class AuditInputs:
+    """Fetch-stage output for one page, with responses detached from their HTTP client.
+
+    Attributes:
+        base_url: Normalized URL of the audited page.
+        response: Homepage response (status, text, headers).
+        sidecars: {path: response | None} for ``_SIDECAR_PATHS``.
+        cdn_result: Outcome of the CDN/WAF bot probes.
+        fetch_seconds: Wall time of the fetch stage, added to ``audit_duration_ms``.
+    """
+
+    base_url: str
+    response: CachedResponse
+    sidecars: dict[str, CachedResponse | None]
+    cdn_result: CdnAiCrawlerResult
+    fetch_seconds: float = 0.0
+
+
+def _detach_response(r) -> CachedResponse | None:
+    """Plain copy of a requests/httpx response, safe to send to another process."""
+    if r is None:
+        return None
     try:
-        _x_robots_async = dict(r_home.headers).get("x-robots-tag") or dict(r_home.headers).get("X-Robots-Tag") or ""
+        headers = dict(r.headers)
     except (TypeError, AttributeError):
-        _x_robots_async = ""
-    if _x_robots_async:
-        meta.x_robots_tag = _x_robots_async
-        if "noindex" in _x_robots_async.lower():
-            meta.x_robots_noindex = True
-    content = audit_content_quality(soup, base_url, soup_clean=soup_clean)
+        headers = {}
+    # The analyze stage reads .text only: leave the bytes behind to halve what is pickled
+    return CachedResponse(status_code=r.status_code, text=r.text, content=b"", headers=headers)
 
-    # v4.1: AI discovery from pre-fetched responses
-    ai_disc = _audit_ai_discovery_from_responses(r_ai_txt, r_ai_summary, r_ai_faq, r_ai_service)
 
-    # v4.2: CDN AI Crawler check (#225) + JS Rendering check (#226)
-    # Fix: wrap synchronous calls with asyncio.to_thread to avoid blocking the event loop
-    cdn_result = await asyncio.to_thread(audit_cdn_ai_crawler, base_url)
-    js_result = audit_js_rendering(soup, r_home.text)
+def _audit_inputs(base_url: str, r, sidecars: dict[str, Any], cdn_result, t0: float) -> AuditInputs:
+    return AuditInputs(
+        base_url=base_url,
+        response=_detach_response(r),
+        sidecars={path: _detach_response(resp) for path, resp in sidecars.items()},
+        cdn_result=cdn_result,
+        fetch_seconds=time.perf_counter() - t0,
+    )
 
-    # Fix #281: compute technical signals (lang, RSS, freshness)
-    signals = audit_signals(soup, schema)
 
-    # v4.3: Brand & Entity signals (zero HTTP requests, uses pre-fetched data only)
-    brand_entity_result = audit_brand_entity(soup, schema, meta, content)
+def fetch_audit_inputs(url: str, fetcher: SyncAuditFetcher, *, cdn: bool = True) -> AuditInputs | AuditResult:
+    """Fetch stage only, synchronous fetcher; returns the error AuditResult if the homepage fails.
 
-    # v4.3: WebMCP Readiness check (#233) — zero HTTP fetch
-    webmcp_result = audit_webmcp_readiness(soup, r_home.text, schema)
+    ``cdn=False`` skips the CDN/WAF bot probes (``cdn_result`` stays unchecked).
+    """
+    t0 = time.perf_counter()
+    base_url = _normalize_base_url(url)
 
-    # v4.3: Negative Signals detection — zero HTTP fetch
-    negative_signals_result = audit_negative_signals(soup, r_home.text, content, meta, schema)
+    r, err = fetcher.fetch_homepage(base_url)
+    failure = _homepage_failure(base_url, r, err)
+    if failure is not None:
+        return _finish(failure, base_url, t0)
 
-    # v4.4: Prompt Injection Pattern Detection (#276) — zero HTTP fetch
-    from geo_optimizer.core.injection_detector import audit_prompt_injection
+    try:
+        fetcher.start_sidecars(base_url)
+        sidecars = fetcher.sidecars()
+    finally:
+        fetcher.close()
+    cdn_result = fetcher.cdn_check(base_url) if cdn else CdnAiCrawlerResult()
+    inputs = _audit_inputs(base_url, r, sidecars, cdn_result, t0)
+    _record_audit_inputs(inputs)
+    return inputs
+
+
+async def fetch_audit_inputs_async(
+    url: str, fetcher: AsyncAuditFetcher, *, cdn: bool = True
+) -> AuditInputs | AuditResult:
+    """Fetch stage only, async fetcher; returns the error AuditResult if the homepage fails.
+
+    ``cdn=False`` skips the CDN/WAF bot probes (``cdn_result`` stays unchecked).
+    """
+    t0 = time.perf_counter()
+    base_url = _normalize_base_url(url)
 
-    prompt_injection_result = audit_prompt_injection(soup, r_home.text)
+    r, err = await fetcher.fetch_homepage(base_url)
+    failure = _homepage_failure(base_url, r, err)
+    if failure is not None:
+        return _finish(failure, base_url, t0)
 
-    # v4.5: Trust Stack Score (#273) — 5-layer aggregation, zero HTTP fetch
-    from geo_optimizer.core.trust_stack import audit_trust_stack
+    fetcher.start_sidecars(base_url)
+    sidecars = await fetcher.sidecars()
+    cdn_result = await fetcher.cdn_check(base_url) if cdn else CdnAiCrawlerResult()
+    inputs = _audit_inputs(base_url, r, sidecars, cdn_result, t0)
+    _record_audit_inputs(inputs)
+    return inputs
 
-    try:
-        resp_headers_async = dict(r_home.headers)
-    except (TypeError, AttributeError):
-        resp_headers_async = {}
-    trust_stack_result = audit_trust_stack(
-        soup=soup,
-        base_url=base_url,
-        response_headers=resp_headers_async,
-        brand_entity=brand_entity_result,
-        schema=schema,
-        meta=meta,
-        content=content,
-        negative_signals=negative_signals_result,
-    )
 
-    # Fix #97 + #104: use _build_audit_result for shared logic and plugin integration
-    result = _build_audit_result(
-        base_url=base_url,
-        robots=robots,
-        llms=llms,
-        schema=schema,
-        meta=meta,
-        content=content,
-        http_status=r_home.status_code,
-        page_size=len(r_home.text),
-        soup=soup,
-        soup_clean=soup_clean,
-        ai_discovery=ai_disc,
-        cdn_check=cdn_result,
-        js_rendering=js_result,
-        signals=signals,
-        brand_entity=brand_entity_result,
-        webmcp=webmcp_result,
-        negative_signals=negative_signals_result,
-        prompt_injection=prompt_injection_result,
-        trust_stack=trust_stack_result,
-    )
+def analyze_audit_inputs(inputs: AuditInputs, *, bots: dict | None = None, parser: str | None = None) -> AuditResult:
+    """Parse and analyze stages on fetched inputs: pure CPU, no I/O, safe in a worker process.
+
+    Args:
+        inputs: Output of ``fetch_audit_inputs`` / ``fetch_audit_inputs_async``.
+        bots: AI bots checked in robots.txt (default: ``AI_BOTS``; see ``_effective_bots``).
+        parser: HTML parser backend (see ``utils.html_parser``).
+    """
+    t0 = time.perf_counter() - inputs.fetch_seconds
+    page = _parse_homepage(inputs.response, parser)
+    result = _analyze(inputs.base_url, page, inputs.sidecars, inputs.cdn_result, bots if bots is not None else AI_BOTS)
+    return _finish(result, inputs.base_url, t0)
+
+
+# ─── Result cache ────────────────────────────────────────────────────────────
+#
+# analyze_audit_inputs is a pure function of the fetched inputs and the audit
+# configuration, so its result can be reused while none of them changes. The
+# fetch stage still runs (revalidated with ETag/Last-Modified when the HTTP
+# cache is on); a hit skips parse and analyze, the CPU-bound part of an audit.
+
+# Homepage headers the analyze stage reads (meta X-Robots-Tag, trust stack technical layer)
+_FINGERPRINT_HEADERS = ("content-security-policy", "strict-transport-security", "x-frame-options", "x-robots-tag")
+
 
-    # gap #10: brand sentiment analysis — opt-in, requires project_config.brand_name
-    _brand_name = getattr(project_config, "brand_name", None)
-    if _brand_name:
-        from geo_optimizer.core.audit_sentiment import audit_brand_sentiment
-
-        result.brand_sentiment = await asyncio.to_thread(
-            audit_brand_sentiment,
-            _brand_name,
-            provider=getattr(project_config, "llm_provider", None),
-            api_key=getattr(project_config, "llm_api_key", None),
-            model=getattr(project_config, "llm_model", None),
+def _plugin_signature() -> list[str]:
+    """Registered CheckRegistry plugins, as sorted ``module.Class:name`` strings."""
+    from geo_optimizer.core.registry import CheckRegistry
+
+    CheckRegistry.load_entry_points()
+    return sorted(f"{type(c).__module__}.{type(c).__qualname__}:{c.name}" for c in CheckRegistry.all())
+
+
+def _audit_config(*, bots: dict | None = None, parser: str | None = None) -> dict:
+    """What an audit result depends on besides the fetched content."""
+    from geo_optimizer import __version__
+
+    return {
+        "version": __version__,
+        "scoring": SCORING,
+        "plugins": _plugin_signature(),
+        "bots": bots if bots is not None else AI_BOTS,
+        "parser": resolve_html_parser(parser),
+    }
+
+
+def audit_config_key(*, bots: dict | None = None, parser: str | None = None) -> str:
+    """Key of the audit configuration alone (SHA-256 hex): version, scoring, plugins, bots, parser.
+
+    Results computed under a different key must not be reused, whatever the
+    content (see ``core.sitemap_state``).
+    """
+    config = _audit_config(bots=bots, parser=parser)
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def audit_fingerprint(
+    inputs: AuditInputs, *, bots: dict | None = None, parser: str | None = None, cdn: bool = True
+) -> str:
+    """Key of the result ``analyze_audit_inputs`` computes for ``inputs`` (SHA-256 hex).
+
+    Covers the homepage (status, body, the headers the audit reads), every
+    sidecar file, the CDN probe outcome, the bots and HTML parser, the plugin
+    set, the ``SCORING`` weights and the package version. Probe timings and
+    content lengths are left out: they change on every run, the result does not.
+    ``cdn=False`` leaves the CDN probe outcome out too, for inputs fetched
+    without the probes (``fetch_audit_inputs(..., cdn=False)``).
+    """
+    r = inputs.response
+    headers = {str(name).lower(): value for name, value in r.headers.items()}
+    config = {
+        **_audit_config(bots=bots, parser=parser),
+        "url": inputs.base_url,
+        "status": r.status_code,
+        "headers": {name: headers.get(name) for name in _FINGERPRINT_HEADERS},
+        "sidecars": {path: None if s is None else s.status_code for path, s in inputs.sidecars.items()},
+    }
+    if cdn:
+        probes = inputs.cdn_result
+        config["cdn"] = [
+            probes.checked,
+            probes.any_blocked,
+            probes.cdn_detected,
+            [[b.get("bot"), b.get("blocked"), b.get("challenge_detected")] for b in probes.bot_results],
+        ]
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode())
+    # Bodies are hashed length-prefixed, so no two different sets of bodies hash alike
+    for text in [r.text] + [s.text for _, s in sorted(inputs.sidecars.items()) if s is not None]:
+        body = text.encode("utf-8", "surrogatepass")
+        digest.update(b"%d:" % len(body))
+        digest.update(body)
+    return digest.hexdigest()
+
+
+def _analyze_with_cache(inputs: AuditInputs, result_cache, project_config=None) -> AuditResult:
+    """Analyze stage through ``result_cache``: computed and stored on a miss, reused on a hit."""
+    bots, parser = _effective_bots(project_config), _html_parser(project_config)
+    fingerprint = audit_fingerprint(inputs, bots=bots, parser=parser)
+    result = result_cache.get(fingerprint)
+    if result is None:
+        result = analyze_audit_inputs(inputs, bots=bots, parser=parser)
+        result_cache.put(fingerprint, inputs.base_url, result)
+        return result
+    # Same content, audited now: this run's timestamp, duration and probe details
+    result.timestamp = datetime.now(timezone.utc).isoformat()
+    result.cdn_check = inputs.cdn_result
+    return _finish(result, inputs.base_url, time.perf_counter() - inputs.fetch_seconds)
+
+
+def _audit_file_cache(use_cache: bool):
+    """Disk cache for the fetch stage, or None when caching is off."""
+    if not use_cache:
+        return None
+    from geo_optimizer.utils.cache import get_http_cache
+
+    return get_http_cache()
+
+
+def _audit_result_cache(use_cache: bool, result_cache=None):
+    """Result cache for the audit: the one passed in, else the shared one when caching is on."""
+    if result_cache is not None or not use_cache:
+        return result_cache
+    from geo_optimizer.utils.cache import get_result_cache
+
+    return get_result_cache()
+
+
+def run_full_audit(url: str, use_cache: bool = False, project_config=None, result_cache=None) -> AuditResult:
+    """Run complete audit and return AuditResult with all sub-results, score, band, and recommendations.
+
+    Args:
+        url: URL of the site to analyze.
+        use_cache: If True, use disk cache for HTTP requests and audit results.
+        project_config: Optional ProjectConfig — if it has extra_bots, merges them with AI_BOTS (fix #120);
+            ``audit.cdn_workers`` / ``audit.cdn_stop_on_challenge`` tune the CDN/WAF bot probes.
+        result_cache: ``AuditResultCache`` that skips the analysis of unchanged pages
+            (default: the shared one when ``use_cache`` is set, else none).
+    """
+    # One keep-alive pool for the fetches of this audit (reuses the batch pool when nested)
+    with http_pool():
+        fetcher = SyncAuditFetcher(cache=_audit_file_cache(use_cache), **cdn_probe_options(project_config))
+        return run_audit_pipeline(
+            url, fetcher, project_config=project_config, result_cache=_audit_result_cache(use_cache, result_cache)
         )
 
-    result.audit_duration_ms = int((time.perf_counter() - _t0) * 1000)
-    if result.audit_duration_ms > AUDIT_TIMEOUT_SECONDS * 1000:
-        logging.getLogger(__name__).warning(
-            "Audit exceeded %ds budget: %dms for %s", AUDIT_TIMEOUT_SECONDS, result.audit_duration_ms, base_url
+
+async def run_full_audit_async(
+    url: str, use_cache: bool = False, project_config=None, result_cache=None
+) -> AuditResult:
+    """Async variant of the full audit with parallel fetch (httpx).
+
+    Runs the homepage and all sidecar fetches in parallel, then the same
+    parse and analyze stages as ``run_full_audit``.
+
+    Args:
+        url: URL of the site to analyze.
+        use_cache: If True, use disk cache for HTTP requests and audit results.
+        project_config: Optional ProjectConfig — if it has extra_bots, merges them with AI_BOTS;
+            ``audit.cdn_workers`` / ``audit.cdn_stop_on_challenge`` tune the CDN/WAF bot probes.
+        result_cache: ``AuditResultCache`` that skips the analysis of unchanged pages
+            (default: the shared one when ``use_cache`` is set, else none).
+
+    Requires: pip install geo-optimizer-skill[async]
+    """
+    async with AsyncAuditFetcher(cache=_audit_file_cache(use_cache), **cdn_probe_options(project_config)) as fetcher:
+        return await run_audit_pipeline_async(
+            url, fetcher, project_config=project_config, result_cache=_audit_result_cache(use_cache, result_cache)
         )
-    return result
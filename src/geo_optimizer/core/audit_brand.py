@@ -9,6 +9,7 @@ from __future__ import annotations
 from collections import Counter
 from typing import TYPE_CHECKING
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.config import ABOUT_LINK_PATTERNS, BRAND_LEGAL_SUFFIXES, KG_PILLAR_DOMAINS
 from geo_optimizer.models.results import BrandEntityResult, ContentResult, MetaResult, SchemaResult
 
@@ -49,7 +50,11 @@ def _normalize_brand_name(name: str) -> str:
 
 
 def audit_brand_entity(
-    soup: BeautifulSoup | None, schema_result: SchemaResult, meta_result: MetaResult, content_result: ContentResult
+    soup: BeautifulSoup | None,
+    schema_result: SchemaResult,
+    meta_result: MetaResult,
+    content_result: ContentResult,
+    index: PageIndex | None = None,
 ) -> BrandEntityResult:
     """Analyze brand identity and entity signals for AI perception (v4.3).
 
@@ -60,6 +65,7 @@ def audit_brand_entity(
         schema_result: Already-computed SchemaResult.
         meta_result: Already-computed MetaResult.
         content_result: Already-computed ContentResult.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         BrandEntityResult with brand/entity signals populated.
@@ -67,15 +73,16 @@ def audit_brand_entity(
     result = BrandEntityResult()
     if soup is None:
         return result
+    idx = get_page_index(soup, index)
 
     # ── 1. Entity Coherence ──────────────────────────────────────
     # Collect brand names from different sources
     names = []
 
     # H1
-    h1 = soup.find("h1")
-    if h1 and h1.get_text(strip=True):
-        h1_text = h1.get_text(strip=True)
+    h1 = idx.find("h1")
+    if h1 and idx.text(h1, strip=True):
+        h1_text = idx.text(h1, strip=True)
         # Take the first part before common separators
         for sep in (" — ", " - ", " | ", " · "):
             if sep in h1_text:
@@ -95,7 +102,7 @@ def audit_brand_entity(
             names.append(title_name)
 
     # og:title
-    og_title = soup.find("meta", property="og:title")
+    og_title = idx.find("meta", property="og:title")
     if og_title and og_title.get("content", ""):
         og_name = og_title["content"]
         for sep in (" — ", " - ", " | ", " · "):
@@ -186,7 +193,7 @@ def audit_brand_entity(
 
     # ── 3. About/Contact Signals ─────────────────────────────────
     # Look for /about link in the page
-    for a_tag in soup.find_all("a", href=True):
+    for a_tag in idx.find_all("a", href=True):
         href = a_tag["href"].lower()
         if any(pattern in href for pattern in ABOUT_LINK_PATTERNS):
             result.has_about_link = True
@@ -208,7 +215,7 @@ def audit_brand_entity(
 
     # ── 4. Geographic Identity ───────────────────────────────────
     # Tag hreflang
-    hreflang_tags = soup.find_all("link", attrs={"rel": "alternate", "hreflang": True})
+    hreflang_tags = idx.find_all("link", attrs={"rel": "alternate", "hreflang": True})
     result.hreflang_count = len(hreflang_tags)
     result.has_hreflang = result.hreflang_count > 0
 
@@ -1,9 +1,186 @@
+"""
+CDN/WAF AI crawler check (#225).
+
+Sends a browser request as baseline, then one probe per AI bot User-Agent and
+compares status codes and body sizes. The bot probes are independent of each
+other, so they run concurrently: on a thread pool in ``audit_cdn_ai_crawler``
+and as coroutines in ``audit_cdn_ai_crawler_async``. Both variants connect
+only to the IP validated for the site (pinned session / pinned async client)
+and send every request once, so they report the same first answers. Inside a
+crawl (``use_fetch_scheduler()``) every request waits for its turn in the
+``FetchScheduler`` and reports its status to it, like ``fetch_url``: the
+probes respect Crawl-delay, the per-host cap and 429/503 backoff.
+"""
+
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from geo_optimizer.models.config import CDN_PROBE_WORKERS
 from geo_optimizer.models.results import CdnAiCrawlerResult
+from geo_optimizer.utils.politeness import active_scheduler
+
+# AI bots to test (most impactful for citations)
+_TEST_BOTS = {
+    "GPTBot": (
+        "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; GPTBot/1.2; +https://openai.com/gptbot)"
+    ),
+    "OAI-SearchBot": (
+        "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; OAI-SearchBot/1.0; "
+        "+https://openai.com/searchbot)"
+    ),
+    "PerplexityBot": (
+        "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; PerplexityBot/1.0; "
+        "+https://perplexity.ai/perplexitybot)"
+    ),
+    "Claude-SearchBot": (
+        "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; Claude-SearchBot/1.0; "
+        "+https://www.anthropic.com/claude-searchbot)"
+    ),
+    "Googlebot": "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+    "Applebot": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_6) AppleWebKit/605.1.15 (KHTML, like Gecko) "
+        "Version/13.1.1 Safari/605.1.15 (Applebot/0.1; +http://www.apple.com/go/applebot)"
+    ),
+}
+
+_BROWSER_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Challenge page indicators (Cloudflare, AWS WAF, etc.)
+_CHALLENGE_INDICATORS = [
+    "cf-browser-verification",
+    "challenge-platform",
+    "just a moment",
+    "checking your browser",
+    "ray id",
+    "access denied",
+    "bot detection",
+    "captcha",
+    "blocked",
+    "forbidden",
+]
+
+# CDN detection headers
+_CDN_HEADER_MAP = {
+    "cf-ray": "cloudflare",
+    "cf-cache-status": "cloudflare",
+    "x-amz-cf-id": "aws-cloudfront",
+    "x-amz-request-id": "aws",
+    "x-akamai-transformed": "akamai",
+    "x-cdn": "",  # generic CDN
+    "x-served-by": "",  # Fastly/Varnish
+    "x-vercel-id": "vercel",
+    "server": "",  # check value
+}
+
+# Fix #348: size check to avoid OOM on oversized responses
+_MAX_BROWSER_BODY = 5 * 1024 * 1024  # 5 MB
+
+_PROBE_TIMEOUT = 10
+
+
+def _record_browser_baseline(result: CdnAiCrawlerResult, status: int, text: str, headers) -> None:
+    """Store the browser baseline and detect the CDN from its response headers."""
+    result.browser_status = status
+    result.browser_content_length = len(text)
+
+    resp_headers = {k.lower(): v for k, v in headers.items()}
+    for header_key, cdn_name in _CDN_HEADER_MAP.items():
+        if header_key in resp_headers:
+            result.cdn_headers[header_key] = resp_headers[header_key]
+            if cdn_name and not result.cdn_detected:
+                result.cdn_detected = cdn_name
+    # Check server header for CDN names
+    server_val = resp_headers.get("server", "").lower()
+    if "cloudflare" in server_val:
+        result.cdn_detected = "cloudflare"
+    elif "akamaighost" in server_val or "akamai" in server_val:
+        result.cdn_detected = "akamai"
+
+
+def _new_bot_entry(bot_name: str) -> dict:
+    return {
+        "bot": bot_name,
+        "status": 0,
+        "content_length": 0,
+        "blocked": False,
+        "challenge_detected": False,
+        "elapsed_ms": 0,
+    }
+
+
+def _evaluate_bot_response(entry: dict, status: int, text: str, result: CdnAiCrawlerResult) -> None:
+    """Fill a bot entry from its probe response, comparing it to the browser baseline."""
+    entry["status"] = status
+    entry["content_length"] = len(text)
+
+    # Check 1: HTTP error status
+    if status in (403, 429, 451, 503):
+        entry["blocked"] = True
 
+    # Check 2: Challenge/captcha page detection
+    body_lower = text[:5000].lower()
+    if any(indicator in body_lower for indicator in _CHALLENGE_INDICATORS):
+        entry["challenge_detected"] = True
 
-def audit_cdn_ai_crawler(base_url: str) -> CdnAiCrawlerResult:
+    # Check 3: Content-length mismatch (>70% difference → probable block)
+    if (
+        result.browser_content_length > 0
+        and entry["content_length"] > 0
+        and result.browser_status == 200
+        and status == 200
+    ):
+        ratio = entry["content_length"] / result.browser_content_length
+        if ratio < 0.3:
+            # Bot receives <30% of the content → likely a block page
+            entry["blocked"] = True
+
+
+def _scheduled_get(session, url: str, user_agent: str):
+    """One probe request, paced by the active ``FetchScheduler`` if any.
+
+    The status is reported to the scheduler (a 429/503 backs the host off)
+    but never retried: the first answer is what the probe measures.
+    """
+    scheduler = active_scheduler()
+    kwargs = {"headers": {"User-Agent": user_agent}, "timeout": _PROBE_TIMEOUT, "allow_redirects": False}
+    if scheduler is None:
+        return session.get(url, **kwargs)
+    with scheduler.slot(url):
+        r = session.get(url, **kwargs)
+    scheduler.record(url, r.status_code, r.headers.get("Retry-After"))
+    return r
+
+
+async def _scheduled_get_async(client, url: str, user_agent: str):
+    """Async counterpart of ``_scheduled_get``."""
+    scheduler = active_scheduler()
+    if scheduler is None:
+        return await client.get(url, headers={"User-Agent": user_agent}, timeout=_PROBE_TIMEOUT)
+    async with scheduler.slot_async(url):
+        r = await client.get(url, headers={"User-Agent": user_agent}, timeout=_PROBE_TIMEOUT)
+    scheduler.record(url, r.status_code, r.headers.get("retry-after"))
+    return r
+
+
+def _finalize(result: CdnAiCrawlerResult, entries: dict[str, dict], aborted: bool) -> None:
+    """Store bot entries in roster order and compute the summary flags."""
+    result.bot_results = [entries[bot] for bot in _TEST_BOTS if bot in entries]
+    result.early_abort = aborted
+    result.checked = True
+    result.any_blocked = any(b["blocked"] or b["challenge_detected"] for b in result.bot_results)
+
+
+def audit_cdn_ai_crawler(
+    base_url: str,
+    max_workers: int = CDN_PROBE_WORKERS,
+    stop_on_challenge: bool = False,
+) -> CdnAiCrawlerResult:
     """Check if CDN/WAF blocks AI crawler user-agents (#225).
 
     Simulates requests with the AI bot User-Agents that actually drive AI
@@ -17,70 +194,15 @@ def audit_cdn_ai_crawler(base_url: str) -> CdnAiCrawlerResult:
 
     Args:
         base_url: Base URL of the site (normalized).
+        max_workers: Bot probes sent concurrently (1 = sequential).
+        stop_on_challenge: Stop sending probes once one bot gets a WAF
+            challenge page; probes not yet sent are left out of ``bot_results``.
 
     Returns:
-        CdnAiCrawlerResult with per-bot comparison data.
+        CdnAiCrawlerResult with per-bot comparison data and per-probe timing.
     """
-    from geo_optimizer.models.results import CdnAiCrawlerResult
-
     result = CdnAiCrawlerResult()
 
-    # AI bots to test (most impactful for citations)
-    test_bots = {
-        "GPTBot": (
-            "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; GPTBot/1.2; +https://openai.com/gptbot)"
-        ),
-        "OAI-SearchBot": (
-            "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; OAI-SearchBot/1.0; "
-            "+https://openai.com/searchbot)"
-        ),
-        "PerplexityBot": (
-            "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; PerplexityBot/1.0; "
-            "+https://perplexity.ai/perplexitybot)"
-        ),
-        "Claude-SearchBot": (
-            "Mozilla/5.0 AppleWebKit/537.36 (KHTML, like Gecko; compatible; Claude-SearchBot/1.0; "
-            "+https://www.anthropic.com/claude-searchbot)"
-        ),
-        "Googlebot": "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
-        "Applebot": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_6) AppleWebKit/605.1.15 (KHTML, like Gecko) "
-            "Version/13.1.1 Safari/605.1.15 (Applebot/0.1; +http://www.apple.com/go/applebot)"
-        ),
-    }
-
-    browser_ua = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
-
-    # Challenge page indicators (Cloudflare, AWS WAF, etc.)
-    challenge_indicators = [
-        "cf-browser-verification",
-        "challenge-platform",
-        "just a moment",
-        "checking your browser",
-        "ray id",
-        "access denied",
-        "bot detection",
-        "captcha",
-        "blocked",
-        "forbidden",
-    ]
-
-    # CDN detection headers
-    cdn_header_map = {
-        "cf-ray": "cloudflare",
-        "cf-cache-status": "cloudflare",
-        "x-amz-cf-id": "aws-cloudfront",
-        "x-amz-request-id": "aws",
-        "x-akamai-transformed": "akamai",
-        "x-cdn": "",  # generic CDN
-        "x-served-by": "",  # Fastly/Varnish
-        "x-vercel-id": "vercel",
-        "server": "",  # check value
-    }
-
     from geo_optimizer.utils.http import create_session_with_retry
     from geo_optimizer.utils.validators import resolve_and_validate_url
 
@@ -91,92 +213,160 @@ def audit_cdn_ai_crawler(base_url: str) -> CdnAiCrawlerResult:
         result.error = f"Unsafe URL: {reason}"
         return result
 
-    # Session with DNS pinning — all requests use pre-validated IPs
-    session = create_session_with_retry(total_retries=1, pinned_ips=pinned_ips)
+    # Session with DNS pinning — all requests use pre-validated IPs. No retries,
+    # as in the async variant: a retried 429/503 would hide the block being probed
+    session = create_session_with_retry(total_retries=0, pinned_ips=pinned_ips)
+
+    def _probe(bot_name: str, bot_ua: str) -> dict:
+        entry = _new_bot_entry(bot_name)
+        t0 = time.perf_counter()
+        try:
+            bot_r = _scheduled_get(session, base_url, bot_ua)
+            _evaluate_bot_response(entry, bot_r.status_code, bot_r.text, result)
+        except Exception:
+            entry["blocked"] = True
+        entry["elapsed_ms"] = int((time.perf_counter() - t0) * 1000)
+        return entry
 
     try:
         # Step 1: Browser request (baseline)
         try:
-            browser_r = session.get(
-                base_url,
-                headers={"User-Agent": browser_ua},
-                timeout=10,
-                allow_redirects=False,
-            )
-            result.browser_status = browser_r.status_code
-            # Fix #348: size check to avoid OOM on oversized responses
-            if len(browser_r.content) > 5 * 1024 * 1024:  # 5 MB
+            browser_r = _scheduled_get(session, base_url, _BROWSER_UA)
+            if len(browser_r.content) > _MAX_BROWSER_BODY:
+                result.browser_status = browser_r.status_code
                 result.error = "Response too large for CDN check"
                 return result
-            result.browser_content_length = len(browser_r.text)
-
-            # Detect CDN from headers
-            resp_headers = {k.lower(): v for k, v in browser_r.headers.items()}
-            for header_key, cdn_name in cdn_header_map.items():
-                if header_key in resp_headers:
-                    result.cdn_headers[header_key] = resp_headers[header_key]
-                    if cdn_name and not result.cdn_detected:
-                        result.cdn_detected = cdn_name
-            # Check server header for CDN names
-            server_val = resp_headers.get("server", "").lower()
-            if "cloudflare" in server_val:
-                result.cdn_detected = "cloudflare"
-            elif "akamaighost" in server_val or "akamai" in server_val:
-                result.cdn_detected = "akamai"
-
+            _record_browser_baseline(result, browser_r.status_code, browser_r.text, browser_r.headers)
         except Exception:
             # Not reachable even as a browser — skip check
             return result
 
-        # Step 2: AI bot requests
-        for bot_name, bot_ua in test_bots.items():
-            bot_entry = {
-                "bot": bot_name,
-                "status": 0,
-                "content_length": 0,
-                "blocked": False,
-                "challenge_detected": False,
+        # Step 2: AI bot probes, fanned out over max_workers threads (with this
+        # context: the scheduler and the crawl's queue clock)
+        entries: dict[str, dict] = {}
+        aborted = False
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="geo-cdn") as executor:
+            pending = {
+                executor.submit(contextvars.copy_context().run, _probe, name, ua) for name, ua in _TEST_BOTS.items()
             }
-            try:
-                bot_r = session.get(
-                    base_url,
-                    headers={"User-Agent": bot_ua},
-                    timeout=10,
-                    allow_redirects=False,
-                )
-                bot_entry["status"] = bot_r.status_code
-                bot_entry["content_length"] = len(bot_r.text)
-
-                # Check 1: HTTP error status
-                if bot_r.status_code in (403, 429, 451, 503):
-                    bot_entry["blocked"] = True
-
-                # Check 2: Challenge/captcha page detection
-                body_lower = bot_r.text[:5000].lower()
-                if any(indicator in body_lower for indicator in challenge_indicators):
-                    bot_entry["challenge_detected"] = True
-
-                # Check 3: Content-length mismatch (>70% difference → probable block)
-                if (
-                    result.browser_content_length > 0
-                    and bot_entry["content_length"] > 0
-                    and result.browser_status == 200
-                    and bot_r.status_code == 200
-                ):
-                    ratio = bot_entry["content_length"] / result.browser_content_length
-                    if ratio < 0.3:
-                        # Bot receives <30% of the content → likely a block page
-                        bot_entry["blocked"] = True
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = future.result()
+                    entries[entry["bot"]] = entry
+                if stop_on_challenge and any(e["challenge_detected"] for e in entries.values()):
+                    # Probes already running finish; queued ones are never sent
+                    for future in pending:
+                        future.cancel()
+                    for future in pending:
+                        if not future.cancelled():
+                            entry = future.result()
+                            entries[entry["bot"]] = entry
+                    aborted = len(entries) < len(_TEST_BOTS)
+                    break
+
+        _finalize(result, entries, aborted)
+
+    except Exception:
+        pass
+    finally:
+        session.close()
+
+    return result
 
+
+async def audit_cdn_ai_crawler_async(
+    base_url: str,
+    client=None,
+    max_concurrency: int = CDN_PROBE_WORKERS,
+    stop_on_challenge: bool = False,
+) -> CdnAiCrawlerResult:
+    """Async-native variant of ``audit_cdn_ai_crawler`` (httpx).
+
+    Same checks and result shape; the bot probes run as coroutines bounded by
+    ``max_concurrency``. Requests go through a ``create_async_client()``
+    client (the batch one from ``use_async_client()`` when active) with the
+    validated IP pinned in ``_pinning_ctx``, like ``fetch_url_async``: the
+    transport refuses any host without a pin.
+
+    Args:
+        base_url: Base URL of the site (normalized).
+        client: Optional httpx.AsyncClient (reuses connections). Only clients
+            from ``create_async_client()`` enforce DNS pinning.
+        max_concurrency: Bot probes in flight at the same time.
+        stop_on_challenge: Cancel the remaining probes once one bot gets a
+            WAF challenge page.
+
+    Requires: pip install geo-optimizer-skill[async]
+    """
+    from geo_optimizer.utils.http_async import _active_client, _pinning_ctx, _pins_for, create_async_client
+    from geo_optimizer.utils.validators import resolve_and_validate_url_async
+
+    result = CdnAiCrawlerResult()
+
+    # Fix #283 + #305: SSRF validation with DNS pinning, off the event loop
+    is_safe, reason, pinned_ips = await resolve_and_validate_url_async(base_url)
+    if not is_safe:
+        result.error = f"Unsafe URL: {reason}"
+        return result
+
+    if client is None:
+        client = _active_client.get()
+    own_client = client is None
+    if own_client:
+        client = create_async_client(timeout=_PROBE_TIMEOUT)
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _probe(bot_name: str, bot_ua: str) -> dict:
+        entry = _new_bot_entry(bot_name)
+        async with semaphore:
+            t0 = time.perf_counter()
+            try:
+                bot_r = await _scheduled_get_async(client, base_url, bot_ua)
+                _evaluate_bot_response(entry, bot_r.status_code, bot_r.text, result)
             except Exception:
-                bot_entry["blocked"] = True
+                entry["blocked"] = True
+            entry["elapsed_ms"] = int((time.perf_counter() - t0) * 1000)
+        return entry
 
-            result.bot_results.append(bot_entry)
+    # Fix H-1: the pin lives in this task's context, copied into the probe tasks
+    token = _pinning_ctx.set(_pins_for(base_url, pinned_ips))
+    try:
+        # Step 1: Browser request (baseline)
+        try:
+            browser_r = await _scheduled_get_async(client, base_url, _BROWSER_UA)
+            if len(browser_r.content) > _MAX_BROWSER_BODY:
+                result.browser_status = browser_r.status_code
+                result.error = "Response too large for CDN check"
+                return result
+            _record_browser_baseline(result, browser_r.status_code, browser_r.text, browser_r.headers)
+        except Exception:
+            return result
+
+        # Step 2: AI bot probes as bounded concurrent tasks
+        entries: dict[str, dict] = {}
+        aborted = False
+        tasks = [asyncio.ensure_future(_probe(name, ua)) for name, ua in _TEST_BOTS.items()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                entry = await next_done
+                entries[entry["bot"]] = entry
+                if stop_on_challenge and entry["challenge_detected"]:
+                    aborted = len(entries) < len(_TEST_BOTS)
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        result.checked = True
-        result.any_blocked = any(b["blocked"] or b["challenge_detected"] for b in result.bot_results)
+        _finalize(result, entries, aborted)
 
     except Exception:
         pass
+    finally:
+        _pinning_ctx.reset(token)
+        if own_client:
+            await client.aclose()
 
     return result
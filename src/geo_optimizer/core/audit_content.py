@@ -4,6 +4,7 @@ import re
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import ContentResult
 
 if TYPE_CHECKING:
@@ -11,44 +12,43 @@ if TYPE_CHECKING:
 
 
 def audit_content_quality(
-    soup: BeautifulSoup | None, url: str, soup_clean: BeautifulSoup | None = None
+    soup: BeautifulSoup | None,
+    url: str,
+    soup_clean: BeautifulSoup | None = None,
+    index: PageIndex | None = None,
 ) -> ContentResult:
     """Check content quality for GEO. Returns ContentResult.
 
     Args:
         soup: BeautifulSoup dell'HTML originale.
         url: URL della pagina.
-        soup_clean: (optional) BeautifulSoup pre-cleaned (no script/style).
-                    Se fornito, evita il re-parse dell'HTML (fix #285).
+        soup_clean: Ignored, kept for backward compatibility (fix #285).
+        index: (optional) PageIndex di ``soup`` condiviso con gli altri sub-audit.
+               get_text() ignora gia' script/style, quindi il testo coincide
+               con quello della vecchia copia pulita senza alcuna deepcopy.
     """
-    import copy
-
     result = ContentResult()
 
     # Fix H-8: guard against None soup (defensive — called from plugins/tests)
     if soup is None:
         return result
 
+    idx = get_page_index(soup, index)
+
     # H1
-    h1 = soup.find("h1")
+    h1 = idx.find("h1")
     if h1:
         result.has_h1 = True
         result.h1_text = h1.text.strip()
 
     # Headings
-    headings = soup.find_all(["h1", "h2", "h3", "h4"])
+    headings = idx.find_all(["h1", "h2", "h3", "h4"])
     result.heading_count = len(headings)
 
-    # Fix #285: use pre-computed soup_clean if available, otherwise create a copy
-    # Use copy.deepcopy() instead of BS(str(soup)) to avoid costly re-parsing
-    if soup_clean is None:
-        soup_clean = copy.deepcopy(soup)
-        for tag in soup_clean(["script", "style"]):
-            tag.decompose()
-
     # Fix #107: separator=" " prevents word concatenation from adjacent tags
     # Example: <span>Hello</span><span>World</span> → "Hello World" instead of "HelloWorld"
-    body_text = soup_clean.get_text(separator=" ", strip=True)
+    # script/style strings are skipped by get_text(), so no cleaned copy is needed
+    body_text = idx.text(separator=" ", strip=True)
     numbers = re.findall(r"\b\d+[%\u20ac$\u00a3]|\b\d+\.\d+|\b\d{3,}\b", body_text)
     result.numbers_count = len(numbers)
     if len(numbers) >= 3:
@@ -61,7 +61,7 @@ def audit_content_quality(
     # External links (citations)
     parsed = urlparse(url)
     base_domain = parsed.netloc
-    all_links = soup.find_all("a", href=True)
+    all_links = idx.find_all("a", href=True)
     # Fix F-08: guard against empty base_domain (malformed URL)
     if base_domain:
         external_links = [
@@ -74,13 +74,14 @@ def audit_content_quality(
         result.has_links = True
 
     # Heading hierarchy: both H2 and H3 present
-    h2_tags = soup_clean.find_all("h2")
-    h3_tags = soup_clean.find_all("h3")
+    # (script/style never contain tags, so the index sees the same headings)
+    h2_tags = idx.find_all("h2")
+    h3_tags = idx.find_all("h3")
     if h2_tags and h3_tags:
         result.has_heading_hierarchy = True
 
     # Lists or tables
-    lists = soup_clean.find_all(["ul", "ol", "table"])
+    lists = idx.find_all(["ul", "ol", "table"])
     if lists:
         result.has_lists_or_tables = True
 
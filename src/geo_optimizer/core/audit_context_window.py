@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import re
 
+from geo_optimizer.core.page_index import PageIndex
 from geo_optimizer.models.results import ContextWindowResult
 
 # Token estimation: ~1.3 tokens per English word (OpenAI tokenizer average)
@@ -50,21 +51,28 @@ _KEY_INFO_RE = re.compile(
 )
 
 
-def audit_context_window(soup, soup_clean=None) -> ContextWindowResult:
+def audit_context_window(soup, soup_clean=None, index: PageIndex | None = None) -> ContextWindowResult:
     """Analyze content for context window utilization efficiency.
 
     Args:
         soup: BeautifulSoup of the full HTML document.
         soup_clean: Optional pre-cleaned soup (scripts/styles removed).
+        index: Optional PageIndex of ``soup`` (memoized body text).
 
     Returns:
         ContextWindowResult with efficiency metrics.
     """
-    body = (soup_clean or soup).find("body") if soup else None
+    if index is not None and index.soup is soup:
+        # get_text() never returns script/style strings, so the original
+        # soup reads the same text as soup_clean
+        body = index.find("body")
+        text = index.text(body, separator=" ", strip=True) if body else ""
+    else:
+        body = (soup_clean or soup).find("body") if soup else None
+        text = body.get_text(separator=" ", strip=True) if body else ""
     if not body:
         return ContextWindowResult(checked=True)
 
-    text = body.get_text(separator=" ", strip=True)
     words = text.split()
     total_words = len(words)
 
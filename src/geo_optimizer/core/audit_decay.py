@@ -14,6 +14,7 @@ from __future__ import annotations
 import re
 from datetime import datetime, timezone
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import ContentDecayResult, DecaySignal
 
 # ─── Patterns ────────────────────────────────────────────────────────────────
@@ -50,19 +51,21 @@ _SUGGESTIONS = {
 }
 
 
-def audit_content_decay(soup, clean_text: str | None = None) -> ContentDecayResult:
+def audit_content_decay(soup, clean_text: str | None = None, index: PageIndex | None = None) -> ContentDecayResult:
     """Predict content decay from temporal patterns in page text.
 
     Args:
         soup: BeautifulSoup of the HTML document.
         clean_text: Optional pre-extracted body text.
+        index: Optional PageIndex of ``soup`` (memoized body text).
 
     Returns:
         ContentDecayResult with decay signals and evergreen score.
     """
     if clean_text is None:
-        body = soup.find("body") if soup else None
-        clean_text = body.get_text(separator=" ", strip=True) if body else ""
+        idx = get_page_index(soup, index) if soup else None
+        body = idx.find("body") if idx else None
+        clean_text = idx.text(body, separator=" ", strip=True) if body else ""
 
     if not clean_text:
         return ContentDecayResult(checked=True)
@@ -13,11 +13,13 @@ from __future__ import annotations
 import logging
 import re
 
+from geo_optimizer.core.page_index import PageIndex
 from geo_optimizer.models.results import EmbeddingProximityResult
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_MODEL = "all-MiniLM-L6-v2"
+_HEADING_RE = re.compile(r"^h[1-6]$")
 _RETRIEVAL_THRESHOLD = 0.45
 
 # Representative queries that a RAG system might use to retrieve content
@@ -35,6 +37,7 @@ def audit_embedding_proximity(
     soup_clean=None,
     model_name: str = _DEFAULT_MODEL,
     queries: list[str] | None = None,
+    index: PageIndex | None = None,
 ) -> EmbeddingProximityResult:
     """Compute embedding similarity between page chunks and sample queries.
 
@@ -43,6 +46,7 @@ def audit_embedding_proximity(
         soup_clean: Optional pre-cleaned soup (scripts/styles removed).
         model_name: Sentence-transformer model name.
         queries: Custom queries (defaults to _SAMPLE_QUERIES).
+        index: Optional PageIndex of ``soup`` (reuses its heading sections).
 
     Returns:
         EmbeddingProximityResult with similarity scores.
@@ -55,11 +59,16 @@ def audit_embedding_proximity(
             skipped_reason="sentence-transformers not installed (pip install geo-optimizer-skill[embedding])",
         )
 
-    body = (soup_clean or soup).find("body") if soup else None
-    if not body:
-        return EmbeddingProximityResult(checked=True, skipped_reason="No body content")
-
-    chunks = _extract_chunks(body)
+    if index is not None and index.soup is soup:
+        body = index.find("body")
+        if not body:
+            return EmbeddingProximityResult(checked=True, skipped_reason="No body content")
+        chunks = _extract_chunks(body, index)
+    else:
+        body = (soup_clean or soup).find("body") if soup else None
+        if not body:
+            return EmbeddingProximityResult(checked=True, skipped_reason="No body content")
+        chunks = _extract_chunks(body)
     if not chunks:
         return EmbeddingProximityResult(checked=True, skipped_reason="No text chunks found")
 
@@ -107,17 +116,27 @@ def audit_embedding_proximity(
     )
 
 
-def _extract_chunks(body) -> list[str]:
+def _extract_chunks(body, index: PageIndex | None = None) -> list[str]:
     """Extract text chunks from body, split by headings or paragraphs."""
-    headings = body.find_all(re.compile(r"^h[1-6]$"))
+    if index is not None:
+        if index.find(_HEADING_RE, within=body):
+            return [text for text in index.sections(body) if len(text.split()) >= 10]
+        return [
+            index.text(p, " ", True)
+            for p in index.find_all("p", within=body)
+            if len(index.text(p, strip=True).split()) >= 10
+        ]
+
+    headings = body.find_all(_HEADING_RE)
 
     if headings:
-        headings_set = set(headings)
+        # Identity set: Tag.__hash__ serialises the whole subtree
+        heading_ids = {id(h) for h in headings}
         chunks: list[str] = []
         for heading in headings:
             parts: list[str] = []
             for sibling in heading.next_siblings:
-                if sibling in headings_set:
+                if id(sibling) in heading_ids:
                     break
                 t = (
                     sibling.get_text(separator=" ", strip=True)
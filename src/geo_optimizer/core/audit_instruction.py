@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import re
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import InstructionReadinessResult
 
 # Elements that represent interactive actions
@@ -39,12 +40,13 @@ _INPUT_TYPES_EXPLICIT = {
 }
 
 
-def audit_instruction_readiness(soup, raw_html: str = "") -> InstructionReadinessResult:
+def audit_instruction_readiness(soup, raw_html: str = "", index: PageIndex | None = None) -> InstructionReadinessResult:
     """Analyze page for AI agent instruction following readiness.
 
     Args:
         soup: BeautifulSoup of the full HTML document.
         raw_html: Raw HTML string for pattern matching.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         InstructionReadinessResult with readiness metrics.
@@ -52,23 +54,26 @@ def audit_instruction_readiness(soup, raw_html: str = "") -> InstructionReadines
     if not soup:
         return InstructionReadinessResult(checked=True)
 
-    body = soup.find("body")
+    idx = get_page_index(soup, index)
+    body = idx.find("body")
     if not body:
         return InstructionReadinessResult(checked=True)
 
     # 1. Action clarity: buttons and links with descriptive text
-    labeled, unlabeled = _analyze_actions(body)
+    labeled, unlabeled = _analyze_actions(body, idx)
 
     # 2. Form machine-readability
-    total_inputs, labeled_inputs, typed_inputs = _analyze_forms(body)
+    total_inputs, labeled_inputs, typed_inputs = _analyze_forms(body, idx)
 
     # 3. Workflow linearity
-    nav_links = len(body.find_all("a", href=True))
-    stateful_urls = bool(body.find("a", href=re.compile(r"[?#]")))
+    nav_links = len(idx.find_all("a", href=True, within=body))
+    stateful_urls = bool(idx.find("a", href=re.compile(r"[?#]"), within=body))
 
     # 4. Error recovery
-    has_aria_live = bool(body.find(attrs={"aria-live": True}))
-    has_error_roles = bool(body.find(attrs={"role": "alert"}) or body.find(attrs={"aria-invalid": True}))
+    has_aria_live = bool(idx.find(attrs={"aria-live": True}, within=body))
+    has_error_roles = bool(
+        idx.find(attrs={"role": "alert"}, within=body) or idx.find(attrs={"aria-invalid": True}, within=body)
+    )
 
     # Compute sub-scores
     action_score = _action_clarity_score(labeled, unlabeled)
@@ -100,23 +105,23 @@ def audit_instruction_readiness(soup, raw_html: str = "") -> InstructionReadines
     )
 
 
-def _analyze_actions(body) -> tuple[int, int]:
+def _analyze_actions(body, idx: PageIndex) -> tuple[int, int]:
     """Count labeled vs unlabeled interactive elements."""
     labeled = 0
     unlabeled = 0
 
-    for btn in body.find_all("button"):
-        if _has_label(btn):
+    for btn in idx.find_all("button", within=body):
+        if _has_label(btn, idx):
             labeled += 1
         else:
             unlabeled += 1
 
     # Links that look like CTAs (role=button or class containing btn/button/cta)
-    for a in body.find_all("a", href=True):
+    for a in idx.find_all("a", href=True, within=body):
         role = (a.get("role") or "").lower()
         classes = " ".join(a.get("class", []))
         if role == "button" or re.search(r"\b(?:btn|button|cta)\b", classes, re.IGNORECASE):
-            if _has_label(a):
+            if _has_label(a, idx):
                 labeled += 1
             else:
                 unlabeled += 1
@@ -124,10 +129,10 @@ def _analyze_actions(body) -> tuple[int, int]:
     return labeled, unlabeled
 
 
-def _has_label(el) -> bool:
+def _has_label(el, idx: PageIndex) -> bool:
     """Check if an element has descriptive text for an AI agent."""
     # Direct text content (stripped, min 2 chars to exclude icon-only)
-    text = el.get_text(strip=True)
+    text = idx.text(el, strip=True)
     if len(text) >= 2:
         return True
     # aria-label
@@ -137,9 +142,9 @@ def _has_label(el) -> bool:
     return bool(el.get("title"))
 
 
-def _analyze_forms(body) -> tuple[int, int, int]:
+def _analyze_forms(body, idx: PageIndex) -> tuple[int, int, int]:
     """Analyze form inputs for machine-readability."""
-    inputs = body.find_all(["input", "select", "textarea"])
+    inputs = idx.find_all(["input", "select", "textarea"], within=body)
     total = 0
     labeled = 0
     typed = 0
@@ -152,7 +157,7 @@ def _analyze_forms(body) -> tuple[int, int, int]:
         total += 1
 
         # Check if labeled
-        if _input_has_label(inp, body):
+        if _input_has_label(inp, body, idx):
             labeled += 1
 
         # Check if explicitly typed
@@ -162,7 +167,7 @@ def _analyze_forms(body) -> tuple[int, int, int]:
     return total, labeled, typed
 
 
-def _input_has_label(inp, body) -> bool:
+def _input_has_label(inp, body, idx: PageIndex) -> bool:
     """Check if an input has an associated label."""
     # aria-label or aria-labelledby
     if inp.get("aria-label") or inp.get("aria-labelledby"):
@@ -172,7 +177,7 @@ def _input_has_label(inp, body) -> bool:
         return True
     # Explicit <label for="id">
     inp_id = inp.get("id")
-    if inp_id and body.find("label", attrs={"for": inp_id}):
+    if inp_id and idx.find("label", attrs={"for": inp_id}, within=body):
         return True
     # Wrapping <label>
     return bool(inp.find_parent("label"))
@@ -6,13 +6,15 @@ Extracted from core/audit.py for maintainability (#402).
 
 from __future__ import annotations
 
-import copy
-
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.config import JS_CRITICAL_WORDS, JS_EMPTY_ROOT_CHARS, JS_EMPTY_ROOT_WORDS, JS_SPA_WORDS
 from geo_optimizer.models.results import JsRenderingResult
 
+# Elements whose text a crawler that doesn't run JS never shows as content
+_NON_RENDERED_TAGS = ("script", "style", "noscript")
+
 
-def audit_js_rendering(soup, raw_html: str) -> JsRenderingResult:
+def audit_js_rendering(soup, raw_html: str, index: PageIndex | None = None) -> JsRenderingResult:
     """Check if page content is accessible without JavaScript (#226).
 
     Analyzes raw HTML (as fetched by requests, without JS execution) for
@@ -24,6 +26,7 @@ def audit_js_rendering(soup, raw_html: str) -> JsRenderingResult:
     Args:
         soup: BeautifulSoup of the page (parsed from raw HTML).
         raw_html: Raw HTML string of the page.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         JsRenderingResult with content analysis.
@@ -35,24 +38,28 @@ def audit_js_rendering(soup, raw_html: str) -> JsRenderingResult:
 
     result.checked = True
 
+    idx = get_page_index(soup, index)
+
     # Extract body text (excluding script/style tags)
-    body = soup.find("body")
+    body = idx.find("body")
     if not body:
         result.js_dependent = True
         result.details = "No <body> tag found in raw HTML"
         return result
 
-    # Fix #24: use deepcopy to avoid mutating the original soup
-    # (audit_citability needs the <script type="application/ld+json"> tags intact)
-    body_clean = copy.deepcopy(body)
-    for tag in body_clean.find_all(["script", "style", "noscript"]):
-        tag.decompose()
+    # Fix #24: never mutate the shared soup (audit_citability needs the
+    # <script type="application/ld+json"> tags intact). The index reads the
+    # body as if script/style/noscript were decomposed, without copying it.
+    hidden = idx.find_all(list(_NON_RENDERED_TAGS), within=body)
+
+    def _rendered(tag) -> bool:
+        return not any(idx.contains(h, tag) for h in hidden)
 
-    body_text = body_clean.get_text(separator=" ", strip=True)
+    body_text = idx.text(body, separator=" ", strip=True, exclude=_NON_RENDERED_TAGS)
     result.raw_word_count = len(body_text.split())
 
-    # Count headings in raw HTML (from clean body, fix #24)
-    headings = body_clean.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
+    # Count headings in raw HTML (outside script/style/noscript, fix #24)
+    headings = [h for h in idx.find_all(["h1", "h2", "h3", "h4", "h5", "h6"], within=body) if _rendered(h)]
     result.raw_heading_count = len(headings)
 
     # Check for empty SPA root containers
@@ -64,19 +71,19 @@ def audit_js_rendering(soup, raw_html: str) -> JsRenderingResult:
         ("div", {"id": "gatsby-focus-wrapper"}),
     ]
     for tag_name, attrs in spa_indicators:
-        el = body_clean.find(tag_name, attrs)
+        el = next((t for t in idx.find_all(tag_name, attrs, within=body) if _rendered(t)), None)
         if el:
             # Check if element is essentially empty (< 50 chars of text)
-            inner_text = el.get_text(strip=True)
+            inner_text = idx.text(el, strip=True, exclude=_NON_RENDERED_TAGS)
             if len(inner_text) < JS_EMPTY_ROOT_CHARS:
                 result.has_empty_root = True
                 break
 
     # Check <noscript> content
     # Fix #27: use the original soup (not mutated, thanks to fix #24)
-    noscript_tags = soup.find_all("noscript")
+    noscript_tags = idx.find_all("noscript")
     for ns in noscript_tags:
-        ns_text = ns.get_text(strip=True)
+        ns_text = idx.text(ns, strip=True)
         if len(ns_text) > 20:
             result.has_noscript_content = True
             break
@@ -8,42 +8,44 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import MetaResult
 
 if TYPE_CHECKING:
     from bs4 import BeautifulSoup
 
 
-def audit_meta_tags(soup: BeautifulSoup | None, url: str) -> MetaResult:
+def audit_meta_tags(soup: BeautifulSoup | None, url: str, index: PageIndex | None = None) -> MetaResult:
     """Check SEO/GEO meta tags. Returns MetaResult."""
     result = MetaResult()
 
     # Fix H-8: guard against None soup
     if soup is None:
         return result
+    idx = get_page_index(soup, index)
 
     # Title
-    title_tag = soup.find("title")
+    title_tag = idx.find("title")
     if title_tag and title_tag.text.strip():
         result.has_title = True
         result.title_text = title_tag.text.strip()
         result.title_length = len(result.title_text)
 
     # Meta description
-    desc = soup.find("meta", attrs={"name": "description"})
+    desc = idx.find("meta", attrs={"name": "description"})
     if desc and desc.get("content", "").strip():
         result.has_description = True
         result.description_text = desc["content"].strip()
         result.description_length = len(result.description_text)
 
     # Canonical
-    canonical = soup.find("link", attrs={"rel": "canonical"})
+    canonical = idx.find("link", attrs={"rel": "canonical"})
     if canonical and canonical.get("href"):
         result.has_canonical = True
         result.canonical_url = canonical["href"]
 
     # noai / noimageai in meta[name="robots"] (gap #7 — blocks AI training data use)
-    robots_meta = soup.find("meta", attrs={"name": lambda n: n and n.lower() == "robots"})
+    robots_meta = idx.find("meta", attrs={"name": lambda n: n and n.lower() == "robots"})
     if robots_meta:
         robots_content = (robots_meta.get("content") or "").lower()
         if "noai" in robots_content or "noimageai" in robots_content:
@@ -51,9 +53,9 @@ def audit_meta_tags(soup: BeautifulSoup | None, url: str) -> MetaResult:
             result.noai_value = robots_meta.get("content", "")
 
     # Open Graph
-    og_title = soup.find("meta", attrs={"property": "og:title"})
-    og_desc = soup.find("meta", attrs={"property": "og:description"})
-    og_image = soup.find("meta", attrs={"property": "og:image"})
+    og_title = idx.find("meta", attrs={"property": "og:title"})
+    og_desc = idx.find("meta", attrs={"property": "og:description"})
+    og_image = idx.find("meta", attrs={"property": "og:image"})
 
     if og_title and og_title.get("content"):
         result.has_og_title = True
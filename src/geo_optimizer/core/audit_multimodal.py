@@ -14,6 +14,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import MultimodalResult, SchemaResult
 
 if TYPE_CHECKING:
@@ -37,29 +38,33 @@ def _informative_alt(img) -> bool:
     return len(alt) >= _MIN_ALT_LEN
 
 
-def audit_multimodal_readiness(soup: BeautifulSoup | None, schema_result: SchemaResult) -> MultimodalResult:
+def audit_multimodal_readiness(
+    soup: BeautifulSoup | None, schema_result: SchemaResult, index: PageIndex | None = None
+) -> MultimodalResult:
     """Check multimodal readiness signals (images, video, audio).
 
     Args:
         soup: BeautifulSoup of the page (None → unchecked result).
         schema_result: Parsed JSON-LD schema result for the page.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         MultimodalResult with per-medium signals and a readiness level.
     """
     if soup is None:
         return MultimodalResult()
+    idx = get_page_index(soup, index)
 
     found_types = set(schema_result.found_types or [])
 
-    images = soup.find_all("img")
+    images = idx.find_all("img")
     total_images = len(images)
     images_with_alt = sum(1 for img in images if _informative_alt(img))
     alt_coverage = round(images_with_alt / total_images, 2) if total_images else 0.0
-    caption_count = len(soup.find_all("figcaption"))
+    caption_count = len(idx.find_all("figcaption"))
 
-    video_tags = soup.find_all("video")
-    video_iframes = [iframe for iframe in soup.find_all("iframe", src=True) if _VIDEO_IFRAME_RE.search(iframe["src"])]
+    video_tags = idx.find_all("video")
+    video_iframes = [iframe for iframe in idx.find_all("iframe", src=True) if _VIDEO_IFRAME_RE.search(iframe["src"])]
     video_count = len(video_tags) + len(video_iframes)
     has_video = video_count > 0
     has_video_schema = bool(found_types & _VIDEO_SCHEMA_TYPES)
@@ -69,7 +74,7 @@ def audit_multimodal_readiness(soup: BeautifulSoup | None, schema_result: Schema
         for track in video.find_all("track")
     )
 
-    audio_tags = soup.find_all("audio")
+    audio_tags = idx.find_all("audio")
     has_audio = len(audio_tags) > 0
     has_audio_schema = bool(found_types & _AUDIO_SCHEMA_TYPES)
 
@@ -77,7 +82,7 @@ def audit_multimodal_readiness(soup: BeautifulSoup | None, schema_result: Schema
     # text or page text, or a transcript property in any schema.
     has_transcript = False
     if has_video or has_audio:
-        page_text = soup.get_text(separator=" ", strip=True)
+        page_text = idx.text(separator=" ", strip=True)
         has_transcript = bool(_TRANSCRIPT_RE.search(page_text)) or any(
             "transcript" in schema for schema in map(str, schema_result.raw_schemas or [])
         )
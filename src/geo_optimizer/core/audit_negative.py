@@ -10,6 +10,7 @@ from __future__ import annotations
 import re
 from collections import Counter
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.config import (
     BOILERPLATE_RATIO_THRESHOLD,
     CONTENT_MIN_WORDS,
@@ -20,7 +21,12 @@ from geo_optimizer.models.results import ContentResult, MetaResult, NegativeSign
 
 
 def audit_negative_signals(
-    soup, raw_html, content_result: ContentResult, meta_result: MetaResult, schema_result: SchemaResult
+    soup,
+    raw_html,
+    content_result: ContentResult,
+    meta_result: MetaResult,
+    schema_result: SchemaResult,
+    index: PageIndex | None = None,
 ) -> NegativeSignalsResult:
     """Detect negative signals that reduce AI citability.
 
@@ -33,6 +39,7 @@ def audit_negative_signals(
         content_result: Already-computed ContentResult.
         meta_result: Already-computed MetaResult.
         schema_result: Already-computed SchemaResult.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         NegativeSignalsResult with detected negative signals.
@@ -40,6 +47,7 @@ def audit_negative_signals(
     result = NegativeSignalsResult()
     if soup is None:
         return result
+    idx = get_page_index(soup, index)
 
     result.checked = True
 
@@ -51,7 +59,7 @@ def audit_negative_signals(
         r"prova gratis|acquista|registrati|offerta limitata)\b",
         re.IGNORECASE,
     )
-    text = soup.get_text(separator=" ", strip=True)
+    text = idx.text(separator=" ", strip=True)
     cta_matches = cta_patterns.findall(text)
     result.cta_count = len(cta_matches)
     # > 5 CTAs on a page = excessive
@@ -62,12 +70,12 @@ def audit_negative_signals(
     # ── 2. Popup/interstitial in DOM ─────────────────────────────
     popup_classes = ["modal", "popup", "overlay", "interstitial", "lightbox", "cookie-banner"]
     for cls in popup_classes:
-        elements = soup.find_all(attrs={"class": lambda c, _cls=cls: c and _cls in str(c).lower()})
+        elements = idx.find_all(attrs={"class": lambda c, _cls=cls: c and _cls in str(c).lower()})
         if elements:
             result.popup_indicators.append(cls)
     # Also check data-* attributes
     for attr in ["data-modal", "data-popup", "data-overlay"]:
-        if soup.find(attrs={attr: True}):
+        if idx.find(attrs={attr: True}):
             result.popup_indicators.append(attr)
     result.has_popup_signals = len(result.popup_indicators) > 0
 
@@ -94,7 +102,7 @@ def audit_negative_signals(
 
     # ── 4. Link rotti/vuoti ──────────────────────────────────────
     broken_count = 0
-    for a_tag in soup.find_all("a", href=True):
+    for a_tag in idx.find_all("a", href=True):
         href = a_tag["href"].strip()
         if href in ("", "#", "javascript:void(0)", "javascript:;", "javascript:void(0);"):
             broken_count += 1
@@ -194,22 +202,22 @@ def audit_negative_signals(
 
     # Also check rel=author or class=author in HTML
     if not result.has_author_signal and (
-        soup.find("a", rel="author") or soup.find(attrs={"class": lambda c: c and "author" in str(c).lower()})
+        idx.find("a", rel="author") or idx.find(attrs={"class": lambda c: c and "author" in str(c).lower()})
     ):
         result.has_author_signal = True
 
     # ── 7. Boilerplate ratio ─────────────────────────────────────
     # Content in <main>, <article>, role="main" vs total
-    main_content = soup.find("main") or soup.find("article") or soup.find(attrs={"role": "main"})
+    main_content = idx.find("main") or idx.find("article") or idx.find(attrs={"role": "main"})
     total_text_len = len(text)
     if main_content and total_text_len > 0:
-        main_text_len = len(main_content.get_text(separator=" ", strip=True))
+        main_text_len = len(idx.text(main_content, separator=" ", strip=True))
         result.boilerplate_ratio = round(1.0 - (main_text_len / total_text_len), 2)
     elif total_text_len > 0:
         # No <main>/<article> — estimate from nav+footer
         nav_footer_len = 0
-        for tag in soup.find_all(["nav", "footer", "header"]):
-            nav_footer_len += len(tag.get_text(separator=" ", strip=True))
+        for tag in idx.find_all(["nav", "footer", "header"]):
+            nav_footer_len += len(idx.text(tag, separator=" ", strip=True))
         if nav_footer_len > 0:
             result.boilerplate_ratio = round(nav_footer_len / total_text_len, 2)
     result.boilerplate_high = result.boilerplate_ratio > BOILERPLATE_RATIO_THRESHOLD
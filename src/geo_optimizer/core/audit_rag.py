@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import re
 
+from geo_optimizer.core.page_index import PageIndex
 from geo_optimizer.models.results import RagChunkResult
 
 _OPTIMAL_MIN_WORDS = 100
@@ -23,26 +24,38 @@ _DEFINITION_RE = re.compile(
     re.MULTILINE,
 )
 
+_HEADING_RE = re.compile(r"^h[1-6]$")
+
 # Anchor sentence: a self-contained factual statement (ends with period, 10-40 words)
 _ANCHOR_RE = re.compile(r"(?<=[.!?]\s)[A-Z][^.!?]{30,200}[.!?]")
 
 
-def audit_rag_readiness(soup, soup_clean=None) -> RagChunkResult:
+def audit_rag_readiness(soup, soup_clean=None, index: PageIndex | None = None) -> RagChunkResult:
     """Analyze content segmentation for RAG retrieval readiness.
 
     Args:
         soup: BeautifulSoup of the full HTML document.
         soup_clean: Optional pre-cleaned soup (scripts/styles removed).
+        index: Optional PageIndex of ``soup``; its section text skips
+            script/style like ``soup_clean`` and is shared with other sub-audits.
 
     Returns:
         RagChunkResult with chunk readiness metrics.
     """
-    body = soup_clean.find("body") if soup_clean else soup.find("body")
-    if not body:
-        return RagChunkResult(checked=True)
-
-    headings = body.find_all(re.compile(r"^h[1-6]$"))
-    sections = _split_by_headings(body, headings)
+    if index is not None and index.soup is soup:
+        body = index.find("body")
+        if not body:
+            return RagChunkResult(checked=True)
+        headings = index.find_all(_HEADING_RE, within=body)
+        sections = index.sections(body)
+        body_text = index.text(body, separator=" ", strip=True)
+    else:
+        body = soup_clean.find("body") if soup_clean else soup.find("body")
+        if not body:
+            return RagChunkResult(checked=True)
+        headings = body.find_all(_HEADING_RE)
+        sections = _split_by_headings(body, headings)
+        body_text = body.get_text(separator=" ", strip=True)
 
     total = len(sections)
     if total == 0:
@@ -53,7 +66,6 @@ def audit_rag_readiness(soup, soup_clean=None) -> RagChunkResult:
     avg_words = sum(word_counts) / total
 
     # Definition opening: check first 150 chars of body text
-    body_text = body.get_text(separator=" ", strip=True)
     has_definition = bool(_DEFINITION_RE.search(body_text[:150]))
 
     # Heading-as-boundary ratio: how many sections start after a heading
@@ -83,12 +95,13 @@ def _split_by_headings(body, headings) -> list[str]:
         text = body.get_text(separator=" ", strip=True)
         return [text] if text else []
 
-    headings_set = set(headings)
+    # Identity set: Tag.__hash__ serialises the whole subtree
+    heading_ids = {id(h) for h in headings}
     sections: list[str] = []
     for heading in headings:
         text_parts: list[str] = []
         for sibling in heading.next_siblings:
-            if sibling in headings_set:
+            if id(sibling) in heading_ids:
                 break
             t = sibling.get_text(separator=" ", strip=True) if hasattr(sibling, "get_text") else str(sibling).strip()
             if t:
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.config import (
     ARTICLE_TYPES,
-    SCHEMA_JSONLD_MAX_BYTES,
     SCHEMA_ORG_REQUIRED,
     SCHEMA_RAW_SCHEMAS_CAP,
     SCHEMA_RICHNESS_HIGH,
@@ -21,29 +20,23 @@ if TYPE_CHECKING:
 _logger = logging.getLogger(__name__)
 
 
-def audit_schema(soup: BeautifulSoup | None, url: str) -> SchemaResult:
+def audit_schema(soup: BeautifulSoup | None, url: str, index: PageIndex | None = None) -> SchemaResult:
     """Check JSON-LD schema on homepage. Returns SchemaResult."""
     result = SchemaResult()
     if soup is None:
         return result
-
-    scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
-    if not scripts:
+    idx = get_page_index(soup, index)
+
+    # Every block is parsed once per page (JsonLdGraph, shared with citability);
+    # blank and oversized scripts (fix #182) are already skipped there
+    graph = idx.jsonld
+    # fix #399: track errors for recommendations
+    result.json_parse_errors = graph.parse_errors
+    if not graph.blocks:
         return result
 
-    for script in scripts:
+    for data in graph.blocks:
         try:
-            # script.string can be None if the tag has multiple child nodes
-            raw = script.string
-            if not raw:
-                raw = script.get_text()
-            if not raw or not raw.strip():
-                continue
-            # Size limit: prevent DoS from oversized JSON-LD (fix #182)
-            if len(raw) > SCHEMA_JSONLD_MAX_BYTES:
-                _logger.debug("JSON-LD too large (%d bytes), skipping", len(raw))
-                continue
-            data = json.loads(raw)
             # Fix: support @graph format (used by Yoast SEO, RankMath, etc.)
             if isinstance(data, dict) and "@graph" in data:
                 # Propaga @context del root a ogni item figlio (fix schema completeness su @graph)
@@ -113,7 +106,7 @@ def audit_schema(soup: BeautifulSoup | None, url: str) -> SchemaResult:
                 if schema.get("dateModified"):
                     result.has_date_modified = True
 
-        except (json.JSONDecodeError, AttributeError, TypeError) as exc:
+        except (AttributeError, TypeError) as exc:
             # Parsing failed: log at debug (not critical, third-party scripts) — fix #81
             _logger.debug("Invalid JSON schema ignored: %s", exc)
             result.json_parse_errors += 1  # fix #399: track errors for recommendations
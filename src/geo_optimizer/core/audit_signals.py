@@ -8,18 +8,22 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import SchemaResult, SignalsResult
 
 if TYPE_CHECKING:
     from bs4 import BeautifulSoup
 
 
-def audit_signals(soup: BeautifulSoup | None, schema_result: SchemaResult) -> SignalsResult:
+def audit_signals(
+    soup: BeautifulSoup | None, schema_result: SchemaResult, index: PageIndex | None = None
+) -> SignalsResult:
     """Compute technical signals: lang, RSS, freshness.
 
     Args:
         soup: BeautifulSoup of the HTML document.
         schema_result: SchemaResult with the JSON-LD schemas found.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         SignalsResult with has_lang, has_rss, has_freshness populated.
@@ -29,9 +33,10 @@ def audit_signals(soup: BeautifulSoup | None, schema_result: SchemaResult) -> Si
     # Fix H-8: guard against None soup
     if soup is None:
         return signals
+    idx = get_page_index(soup, index)
 
     # 1. Check lang attribute on <html>
-    html_tag = soup.find("html")
+    html_tag = idx.find("html")
     if html_tag:
         lang_val = html_tag.get("lang", "").strip()
         if lang_val:
@@ -39,7 +44,7 @@ def audit_signals(soup: BeautifulSoup | None, schema_result: SchemaResult) -> Si
             signals.lang_value = lang_val
 
     # 2. Check RSS/Atom feed
-    rss_link = soup.find("link", attrs={"type": lambda t: t and ("rss" in t.lower() or "atom" in t.lower())})
+    rss_link = idx.find("link", attrs={"type": lambda t: t and ("rss" in t.lower() or "atom" in t.lower())})
     if rss_link:
         signals.has_rss = True
         signals.rss_url = rss_link.get("href", "")
@@ -56,7 +61,7 @@ def audit_signals(soup: BeautifulSoup | None, schema_result: SchemaResult) -> Si
 
     # Fallback: meta tag article:modified_time
     if not signals.has_freshness:
-        meta_mod = soup.find("meta", attrs={"property": "article:modified_time"})
+        meta_mod = idx.find("meta", attrs={"property": "article:modified_time"})
         if meta_mod and meta_mod.get("content", "").strip():
             signals.has_freshness = True
             signals.freshness_date = meta_mod["content"].strip()
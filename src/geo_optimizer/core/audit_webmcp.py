@@ -10,6 +10,7 @@ import json  # noqa: F401 (available for future extensions)
 import re  # noqa: F401 (available for future extensions)
 from typing import TYPE_CHECKING
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import SchemaResult, WebMcpResult
 
 if TYPE_CHECKING:
@@ -47,7 +48,9 @@ def _extract_actions(schema_obj, action_types: set) -> None:
             _extract_actions(item, action_types)
 
 
-def audit_webmcp_readiness(soup: BeautifulSoup | None, raw_html: str, schema_result: SchemaResult) -> WebMcpResult:
+def audit_webmcp_readiness(
+    soup: BeautifulSoup | None, raw_html: str, schema_result: SchemaResult, index: PageIndex | None = None
+) -> WebMcpResult:
     """Check WebMCP readiness and agent-readiness signals (#233).
 
     Analyzes:
@@ -62,6 +65,7 @@ def audit_webmcp_readiness(soup: BeautifulSoup | None, raw_html: str, schema_res
         soup: BeautifulSoup of the page.
         raw_html: Raw HTML of the page.
         schema_result: SchemaResult with the JSON-LD schemas found.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         WebMcpResult with detected readiness signals.
@@ -69,6 +73,7 @@ def audit_webmcp_readiness(soup: BeautifulSoup | None, raw_html: str, schema_res
     result = WebMcpResult()
     if soup is None or not raw_html:
         return result
+    idx = get_page_index(soup, index)
 
     result.checked = True
 
@@ -78,7 +83,7 @@ def audit_webmcp_readiness(soup: BeautifulSoup | None, raw_html: str, schema_res
         result.has_register_tool = True
 
     # API dichiarativa: attributi toolname/tooldescription sugli elementi HTML
-    tool_elements = soup.find_all(attrs={"toolname": True})
+    tool_elements = idx.find_all(attrs={"toolname": True})
     if tool_elements:
         result.has_tool_attributes = True
         result.tool_count = len(tool_elements)
@@ -93,7 +98,7 @@ def audit_webmcp_readiness(soup: BeautifulSoup | None, raw_html: str, schema_res
         result.potential_actions = sorted(action_types)
 
     # ── 3. Accessible forms (agent-usable) ──────────────────────
-    forms = soup.find_all("form")
+    forms = idx.find_all("form")
     labeled_count = 0
     for form in forms:
         # A form is "agent-usable" if it has:
@@ -123,14 +128,14 @@ def audit_webmcp_readiness(soup: BeautifulSoup | None, raw_html: str, schema_res
 
     # ── 4. OpenAPI/Swagger detection ─────────────────────────────
     openapi_patterns = ["/api-docs", "/swagger", "openapi.json", "openapi.yaml", "swagger.json"]
-    for a_tag in soup.find_all("a", href=True):
+    for a_tag in idx.find_all("a", href=True):
         href = a_tag["href"].lower()
         if any(pattern in href for pattern in openapi_patterns):
             result.has_openapi = True
             break
     # Also check link tags
     if not result.has_openapi:
-        for link in soup.find_all("link", href=True):
+        for link in idx.find_all("link", href=True):
             href = link["href"].lower()
             if any(pattern in href for pattern in openapi_patterns):
                 result.has_openapi = True
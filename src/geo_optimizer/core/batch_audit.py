@@ -3,16 +3,52 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import contextlib
+import dataclasses
+import functools
+import itertools
+import logging
+import multiprocessing
 from collections import Counter
-
-from geo_optimizer.core.audit import run_full_audit, run_full_audit_async
-from geo_optimizer.core.llms_generator import fetch_sitemap
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+from geo_optimizer.core.audit import (
+    AsyncAuditFetcher,
+    AuditInputs,
+    SidecarMemo,
+    SyncAuditFetcher,
+    _audit_file_cache,
+    _effective_bots,
+    _html_parser,
+    _normalize_base_url,
+    analyze_audit_inputs,
+    audit_config_key,
+    audit_fingerprint,
+    audit_url_key,
+    capture_audit_inputs,
+    cdn_probe_options,
+    fetch_audit_inputs,
+    fetch_audit_inputs_async,
+    run_full_audit,
+    run_full_audit_async,
+    use_sidecar_memo,
+)
+from geo_optimizer.core.llms_generator import fetch_sitemap, iter_sitemap
 from geo_optimizer.core.scoring import get_score_band
-from geo_optimizer.models.config import AUDIT_TIMEOUT_SECONDS
-from geo_optimizer.models.results import AuditResult, BatchAuditPageResult, BatchAuditResult
+from geo_optimizer.core.sitemap_state import SitemapStateStore, lastmod_is_newer, state_is_expired
+from geo_optimizer.models.config import AUDIT_TIMEOUT_SECONDS, SITEMAP_STATE_MAX_AGE_DAYS
+from geo_optimizer.models.results import AuditResult, BatchAuditPageResult, BatchAuditResult, SitemapPageState
+from geo_optimizer.utils.html_parser import resolve_html_parser
+from geo_optimizer.utils.http import HttpClientPool, use_http_pool
+from geo_optimizer.utils.http_async import create_async_client, use_async_client
+from geo_optimizer.utils.politeness import FetchScheduler, use_fetch_scheduler, wait_for_excluding_queue
+
+_logger = logging.getLogger(__name__)
 
 _DEFAULT_BATCH_MAX_URLS = 50
-_DEFAULT_BATCH_CONCURRENCY = 5
+_DEFAULT_BATCH_CONCURRENCY = 10
 _TOP_PAGE_LIMIT = 5
 
 
@@ -23,6 +59,10 @@ def run_batch_audit(
     project_config=None,
     max_urls: int = _DEFAULT_BATCH_MAX_URLS,
     concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+    workers: int = 0,
+    sitemap_order: bool = False,
+    changed_only: bool = False,
+    state_store: SitemapStateStore | None = None,
 ) -> BatchAuditResult:
     """Esegue un audit batch sincrono partendo da una sitemap XML."""
     return asyncio.run(
@@ -32,6 +72,10 @@ def run_batch_audit(
             project_config=project_config,
             max_urls=max_urls,
             concurrency=concurrency,
+            workers=workers,
+            sitemap_order=sitemap_order,
+            changed_only=changed_only,
+            state_store=state_store,
         )
     )
 
@@ -43,12 +87,117 @@ async def run_batch_audit_async(
     project_config=None,
     max_urls: int = _DEFAULT_BATCH_MAX_URLS,
     concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+    workers: int = 0,
+    sitemap_order: bool = False,
+    changed_only: bool = False,
+    state_store: SitemapStateStore | None = None,
 ) -> BatchAuditResult:
-    """Esegue audit concorrenti sugli URL contenuti in una sitemap."""
+    """Esegue audit concorrenti sugli URL contenuti in una sitemap.
+
+    Args:
+        sitemap_url: URL della sitemap XML.
+        use_cache: Usa la cache HTTP su disco.
+        project_config: ProjectConfig opzionale (extra_bots, audit.parser).
+        max_urls: Numero massimo di URL auditati.
+        concurrency: Pagine scaricate in parallelo (I/O).
+        workers: Processi per parsing e analisi (CPU). 0 (default) = tutto nel
+            processo corrente; con N > 0 il fetch resta async e parse + analisi
+            girano in un ProcessPoolExecutor da N processi.
+        sitemap_order: Audita i primi ``max_urls`` URL nell'ordine della
+            sitemap, partendo mentre la sitemap è ancora in lettura, invece di
+            leggerla tutta e scegliere quelli a priority più alta.
+        changed_only: Riaudita solo le pagine nuove, con ``lastmod`` più
+            recente o con il body cambiato dall'ultimo giro ``changed_only``;
+            le altre riusano il risultato salvato (``core.sitemap_state``).
+            Il riepilogo resta calcolato su tutte le pagine.
+        state_store: ``SitemapStateStore`` da usare con ``changed_only``
+            (default: quello in ``~/.geo-optimizer/sitemap-state.db``).
+    """
+    urls = await _discover_urls(
+        sitemap_url, max_urls=max_urls, concurrency=concurrency, workers=workers, sitemap_order=sitemap_order
+    )
+    stats = BatchAuditStats(sitemap_url=sitemap_url)
+    # Le pagine finiscono in ordine sparso: il report le elenca nell'ordine degli URL
+    page_results: dict[int, BatchAuditPageResult] = {}
+    async with urls:
+        async for position, page, unchanged in _iter_page_results(
+            urls,
+            use_cache=use_cache,
+            project_config=project_config,
+            concurrency=concurrency,
+            workers=workers,
+            state_store=_state_store(changed_only, state_store),
+        ):
+            page_results[position] = page
+            stats.add(page, position=position, unchanged=unchanged)
+        stats.discovered_urls = await urls.count_discovered()
+    return stats.to_result(pages=[page_results[position] for position in sorted(page_results)])
+
+
+async def iter_batch_audit(
+    sitemap_url: str,
+    *,
+    use_cache: bool = False,
+    project_config=None,
+    max_urls: int = _DEFAULT_BATCH_MAX_URLS,
+    concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+    workers: int = 0,
+    sitemap_order: bool = False,
+    changed_only: bool = False,
+    state_store: SitemapStateStore | None = None,
+    stats: BatchAuditStats | None = None,
+) -> AsyncIterator[BatchAuditPageResult]:
+    """Audit batch in streaming: produce ogni ``BatchAuditPageResult`` appena la pagina finisce.
+
+    Stessi argomenti di ``run_batch_audit_async``. Le pagine arrivano in ordine
+    di completamento e nessuna lista di risultati viene accumulata: con
+    ``stats`` le medie, i conteggi per band e le classifiche vengono aggiornati
+    pagina per pagina (``stats.to_result()`` dà il riepilogo finale senza
+    ``pages``).
+
+    Raises:
+        ValueError: Argomenti non validi o sitemap senza URL (prima della prima pagina).
+    """
+    urls = await _discover_urls(
+        sitemap_url, max_urls=max_urls, concurrency=concurrency, workers=workers, sitemap_order=sitemap_order
+    )
+    if stats is not None:
+        stats.sitemap_url = sitemap_url
+    async with urls:
+        async for position, page, unchanged in _iter_page_results(
+            urls,
+            use_cache=use_cache,
+            project_config=project_config,
+            concurrency=concurrency,
+            workers=workers,
+            state_store=_state_store(changed_only, state_store),
+        ):
+            if stats is not None:
+                stats.add(page, position=position, unchanged=unchanged)
+            yield page
+        discovered_urls = await urls.count_discovered()
+    if stats is not None:
+        stats.discovered_urls = discovered_urls
+
+
+async def _discover_urls(
+    sitemap_url: str, *, max_urls: int, concurrency: int, workers: int, sitemap_order: bool = False
+) -> _SitemapUrls:
+    """Valida gli argomenti e restituisce gli URL da auditare."""
     if max_urls <= 0:
         raise ValueError("max_urls must be greater than 0")
     if concurrency <= 0:
         raise ValueError("concurrency must be greater than 0")
+    if workers < 0:
+        raise ValueError("workers must be 0 or greater")
+
+    if sitemap_order:
+        urls = _StreamedSitemapUrls(sitemap_url, max_urls=max_urls)
+        # Il primo URL arriva prima della prima pagina: sitemap vuota = ValueError subito
+        if not await urls.prefetch():
+            await urls.aclose()
+            raise ValueError("No URLs found in sitemap")
+        return urls
 
     sitemap_entries = await asyncio.to_thread(fetch_sitemap, sitemap_url)
     if not sitemap_entries:
@@ -57,73 +206,406 @@ async def run_batch_audit_async(
     selected_urls = _select_urls(sitemap_entries, max_urls=max_urls)
     if not selected_urls:
         raise ValueError("No URLs found in sitemap")
-
-    page_results = await _audit_urls(
-        selected_urls,
-        use_cache=use_cache,
-        project_config=project_config,
-        concurrency=concurrency,
-    )
-    return _aggregate_batch_result(
-        sitemap_url=sitemap_url,
-        discovered_urls=len(sitemap_entries),
-        page_results=page_results,
-    )
+    urls = _SitemapUrls(selected_urls, discovered_urls=len(sitemap_entries))
+    for entry in sitemap_entries:
+        urls.lastmods.setdefault(entry.url, entry.lastmod)
+    return urls
+
+
+class _SitemapUrls:
+    """URL da auditare già scelti (sitemap letta per intero e ordinata per priority)."""
+
+    def __init__(self, urls: list[str], discovered_urls: int):
+        self._urls = urls
+        self._discovered_urls = discovered_urls
+        # <lastmod> della sitemap per URL, per ``changed_only``
+        self.lastmods: dict[str, str | None] = {}
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return _aiter(self._urls)
+
+    async def count_discovered(self) -> int:
+        """URL trovati nella sitemap (dopo l'ultimo URL auditato)."""
+        return self._discovered_urls
+
+    async def aclose(self) -> None:
+        pass
+
+    async def __aenter__(self) -> _SitemapUrls:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class _StreamedSitemapUrls(_SitemapUrls):
+    """URL in ordine di sitemap, letti in un thread mentre gli audit sono già partiti.
+
+    ``iter_sitemap`` produce le voci mentre scarica e analizza la sitemap;
+    gli URL già visti (``audit_url_key``) vengono saltati e dopo ``max_urls``
+    URL distinti l'iterazione finisce. ``count_discovered()`` legge il resto
+    della sitemap solo per contarne le voci (fino a ``MAX_TOTAL_URLS``).
+    """
+
+    def __init__(self, sitemap_url: str, *, max_urls: int):
+        super().__init__([], discovered_urls=0)
+        self._entries = iter_sitemap(sitemap_url)
+        self._max_urls = max_urls
+        self._seen: set[str] = set()
+        self._prefetched: str | None = None
+
+    async def _next_entry(self):
+        return await asyncio.to_thread(next, self._entries, None)
+
+    async def _next_url(self) -> str | None:
+        while len(self._seen) < self._max_urls:
+            entry = await self._next_entry()
+            if entry is None:
+                return None
+            self._discovered_urls += 1
+            self.lastmods.setdefault(entry.url, entry.lastmod)
+            key = audit_url_key(entry.url)
+            if key not in self._seen:
+                self._seen.add(key)
+                return entry.url
+        return None
+
+    async def prefetch(self) -> bool:
+        """Legge il primo URL in anticipo; False se la sitemap non ne ha."""
+        self._prefetched = await self._next_url()
+        return self._prefetched is not None
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        if self._prefetched is not None:
+            url, self._prefetched = self._prefetched, None
+            yield url
+        while (url := await self._next_url()) is not None:
+            yield url
+
+    async def count_discovered(self) -> int:
+        self._discovered_urls += await asyncio.to_thread(sum, (1 for _entry in self._entries))
+        return self._discovered_urls
+
+    async def aclose(self) -> None:
+        # ValueError: a cancelled read is still running in its thread; the
+        # generator stops with it and the fetch threads of iter_sitemap exit
+        with contextlib.suppress(ValueError):
+            await asyncio.to_thread(self._entries.close)
+
+
+async def _aiter(items: Iterable[str]) -> AsyncIterator[str]:
+    for item in items:
+        yield item
 
 
 def _select_urls(sitemap_entries, *, max_urls: int) -> list[str]:
-    """Deduplica gli URL della sitemap, ordinando per priority discendente (gap #6)."""
+    """Deduplica gli URL della sitemap, ordinando per priority discendente (gap #6).
+
+    Due URL sono lo stesso se l'audit li tratterebbe allo stesso modo
+    (``audit_url_key``: ``/page`` e ``/page/``, host in maiuscolo, frammenti):
+    la pagina viene auditata una volta sola, col primo URL incontrato.
+    """
     # Sort by <priority> descending so higher-priority pages are audited first
     sorted_entries = sorted(sitemap_entries, key=lambda e: getattr(e, "priority", 0.5), reverse=True)
     seen: set[str] = set()
     selected: list[str] = []
     for entry in sorted_entries:
-        if entry.url in seen:
+        key = audit_url_key(entry.url)
+        if key in seen:
             continue
-        seen.add(entry.url)
+        seen.add(key)
         selected.append(entry.url)
         if len(selected) >= max_urls:
             break
     return selected
 
 
-async def _audit_urls(
-    urls: list[str],
+async def _iter_page_results(
+    urls: _SitemapUrls,
     *,
     use_cache: bool,
     project_config,
     concurrency: int,
-) -> list[BatchAuditPageResult]:
-    """Esegue gli audit delle pagine con un limite di concorrenza."""
-    semaphore = asyncio.Semaphore(concurrency)
-
-    async def _worker(url: str) -> BatchAuditPageResult:
-        async with semaphore:
-            # Fix H-2: per-URL timeout prevents a single hanging URL from blocking the batch
-            try:
-                return await asyncio.wait_for(
-                    _audit_single_url(url, use_cache=use_cache, project_config=project_config),
-                    timeout=AUDIT_TIMEOUT_SECONDS,
-                )
-            except asyncio.TimeoutError:
-                result = AuditResult(url=url, error=f"Timeout ({AUDIT_TIMEOUT_SECONDS}s)", band="critical")
-                return _summarize_audit_result(result)
+    workers: int,
+    state_store: SitemapStateStore | None = None,
+) -> AsyncIterator[tuple[int, BatchAuditPageResult, bool]]:
+    """Produce ``(posizione dell'URL, sintesi, riusata)`` man mano che le pagine finiscono.
+
+    Ogni pagina è un task asyncio; ne restano in volo al massimo
+    ``concurrency`` (+ ``workers`` in analisi nel pool) e l'URL successivo
+    parte solo quando uno termina, quindi la memoria non cresce con la sitemap.
+    Gli URL sono una sorgente async: con ``sitemap_order`` arrivano mentre la
+    sitemap è ancora in lettura. Con ``state_store`` le pagine invariate
+    riusano il risultato salvato (terzo elemento True) invece dell'audit.
+    """
+    async with contextlib.AsyncExitStack() as stack:
+        # Shared keep-alive pools: not activated here, because a ContextVar set
+        # around a ``yield`` would leak into the consumer. Each task activates them
+        # in its own context, and audits offloaded with asyncio.to_thread inherit them.
+        http_clients = stack.enter_context(HttpClientPool())
+        # One pinned httpx client for every async fetch of the batch
+        async_client = (
+            await stack.enter_async_context(create_async_client(max_keepalive=max(20, 4 * concurrency)))
+            if _async_runtime_available()
+            else None
+        )
+        # Per-host pacing: Crawl-delay (learnt from the audits' own robots.txt
+        # fetches), in-flight caps and backoff on 429/503 for every page
+        scheduler = FetchScheduler()
+        # robots.txt, llms.txt and the other site-level files: once per host, not per page
+        sidecars = SidecarMemo()
+        stack.push_async_callback(sidecars.aclose)
+        if workers:
+            # spawn: forking a process that already runs event-loop and fetch threads is unsafe
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            )
+            audit_url = _pool_auditor(
+                executor, use_cache=use_cache, project_config=project_config, concurrency=concurrency, workers=workers
+            )
+            in_flight = concurrency + workers
+        else:
+            audit_url = functools.partial(_audit_url, use_cache=use_cache, project_config=project_config)
+            in_flight = concurrency
+        changes = (
+            None
+            if state_store is None
+            else _ChangeTracker(state_store, urls.lastmods, use_cache=use_cache, project_config=project_config)
+        )
 
-    return await asyncio.gather(*(_worker(url) for url in urls))
+        async def _run(position: int, url: str) -> tuple[int, BatchAuditPageResult, bool]:
+            with contextlib.ExitStack() as context:
+                context.enter_context(use_http_pool(http_clients))
+                context.enter_context(use_async_client(async_client))
+                context.enter_context(use_fetch_scheduler(scheduler))
+                context.enter_context(use_sidecar_memo(sidecars))
+                if changes is not None:
+                    return (position, *await changes.audit(url, audit_url))
+                return position, await audit_url(url), False
+
+        queued = urls.__aiter__()
+        positions = itertools.count()
+        pending: set[asyncio.Future] = set()
+        exhausted = False
+
+        async def _fill() -> None:
+            nonlocal exhausted
+            while not exhausted and len(pending) < in_flight:
+                try:
+                    url = await queued.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    return
+                pending.add(asyncio.ensure_future(_run(next(positions), url)))
+
+        try:
+            await _fill()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Refill before yielding: fetches go on while the consumer handles a page
+                await _fill()
+                for item in sorted((task.result() for task in done), key=lambda item: item[0]):
+                    yield item
+        finally:
+            # Consumer stopped early (break, error, Ctrl-C): do not leave audits running
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            stats = scheduler.stats()
+            _logger.info(
+                "Batch fetch scheduler: %d host(s), %d throttled answer(s)", len(stats["hosts"]), stats["throttled"]
+            )
+
+
+def _state_store(changed_only: bool, state_store: SitemapStateStore | None) -> SitemapStateStore | None:
+    """Store dello stato sitemap per ``changed_only`` (quello di default se non passato)."""
+    if not changed_only:
+        return None
+    return state_store if state_store is not None else SitemapStateStore()
+
+
+class _ChangeTracker:
+    """Decide per ogni URL se riauditare la pagina o riusare il risultato salvato.
+
+    La pagina viene riauditata senza altri controlli se non ha stato salvato,
+    se la configurazione di audit è cambiata, se il ``lastmod`` della sitemap
+    è più recente o se il risultato salvato ha più di ``max_age_days`` giorni.
+    Altrimenti la fase di fetch dell'audit, senza le sonde CDN (dalla cache
+    HTTP con ``use_cache``, entro il timeout per URL), dà il fingerprint di
+    pagina, header e file di sito (robots.txt, llms.txt, /ai/*.json...): se
+    coincide si riusa il risultato. Le sonde CDN/WAF restano fuori dal
+    confronto, perché costano sette richieste per pagina: un loro cambiamento
+    emerge al più tardi dopo ``max_age_days``. Dopo un audit riuscito lo stato
+    viene aggiornato col fingerprint degli input scaricati dall'audit stesso.
+    Gli audit falliti non vengono salvati: si riprova al giro dopo.
+    """
+
+    def __init__(
+        self,
+        store: SitemapStateStore,
+        lastmods: dict[str, str | None],
+        *,
+        use_cache: bool,
+        project_config,
+        max_age_days: float = SITEMAP_STATE_MAX_AGE_DAYS,
+    ):
+        self._store = store
+        self._lastmods = lastmods
+        self._use_cache = use_cache
+        self._max_age_days = max_age_days
+        self._bots = _effective_bots(project_config)
+        self._parser = _html_parser(project_config)
+        self._config_key = audit_config_key(bots=self._bots, parser=self._parser)
+
+    async def audit(
+        self, url: str, audit_url: Callable[[str], Awaitable[BatchAuditPageResult]]
+    ) -> tuple[BatchAuditPageResult, bool]:
+        """Restituisce ``(sintesi, riusata)`` per ``url``."""
+        lastmod = self._lastmods.get(url)
+        state = await asyncio.to_thread(self._store.get, url)
+        if (
+            state is not None
+            and state.config_key == self._config_key
+            and not lastmod_is_newer(lastmod, state.lastmod)
+            and not state_is_expired(state, self._max_age_days)
+            and await self._current_fingerprint(url) == state.fingerprint
+        ):
+            return dataclasses.replace(state.result, url=url), True
+
+        with capture_audit_inputs() as fetched:
+            page = await audit_url(url)
+        inputs = fetched.get(_normalize_base_url(url))
+        if page.error is None and inputs is not None:
+            new_state = SitemapPageState(
+                url=url,
+                lastmod=lastmod,
+                fingerprint=self._fingerprint(inputs),
+                config_key=self._config_key,
+                result=page,
+            )
+            await asyncio.to_thread(self._store.save, new_state)
+        return page, False
+
+    def _fingerprint(self, inputs: AuditInputs) -> str:
+        return audit_fingerprint(inputs, bots=self._bots, parser=self._parser, cdn=False)
+
+    async def _current_fingerprint(self, url: str) -> str | None:
+        """Fingerprint della pagina com'è ora, o None se il fetch fallisce o scade (la pagina viene riauditata)."""
+        try:
+            # Fix H-2: stesso timeout per URL dell'audit, senza contare l'attesa nello scheduler
+            inputs = await wait_for_excluding_queue(
+                _fetch_inputs(url, use_cache=self._use_cache, cdn=False), timeout=AUDIT_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            return None
+        except Exception:  # pragma: no cover - rete/eccezioni inattese
+            return None
+        if isinstance(inputs, AuditResult):
+            return None
+        return await asyncio.to_thread(self._fingerprint, inputs)
+
+
+async def _audit_url(url: str, *, use_cache: bool, project_config) -> BatchAuditPageResult:
+    """Audit in-process di una pagina con timeout per URL."""
+    # Fix H-2: per-URL timeout prevents a single hanging URL from blocking the batch.
+    # The wait for Crawl-delay/backoff in the scheduler is not charged to it
+    try:
+        return await wait_for_excluding_queue(
+            _audit_single_url(url, use_cache=use_cache, project_config=project_config),
+            timeout=AUDIT_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        result = AuditResult(url=url, error=f"Timeout ({AUDIT_TIMEOUT_SECONDS}s)", band="critical")
+        return _summarize_audit_result(result)
 
 
 async def _audit_single_url(url: str, *, use_cache: bool, project_config) -> BatchAuditPageResult:
     """Esegue un audit singolo e lo converte in un risultato batch sintetico."""
     try:
-        if use_cache or not _async_runtime_available():
-            result = await asyncio.to_thread(run_full_audit, url, use_cache=use_cache, project_config=project_config)
+        # The staged engine honours use_cache in both modes: threads only without httpx
+        if _async_runtime_available():
+            result = await run_full_audit_async(url, use_cache=use_cache, project_config=project_config)
         else:
-            result = await run_full_audit_async(url, project_config=project_config)
+            result = await asyncio.to_thread(run_full_audit, url, use_cache=use_cache, project_config=project_config)
     except Exception as exc:  # pragma: no cover - rete/eccezioni inattese
         result = AuditResult(url=url, error=f"{type(exc).__name__}: {exc}", band="critical")
     return _summarize_audit_result(result)
 
 
+def _pool_auditor(
+    executor: ProcessPoolExecutor,
+    *,
+    use_cache: bool,
+    project_config,
+    concurrency: int,
+    workers: int,
+) -> Callable[[str], Awaitable[BatchAuditPageResult]]:
+    """Fetch asincrono con ``concurrency`` pagine in volo, parse + analisi in ``workers`` processi.
+
+    Ogni worker restituisce solo la sintesi ``BatchAuditPageResult``, non
+    l'AuditResult completo. Una pagina scaricata occupa uno slot di fetch
+    finché non trova un processo libero: se la CPU è satura il fetch rallenta
+    invece di accumulare HTML in memoria. Il timeout per URL (fix H-2) copre
+    il fetch, esclusa l'attesa nello scheduler; l'analisi è CPU pura e non può
+    restare appesa sulla rete.
+    """
+    fetch_slots = asyncio.Semaphore(concurrency)
+    cpu_slots = asyncio.Semaphore(workers)
+    bots = _effective_bots(project_config)
+    # Resolved here so every worker uses the same backend, whatever its environment
+    parser = resolve_html_parser(_html_parser(project_config))
+    loop = asyncio.get_running_loop()
+
+    async def _audit(url: str) -> BatchAuditPageResult:
+        async with fetch_slots:
+            try:
+                inputs = await wait_for_excluding_queue(
+                    _fetch_inputs(url, use_cache=use_cache, project_config=project_config),
+                    timeout=AUDIT_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                result = AuditResult(url=url, error=f"Timeout ({AUDIT_TIMEOUT_SECONDS}s)", band="critical")
+                return _summarize_audit_result(result)
+            except Exception as exc:  # pragma: no cover - rete/eccezioni inattese
+                result = AuditResult(url=url, error=f"{type(exc).__name__}: {exc}", band="critical")
+                return _summarize_audit_result(result)
+            if isinstance(inputs, AuditResult):
+                return _summarize_audit_result(inputs)
+            await cpu_slots.acquire()
+        try:
+            return await loop.run_in_executor(executor, _analyze_in_worker, inputs, bots, parser)
+        except Exception as exc:
+            result = AuditResult(url=inputs.base_url, error=f"{type(exc).__name__}: {exc}", band="critical")
+            return _summarize_audit_result(result)
+        finally:
+            cpu_slots.release()
+
+    return _audit
+
+
+async def _fetch_inputs(
+    url: str, *, use_cache: bool, cdn: bool = True, project_config=None
+) -> AuditInputs | AuditResult:
+    """Solo la fase di fetch di un audit, con lo stesso fetcher del path in-process.
+
+    ``cdn``: vedi ``fetch_audit_inputs``; le sonde CDN usano ``audit.cdn_workers`` e
+    ``audit.cdn_stop_on_challenge`` di ``project_config``.
+    """
+    cache = _audit_file_cache(use_cache)
+    options = cdn_probe_options(project_config)
+    if _async_runtime_available():
+        async with AsyncAuditFetcher(cache=cache, **options) as fetcher:
+            return await fetch_audit_inputs_async(url, fetcher, cdn=cdn)
+    fetcher = SyncAuditFetcher(cache=cache, **options)
+    return await asyncio.to_thread(functools.partial(fetch_audit_inputs, url, fetcher, cdn=cdn))
+
+
+def _analyze_in_worker(inputs: AuditInputs, bots: dict, parser: str) -> BatchAuditPageResult:
+    """Parse + analisi di una pagina in un processo del pool (deve restare a livello di modulo)."""
+    return _summarize_audit_result(analyze_audit_inputs(inputs, bots=bots, parser=parser))
+
+
 def _async_runtime_available() -> bool:
     """Verifica se il path async è disponibile per gli audit batch."""
     try:
@@ -147,60 +629,109 @@ def _summarize_audit_result(result: AuditResult) -> BatchAuditPageResult:
     )
 
 
-def _aggregate_batch_result(
-    *,
-    sitemap_url: str,
-    discovered_urls: int,
-    page_results: list[BatchAuditPageResult],
-) -> BatchAuditResult:
-    """Calcola medie e classifiche a partire dai risultati pagina."""
-    successful_pages = [page for page in page_results if not page.error]
-    failed_pages = [page for page in page_results if page.error]
-
-    average_score = 0.0
-    average_band = "critical"
-    band_counts: dict[str, int] = {}
-    average_score_breakdown: dict[str, float] = {}
-
-    if successful_pages:
-        average_score = round(sum(page.score for page in successful_pages) / len(successful_pages), 2)
-        average_band = get_score_band(int(round(average_score)))
-        band_counts = dict(Counter(page.band for page in successful_pages))
-        average_score_breakdown = _average_breakdowns(successful_pages)
-
-    ranked_pages = sorted(successful_pages, key=lambda page: page.score, reverse=True)
-
-    # gap #6: warn when sitemap has more URLs than the cap
-    truncated_warning = ""
-    if discovered_urls > len(page_results):
-        truncated_warning = (
-            f"Sitemap contains {discovered_urls} URLs but only {len(page_results)} were audited "
-            f"(cap: --max-urls). Use --max-urls to increase the limit."
-        )
-
-    return BatchAuditResult(
-        sitemap_url=sitemap_url,
-        discovered_urls=discovered_urls,
-        audited_urls=len(page_results),
-        successful_urls=len(successful_pages),
-        failed_urls=len(failed_pages),
-        average_score=average_score,
-        average_band=average_band,
-        band_counts=band_counts,
-        average_score_breakdown=average_score_breakdown,
-        pages=page_results,
-        top_pages=ranked_pages[:_TOP_PAGE_LIMIT],
-        worst_pages=list(reversed(ranked_pages[-_TOP_PAGE_LIMIT:])),
-        truncated_warning=truncated_warning,
-    )
-
-
-def _average_breakdowns(page_results: list[BatchAuditPageResult]) -> dict[str, float]:
-    """Calcola la media dei punteggi per categoria sulle pagine valide."""
-    category_totals: dict[str, float] = {}
-    for page in page_results:
+class BatchAuditStats:
+    """Aggregati di un audit batch aggiornati pagina per pagina.
+
+    Tiene contatori, somme e le ``_TOP_PAGE_LIMIT`` pagine migliori e peggiori,
+    mai la lista delle pagine: ``iter_batch_audit`` lo usa per il riepilogo di
+    un batch in streaming. I valori coincidono con quelli calcolati sull'intero
+    elenco di pagine, classifiche comprese (a pari punteggio vale la posizione
+    dell'URL).
+    """
+
+    def __init__(self, sitemap_url: str = "", discovered_urls: int = 0):
+        self.sitemap_url = sitemap_url
+        self.discovered_urls = discovered_urls
+        self.audited_urls = 0
+        self.successful_urls = 0
+        self.failed_urls = 0
+        self.unchanged_urls = 0
+        self.band_counts: Counter[str] = Counter()
+        self._score_total = 0
+        self._category_totals: dict[str, float] = {}
+        # (sort key, page), kept sorted and cut at _TOP_PAGE_LIMIT entries
+        self._top: list[tuple[tuple, BatchAuditPageResult]] = []
+        self._worst: list[tuple[tuple, BatchAuditPageResult]] = []
+
+    def add(self, page: BatchAuditPageResult, position: int | None = None, unchanged: bool = False) -> None:
+        """Aggiunge una pagina; ``position`` è l'indice dell'URL (default: ordine di arrivo).
+
+        ``unchanged`` segna una pagina il cui risultato salvato è stato riusato
+        (``changed_only``): conta come le altre nelle medie e nelle classifiche.
+        """
+        if position is None:
+            position = self.audited_urls
+        self.audited_urls += 1
+        self.unchanged_urls += unchanged
+        if page.error:
+            self.failed_urls += 1
+            return
+
+        self.successful_urls += 1
+        self.band_counts[page.band] += 1
+        self._score_total += page.score
         for category, score in page.score_breakdown.items():
-            category_totals[category] = category_totals.get(category, 0.0) + score
-
-    total_pages = len(page_results)
-    return {category: round(total / total_pages, 2) for category, total in sorted(category_totals.items())}
+            self._category_totals[category] = self._category_totals.get(category, 0.0) + score
+
+        # Same order as a stable sort by score: ties keep the URL order in the
+        # top list and the reverse URL order in the worst list.
+        tiebreak = self.audited_urls
+        bisect.insort(self._top, ((-page.score, position, tiebreak), page))
+        bisect.insort(self._worst, ((page.score, -position, -tiebreak), page))
+        del self._top[_TOP_PAGE_LIMIT:]
+        del self._worst[_TOP_PAGE_LIMIT:]
+
+    @property
+    def average_score(self) -> float:
+        if not self.successful_urls:
+            return 0.0
+        return round(self._score_total / self.successful_urls, 2)
+
+    @property
+    def average_band(self) -> str:
+        if not self.successful_urls:
+            return "critical"
+        return get_score_band(int(round(self.average_score)))
+
+    @property
+    def average_score_breakdown(self) -> dict[str, float]:
+        """Media dei punteggi per categoria sulle pagine valide."""
+        return {
+            category: round(total / self.successful_urls, 2)
+            for category, total in sorted(self._category_totals.items())
+        }
+
+    @property
+    def top_pages(self) -> list[BatchAuditPageResult]:
+        return [page for _key, page in self._top]
+
+    @property
+    def worst_pages(self) -> list[BatchAuditPageResult]:
+        return [page for _key, page in self._worst]
+
+    def to_result(self, pages: list[BatchAuditPageResult] | None = None) -> BatchAuditResult:
+        """Costruisce il ``BatchAuditResult``; ``pages`` resta vuoto se non passato."""
+        # gap #6: warn when sitemap has more URLs than the cap
+        truncated_warning = ""
+        if self.discovered_urls > self.audited_urls:
+            truncated_warning = (
+                f"Sitemap contains {self.discovered_urls} URLs but only {self.audited_urls} were audited "
+                f"(cap: --max-urls). Use --max-urls to increase the limit."
+            )
+
+        return BatchAuditResult(
+            sitemap_url=self.sitemap_url,
+            discovered_urls=self.discovered_urls,
+            audited_urls=self.audited_urls,
+            successful_urls=self.successful_urls,
+            failed_urls=self.failed_urls,
+            average_score=self.average_score,
+            average_band=self.average_band,
+            band_counts=dict(self.band_counts),
+            average_score_breakdown=self.average_score_breakdown,
+            pages=list(pages or []),
+            top_pages=self.top_pages,
+            worst_pages=self.worst_pages,
+            truncated_warning=truncated_warning,
+            unchanged_urls=self.unchanged_urls,
+        )
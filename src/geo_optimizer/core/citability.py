@@ -10,12 +10,12 @@ Paper: "GEO: Generative Engine Optimization" (arxiv.org/abs/2311.09735)
 from __future__ import annotations
 
 import functools
-import json
 import re
 from collections import Counter
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
+from geo_optimizer.core.page_index import NON_CONTENT_TAGS, PageIndex, get_page_index
 from geo_optimizer.models.config import (
     FRESHNESS_AGING_DAYS,
     FRESHNESS_FRESH_DAYS,
@@ -160,31 +160,18 @@ _STOP_WORDS = {
 # ─── Helper function ─────────────────────────────────────────────────────────
 
 
-def _get_clean_text(soup, soup_clean=None) -> str:
-    """Estrae testo pulito rimuovendo script, style, nav, footer.
+def _get_clean_text(soup, soup_clean=None, index: PageIndex | None = None) -> str:
+    """Estrae testo pulito escludendo script, style, nav, header, footer.
 
     Args:
         soup: BeautifulSoup originale.
-        soup_clean: (optional) soup pre-cleaned from script/style (fix #285).
-                    Se fornito, evita il re-parse costoso dell'HTML.
+        soup_clean: Ignored, kept for backward compatibility (fix #285).
+        index: (optional) PageIndex of ``soup``; the text is read without copying the tree.
     """
-    import copy
+    return get_page_index(soup, index).clean_text
 
-    if soup_clean is not None:
-        # Use a copy of the pre-computed soup_clean, strip only nav/footer/header
-        working = copy.deepcopy(soup_clean)
-        for tag in working(["nav", "footer", "header"]):
-            tag.decompose()
-        return str(working.get_text(separator=" ", strip=True))
 
-    # Fallback: build a clean copy from scratch with deepcopy (fix #285: avoid BS(str(soup)))
-    working = copy.deepcopy(soup)
-    for tag in working(["script", "style", "nav", "footer", "header"]):
-        tag.decompose()
-    return str(working.get_text(separator=" ", strip=True))
-
-
-def _iter_jsonld_objects(soup):
+def _iter_jsonld_objects(soup, index: PageIndex | None = None):
     """Yield every JSON-LD object on the page, with `@graph` containers unpacked.
 
     gap #4.16.3: fix #326 added `@graph` unpacking to three of the twelve places in
@@ -195,35 +182,21 @@ def _iter_jsonld_objects(soup):
     Those detectors then reported the signals as absent and scored them at zero.
 
     Nested `@graph` containers are unpacked too, and malformed JSON is skipped rather
-    than raised, matching the previous per-call-site behaviour.
+    than raised, matching the previous per-call-site behaviour. The unpacking lives
+    in `JsonLdGraph`, parsed once per page; detectors that look for a type or a
+    property query the graph directly instead of scanning every object.
 
     Args:
         soup: BeautifulSoup of the HTML page.
+        index: (optional) PageIndex of ``soup`` carrying the page's JsonLdGraph.
 
     Yields:
         dict: One JSON-LD object at a time, in document order.
     """
-    for script in soup.find_all("script", type="application/ld+json"):
-        try:
-            data = json.loads(script.string or "")
-        except (json.JSONDecodeError, TypeError):
-            continue
-
-        queue = list(data) if isinstance(data, list) else [data]
-        while queue:
-            item = queue.pop(0)
-            if not isinstance(item, dict):
-                continue
-            graph = item.get("@graph")
-            if isinstance(graph, list):
-                # Prepend so the graph's own members keep document order ahead of
-                # whatever follows this container.
-                queue = list(graph) + queue
-                continue
-            yield item
+    yield from get_page_index(soup, index).jsonld.entities
 
 
-def _extract_dates_from_soup(soup) -> dict[str, str | None]:
+def _extract_dates_from_soup(soup, index: PageIndex | None = None) -> dict[str, str | None]:
     """Estrae dateModified e datePublished da JSON-LD e meta tag.
 
     Fix #5/#9: logica condivisa tra detect_content_freshness e detect_content_decay.
@@ -231,22 +204,22 @@ def _extract_dates_from_soup(soup) -> dict[str, str | None]:
     Returns:
         Dict con chiavi "dateModified" e "datePublished" (None se non trovate).
     """
+    idx = get_page_index(soup, index)
     dates: dict[str, str | None] = {"dateModified": None, "datePublished": None}
 
     # JSON-LD schema — fix #326 unpacks @graph (Yoast/RankMath), now via the shared helper
-    for item in _iter_jsonld_objects(soup):
-        if "dateModified" in item and not dates["dateModified"]:
-            dates["dateModified"] = item["dateModified"]
-        if "datePublished" in item and not dates["datePublished"]:
-            dates["datePublished"] = item["datePublished"]
+    for key in ("dateModified", "datePublished"):
+        for item in idx.jsonld.with_property(key):
+            if not dates[key]:
+                dates[key] = item[key]
 
     # Meta tag fallback
     if not dates["dateModified"]:
-        meta_mod = soup.find("meta", attrs={"property": "article:modified_time"})
+        meta_mod = idx.find("meta", attrs={"property": "article:modified_time"})
         if meta_mod and meta_mod.get("content"):
             dates["dateModified"] = meta_mod["content"]
     if not dates["datePublished"]:
-        meta_pub = soup.find("meta", attrs={"property": "article:published_time"})
+        meta_pub = idx.find("meta", attrs={"property": "article:published_time"})
         if meta_pub and meta_pub.get("content"):
             dates["datePublished"] = meta_pub["content"]
 
@@ -256,15 +229,16 @@ def _extract_dates_from_soup(soup) -> dict[str, str | None]:
 # ─── 1. Cite Sources (+27%) ──────────────────────────────────────────────────
 
 
-def detect_cite_sources(soup, base_url: str) -> MethodScore:
+def detect_cite_sources(soup, base_url: str, index: PageIndex | None = None) -> MethodScore:
     """Detect citations to authoritative sources (.edu, .gov, Wikipedia, etc.)."""
+    idx = get_page_index(soup, index)
     parsed_base = urlparse(base_url)
     base_domain = parsed_base.netloc.replace("www.", "")
 
     authoritative_count = 0
     external_count = 0
 
-    for a in soup.find_all("a", href=True):
+    for a in idx.find_all("a", href=True):
         href = a["href"]
         if not href.startswith("http"):
             continue
@@ -279,10 +253,10 @@ def detect_cite_sources(soup, base_url: str) -> MethodScore:
     # References/bibliography section
     ref_headings = [
         h
-        for h in soup.find_all(["h2", "h3", "h4"])
-        if re.search(r"references?|sources?|bibliograph|citazion", h.get_text(), re.I)
+        for h in idx.find_all(["h2", "h3", "h4"])
+        if re.search(r"references?|sources?|bibliograph|citazion", idx.text(h), re.I)
     ]
-    cite_tags = len(soup.find_all("cite"))
+    cite_tags = len(idx.find_all("cite"))
 
     score = min(authoritative_count * 2 + external_count + cite_tags * 2 + len(ref_headings) * 2, 6)
     detected = authoritative_count >= 2 or bool(ref_headings) or cite_tags >= 1
@@ -306,20 +280,21 @@ def detect_cite_sources(soup, base_url: str) -> MethodScore:
 # ─── 2. Quotation Addition (+41%) ────────────────────────────────────────────
 
 
-def detect_quotations(soup, clean_text: str | None = None) -> MethodScore:
+def detect_quotations(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect attributed quotes (blockquote, attributed quoted text)."""
-    blockquotes = soup.find_all("blockquote")
-    q_tags = soup.find_all("q")
+    idx = get_page_index(soup, index)
+    blockquotes = idx.find_all("blockquote")
+    q_tags = idx.find_all("q")
 
     # Blockquote with cite attribute = formal citation
     bq_with_cite = [bq for bq in blockquotes if bq.get("cite") or bq.find("cite")]
 
     # Text pattern "..." — Author (fix #29: use clean_text to avoid noise)
-    body_text = clean_text or _get_clean_text(soup)
+    body_text = clean_text or idx.clean_text
     text_attributions = _QUOTE_ATTRIBUTION_RE.findall(body_text)
 
     # Pull quotes (CSS class)
-    pull_quotes = soup.find_all(
+    pull_quotes = idx.find_all(
         ["figure", "aside", "div"],
         class_=re.compile(r"pull.?quote|blockquote|testimonial", re.I),
     )
@@ -346,16 +321,17 @@ def detect_quotations(soup, clean_text: str | None = None) -> MethodScore:
 # ─── 3. Statistics Addition (+33%) ───────────────────────────────────────────
 
 
-def detect_statistics(soup, clean_text: str | None = None) -> MethodScore:
+def detect_statistics(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect statistical and quantitative data in content."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     matches = _STAT_RE.findall(body_text)
 
     # Tables with numerical data (separator=" " to avoid concatenation without spaces)
-    tables_with_data = sum(1 for t in soup.find_all("table") if _STAT_RE.search(t.get_text(separator=" ")))
+    tables_with_data = sum(1 for t in idx.find_all("table") if _STAT_RE.search(idx.text(t, separator=" ")))
 
     # HTML5 data elements
-    data_elements = len(soup.find_all(["data", "meter", "progress"]))
+    data_elements = len(idx.find_all(["data", "meter", "progress"]))
 
     word_count = max(len(body_text.split()), 1)
     density = len(matches) / word_count * 1000
@@ -380,22 +356,23 @@ def detect_statistics(soup, clean_text: str | None = None) -> MethodScore:
 # ─── 4. Fluency Optimization (+29%) ──────────────────────────────────────────
 
 
-def detect_fluency(soup, clean_text: str | None = None) -> MethodScore:
+def detect_fluency(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Estimate text fluency through structural heuristics."""
-    paragraphs = soup.find_all("p")
+    idx = get_page_index(soup, index)
+    paragraphs = idx.find_all("p")
     if not paragraphs:
         return MethodScore(name="fluency_optimization", label="Fluency Optimization", max_score=6, impact="+29%")
 
     # Average paragraph length
-    para_lengths = [len(p.get_text().split()) for p in paragraphs if p.get_text().strip()]
+    para_lengths = [len(idx.text(p).split()) for p in paragraphs if idx.text(p).strip()]
     avg_para_len = sum(para_lengths) / max(len(para_lengths), 1)
 
     # Logical connectives (fix #29: use clean_text)
-    body_text = clean_text or _get_clean_text(soup)
+    body_text = clean_text or idx.clean_text
     connective_count = len(_CONNECTIVES.findall(body_text))
 
     # Text-to-list ratio
-    list_items = soup.find_all("li")
+    list_items = idx.find_all("li")
     text_to_list_ratio = len(paragraphs) / max(len(list_items), 1)
 
     score = 0
@@ -428,14 +405,15 @@ def detect_fluency(soup, clean_text: str | None = None) -> MethodScore:
 # ─── 5. Technical Terms (+18%) ───────────────────────────────────────────────
 
 
-def detect_technical_terms(soup, clean_text: str | None = None) -> MethodScore:
+def detect_technical_terms(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect density of technical terminology in content."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     tech_matches = _TECH_RE.findall(body_text)
 
-    code_blocks = len(soup.find_all(["code", "pre", "kbd", "samp"]))
-    abbr_tags = len(soup.find_all("abbr"))
-    dfn_tags = len(soup.find_all("dfn"))
+    code_blocks = len(idx.find_all(["code", "pre", "kbd", "samp"]))
+    abbr_tags = len(idx.find_all("abbr"))
+    dfn_tags = len(idx.find_all("dfn"))
 
     word_count = max(len(body_text.split()), 1)
     density = len(tech_matches) / word_count * 1000
@@ -461,25 +439,26 @@ def detect_technical_terms(soup, clean_text: str | None = None) -> MethodScore:
 # ─── 6. Authoritative Tone (+16%) ────────────────────────────────────────────
 
 
-def detect_authoritative_tone(soup, clean_text: str | None = None) -> MethodScore:
+def detect_authoritative_tone(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect authoritative tone signals and author credentials."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
 
     authority_signals = len(_AUTHORITY_RE.findall(body_text))
     hedge_signals = len(_HEDGE_RE.findall(body_text))
 
     # Author bio
-    author_bio = soup.find_all(
+    author_bio = idx.find_all(
         ["div", "section", "aside"],
         class_=re.compile(r"author|bio|about-author|byline|contributor", re.I),
     )
-    author_schema = soup.find_all("span", attrs={"itemprop": "author"})
+    author_schema = idx.find_all("span", attrs={"itemprop": "author"})
 
     # Credentials
     credentials = re.findall(r"\b(?:Dr\.?|Prof\.?|PhD|M\.?D\.?|MBA|MSc|BSc|CEO|CTO)\b", body_text)
 
     # Author meta tag
-    author_meta = soup.find("meta", attrs={"name": re.compile(r"author", re.I)})
+    author_meta = idx.find("meta", attrs={"name": re.compile(r"author", re.I)})
 
     score = 0
     score += min(authority_signals, 4)
@@ -508,14 +487,15 @@ def detect_authoritative_tone(soup, clean_text: str | None = None) -> MethodScor
 # ─── 7. Easy-to-Understand (+14%) ────────────────────────────────────────────
 
 
-def detect_easy_to_understand(soup) -> MethodScore:
+def detect_easy_to_understand(soup, index: PageIndex | None = None) -> MethodScore:
     """Estimate readability with structural metrics."""
-    main = soup.find("main") or soup.find("article") or soup
-    paragraphs = main.find_all("p") if main else []
+    idx = get_page_index(soup, index)
+    main = idx.find("main") or idx.find("article") or soup
+    paragraphs = idx.find_all("p", within=main) if main else []
 
     all_sentences = []
     for p in paragraphs:
-        text = p.get_text(separator=" ")
+        text = idx.text(p, separator=" ")
         for s in re.split(r"[.!?]+", text):
             words = s.split()
             if len(words) >= 3:
@@ -527,12 +507,12 @@ def detect_easy_to_understand(soup) -> MethodScore:
     avg_sentence_len = sum(len(s) for s in all_sentences) / len(all_sentences)
 
     # Heading hierarchy
-    h2_count = len(soup.find_all("h2"))
-    h3_count = len(soup.find_all("h3"))
+    h2_count = len(idx.find_all("h2"))
+    h3_count = len(idx.find_all("h3"))
 
     # FAQ sections
     faq_headings = [
-        h for h in soup.find_all(["h2", "h3"]) if re.search(r"faq|domand|question|how to|come", h.get_text(), re.I)
+        h for h in idx.find_all(["h2", "h3"]) if re.search(r"faq|domand|question|how to|come", idx.text(h), re.I)
     ]
 
     score = 0
@@ -567,9 +547,10 @@ def detect_easy_to_understand(soup) -> MethodScore:
 # ─── 8. Unique Words (+7%) ───────────────────────────────────────────────────
 
 
-def detect_unique_words(soup, clean_text: str | None = None) -> MethodScore:
+def detect_unique_words(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Calculate Type-Token Ratio to estimate vocabulary richness."""
-    body_text = (clean_text or _get_clean_text(soup)).lower()
+    idx = get_page_index(soup, index)
+    body_text = (clean_text or idx.clean_text).lower()
     words = [w for w in re.findall(r"\b[a-zA-Zà-ú]{4,}\b", body_text) if w not in _STOP_WORDS]
 
     if len(words) < 50:
@@ -605,9 +586,10 @@ def detect_unique_words(soup, clean_text: str | None = None) -> MethodScore:
 # ─── 9. Keyword Stuffing (-9%) ───────────────────────────────────────────────
 
 
-def detect_keyword_stuffing(soup, clean_text: str | None = None) -> MethodScore:
+def detect_keyword_stuffing(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect keyword stuffing that penalizes AI visibility."""
-    body_text = (clean_text or _get_clean_text(soup)).lower()
+    idx = get_page_index(soup, index)
+    body_text = (clean_text or idx.clean_text).lower()
     words = re.findall(r"\b[a-zA-Zà-ú]{3,}\b", body_text)
 
     if len(words) < 50:
@@ -695,14 +677,15 @@ _FACT_RE = re.compile(
 )
 
 
-def detect_answer_first(soup) -> MethodScore:
+def detect_answer_first(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect answer-first structure: H2 followed by paragraph with concrete fact.
 
     AutoGEO (ICLR 2026) identifies AnswerFirst as one of the most effective
     strategies for AI citation. For each H2, checks if the first paragraph
     contains a concrete fact (number, assertive statement) in the first 150 chars.
     """
-    h2_tags = soup.find_all("h2")
+    idx = get_page_index(soup, index)
+    h2_tags = idx.find_all("h2")
     if not h2_tags:
         return MethodScore(name="answer_first", label="Answer-First Structure", max_score=5, impact="+25%")
 
@@ -714,7 +697,7 @@ def detect_answer_first(soup) -> MethodScore:
         if not next_el:
             continue
         # Skip empty elements (empty divs without text content)
-        first_text = next_el.get_text(strip=True)[:150]
+        first_text = idx.text(next_el, strip=True)[:150]
         if not first_text:
             continue
         if _FACT_RE.search(first_text):
@@ -744,13 +727,14 @@ def detect_answer_first(soup) -> MethodScore:
 # ─── 11. Passage Density (+23%) — Stanford Nature Communications 2025 ────────
 
 
-def detect_passage_density(soup) -> MethodScore:
+def detect_passage_density(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect self-contained dense passages (50-150 words with numeric data).
 
     Stanford Nature Communications 2025: paragraphs of 50-150 words containing
     concrete data have 2.3x citation rate compared to generic paragraphs.
     """
-    paragraphs = soup.find_all("p")
+    idx = get_page_index(soup, index)
+    paragraphs = idx.find_all("p")
     if not paragraphs:
         return MethodScore(name="passage_density", label="Passage Density", max_score=5, impact="+23%")
 
@@ -758,7 +742,7 @@ def detect_passage_density(soup) -> MethodScore:
     dense_paras = 0
 
     for p in paragraphs:
-        text = p.get_text(strip=True)
+        text = idx.text(p, strip=True)
         word_count = len(text.split())
         if word_count < 10:
             # Paragraphs that are too short are skipped
@@ -810,9 +794,10 @@ def _count_syllables(word: str) -> int:
     return max(count, 1)
 
 
-def detect_readability(soup, clean_text: str | None = None) -> MethodScore:
+def detect_readability(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect readability using Flesch-Kincaid Grade Level and section length."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     words = body_text.split()
     if len(words) < 30:
         return MethodScore(name="readability", label="Readability Score", max_score=8, impact="+15%")
@@ -829,7 +814,7 @@ def detect_readability(soup, clean_text: str | None = None) -> MethodScore:
     fk_grade = 0.39 * (num_words / num_sentences) + 11.8 * (total_syllables / num_words) - 15.59
 
     # Check section length between headings
-    headings = soup.find_all(["h1", "h2", "h3", "h4"])
+    headings = idx.find_all(["h1", "h2", "h3", "h4"])
     section_lengths = []
     for _i, h in enumerate(headings):
         # Count words between this heading and the next
@@ -837,7 +822,7 @@ def detect_readability(soup, clean_text: str | None = None) -> MethodScore:
         sibling = h.find_next_sibling()
         while sibling and sibling.name not in ["h1", "h2", "h3", "h4"]:
             if sibling.name in ["p", "li", "td"]:
-                section_text.append(sibling.get_text(strip=True))
+                section_text.append(idx.text(sibling, strip=True))
             sibling = sibling.find_next_sibling()
         section_word_count = len(" ".join(section_text).split())
         if section_word_count > 0:
@@ -881,37 +866,38 @@ def detect_readability(soup, clean_text: str | None = None) -> MethodScore:
 # ─── 13. FAQ-in-Content Check (+12%) — SE Ranking 2025 ───────────────────────
 
 
-def detect_faq_in_content(soup) -> MethodScore:
+def detect_faq_in_content(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect FAQ patterns in content (not FAQPage schema, which has zero impact)."""
+    idx = get_page_index(soup, index)
     faq_count = 0
 
     # Pattern 1: heading ending with "?" followed by a paragraph
-    for heading in soup.find_all(["h2", "h3", "h4"]):
-        heading_text = heading.get_text(strip=True)
+    for heading in idx.find_all(["h2", "h3", "h4"]):
+        heading_text = idx.text(heading, strip=True)
         if heading_text.endswith("?"):
             # Look for an answer paragraph after the heading
             next_elem = heading.find_next_sibling()
             if next_elem and next_elem.name in ["p", "div", "ul", "ol"]:
-                answer_text = next_elem.get_text(strip=True)
+                answer_text = idx.text(next_elem, strip=True)
                 if len(answer_text) >= 20:
                     faq_count += 1
 
     # Pattern 2: <details><summary> FAQ pattern
-    details_elements = soup.find_all("details")
+    details_elements = idx.find_all("details")
     for detail in details_elements:
         summary = detail.find("summary")
         if summary:
-            summary_text = summary.get_text(strip=True)
+            summary_text = idx.text(summary, strip=True)
             # Verify there is content after the summary
-            detail_text = detail.get_text(strip=True).replace(summary_text, "").strip()
+            detail_text = idx.text(detail, strip=True).replace(summary_text, "").strip()
             if len(detail_text) >= 20:
                 faq_count += 1
 
     # Pattern 3: dt/dd (definition list come FAQ)
-    dt_elements = soup.find_all("dt")
+    dt_elements = idx.find_all("dt")
     for dt in dt_elements:
         dd = dt.find_next_sibling("dd")
-        if dd and "?" in dt.get_text():
+        if dd and "?" in idx.text(dt):
             faq_count += 1
 
     # Score based on the number of FAQ patterns found
@@ -947,9 +933,10 @@ _GENERIC_ALT_RE = re.compile(
 )
 
 
-def detect_image_alt_quality(soup) -> MethodScore:
+def detect_image_alt_quality(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect image alt text quality: penalize missing or generic alt text."""
-    images = soup.find_all("img")
+    idx = get_page_index(soup, index)
+    images = idx.find_all("img")
     if not images:
         # No images = neutral score
         return MethodScore(
@@ -1043,7 +1030,7 @@ def _freshness_citability_score(freshness_level: str) -> int:
     }.get(freshness_level, 0)
 
 
-def detect_content_freshness(soup, clean_text: str | None = None) -> MethodScore:
+def detect_content_freshness(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect content freshness via JSON-LD dates and year references in text.
 
     Returns a graduated freshness_level (#401):
@@ -1052,11 +1039,12 @@ def detect_content_freshness(soup, clean_text: str | None = None) -> MethodScore
     - aging: 6-12 months (2 citability points)
     - stale: > 12 months or no date (0 citability points)
     """
+    idx = get_page_index(soup, index)
     now = datetime.now(tz=timezone.utc)
     current_year = now.year
 
     # Fix #5: use shared helper to extract dates
-    _dates = _extract_dates_from_soup(soup)
+    _dates = _extract_dates_from_soup(soup, index=idx)
     date_modified = _dates["dateModified"]
     date_published = _dates["datePublished"]
 
@@ -1091,7 +1079,7 @@ def detect_content_freshness(soup, clean_text: str | None = None) -> MethodScore
         freshness_level = "stale"
 
     # Look for year references in the text
-    body_text = clean_text or _get_clean_text(soup)
+    body_text = clean_text or idx.clean_text
     year_refs = re.findall(r"\b(20[12]\d)\b", body_text)
     year_counts = Counter(year_refs)
 
@@ -1155,9 +1143,10 @@ _CITABLE_PROPER_NAME_RE = re.compile(
 )
 
 
-def detect_citability_density(soup, clean_text: str | None = None) -> MethodScore:
+def detect_citability_density(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect density of citable facts per paragraph."""
-    paragraphs = soup.find_all("p")
+    idx = get_page_index(soup, index)
+    paragraphs = idx.find_all("p")
     if not paragraphs:
         return MethodScore(name="citability_density", label="Citability Density", max_score=7, impact="+15%")
 
@@ -1166,7 +1155,7 @@ def detect_citability_density(soup, clean_text: str | None = None) -> MethodScor
     total_facts = 0
 
     for p in paragraphs:
-        text = p.get_text(strip=True)
+        text = idx.text(p, strip=True)
         if len(text.split()) < 10:
             continue
         total_paras += 1
@@ -1220,9 +1209,10 @@ _DEFINITION_RE = re.compile(
 )
 
 
-def detect_definition_patterns(soup) -> MethodScore:
+def detect_definition_patterns(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect definition patterns after H1/H2 headings (matches 'what is X?' queries)."""
-    headings = soup.find_all(["h1", "h2"])
+    idx = get_page_index(soup, index)
+    headings = idx.find_all(["h1", "h2"])
     if not headings:
         return MethodScore(name="definition_patterns", label="Definition Patterns", max_score=5, impact="+10%")
 
@@ -1238,7 +1228,7 @@ def detect_definition_patterns(soup) -> MethodScore:
             continue
 
         # Check the first 150 characters of the paragraph
-        first_text = next_elem.get_text(strip=True)[:150]
+        first_text = idx.text(next_elem, strip=True)[:150]
         if _DEFINITION_RE.search(first_text):
             definitions_found += 1
 
@@ -1275,15 +1265,16 @@ def detect_definition_patterns(soup) -> MethodScore:
 # ─── 18. Response Format Mix (+8%) ───────────────────────────────────────────
 
 
-def detect_format_mix(soup) -> MethodScore:
+def detect_format_mix(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect mix of content formats: paragraphs, lists, tables."""
-    has_paragraphs = len(soup.find_all("p")) >= 3
-    has_lists = len(soup.find_all(["ul", "ol"])) >= 1
-    has_tables = len(soup.find_all("table")) >= 1
+    idx = get_page_index(soup, index)
+    has_paragraphs = len(idx.find_all("p")) >= 3
+    has_lists = len(idx.find_all(["ul", "ol"])) >= 1
+    has_tables = len(idx.find_all("table")) >= 1
 
     # Additional formats (bonus)
-    has_code = len(soup.find_all(["pre", "code"])) >= 1
-    has_blockquote = len(soup.find_all("blockquote")) >= 1
+    has_code = len(idx.find_all(["pre", "code"])) >= 1
+    has_blockquote = len(idx.find_all("blockquote")) >= 1
 
     # Count formats present
     base_formats = sum([has_paragraphs, has_lists, has_tables])
@@ -1331,29 +1322,30 @@ _ATTRIBUTION_INLINE_RE = re.compile(
 _FOOTNOTE_RE = re.compile(r"\[(\d{1,3})\]|\{\d{1,3}\}")
 
 
-def detect_attribution(soup, clean_text: str | None = None) -> MethodScore:
+def detect_attribution(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect attribution completeness: inline citations, footnotes, sourced claims."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
 
     # Inline citations (close to the claim)
     inline_attributions = _ATTRIBUTION_INLINE_RE.findall(body_text)
 
     # Inline links near claim text (paragraphs with links + authoritative pattern)
     inline_link_citations = 0
-    for p in soup.find_all("p"):
-        p_text = p.get_text(strip=True)
-        links_in_p = p.find_all("a", href=True)
+    for p in idx.find_all("p"):
+        p_text = idx.text(p, strip=True)
+        links_in_p = idx.find_all("a", href=True, within=p)
         if links_in_p and _AUTHORITY_RE.search(p_text):
             inline_link_citations += 1
 
     # Footnotes (end of page)
-    raw_html = str(soup)
+    raw_html = idx.html
     footnotes = _FOOTNOTE_RE.findall(raw_html)
 
     # Count sup tags with numbers (HTML footnotes)
     sup_footnotes = 0
-    for sup in soup.find_all("sup"):
-        sup_text = sup.get_text(strip=True)
+    for sup in idx.find_all("sup"):
+        sup_text = idx.text(sup, strip=True)
         if sup_text.isdigit():
             sup_footnotes += 1
 
@@ -1389,9 +1381,10 @@ _CTA_RE = re.compile(
 )
 
 
-def detect_negative_signals(soup, clean_text: str | None = None) -> MethodScore:
+def detect_negative_signals(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect negative quality signals: excessive self-promotion, thin content, repetitions."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     words = body_text.split()
     word_count = len(words)
     penalties = 0
@@ -1403,17 +1396,17 @@ def detect_negative_signals(soup, clean_text: str | None = None) -> MethodScore:
         penalties += 2  # CTAs too frequent (1 CTA per 200 words)
 
     # 2. Thin content: < 300 words with complex H2 headings
-    h2_tags = soup.find_all("h2")
+    h2_tags = idx.find_all("h2")
     if h2_tags and word_count < 300:
         penalties += 2  # Content too thin for a structured topic
 
     # 3. Content with no author
-    author_meta = soup.find("meta", attrs={"name": re.compile(r"author", re.I)})
-    author_bio = soup.find_all(
+    author_meta = idx.find("meta", attrs={"name": re.compile(r"author", re.I)})
+    author_bio = idx.find_all(
         ["div", "section", "aside"],
         class_=re.compile(r"author|bio|byline", re.I),
     )
-    author_schema = soup.find_all("span", attrs={"itemprop": "author"})
+    author_schema = idx.find_all("span", attrs={"itemprop": "author"})
     if not author_meta and not author_bio and not author_schema:
         penalties += 1
 
@@ -1454,32 +1447,33 @@ _PRO_CON_RE = re.compile(
 )
 
 
-def detect_comparison_content(soup, clean_text: str | None = None) -> MethodScore:
+def detect_comparison_content(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect comparison content: tables, pro/con sections, X vs Y headings."""
+    idx = get_page_index(soup, index)
     score = 0
 
     # 1. "X vs Y" pattern in headings
     vs_headings = 0
-    for h in soup.find_all(["h1", "h2", "h3", "h4"]):
-        h_text = h.get_text(strip=True)
+    for h in idx.find_all(["h1", "h2", "h3", "h4"]):
+        h_text = idx.text(h, strip=True)
         if _VS_RE.search(h_text):
             vs_headings += 1
 
     # 2. Sezioni pro/contro
     pro_con_sections = 0
-    for h in soup.find_all(["h2", "h3", "h4"]):
-        h_text = h.get_text(strip=True)
+    for h in idx.find_all(["h2", "h3", "h4"]):
+        h_text = idx.text(h, strip=True)
         if _PRO_CON_RE.search(h_text):
             pro_con_sections += 1
     # Search in text as well (fix #30: use clean_text)
-    body_text = clean_text or _get_clean_text(soup)
+    body_text = clean_text or idx.clean_text
     pro_con_in_text = len(_PRO_CON_RE.findall(body_text))
 
     # 3. Comparison tables (>3 rows and >2 columns = bonus)
     comparison_tables = 0
     large_tables = 0
-    for table in soup.find_all("table"):
-        rows = table.find_all("tr")
+    for table in idx.find_all("table"):
+        rows = idx.find_all("tr", within=table)
         if len(rows) >= 2:
             comparison_tables += 1
             # Check if it's "large" (>3 rows and >2 columns)
@@ -1513,15 +1507,16 @@ def detect_comparison_content(soup, clean_text: str | None = None) -> MethodScor
 # ─── 22. E-E-A-T Composite (+15%) — Quality Signal Batch 2 ──────────────────
 
 
-def detect_eeat(soup) -> MethodScore:
+def detect_eeat(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect E-E-A-T trust signals not covered by detect_authoritative_tone."""
+    idx = get_page_index(soup, index)
     score = 0
 
     # Trust signals: privacy policy, terms, about, contact
     trust_links = {"privacy": False, "terms": False, "about": False, "contact": False}
-    for a in soup.find_all("a", href=True):
+    for a in idx.find_all("a", href=True):
         href = a["href"].lower()
-        link_text = a.get_text(strip=True).lower()
+        link_text = idx.text(a, strip=True).lower()
         combined = href + " " + link_text
         if "privacy" in combined or "cookie" in combined:
             trust_links["privacy"] = True
@@ -1536,13 +1531,13 @@ def detect_eeat(soup) -> MethodScore:
     score += min(trust_count, 3)
 
     # Experience: author with a detailed bio (look for year/experience patterns)
-    author_sections = soup.find_all(
+    author_sections = idx.find_all(
         ["div", "section", "aside"],
         class_=re.compile(r"author|bio|about-author|byline|contributor", re.I),
     )
     has_detailed_bio = False
     for section in author_sections:
-        bio_text = section.get_text(strip=True)
+        bio_text = idx.text(section, strip=True)
         # Detailed bio: > 50 characters with numbers or years
         if len(bio_text) > 50 and re.search(r"\b\d+\s*(?:years?|anni|experience)\b", bio_text, re.I):
             has_detailed_bio = True
@@ -1552,8 +1547,8 @@ def detect_eeat(soup) -> MethodScore:
         score += 1
 
     # HTTPS (look for canonical or og:url starting with https)
-    canonical = soup.find("link", attrs={"rel": "canonical"})
-    og_url = soup.find("meta", attrs={"property": "og:url"})
+    canonical = idx.find("link", attrs={"rel": "canonical"})
+    og_url = idx.find("meta", attrs={"property": "og:url"})
     is_https = False
     for tag in [canonical, og_url]:
         if tag:
@@ -1583,9 +1578,10 @@ def detect_eeat(soup) -> MethodScore:
 # ─── 23. Content Decay Detection (-10%) — Quality Signal Batch 2 ─────────────
 
 
-def detect_content_decay(soup, clean_text: str | None = None) -> MethodScore:
+def detect_content_decay(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect content decay signals: old year references, stale update dates."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     now = datetime.now(tz=timezone.utc)
     current_year = now.year
     penalties = 0
@@ -1596,7 +1592,7 @@ def detect_content_decay(soup, clean_text: str | None = None) -> MethodScore:
     current_years = [int(y) for y in year_refs if int(y) >= current_year]
 
     # Fix #9: use shared helper to extract dates
-    _dates = _extract_dates_from_soup(soup)
+    _dates = _extract_dates_from_soup(soup, index=idx)
     date_modified = _dates["dateModified"]
 
     # Check whether dateModified is recent
@@ -1629,7 +1625,7 @@ def detect_content_decay(soup, clean_text: str | None = None) -> MethodScore:
 
     # 3. Count external links (cannot test if broken, but report the count)
     external_links = 0
-    for a in soup.find_all("a", href=True):
+    for a in idx.find_all("a", href=True):
         href = a["href"]
         if href.startswith("http") and not href.startswith("#"):
             external_links += 1
@@ -1657,18 +1653,12 @@ def detect_content_decay(soup, clean_text: str | None = None) -> MethodScore:
 # ─── 24. Content-to-Boilerplate Ratio (+8%) — Quality Signal Batch 2 ─────────
 
 
-def detect_boilerplate_ratio(soup, soup_clean=None) -> MethodScore:
+def detect_boilerplate_ratio(soup, soup_clean=None, index: PageIndex | None = None) -> MethodScore:
     """Detect content-to-boilerplate ratio: main/article text vs total page text."""
-    import copy
+    idx = get_page_index(soup, index)
 
-    # Fix #4: use pre-computed soup_clean if available
-    if soup_clean is not None:
-        total_soup = soup_clean
-    else:
-        total_soup = copy.deepcopy(soup)
-        for tag in total_soup(["script", "style"]):
-            tag.decompose()
-    total_text = total_soup.get_text(separator=" ", strip=True)
+    # get_text() already skips script/style strings: no clean copy needed (fix #4)
+    total_text = idx.text(separator=" ", strip=True)
     total_len = len(total_text)
 
     if total_len < 50:
@@ -1683,34 +1673,30 @@ def detect_boilerplate_ratio(soup, soup_clean=None) -> MethodScore:
         )
 
     # Look for the main content in <main> or <article>
-    content_tag = soup.find("main") or soup.find("article")
+    content_tag = idx.find("main") or idx.find("article")
     method = "main_tag"
 
     if content_tag:
-        # Fix #419: remove script/style from content_tag before extracting text
-        # (total_text already has them removed; without this, ratio is inflated)
-        clean_content = copy.deepcopy(content_tag)
-        for tag in clean_content(["script", "style"]):
-            tag.decompose()
-        content_text = clean_content.get_text(separator=" ", strip=True)
+        # Fix #419: exclude script/style from content_tag text
+        # (total_text already excludes them; without this, ratio is inflated)
+        content_text = idx.text(content_tag, " ", True, exclude=NON_CONTENT_TAGS)
     else:
-        # Heuristic: remove nav, header, footer, sidebar
+        # Heuristic: skip nav, header, footer, sidebar
         method = "heuristic"
-        clean_soup = copy.deepcopy(soup)
-        for tag in clean_soup(["script", "style", "nav", "header", "footer"]):
-            tag.decompose()
-        # Remove sidebar by class/id
-        for tag in clean_soup.find_all(
+        sidebars = idx.find_all(
             ["div", "aside", "section"],
             class_=re.compile(r"sidebar|widget|menu|navigation|nav-", re.I),
-        ):
-            tag.decompose()
-        for tag in clean_soup.find_all(
+        ) + idx.find_all(
             ["div", "aside", "section"],
             id=re.compile(r"sidebar|widget|menu|navigation", re.I),
-        ):
-            tag.decompose()
-        content_text = clean_soup.get_text(separator=" ", strip=True)
+        )
+        content_text = " ".join(
+            idx.iter_strings(
+                strip=True,
+                exclude_names=("script", "style", "nav", "header", "footer"),
+                exclude_tags=sidebars,
+            )
+        )
 
     content_len = len(content_text)
     ratio = content_len / total_len if total_len > 0 else 0
@@ -1764,17 +1750,18 @@ _NUANCE_HEADING_RE = re.compile(
 )
 
 
-def detect_nuance_signals(soup, clean_text: str | None = None) -> MethodScore:
+def detect_nuance_signals(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect nuance and intellectual honesty signals in content."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
 
     # Honesty patterns in text
     nuance_matches = _NUANCE_RE.findall(body_text)
 
     # Headings with sections dedicated to limitations/drawbacks
     nuance_headings = 0
-    for h in soup.find_all(["h2", "h3", "h4"]):
-        h_text = h.get_text(strip=True)
+    for h in idx.find_all(["h2", "h3", "h4"]):
+        h_text = idx.text(h, strip=True)
         if _NUANCE_HEADING_RE.search(h_text):
             nuance_headings += 1
 
@@ -1815,25 +1802,26 @@ _SNIPPET_DEF_RE = re.compile(
 )
 
 
-def detect_snippet_ready(soup) -> MethodScore:
+def detect_snippet_ready(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect zero-click / snippet-ready content sections.
 
     Checks if headings are followed by concise definitions (first 150 chars)
     or if question headings (ending with '?') have direct answers under 60 words.
     """
-    headings = soup.find_all(["h2", "h3", "h4"])
+    idx = get_page_index(soup, index)
+    headings = idx.find_all(["h2", "h3", "h4"])
     if not headings:
         return MethodScore(name="snippet_ready", label="Snippet-Ready Content", max_score=4, impact="+10%")
 
     snippet_ready_count = 0
 
     for heading in headings:
-        heading_text = heading.get_text(strip=True)
+        heading_text = idx.text(heading, strip=True)
         # Find the first paragraph after the heading
         next_p = heading.find_next("p")
         if not next_p:
             continue
-        p_text = next_p.get_text(strip=True)
+        p_text = idx.text(next_p, strip=True)
 
         # Pattern 1: heading with "?" → direct answer under 60 words
         if heading_text.endswith("?"):
@@ -1882,13 +1870,14 @@ def detect_snippet_ready(soup) -> MethodScore:
 # Fix #7: removed duplicate _CONCRETE_DATA_RE — use _CITABLE_FACT_NUMERIC_RE
 
 
-def detect_chunk_quotability(soup) -> MethodScore:
+def detect_chunk_quotability(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect quotable content chunks: self-contained paragraphs with concrete data.
 
     For each paragraph of 50-150 words, checks if it contains concrete data
     (numbers, percentages, dates) making it independently quotable by AI.
     """
-    paragraphs = soup.find_all("p")
+    idx = get_page_index(soup, index)
+    paragraphs = idx.find_all("p")
     if not paragraphs:
         return MethodScore(name="chunk_quotability", label="Chunk Quotability", max_score=4, impact="+10%")
 
@@ -1896,7 +1885,7 @@ def detect_chunk_quotability(soup) -> MethodScore:
     quotable_count = 0
 
     for p in paragraphs:
-        text = p.get_text(strip=True)
+        text = idx.text(p, strip=True)
         word_count = len(text.split())
         # Only paragraphs in the 50-150 word range
         if word_count < 50 or word_count > 150:
@@ -1938,22 +1927,15 @@ def detect_chunk_quotability(soup) -> MethodScore:
 # ─── 28. Blog Structure (#230) ───────────────────────────────────────────────
 
 
-def detect_blog_structure(soup) -> MethodScore:
+def detect_blog_structure(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect blog structure signals in Article/BlogPosting schema.
 
     Checks: datePublished/dateModified, author bio, categories/tags.
     Only scores if Article or BlogPosting schema is present (non-blog pages get 0).
     """
+    idx = get_page_index(soup, index)
     # Look for Article or BlogPosting schema in JSON-LD
-    article_schema = None
-    for item in _iter_jsonld_objects(soup):
-        schema_type = item.get("@type", "")
-        types = schema_type if isinstance(schema_type, list) else [schema_type]
-        if any(t in ("Article", "BlogPosting", "NewsArticle") for t in types):
-            article_schema = item
-            break
-        if article_schema:
-            break
+    article_schema = idx.jsonld.first_of_type("Article", "BlogPosting", "NewsArticle")
 
     # If no Article/BlogPosting schema, score 0 without penalty
     if not article_schema:
@@ -1974,10 +1956,10 @@ def detect_blog_structure(soup) -> MethodScore:
     has_categories = bool(
         article_schema.get("articleSection")
         or article_schema.get("keywords")
-        or soup.find("meta", attrs={"property": "article:tag"})
+        or idx.find("meta", attrs={"property": "article:tag"})
     )
     # Look for author bio in the DOM
-    author_bio = soup.find_all(
+    author_bio = idx.find_all(
         ["div", "section", "aside"],
         class_=re.compile(r"author|bio|about-author|byline", re.I),
     )
@@ -2012,21 +1994,14 @@ def detect_blog_structure(soup) -> MethodScore:
 # ─── 29. AI Shopping Readiness (#277) ────────────────────────────────────────
 
 
-def detect_shopping_readiness(soup) -> MethodScore:
+def detect_shopping_readiness(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect AI shopping readiness from Product schema.
 
     Checks: Product schema with price + availability, AggregateRating, review count.
     Only scores if Product schema is present (non-ecommerce pages get 0).
     """
-    product_schema = None
-    for item in _iter_jsonld_objects(soup):
-        schema_type = item.get("@type", "")
-        types = schema_type if isinstance(schema_type, list) else [schema_type]
-        if "Product" in types:
-            product_schema = item
-            break
-        if product_schema:
-            break
+    idx = get_page_index(soup, index)
+    product_schema = idx.jsonld.first_of_type("Product")
 
     if not product_schema:
         return MethodScore(
@@ -2081,21 +2056,14 @@ def detect_shopping_readiness(soup) -> MethodScore:
 # ─── 30. ChatGPT Shopping Feed (#275) ────────────────────────────────────────
 
 
-def detect_chatgpt_shopping(soup) -> MethodScore:
+def detect_chatgpt_shopping(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect ChatGPT Shopping integration signals from Product schema.
 
     Checks required fields for ChatGPT Shopping: name, price, image, availability, brand.
     Cannot verify chatgpt.com/merchants registration, but verifies field completeness.
     """
-    product_schema = None
-    for item in _iter_jsonld_objects(soup):
-        schema_type = item.get("@type", "")
-        types = schema_type if isinstance(schema_type, list) else [schema_type]
-        if "Product" in types:
-            product_schema = item
-            break
-        if product_schema:
-            break
+    idx = get_page_index(soup, index)
+    product_schema = idx.jsonld.first_of_type("Product")
 
     if not product_schema:
         return MethodScore(
@@ -2163,24 +2131,25 @@ _QUESTION_HEADING_RE = re.compile(
 )
 
 
-def detect_voice_search(soup) -> MethodScore:
+def detect_voice_search(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect voice/conversational search readiness signals."""
+    idx = get_page_index(soup, index)
     score = 0
     question_headings = 0
     concise_answers = 0
     has_speakable = False
 
     # 1. Look for headings in natural question format
-    headings = soup.find_all(re.compile(r"^h[1-6]$", re.I))
+    headings = idx.find_all(re.compile(r"^h[1-6]$", re.I))
     for h in headings:
-        text = h.get_text(strip=True)
+        text = idx.text(h, strip=True)
         if "?" in text or _QUESTION_HEADING_RE.search(text):
             question_headings += 1
             # Look for a concise answer after a "?" heading
             if "?" in text:
                 next_p = h.find_next("p")
                 if next_p:
-                    words = next_p.get_text(strip=True).split()
+                    words = idx.text(next_p, strip=True).split()
                     if 0 < len(words) < 60:
                         concise_answers += 1
 
@@ -2190,10 +2159,8 @@ def detect_voice_search(soup) -> MethodScore:
         score += 1
 
     # 2. Look for speakable schema in any JSON-LD
-    for item in _iter_jsonld_objects(soup):
-        if "speakable" in item:
-            has_speakable = True
-            break
+    if idx.jsonld.with_property("speakable"):
+        has_speakable = True
 
     if has_speakable:
         score += 1
@@ -2240,12 +2207,13 @@ _PLATFORM_DOMAINS = {
 }
 
 
-def detect_multi_platform(soup) -> MethodScore:
+def detect_multi_platform(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect multi-platform presence via sameAs URLs in schema."""
+    idx = get_page_index(soup, index)
     platforms_found: set[str] = set()
 
     # Extract sameAs from all JSON-LD schemas
-    for item in _iter_jsonld_objects(soup):
+    for item in idx.jsonld.with_property("sameAs"):
         same_as = item.get("sameAs", [])
         if isinstance(same_as, str):
             same_as = [same_as]
@@ -2283,13 +2251,14 @@ def detect_multi_platform(soup) -> MethodScore:
 # ─── Entity Disambiguation (+8%) — Batch A v3.16.0 ───────────────────────────
 
 
-def detect_entity_disambiguation(soup) -> MethodScore:
+def detect_entity_disambiguation(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect entity disambiguation signals: consistent naming and explicit definitions."""
+    idx = get_page_index(soup, index)
     score = 0
 
     # 1. Collect names from title, og:title, schema name
     names: list[str] = []
-    title_tag = soup.find("title")
+    title_tag = idx.find("title")
     if title_tag and title_tag.string:
         # Take the part before common separators
         raw = title_tag.string.strip()
@@ -2297,7 +2266,7 @@ def detect_entity_disambiguation(soup) -> MethodScore:
         if parts:
             names.append(parts[0].strip().lower())
 
-    og_title = soup.find("meta", attrs={"property": "og:title"})
+    og_title = idx.find("meta", attrs={"property": "og:title"})
     if og_title and og_title.get("content"):
         parts = re.split(r"\s*[|\-–—]\s*", og_title["content"])
         if parts:
@@ -2306,7 +2275,7 @@ def detect_entity_disambiguation(soup) -> MethodScore:
     # Name from JSON-LD schema
     schema_name = None
     sameas_count = 0
-    for item in _iter_jsonld_objects(soup):
+    for item in _iter_jsonld_objects(soup, index=idx):
         if "name" in item and not schema_name:
             schema_name = str(item["name"]).strip().lower()
             names.append(schema_name)
@@ -2323,12 +2292,12 @@ def detect_entity_disambiguation(soup) -> MethodScore:
             score += 1
 
     # 2. First sentence contains an explicit definition of the brand/site
-    body = soup.find("body")
+    body = idx.find("body")
     if body:
         # Find the first meaningful paragraph
         first_p = body.find("p")
         if first_p:
-            first_text = first_p.get_text(strip=True)
+            first_text = idx.text(first_p, strip=True)
             # Look for definition pattern: "X is...", "X è..."
             if re.search(r"\b(?:is|are|è|sono)\s+(?:a|an|the|un|una|il|la|lo)\b", first_text, re.I):
                 score += 1
@@ -2370,9 +2339,10 @@ _OWN_DATA_RE = re.compile(
 )
 
 
-def detect_first_party_data(soup, clean_text: str | None = None) -> MethodScore:
+def detect_first_party_data(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect first-party data and original research signals."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     score = 0
 
     # 1. Original research patterns
@@ -2389,8 +2359,8 @@ def detect_first_party_data(soup, clean_text: str | None = None) -> MethodScore:
 
     # 3. "Methodology" or "Methods" section
     has_methodology = False
-    for h in soup.find_all(re.compile(r"^h[1-6]$", re.I)):
-        h_text = h.get_text(strip=True).lower()
+    for h in idx.find_all(re.compile(r"^h[1-6]$", re.I)):
+        h_text = idx.text(h, strip=True).lower()
         if h_text in (
             "methodology",
             "methods",
@@ -2423,18 +2393,19 @@ def detect_first_party_data(soup, clean_text: str | None = None) -> MethodScore:
 # ─── Stale Data Detection (-10%) — Batch A v3.16.0 ──────────────────────────
 
 
-def detect_stale_data(soup, clean_text: str | None = None) -> MethodScore:
+def detect_stale_data(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect stale data signals. Score INVERSO: 4 se pulito, 0 se molto stale."""
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     now = datetime.now(tz=timezone.utc)
     current_year = now.year
     penalties = 0
 
     # 1. Old copyright year in the footer
-    footer = soup.find("footer")
+    footer = idx.find("footer")
     old_copyright = False
     if footer:
-        footer_text = footer.get_text(strip=True)
+        footer_text = idx.text(footer, strip=True)
         # Fix #418: handle copyright ranges (e.g. © 2020-2026) — use end year
         copyright_years = re.findall(
             r"©\s*(20\d{2})(?:\s*[-–]\s*(20\d{2}))?|copyright\s*(20\d{2})(?:\s*[-–]\s*(20\d{2}))?",
@@ -2483,13 +2454,14 @@ def detect_stale_data(soup, clean_text: str | None = None) -> MethodScore:
 # ─── Social Proof (+8%) — Batch A v3.16.0 ────────────────────────────────────
 
 
-def detect_social_proof(soup, clean_text: str | None = None) -> MethodScore:
+def detect_social_proof(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect social proof signals: testimonials, ratings, trust badges."""
+    idx = get_page_index(soup, index)
     score = 0
 
     # 1. Testimonial: class="testimonial", blockquote with attribution, "as seen in"
     has_testimonial = False
-    testimonial_divs = soup.find_all(
+    testimonial_divs = idx.find_all(
         ["div", "section", "aside"],
         class_=re.compile(r"testimonial|review|customer-quote", re.I),
     )
@@ -2497,7 +2469,7 @@ def detect_social_proof(soup, clean_text: str | None = None) -> MethodScore:
         has_testimonial = True
 
     # Blockquote with attribution (person's name)
-    blockquotes = soup.find_all("blockquote")
+    blockquotes = idx.find_all("blockquote")
     for bq in blockquotes:
         # Look for cite or footer inside blockquote
         cite = bq.find(["cite", "footer", "figcaption"])
@@ -2506,7 +2478,7 @@ def detect_social_proof(soup, clean_text: str | None = None) -> MethodScore:
             break
 
     # Pattern "as seen in" / "as featured in"
-    body_text = clean_text or _get_clean_text(soup)
+    body_text = clean_text or idx.clean_text
     if re.search(r"\b(?:as\s+seen\s+in|as\s+featured\s+in|featured\s+by|trusted\s+by)\b", body_text, re.I):
         has_testimonial = True
 
@@ -2515,7 +2487,7 @@ def detect_social_proof(soup, clean_text: str | None = None) -> MethodScore:
 
     # 2. AggregateRating in schema with reviewCount > 10
     has_rating = False
-    for item in _iter_jsonld_objects(soup):
+    for item in idx.jsonld.with_property("aggregateRating"):
         rating = item.get("aggregateRating", {})
         if not isinstance(rating, dict):
             continue
@@ -2534,7 +2506,7 @@ def detect_social_proof(soup, clean_text: str | None = None) -> MethodScore:
 
     # 3. Trust badges, partner logos
     has_trust_badges = False
-    badge_imgs = soup.find_all(
+    badge_imgs = idx.find_all(
         "img",
         attrs={
             "alt": re.compile(r"badge|certified|partner|award|trust|seal|logo", re.I),
@@ -2544,7 +2516,7 @@ def detect_social_proof(soup, clean_text: str | None = None) -> MethodScore:
         has_trust_badges = True
 
     # Trust/partner section
-    trust_sections = soup.find_all(
+    trust_sections = idx.find_all(
         ["div", "section"],
         class_=re.compile(r"partner|trust|badge|certified|award|client-logo", re.I),
     )
@@ -2572,15 +2544,16 @@ def detect_social_proof(soup, clean_text: str | None = None) -> MethodScore:
 # ─── Accessibility as Signal (+5%) — Batch A v3.16.0 ─────────────────────────
 
 
-def detect_accessibility_signals(soup) -> MethodScore:
+def detect_accessibility_signals(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect accessibility signals: semantic HTML, ARIA landmarks, skip links."""
+    idx = get_page_index(soup, index)
     score = 0
 
     # 1. Semantic HTML tags
     semantic_tags = {"main", "nav", "header", "footer"}
     found_semantic = set()
     for tag_name in semantic_tags:
-        if soup.find(tag_name):
+        if idx.find(tag_name):
             found_semantic.add(tag_name)
 
     if len(found_semantic) >= 3:
@@ -2590,7 +2563,7 @@ def detect_accessibility_signals(soup) -> MethodScore:
     aria_roles = {"main", "navigation", "banner", "contentinfo"}
     found_aria = set()
     for role in aria_roles:
-        if soup.find(attrs={"role": role}):
+        if idx.find(attrs={"role": role}):
             found_aria.add(role)
 
     if found_aria:
@@ -2598,13 +2571,13 @@ def detect_accessibility_signals(soup) -> MethodScore:
 
     # 3. Skip link
     has_skip_link = False
-    for a in soup.find_all("a", href=True):
+    for a in idx.find_all("a", href=True):
         href = a["href"].lower()
         if href in ("#main", "#content", "#main-content", "#maincontent"):
             has_skip_link = True
             break
         # Also check for "skip to" text
-        link_text = a.get_text(strip=True).lower()
+        link_text = idx.text(a, strip=True).lower()
         if "skip to" in link_text or "vai al contenuto" in link_text:
             has_skip_link = True
             break
@@ -2639,14 +2612,15 @@ _CTA_FUNNEL_RE = re.compile(
 )
 
 
-def detect_conversion_funnel(soup) -> MethodScore:
+def detect_conversion_funnel(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect AI conversion funnel signals: CTAs, pricing links, contact info."""
+    idx = get_page_index(soup, index)
     score = 0
 
     # 1. Visible CTA (button/link with CTA pattern)
     has_cta = False
-    for tag in soup.find_all(["a", "button"]):
-        text = tag.get_text(strip=True)
+    for tag in idx.find_all(["a", "button"]):
+        text = idx.text(tag, strip=True)
         if _CTA_FUNNEL_RE.search(text):
             has_cta = True
             break
@@ -2656,7 +2630,7 @@ def detect_conversion_funnel(soup) -> MethodScore:
 
     # 2. Pricing page link
     has_pricing = False
-    for a in soup.find_all("a", href=True):
+    for a in idx.find_all("a", href=True):
         href = a["href"].lower()
         if "pricing" in href or "plans" in href or "prezzi" in href:
             has_pricing = True
@@ -2667,7 +2641,7 @@ def detect_conversion_funnel(soup) -> MethodScore:
 
     # 3. Contact info (href with "contact", "mailto:")
     has_contact = False
-    for a in soup.find_all("a", href=True):
+    for a in idx.find_all("a", href=True):
         href = a["href"].lower()
         if "contact" in href or "mailto:" in href or "contatti" in href:
             has_contact = True
@@ -2724,18 +2698,19 @@ def _parse_date_flexible(date_str: str) -> datetime | None:
     return None
 
 
-def detect_temporal_coherence(soup, clean_text: str | None = None) -> MethodScore:
+def detect_temporal_coherence(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect temporal signal coherence across schema dates and visible content dates.
 
     Compares dateModified/datePublished from JSON-LD schema with visible
     'Last updated' / 'Updated' patterns in text. Coherent dates (< 30 days
     apart) get full score; incoherent dates (> 90 days) get a warning.
     """
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     dates_found: dict[str, datetime] = {}
 
     # 1. Schema JSON-LD: dateModified, datePublished
-    for item in _iter_jsonld_objects(soup):
+    for item in _iter_jsonld_objects(soup, index=idx):
         for key in ("dateModified", "datePublished"):
             if key in item:
                 parsed = _parse_date_flexible(str(item[key]))
@@ -2747,7 +2722,7 @@ def detect_temporal_coherence(soup, clean_text: str | None = None) -> MethodScor
         ("article:modified_time", "meta_modified"),
         ("article:published_time", "meta_published"),
     ]:
-        meta = soup.find("meta", attrs={"property": meta_prop})
+        meta = idx.find("meta", attrs={"property": meta_prop})
         if meta and meta.get("content"):
             parsed = _parse_date_flexible(meta["content"])
             if parsed:
@@ -2827,13 +2802,14 @@ _GENERIC_ANCHORS = {
 }
 
 
-def detect_anchor_text_quality(soup, base_url: str) -> MethodScore:
+def detect_anchor_text_quality(soup, base_url: str, index: PageIndex | None = None) -> MethodScore:
     """Detect internal link anchor text quality.
 
     Counts internal links with generic anchor text ('click here', 'read more',
     'here', etc.) vs descriptive anchor text (> 3 words, not generic).
     Score: > 80% descriptive = full, < 50% = 0.
     """
+    idx = get_page_index(soup, index)
     parsed_base = urlparse(base_url)
     base_domain = parsed_base.netloc.replace("www.", "")
 
@@ -2841,7 +2817,7 @@ def detect_anchor_text_quality(soup, base_url: str) -> MethodScore:
     descriptive_count = 0
     total_internal = 0
 
-    for a in soup.find_all("a", href=True):
+    for a in idx.find_all("a", href=True):
         href = a["href"]
         # Determine if it's an internal link
         if href.startswith("http"):
@@ -2852,7 +2828,7 @@ def detect_anchor_text_quality(soup, base_url: str) -> MethodScore:
             continue  # Internal anchor or mailto/tel, skip
 
         # Internal link
-        anchor_text = a.get_text(strip=True).lower()
+        anchor_text = idx.text(a, strip=True).lower()
         if not anchor_text:
             continue
 
@@ -2914,27 +2890,24 @@ def detect_anchor_text_quality(soup, base_url: str) -> MethodScore:
 # ─── International GEO (+5%) — Batch B v3.16.0 ─────────────────────────────
 
 
-def detect_international_geo(soup) -> MethodScore:
+def detect_international_geo(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect international GEO signals: hreflang tags, html lang, schema inLanguage.
 
     Only scores if the site HAS hreflang tags — does not penalize monolingual sites.
     """
+    idx = get_page_index(soup, index)
     score = 0
 
     # 1. <html lang="...">
-    html_tag = soup.find("html")
+    html_tag = idx.find("html")
     html_lang = html_tag.get("lang", "").strip() if html_tag else ""
 
     # 2. <link rel="alternate" hreflang="..."> tags
-    hreflang_tags = soup.find_all("link", attrs={"rel": "alternate", "hreflang": True})
+    hreflang_tags = idx.find_all("link", attrs={"rel": "alternate", "hreflang": True})
     hreflang_langs = [tag.get("hreflang", "") for tag in hreflang_tags if tag.get("hreflang")]
 
     # 3. Schema inLanguage
-    in_language = None
-    for item in _iter_jsonld_objects(soup):
-        if "inLanguage" in item:
-            in_language = item["inLanguage"]
-            break
+    in_language = idx.jsonld.first("inLanguage")
 
     # Only assign a score if the site has hreflang
     has_hreflang = len(hreflang_langs) > 0
@@ -2986,17 +2959,18 @@ def detect_international_geo(soup) -> MethodScore:
 # ─── AI Crawl Budget (+5%) — Batch B v3.16.0 ────────────────────────────────
 
 
-def detect_crawl_budget(soup) -> MethodScore:
+def detect_crawl_budget(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect AI crawl budget signals from HTML meta tags and head links.
 
     Since citability analysis only has access to HTML (not robots.txt),
     checks: link rel='sitemap' in head, meta robots noindex/nofollow penalties.
     """
+    idx = get_page_index(soup, index)
     score = 3  # Full score by default, with penalties
     penalties = []
 
     # 1. Check meta robots for noindex/nofollow
-    meta_robots = soup.find("meta", attrs={"name": re.compile(r"^robots$", re.I)})
+    meta_robots = idx.find("meta", attrs={"name": re.compile(r"^robots$", re.I)})
     has_noindex = False
     has_nofollow = False
     if meta_robots:
@@ -3015,7 +2989,7 @@ def detect_crawl_budget(soup) -> MethodScore:
             score -= 1
 
     # 2. Check X-Robots-Tag meta (alternative)
-    meta_x_robots = soup.find("meta", attrs={"http-equiv": re.compile(r"x-robots-tag", re.I)})
+    meta_x_robots = idx.find("meta", attrs={"http-equiv": re.compile(r"x-robots-tag", re.I)})
     if meta_x_robots:
         content = (meta_x_robots.get("content") or "").lower()
         if "noindex" in content and not has_noindex:
@@ -3029,7 +3003,7 @@ def detect_crawl_budget(soup) -> MethodScore:
 
     # 3. Look for link rel="sitemap" in <head>
     has_sitemap_link = False
-    sitemap_link = soup.find("link", attrs={"rel": "sitemap"})
+    sitemap_link = idx.find("link", attrs={"rel": "sitemap"})
     if sitemap_link and sitemap_link.get("href"):
         has_sitemap_link = True
 
@@ -3101,7 +3075,7 @@ _RETRIEVAL_TRIGGER_RE = re.compile(
 )
 
 
-def detect_answer_capsule(soup, clean_text: str | None = None) -> MethodScore:
+def detect_answer_capsule(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect self-contained answer paragraphs extractable by RAG systems (#372).
 
     An answer capsule is a paragraph that:
@@ -3110,7 +3084,8 @@ def detect_answer_capsule(soup, clean_text: str | None = None) -> MethodScore:
     3. Is 30-120 words (fits in a single RAG chunk)
     4. Ends with a complete sentence (not truncated)
     """
-    paragraphs = soup.find_all("p")
+    idx = get_page_index(soup, index)
+    paragraphs = idx.find_all("p")
     if not paragraphs:
         return MethodScore(
             name="answer_capsule",
@@ -3123,7 +3098,7 @@ def detect_answer_capsule(soup, clean_text: str | None = None) -> MethodScore:
     total_candidates = 0
 
     for p in paragraphs:
-        text = p.get_text(strip=True)
+        text = idx.text(p, strip=True)
         words = text.split()
         word_count = len(words)
 
@@ -3184,20 +3159,17 @@ def detect_answer_capsule(soup, clean_text: str | None = None) -> MethodScore:
     )
 
 
-def detect_token_efficiency(soup, clean_text: str | None = None) -> MethodScore:
+def detect_token_efficiency(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Analyze content-to-noise ratio for LLM context window efficiency (#365).
 
     Measures how much of the page is useful content vs boilerplate/noise
     from an LLM token perspective. High token efficiency = more useful
     information per token consumed from the context window.
     """
-    import copy
+    idx = get_page_index(soup, index)
 
-    # Total page text (without scripts/styles)
-    total_soup = copy.deepcopy(soup)
-    for tag in total_soup(["script", "style"]):
-        tag.decompose()
-    total_text = total_soup.get_text(separator=" ", strip=True)
+    # Total page text (get_text() already skips script/style strings)
+    total_text = idx.text(separator=" ", strip=True)
     total_words = len(total_text.split())
 
     if total_words < 20:
@@ -3212,15 +3184,12 @@ def detect_token_efficiency(soup, clean_text: str | None = None) -> MethodScore:
         )
 
     # Content words: text inside <main>, <article>, or content <p> tags
-    content_tag = soup.find("main") or soup.find("article")
+    content_tag = idx.find("main") or idx.find("article")
     if content_tag:
-        clean_content = copy.deepcopy(content_tag)
-        for tag in clean_content(["script", "style", "nav"]):
-            tag.decompose()
-        content_text = clean_content.get_text(separator=" ", strip=True)
+        content_text = idx.text(content_tag, " ", True, exclude=("script", "style", "nav"))
     else:
         # Fallback: sum all <p> text
-        content_text = " ".join(p.get_text(strip=True) for p in soup.find_all("p"))
+        content_text = " ".join(idx.text(p, strip=True) for p in idx.find_all("p"))
 
     content_words = len(content_text.split())
 
@@ -3254,7 +3223,7 @@ def detect_token_efficiency(soup, clean_text: str | None = None) -> MethodScore:
     )
 
 
-def detect_entity_resolution(soup) -> MethodScore:
+def detect_entity_resolution(soup, index: PageIndex | None = None) -> MethodScore:
     """Detect how easily LLMs can disambiguate entities on the page (#373).
 
     Checks:
@@ -3263,6 +3232,7 @@ def detect_entity_resolution(soup) -> MethodScore:
     3. Consistent entity naming (no conflicting references)
     4. sameAs links for disambiguation
     """
+    idx = get_page_index(soup, index)
     score = 0
     has_schema_entity = False
     has_sameas = False
@@ -3270,7 +3240,7 @@ def detect_entity_resolution(soup) -> MethodScore:
     entity_types_found: list[str] = []
 
     # 1. Check JSON-LD for well-typed entities with description
-    for item in _iter_jsonld_objects(soup):
+    for item in _iter_jsonld_objects(soup, index=idx):
         entity_type = item.get("@type")
         name = item.get("name")
         desc = item.get("description")
@@ -3295,11 +3265,11 @@ def detect_entity_resolution(soup) -> MethodScore:
         score += 1
 
     # 2. Check first paragraph for entity definition pattern
-    body = soup.find("body")
+    body = idx.find("body")
     if body:
         first_p = body.find("p")
         if first_p:
-            text = first_p.get_text(strip=True)
+            text = idx.text(first_p, strip=True)
             if re.search(
                 r"\b(?:is|are|refers?\s+to|è|sono|significa)\s+"
                 r"(?:a|an|the|un|una|il|la|lo|one\s+of|defined\s+as)",
@@ -3325,14 +3295,15 @@ def detect_entity_resolution(soup) -> MethodScore:
     )
 
 
-def detect_kg_density(soup, clean_text: str | None = None) -> MethodScore:
+def detect_kg_density(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect explicit entity relationships for knowledge graph extraction (#366).
 
     Measures how many explicit relationship statements (e.g., "X is a Y",
     "founded by Z", "located in W") exist in the content, making it easier
     for LLMs to build structured knowledge from the page.
     """
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     if not body_text or len(body_text) < 50:
         return MethodScore(
             name="kg_density",
@@ -3351,7 +3322,7 @@ def detect_kg_density(soup, clean_text: str | None = None) -> MethodScore:
 
     # Check for structured data relationships too (schema.org)
     schema_relations = 0
-    for item in _iter_jsonld_objects(soup):
+    for item in _iter_jsonld_objects(soup, index=idx):
         # Count relationship properties
         for key in (
             "author",
@@ -3400,14 +3371,15 @@ def detect_kg_density(soup, clean_text: str | None = None) -> MethodScore:
     )
 
 
-def detect_retrieval_triggers(soup, clean_text: str | None = None) -> MethodScore:
+def detect_retrieval_triggers(soup, clean_text: str | None = None, index: PageIndex | None = None) -> MethodScore:
     """Detect phrases that trigger RAG retrieval in LLM pipelines (#374).
 
     RAG systems rank chunks by relevance to user queries. Content with
     explicit trigger phrases (e.g., "research shows", "best practice",
     "how to", "compared to") is more likely to be retrieved and cited.
     """
-    body_text = clean_text or _get_clean_text(soup)
+    idx = get_page_index(soup, index)
+    body_text = clean_text or idx.clean_text
     if not body_text or len(body_text) < 50:
         return MethodScore(
             name="retrieval_triggers",
@@ -3427,8 +3399,8 @@ def detect_retrieval_triggers(soup, clean_text: str | None = None) -> MethodScor
 
     # Check for question-format headings (strong retrieval triggers)
     question_headings = 0
-    for h in soup.find_all(re.compile(r"^h[1-6]$")):
-        text = h.get_text(strip=True)
+    for h in idx.find_all(re.compile(r"^h[1-6]$")):
+        text = idx.text(h, strip=True)
         if text.endswith("?") or re.match(r"(?:how|what|why|when|where|which|who)\b", text, re.I):
             question_headings += 1
 
@@ -3589,76 +3561,78 @@ def _compute_grade(total: int) -> str:
     return "critical"
 
 
-def audit_citability(soup, base_url: str, soup_clean=None) -> CitabilityResult:
+def audit_citability(soup, base_url: str, soup_clean=None, index: PageIndex | None = None) -> CitabilityResult:
     """Analyze content citability with 47 methods (Princeton GEO + AutoGEO + RAG readiness).
 
     Args:
         soup: BeautifulSoup of the HTML page.
         base_url: Base URL of the site.
-        soup_clean: (optional) soup pre-cleaned from script/style (fix #285).
+        soup_clean: Ignored, kept for backward compatibility (fix #285).
+        index: (optional) PageIndex of ``soup``, shared with the other sub-audits.
 
     Returns:
         CitabilityResult with a 0-100 score normalized over the maximum the methods
         expose, the raw/max figures behind it, and per-method detail.
     """
-    # Fix #285: pass soup_clean to _get_clean_text to avoid re-parsing
-    clean_text = _get_clean_text(soup, soup_clean=soup_clean)
+    # One DOM traversal for all 47 methods: each reads tags, text and JSON-LD from the index
+    index = get_page_index(soup, index)
+    clean_text = index.clean_text
 
     methods = [
         # Original Princeton GEO methods (recalibrated)
-        detect_quotations(soup, clean_text=clean_text),
-        detect_statistics(soup, clean_text=clean_text),
-        detect_fluency(soup, clean_text=clean_text),
-        detect_cite_sources(soup, base_url),
-        detect_answer_first(soup),
-        detect_passage_density(soup),
-        detect_technical_terms(soup, clean_text=clean_text),
-        detect_authoritative_tone(soup, clean_text=clean_text),
-        detect_easy_to_understand(soup),
-        detect_unique_words(soup, clean_text=clean_text),
-        detect_keyword_stuffing(soup, clean_text=clean_text),
+        detect_quotations(soup, clean_text=clean_text, index=index),
+        detect_statistics(soup, clean_text=clean_text, index=index),
+        detect_fluency(soup, clean_text=clean_text, index=index),
+        detect_cite_sources(soup, base_url, index=index),
+        detect_answer_first(soup, index=index),
+        detect_passage_density(soup, index=index),
+        detect_technical_terms(soup, clean_text=clean_text, index=index),
+        detect_authoritative_tone(soup, clean_text=clean_text, index=index),
+        detect_easy_to_understand(soup, index=index),
+        detect_unique_words(soup, clean_text=clean_text, index=index),
+        detect_keyword_stuffing(soup, clean_text=clean_text, index=index),
         # New content analysis methods v3.15
-        detect_readability(soup, clean_text=clean_text),
-        detect_faq_in_content(soup),
-        detect_image_alt_quality(soup),
-        detect_content_freshness(soup, clean_text=clean_text),
-        detect_citability_density(soup, clean_text=clean_text),
-        detect_definition_patterns(soup),
-        detect_format_mix(soup),
+        detect_readability(soup, clean_text=clean_text, index=index),
+        detect_faq_in_content(soup, index=index),
+        detect_image_alt_quality(soup, index=index),
+        detect_content_freshness(soup, clean_text=clean_text, index=index),
+        detect_citability_density(soup, clean_text=clean_text, index=index),
+        detect_definition_patterns(soup, index=index),
+        detect_format_mix(soup, index=index),
         # Quality Signals Batch 2 (bonus — capped at 100 total)
-        detect_attribution(soup, clean_text=clean_text),
-        detect_negative_signals(soup, clean_text=clean_text),
-        detect_comparison_content(soup, clean_text=clean_text),
-        detect_eeat(soup),
-        detect_content_decay(soup, clean_text=clean_text),
-        detect_boilerplate_ratio(soup),
-        detect_nuance_signals(soup, clean_text=clean_text),
+        detect_attribution(soup, clean_text=clean_text, index=index),
+        detect_negative_signals(soup, clean_text=clean_text, index=index),
+        detect_comparison_content(soup, clean_text=clean_text, index=index),
+        detect_eeat(soup, index=index),
+        detect_content_decay(soup, clean_text=clean_text, index=index),
+        detect_boilerplate_ratio(soup, index=index),
+        detect_nuance_signals(soup, clean_text=clean_text, index=index),
         # Quality Signals Batch 3+4 (bonus — capped at 100 total)
-        detect_snippet_ready(soup),
-        detect_chunk_quotability(soup),
-        detect_blog_structure(soup),
-        detect_shopping_readiness(soup),
-        detect_chatgpt_shopping(soup),
+        detect_snippet_ready(soup, index=index),
+        detect_chunk_quotability(soup, index=index),
+        detect_blog_structure(soup, index=index),
+        detect_shopping_readiness(soup, index=index),
+        detect_chatgpt_shopping(soup, index=index),
         # Quality Signals Batch A v3.16.0 (bonus — capped at 100 total)
-        detect_voice_search(soup),
-        detect_multi_platform(soup),
-        detect_entity_disambiguation(soup),
-        detect_first_party_data(soup, clean_text=clean_text),
-        detect_stale_data(soup, clean_text=clean_text),
-        detect_social_proof(soup, clean_text=clean_text),
-        detect_accessibility_signals(soup),
-        detect_conversion_funnel(soup),
+        detect_voice_search(soup, index=index),
+        detect_multi_platform(soup, index=index),
+        detect_entity_disambiguation(soup, index=index),
+        detect_first_party_data(soup, clean_text=clean_text, index=index),
+        detect_stale_data(soup, clean_text=clean_text, index=index),
+        detect_social_proof(soup, clean_text=clean_text, index=index),
+        detect_accessibility_signals(soup, index=index),
+        detect_conversion_funnel(soup, index=index),
         # Quality Signals Batch B v3.16.0
-        detect_temporal_coherence(soup, clean_text=clean_text),
-        detect_anchor_text_quality(soup, base_url),
-        detect_international_geo(soup),
-        detect_crawl_budget(soup),
+        detect_temporal_coherence(soup, clean_text=clean_text, index=index),
+        detect_anchor_text_quality(soup, base_url, index=index),
+        detect_international_geo(soup, index=index),
+        detect_crawl_budget(soup, index=index),
         # RAG Readiness Batch v4.1.0 (#372, #365, #373, #366, #374)
-        detect_answer_capsule(soup, clean_text=clean_text),
-        detect_token_efficiency(soup, clean_text=clean_text),
-        detect_entity_resolution(soup),
-        detect_kg_density(soup, clean_text=clean_text),
-        detect_retrieval_triggers(soup, clean_text=clean_text),
+        detect_answer_capsule(soup, clean_text=clean_text, index=index),
+        detect_token_efficiency(soup, clean_text=clean_text, index=index),
+        detect_entity_resolution(soup, index=index),
+        detect_kg_density(soup, clean_text=clean_text, index=index),
+        detect_retrieval_triggers(soup, clean_text=clean_text, index=index),
     ]
 
     # gap #4.16.3: the 47 methods add up to well over 100 raw points, so clamping the
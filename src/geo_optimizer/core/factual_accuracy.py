@@ -6,10 +6,10 @@ import re
 from typing import Callable
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
-
 from geo_optimizer.models.results import FactualAccuracyResult
+from geo_optimizer.utils.html_parser import parse_html
 from geo_optimizer.utils.http import fetch_url
+from geo_optimizer.utils.politeness import FetchScheduler, use_fetch_scheduler
 
 _NUMERIC_CLAIM_RE = re.compile(
     r"\b\d+(?:[.,]\d+)?%"
@@ -117,7 +117,7 @@ def run_factual_accuracy_audit(url: str, max_source_checks: int = _DEFAULT_MAX_S
             severity="high",
         )
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse_html(response.text)
     return audit_factual_accuracy(
         soup=soup,
         html=response.text,
@@ -264,21 +264,26 @@ def _check_source_links(
     fetcher: Callable[[str], tuple[object | None, object | None]],
     max_source_checks: int,
 ) -> None:
-    """Verifica un numero limitato di link sorgente per intercettare 404 ed errori."""
-    for link in links[: max(0, max_source_checks)]:
-        result.source_links_checked += 1
-        response, err = fetcher(link)
-        # `response is None`, not `not response`: an HTTP error Response is falsy
-        # (requests sets __bool__ to `ok`). The outcome here was right either way —
-        # a link answering 4xx/5xx is broken — because the status check below
-        # catches it. Being explicit keeps the two cases distinguishable.
-        if err or response is None:
-            _append_unique(result.broken_source_links, link)
-            continue
-
-        status_code = getattr(response, "status_code", 0)
-        if status_code not in (200, 203):
-            _append_unique(result.broken_source_links, link)
+    """Verifica un numero limitato di link sorgente per intercettare 404 ed errori.
+
+    I link verso lo stesso host passano dallo scheduler di cortesia: dopo un
+    429/503 le verifiche successive verso quell'host attendono il Retry-After.
+    """
+    with use_fetch_scheduler(FetchScheduler()):
+        for link in links[: max(0, max_source_checks)]:
+            result.source_links_checked += 1
+            response, err = fetcher(link)
+            # `response is None`, not `not response`: an HTTP error Response is falsy
+            # (requests sets __bool__ to `ok`). The outcome here was right either way —
+            # a link answering 4xx/5xx is broken — because the status check below
+            # catches it. Being explicit keeps the two cases distinguishable.
+            if err or response is None:
+                _append_unique(result.broken_source_links, link)
+                continue
+
+            status_code = getattr(response, "status_code", 0)
+            if status_code not in (200, 203):
+                _append_unique(result.broken_source_links, link)
 
 
 def _severity_for_result(result: FactualAccuracyResult) -> str:
@@ -13,6 +13,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import ContentResult, MetaResult, SchemaResult
 
 # ─── Hallucination-bait patterns ─────────────────────────────────────────────
@@ -114,7 +115,7 @@ class HallucinationBaitResult:
     details: list[str] = field(default_factory=list)
 
 
-def _extract_text_for_analysis(soup, content: ContentResult, meta: MetaResult) -> str:
+def _extract_text_for_analysis(soup, content: ContentResult, meta: MetaResult, index: PageIndex | None = None) -> str:
     """Extract main content text for analysis."""
     parts: list[str] = []
 
@@ -126,9 +127,10 @@ def _extract_text_for_analysis(soup, content: ContentResult, meta: MetaResult) -
         parts.append(meta.description_text)
 
     if soup is not None:
-        main = soup.find("main") or soup.find("article") or soup.body
+        idx = get_page_index(soup, index)
+        main = idx.find("main") or idx.find("article") or idx.find("body")
         if main:
-            text = main.get_text(separator=" ", strip=True)
+            text = idx.text(main, separator=" ", strip=True)
             parts.append(text)
 
     return " ".join(parts)
@@ -151,6 +153,7 @@ def audit_hallucination_bait(
     content_result: ContentResult,
     meta_result: MetaResult,
     schema_result: SchemaResult,
+    index: PageIndex | None = None,
 ) -> HallucinationBaitResult:
     """Detect patterns that may cause LLM hallucinations when citing the page.
 
@@ -160,6 +163,7 @@ def audit_hallucination_bait(
         content_result: Computed ContentResult.
         meta_result: Computed MetaResult.
         schema_result: Computed SchemaResult.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         HallucinationBaitResult with detected patterns.
@@ -169,7 +173,7 @@ def audit_hallucination_bait(
         return result
 
     result.checked = True
-    text = _extract_text_for_analysis(soup, content_result, meta_result)
+    text = _extract_text_for_analysis(soup, content_result, meta_result, index=index)
 
     # ── 1: Unsourced statistics ─────────────────────────────
     unsourced = _find_all_with_context(_UNSOURCED_STAT_RE, text)
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import re
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.config import (
     MICROFONT_SIZE_THRESHOLD_PX,
     PROMPT_INJECTION_COMMENT_KEYWORDS,
@@ -69,12 +70,13 @@ def _get_text_safe(element) -> str:
 # ─── Category 1: CSS-hidden text ─────────────────────────────────────────────
 
 
-def _detect_hidden_text(soup) -> tuple[bool, int, list[str]]:
+def _detect_hidden_text(soup, index: PageIndex | None = None) -> tuple[bool, int, list[str]]:
     """Detect text hidden via inline CSS."""
+    idx = get_page_index(soup, index)
     found_count = 0
     samples: list[str] = []
 
-    for el in soup.find_all(style=True):
+    for el in idx.find_all(style=True):
         style = el.get("style", "")
         text = _get_text_safe(el)
         if len(text) < 3:
@@ -93,9 +95,10 @@ def _detect_hidden_text(soup) -> tuple[bool, int, list[str]]:
 # ─── Category 2: Invisible Unicode ───────────────────────────────────────────
 
 
-def _detect_invisible_unicode(soup) -> tuple[bool, int]:
+def _detect_invisible_unicode(soup, index: PageIndex | None = None) -> tuple[bool, int]:
     """Detect invisible Unicode characters in the body text."""
-    body = soup.find("body")
+    idx = get_page_index(soup, index)
+    body = idx.find("body")
     if not body:
         return False, 0
 
@@ -173,11 +176,12 @@ def _normalize_hex(h: str) -> str:
     return h
 
 
-def _detect_monochrome_text(soup) -> tuple[bool, int]:
+def _detect_monochrome_text(soup, index: PageIndex | None = None) -> tuple[bool, int]:
     """Detect text whose color matches or is very close to the background."""
+    idx = get_page_index(soup, index)
     found_count = 0
 
-    for el in soup.find_all(style=True):
+    for el in idx.find_all(style=True):
         style = el.get("style", "")
         text = _get_text_safe(el)
         if len(text) < 3:
@@ -204,11 +208,12 @@ def _detect_monochrome_text(soup) -> tuple[bool, int]:
 # ─── Category 6: Micro-font ──────────────────────────────────────────────────
 
 
-def _detect_microfont(soup) -> tuple[bool, int]:
+def _detect_microfont(soup, index: PageIndex | None = None) -> tuple[bool, int]:
     """Detect elements with font-size < 2px that contain text."""
+    idx = get_page_index(soup, index)
     found_count = 0
 
-    for el in soup.find_all(style=True):
+    for el in idx.find_all(style=True):
         text = _get_text_safe(el)
         if len(text) < 3:
             continue
@@ -232,12 +237,13 @@ def _detect_microfont(soup) -> tuple[bool, int]:
 # ─── Category 7: Data attribute injection ────────────────────────────────────
 
 
-def _detect_data_attr_injection(soup) -> tuple[bool, int, list[str]]:
+def _detect_data_attr_injection(soup, index: PageIndex | None = None) -> tuple[bool, int, list[str]]:
     """Detect suspicious data attributes (data-ai-*, data-prompt-*, etc.)."""
+    idx = get_page_index(soup, index)
     found_count = 0
     samples: list[str] = []
 
-    for el in soup.find_all():
+    for el in idx.find_all():
         for attr_name, attr_value in el.attrs.items():
             if isinstance(attr_name, str) and _DATA_ATTR_RE.match(attr_name):
                 found_count += 1
@@ -271,12 +277,13 @@ def _is_mostly_link_text(el, total_words: int, threshold: float = 0.8) -> bool:
     return link_words / total_words >= threshold
 
 
-def _detect_aria_hidden_injection(soup) -> tuple[bool, int, list[str]]:
+def _detect_aria_hidden_injection(soup, index: PageIndex | None = None) -> tuple[bool, int, list[str]]:
     """Detect aria-hidden elements with instructional AI content."""
+    idx = get_page_index(soup, index)
     found_count = 0
     samples: list[str] = []
 
-    for el in soup.find_all(attrs={"aria-hidden": "true"}):
+    for el in idx.find_all(attrs={"aria-hidden": "true"}):
         text = _get_text_safe(el)
         if not text:
             continue
@@ -309,7 +316,7 @@ def _detect_aria_hidden_injection(soup) -> tuple[bool, int, list[str]]:
 # ─── Orchestrator ─────────────────────────────────────────────────────────────
 
 
-def audit_prompt_injection(soup, raw_html: str) -> PromptInjectionResult:
+def audit_prompt_injection(soup, raw_html: str, index: PageIndex | None = None) -> PromptInjectionResult:
     """Analyze content for prompt injection patterns.
 
     Zero HTTP requests — works only on already-available data.
@@ -317,17 +324,21 @@ def audit_prompt_injection(soup, raw_html: str) -> PromptInjectionResult:
     Args:
         soup: BeautifulSoup of the HTML document.
         raw_html: Raw HTML text for regex matching on comments and attributes.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         PromptInjectionResult with severity and per-category details.
     """
+    idx = get_page_index(soup, index)
     result = PromptInjectionResult(checked=True)
 
     # Cat 1: CSS-hidden text
-    result.hidden_text_found, result.hidden_text_count, result.hidden_text_samples = _detect_hidden_text(soup)
+    result.hidden_text_found, result.hidden_text_count, result.hidden_text_samples = _detect_hidden_text(
+        soup, index=idx
+    )
 
     # Cat 2: invisible Unicode
-    result.invisible_unicode_found, result.invisible_unicode_count = _detect_invisible_unicode(soup)
+    result.invisible_unicode_found, result.invisible_unicode_count = _detect_invisible_unicode(soup, index=idx)
 
     # Cat 3: LLM instructions
     result.llm_instruction_found, result.llm_instruction_count, result.llm_instruction_samples = (
@@ -340,19 +351,19 @@ def audit_prompt_injection(soup, raw_html: str) -> PromptInjectionResult:
     )
 
     # Cat 5: monochrome text
-    result.monochrome_text_found, result.monochrome_text_count = _detect_monochrome_text(soup)
+    result.monochrome_text_found, result.monochrome_text_count = _detect_monochrome_text(soup, index=idx)
 
     # Cat 6: micro-font
-    result.microfont_found, result.microfont_count = _detect_microfont(soup)
+    result.microfont_found, result.microfont_count = _detect_microfont(soup, index=idx)
 
     # Cat 7: data attribute injection
     result.data_attr_injection_found, result.data_attr_injection_count, result.data_attr_samples = (
-        _detect_data_attr_injection(soup)
+        _detect_data_attr_injection(soup, index=idx)
     )
 
     # Cat 8: aria-hidden injection
     result.aria_hidden_injection_found, result.aria_hidden_injection_count, result.aria_hidden_samples = (
-        _detect_aria_hidden_injection(soup)
+        _detect_aria_hidden_injection(soup, index=idx)
     )
 
     # Compute summary
@@ -12,6 +12,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.results import ContentResult, IntentMappingResult, MetaResult, SchemaResult
 
 # ─── Pattern di intenti ──────────────────────────────────────────────────────
@@ -82,7 +83,7 @@ _INTENT_PATTERNS: dict[str, dict[str, Any]] = {
 _CONTENT_SECTIONS = ["h1", "title", "h2", "h3", "h4", "h5", "h6", "meta_description"]
 
 
-def _extract_page_text(soup, content: ContentResult, meta: MetaResult) -> str:
+def _extract_page_text(soup, content: ContentResult, meta: MetaResult, index: PageIndex | None = None) -> str:
     """Estrae testo rilevante per analisi intenti (heading, title, meta)."""
     parts: list[str] = []
 
@@ -95,23 +96,24 @@ def _extract_page_text(soup, content: ContentResult, meta: MetaResult) -> str:
         parts.append(meta.title_text)
 
     # H2-H6 dal soup se disponibile
-    if soup is not None:
+    idx = get_page_index(soup, index) if soup is not None else None
+    if idx is not None:
         for level in range(2, 7):
-            for tag in soup.find_all(f"h{level}"):
-                text = tag.get_text(strip=True)
+            for tag in idx.find_all(f"h{level}"):
+                text = idx.text(tag, strip=True)
                 if text:
                     parts.append(text)
 
         # Meta description
-        desc_tag = soup.find("meta", attrs={"name": "description"})
+        desc_tag = idx.find("meta", attrs={"name": "description"})
         if desc_tag and desc_tag.get("content"):
             parts.append(desc_tag["content"])
 
     # Testo principale dalla pagina
-    if soup is not None:
-        main = soup.find("main") or soup.find("article") or soup.body
+    if idx is not None:
+        main = idx.find("main") or idx.find("article") or idx.find("body")
         if main:
-            text = main.get_text(separator=" ", strip=True)
+            text = idx.text(main, separator=" ", strip=True)
             if text:
                 # Solo le prime 2000 parole per performance
                 words = text.split()[:2000]
@@ -201,6 +203,7 @@ def audit_intent_mapping(
     content_result: ContentResult,
     meta_result: MetaResult,
     schema_result: SchemaResult,
+    index: PageIndex | None = None,
 ) -> IntentMappingResult:
     """Mappa gli intenti di ricerca AI serviti dalla pagina.
 
@@ -210,6 +213,7 @@ def audit_intent_mapping(
         content_result: ContentResult gia calcolato.
         meta_result: MetaResult gia calcolato.
         schema_result: SchemaResult gia calcolato.
+        index: PageIndex opzionale di ``soup``, condiviso con gli altri sub-audit.
 
     Returns:
         IntentMappingResult con intenti trovati, mancanti e punteggio.
@@ -221,7 +225,7 @@ def audit_intent_mapping(
     result.checked = True
 
     # Estrazione testo
-    text = _extract_page_text(soup, content_result, meta_result)
+    text = _extract_page_text(soup, content_result, meta_result, index=index)
 
     # Pattern matching
     intent_signals = _score_text_for_intents(text)
@@ -0,0 +1,142 @@
+"""
+Parsed JSON-LD graph of a page, built once and shared by every consumer.
+
+``audit_schema`` and a dozen citability detectors all read the page's
+``<script type="application/ld+json">`` blocks. ``JsonLdGraph`` parses each
+block once, unpacks ``@graph`` containers and indexes the resulting entities
+by ``@type``, by ``@id`` and by property name, so "the first Product", "every
+entity with sameAs" or "the entity with this @id" are dictionary lookups.
+
+One graph per page lives on the ``PageIndex`` (``index.jsonld``), which the
+audit pipeline already threads through ``_build_audit_result`` and every
+sub-audit.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from geo_optimizer.models.config import SCHEMA_JSONLD_MAX_BYTES
+
+_logger = logging.getLogger(__name__)
+
+
+def _entity_types(entity: dict) -> list:
+    """``@type`` of an entity as a list (a bare string becomes a one-item list)."""
+    schema_type = entity.get("@type", "")
+    return schema_type if isinstance(schema_type, list) else [schema_type]
+
+
+class JsonLdGraph:
+    """JSON-LD payloads of one page with ``@graph`` unpacked and entities indexed.
+
+    Args:
+        scripts: ``<script type="application/ld+json">`` elements in document
+            order. Blank and oversized (``SCHEMA_JSONLD_MAX_BYTES``, fix #182)
+            blocks are skipped, malformed ones are counted in ``parse_errors``.
+
+    Attributes:
+        blocks: Top-level payload of each valid block, in document order.
+        entities: Every JSON-LD object with ``@graph`` containers (nested ones
+            included) unpacked, in document order; non-dict items are dropped.
+        parse_errors: Number of blocks that were not valid JSON.
+    """
+
+    def __init__(self, scripts=()):
+        self.blocks: list[Any] = []
+        self.parse_errors = 0
+        for script in scripts:
+            # script.string can be None if the tag has multiple child nodes
+            raw = script.string or script.get_text()
+            if not raw or not raw.strip():
+                continue
+            if len(raw) > SCHEMA_JSONLD_MAX_BYTES:
+                _logger.debug("JSON-LD too large (%d bytes), skipping", len(raw))
+                continue
+            try:
+                self.blocks.append(json.loads(raw))
+            except (json.JSONDecodeError, TypeError) as exc:
+                _logger.debug("Invalid JSON schema ignored: %s", exc)
+                self.parse_errors += 1
+
+        self.entities: list[dict] = []
+        self._by_type: dict[str, list[dict]] = {}
+        self._by_id: dict[str, dict] = {}
+        self._by_property: dict[str, list[dict]] = {}
+        self._position: dict[int, int] = {}
+        for data in self.blocks:
+            queue = list(data) if isinstance(data, list) else [data]
+            while queue:
+                item = queue.pop(0)
+                if not isinstance(item, dict):
+                    continue
+                graph = item.get("@graph")
+                if isinstance(graph, list):
+                    # Prepend so the graph's own members keep document order ahead of
+                    # whatever follows this container.
+                    queue = list(graph) + queue
+                    continue
+                self._add(item)
+
+    def _add(self, entity: dict) -> None:
+        self._position[id(entity)] = len(self.entities)
+        self.entities.append(entity)
+        for t in _entity_types(entity):
+            if isinstance(t, str):
+                self._by_type.setdefault(t, []).append(entity)
+        entity_id = entity.get("@id")
+        if isinstance(entity_id, str):
+            self._by_id.setdefault(entity_id, entity)
+        for key in entity:
+            self._by_property.setdefault(key, []).append(entity)
+
+    @classmethod
+    def from_soup(cls, soup) -> JsonLdGraph:
+        """Parse every ``application/ld+json`` script of ``soup``."""
+        return cls(soup.find_all("script", attrs={"type": "application/ld+json"}))
+
+    # ─── Queries ─────────────────────────────────────────────────────────────
+
+    @property
+    def types(self) -> list[str]:
+        """Distinct ``@type`` values, in order of first appearance."""
+        return list(self._by_type)
+
+    def has_type(self, *types: str) -> bool:
+        return any(t in self._by_type for t in types)
+
+    def of_type(self, *types: str) -> list[dict]:
+        """Entities whose ``@type`` is any of ``types``, in document order."""
+        if len(types) == 1:
+            return list(self._by_type.get(types[0], ()))
+        seen: dict[int, dict] = {}
+        for t in types:
+            for entity in self._by_type.get(t, ()):
+                seen[id(entity)] = entity
+        return sorted(seen.values(), key=lambda e: self._position[id(e)])
+
+    def first_of_type(self, *types: str) -> dict | None:
+        """First entity (document order) whose ``@type`` is any of ``types``."""
+        candidates = [self._by_type[t][0] for t in types if t in self._by_type]
+        return min(candidates, key=lambda e: self._position[id(e)]) if candidates else None
+
+    def get(self, entity_id: str) -> dict | None:
+        """Entity declaring ``@id`` == ``entity_id`` (the first one if repeated)."""
+        return self._by_id.get(entity_id)
+
+    def with_property(self, prop: str) -> list[dict]:
+        """Entities that declare ``prop``, in document order."""
+        return list(self._by_property.get(prop, ()))
+
+    def first(self, prop: str, default: Any = None) -> Any:
+        """Value of ``prop`` on the first entity that declares it."""
+        holders = self._by_property.get(prop)
+        return holders[0][prop] if holders else default
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __iter__(self):
+        return iter(self.entities)
@@ -9,13 +9,18 @@ nothing is printed to stdout.  Status updates go through an optional
 from __future__ import annotations
 
 import logging
+import queue
 import re
+import threading
+import zlib
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from geo_optimizer.models.config import (
     CATEGORY_PATTERNS,
@@ -27,6 +32,7 @@ from geo_optimizer.models.config import (
     SKIP_PATTERNS,
 )
 from geo_optimizer.models.results import SitemapUrl
+from geo_optimizer.utils.html_parser import parse_html
 from geo_optimizer.utils.http import MAX_RESPONSE_SIZE, create_session_with_retry
 from geo_optimizer.utils.validators import (
     resolve_and_validate_url,
@@ -56,6 +62,14 @@ _MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 # ---------------------------------------------------------------------------
 
 _MAX_SITEMAP_DEPTH = 3  # Maximum sitemap index recursion depth
+# Child sitemaps of an index fetched in parallel (over the same pooled session)
+_SUB_SITEMAP_WORKERS = 4
+# Entries a child fetcher may parse ahead of the consumer before it waits
+_SUB_SITEMAP_READ_AHEAD = 1000
+# Decompressed size cap for .xml.gz sitemaps (sitemaps.org: 50 MB uncompressed)
+_MAX_SITEMAP_UNCOMPRESSED = 50 * 1024 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+_CHILD_DONE = object()
 
 
 def fetch_sitemap(
@@ -67,7 +81,8 @@ def fetch_sitemap(
 ) -> list[SitemapUrl]:
     """Download and parse an XML sitemap, including sitemap indexes.
 
-    Uses automatic retry with exponential backoff for transient errors.
+    List wrapper around :func:`iter_sitemap`: same streaming parser, gzip
+    support and concurrent child sitemaps.
     Recursion is limited to ``_MAX_SITEMAP_DEPTH`` levels (anti-bomb).
     Total URLs are limited to ``MAX_TOTAL_URLS`` (fix #124 — sitemap bomb).
 
@@ -75,15 +90,13 @@ def fetch_sitemap(
         sitemap_url: URL of the XML sitemap.
         on_status: Optional callback for progress messages.
         _depth: Recursion depth counter (do not use directly).
-        _total_count: Mutable list [n] for tracking total URLs across recursive calls.
+        _total_count: Mutable list [n] for tracking total URLs across calls.
         session: HTTP session to reuse (fix #122). If None, creates a new one.
 
     Returns:
         List of :class:`SitemapUrl` found in the sitemap.
     """
-    urls: list[SitemapUrl] = []
-
-    # Fix #124: initialize shared counter across recursive calls
+    # Fix #124: shared counter across calls
     if _total_count is None:
         _total_count = [0]
 
@@ -92,147 +105,312 @@ def fetch_sitemap(
         logger.warning("Limite URL raggiunto (%d), skip sitemap: %s", MAX_TOTAL_URLS, sitemap_url)
         if on_status:
             on_status(f"URL limit reached ({MAX_TOTAL_URLS}), skipping: {sitemap_url}")
-        return urls
+        return []
+
+    urls = list(
+        iter_sitemap(
+            sitemap_url,
+            on_status=on_status,
+            session=session,
+            max_urls=MAX_TOTAL_URLS - _total_count[0],
+            _depth=_depth,
+        )
+    )
+    _total_count[0] += len(urls)
+    return urls
+
+
+def iter_sitemap(
+    sitemap_url: str,
+    on_status: Callable[[str], None] | None = None,
+    session=None,
+    max_urls: int = MAX_TOTAL_URLS,
+    _depth: int = 0,
+) -> Iterator[SitemapUrl]:
+    """Yield the URLs of an XML sitemap (or sitemap index) as they are parsed.
+
+    The body is fed chunk by chunk to an lxml pull parser, so entries come out
+    while the download is still running and memory does not grow with the
+    sitemap. Gzip-compressed sitemaps (``.xml.gz``) are recognised by their
+    magic bytes and inflated on the fly. The child sitemaps of an index are
+    fetched by ``_SUB_SITEMAP_WORKERS`` threads over the same session, and
+    their entries are yielded in index order.
+
+    At most ``max_urls`` entries are yielded (never more than
+    ``MAX_TOTAL_URLS``); closing the generator early stops every fetch.
+
+    Args:
+        sitemap_url: URL of the XML sitemap.
+        on_status: Optional callback for progress messages (called from the
+            consuming thread only).
+        session: HTTP session to reuse (fix #122). If None, creates a new one.
+        max_urls: Hard cap on the entries yielded.
+        _depth: Recursion depth counter (do not use directly).
+    """
+    walk = _SitemapWalk(limit=min(max_urls, MAX_TOTAL_URLS))
+    events = _walk_sitemap(sitemap_url, _depth, session, walk, parallel=True)
+    count = 0
+    try:
+        for kind, payload in events:
+            if kind == "status":
+                if on_status:
+                    on_status(payload)
+                continue
+            # Fix #124: hard cap, checked before yielding one entry too many
+            if count >= walk.limit:
+                logger.warning("URL limit reached (%d), stopping sitemap parsing: %s", walk.limit, sitemap_url)
+                if on_status:
+                    on_status(f"URL limit reached ({walk.limit}), stopping")
+                break
+            count += 1
+            yield payload
+    finally:
+        walk.stopped.set()
+        events.close()
+
+
+class _SitemapWalk:
+    """State shared by the fetchers of one ``iter_sitemap`` call."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        # Set when the consumer is done: child fetchers stop at the next entry
+        self.stopped = threading.Event()
+
 
+def _walk_sitemap(
+    sitemap_url: str, depth: int, session, walk: _SitemapWalk, *, parallel: bool
+) -> Iterator[tuple[str, object]]:
+    """Events of one sitemap and its children: ``("status", msg)`` and ``("url", SitemapUrl)``."""
     # Anti-bomb protection: limit recursion depth
-    if _depth >= _MAX_SITEMAP_DEPTH:
-        logger.warning("Maximum sitemap depth reached (%d), skipping: %s", _depth, sitemap_url)
-        if on_status:
-            on_status(f"Max sitemap depth reached ({_depth}), skipping: {sitemap_url}")
-        return urls
+    if depth >= _MAX_SITEMAP_DEPTH:
+        logger.warning("Maximum sitemap depth reached (%d), skipping: %s", depth, sitemap_url)
+        yield "status", f"Max sitemap depth reached ({depth}), skipping: {sitemap_url}"
+        return
 
-    if on_status:
-        on_status(f"Fetching sitemap: {sitemap_url}")
+    yield "status", f"Fetching sitemap: {sitemap_url}"
     logger.info("Fetching sitemap: %s", sitemap_url)
 
     # Anti-SSRF validation + DNS pinning (#447: was validate_public_url without pinning)
     ok, reason, pinned_ips = resolve_and_validate_url(sitemap_url)
     if not ok:
         logger.warning("Sitemap URL blocked (SSRF): %s — %s", sitemap_url, reason)
-        return urls
+        return
 
     # Fix #122: reuse parent session, or create with DNS pinning (#447)
     if session is None:
         session = create_session_with_retry(pinned_ips=pinned_ips)
 
+    children: list[str] = []
+    found = 0
+    for kind, payload in _read_sitemap(sitemap_url, session):
+        if kind == "sitemap":
+            children.append(payload)
+            continue
+        if kind == "url":
+            found += 1
+        yield kind, payload
+
+    if not children:
+        logger.info("URLs found: %d", found)
+        yield "status", f"URLs found: {found}"
+        return
+
+    # Sitemap index (contains nested sitemaps)
+    logger.info("Sitemap index found: %d sitemaps", len(children))
+    yield "status", f"Sitemap index found: {len(children)} sitemaps"
+    safe_children = []
+    for sub_url in children[:MAX_SUB_SITEMAPS]:  # Limit sub-sitemaps (fix #90)
+        # Anti-SSRF validation: verify that sub-URL is public
+        safe, reason = validate_public_url(sub_url)
+        if not safe:
+            logger.warning("Unsafe sub-sitemap URL ignored: %s (%s)", sub_url, reason)
+            yield "status", f"Sub-sitemap skipped (unsafe): {sub_url}"
+            continue
+        safe_children.append(sub_url)
+
+    if parallel and len(safe_children) > 1:
+        yield from _walk_children_parallel(safe_children, depth + 1, session, walk)
+        return
+    for sub_url in safe_children:
+        if walk.stopped.is_set():
+            return
+        # Fix #122: reuse session
+        yield from _walk_sitemap(sub_url, depth + 1, session, walk, parallel=False)
+
+
+def _walk_children_parallel(
+    children: list[str], depth: int, session, walk: _SitemapWalk
+) -> Iterator[tuple[str, object]]:
+    """Fetch child sitemaps in worker threads; yield their events in index order.
+
+    Each child writes into its own bounded queue, so the consumer reads the
+    first child while the next ones download, and a slow consumer holds back
+    at most ``_SUB_SITEMAP_READ_AHEAD`` entries per child. Workers start in
+    index order, so the child being read always has a running worker.
+    """
+    queues = [queue.Queue(maxsize=_SUB_SITEMAP_READ_AHEAD) for _ in children]
+    executor = ThreadPoolExecutor(
+        max_workers=min(_SUB_SITEMAP_WORKERS, len(children)), thread_name_prefix="geo-sitemap"
+    )
+    try:
+        for sub_url, events in zip(children, queues):
+            executor.submit(_fetch_child_sitemap, sub_url, depth, session, walk, events)
+        for events in queues:
+            while True:
+                event = events.get()
+                if event is _CHILD_DONE:
+                    break
+                yield event
+    finally:
+        walk.stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _fetch_child_sitemap(sub_url: str, depth: int, session, walk: _SitemapWalk, events: queue.Queue) -> None:
+    """Worker: walk one child sitemap (and its own children, sequentially) into ``events``."""
+    found = 0
+    try:
+        for event in _walk_sitemap(sub_url, depth, session, walk, parallel=False):
+            if event[0] == "url":
+                found += 1
+                # No child can contribute more than the whole budget
+                if found > walk.limit:
+                    break
+            if not _put_event(events, event, walk):
+                return
+    except Exception as e:
+        logger.warning("Sub-sitemap error: %s — %s", sub_url, e)
+    _put_event(events, _CHILD_DONE, walk)
+
+
+def _put_event(events: queue.Queue, event, walk: _SitemapWalk) -> bool:
+    """Queue ``event`` unless the walk stops first (the consumer no longer reads)."""
+    while not walk.stopped.is_set():
+        try:
+            events.put(event, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_sitemap(sitemap_url: str, session) -> Iterator[tuple[str, object]]:
+    """Stream one sitemap document: ``("url", SitemapUrl)``, ``("sitemap", child URL)`` and ``("status", msg)``."""
     try:
         # stream=True: the body is downloaded in chunks so the size check
         # below can abort mid-download, instead of requests.Session buffering
-        # the entire response into r.content before any check runs (the
-        # non-streamed call previously here had no real DoS protection —
-        # every other network call in this codebase streams for this reason;
-        # see utils.http.fetch_url).
+        # the entire response into r.content before any check runs (every
+        # other network call in this codebase streams for this reason; see
+        # utils.http.fetch_url).
         r = session.get(sitemap_url, headers=HEADERS, timeout=15, stream=True)
         r.raise_for_status()
 
-        body = bytearray()
+        # recover=True: a truncated or slightly broken sitemap still yields
+        # the entries read so far; no entities, no network (XXE)
+        parser = etree.XMLPullParser(
+            events=("end",), resolve_entities=False, no_network=True, huge_tree=False, recover=True
+        )
+        inflater = None
+        received = 0
+        inflated = 0
         for chunk in r.iter_content(chunk_size=8192):
-            body.extend(chunk)
-            if len(body) > MAX_RESPONSE_SIZE:
+            received += len(chunk)
+            if received > MAX_RESPONSE_SIZE:
                 r.close()
                 logger.warning("Sitemap too large (>%d bytes), aborting download: %s", MAX_RESPONSE_SIZE, sitemap_url)
-                if on_status:
-                    on_status(f"Sitemap too large, aborting: {sitemap_url}")
-                return urls
-        sitemap_body = bytes(body)
+                yield "status", f"Sitemap too large, aborting: {sitemap_url}"
+                return
+            if received == len(chunk) and chunk[:2] == _GZIP_MAGIC:
+                # .xml.gz served as a plain file (no Content-Encoding for requests to undo)
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            if inflater is not None:
+                chunk = inflater.decompress(chunk, _MAX_SITEMAP_UNCOMPRESSED - inflated + 1)
+                inflated += len(chunk)
+                if inflated > _MAX_SITEMAP_UNCOMPRESSED:
+                    r.close()
+                    logger.warning("Compressed sitemap too large once inflated, aborting: %s", sitemap_url)
+                    yield "status", f"Sitemap too large, aborting: {sitemap_url}"
+                    return
+            parser.feed(chunk)
+            yield from _sitemap_events(parser, sitemap_url)
+        parser.close()
+        yield from _sitemap_events(parser, sitemap_url)
     except requests.exceptions.Timeout:
         logger.warning("Sitemap timeout: %s", sitemap_url)
-        if on_status:
-            on_status(f"Sitemap timeout: {sitemap_url}")
-        return urls
+        yield "status", f"Sitemap timeout: {sitemap_url}"
     except requests.exceptions.HTTPError as e:
         logger.warning("Sitemap HTTP error: %s — %s", sitemap_url, e)
-        if on_status:
-            on_status(f"Sitemap HTTP error: {e}")
-        return urls
+        yield "status", f"Sitemap HTTP error: {e}"
     except requests.exceptions.RequestException as e:
         logger.warning("Sitemap request error (after retries): %s", e)
-        if on_status:
-            on_status(f"Sitemap error (after retries): {e}")
-        return urls
+        yield "status", f"Sitemap error (after retries): {e}"
     except Exception as e:
         # Final catch for unexpected errors (e.g. mocks in tests) — fix #78
         logger.warning("Sitemap unexpected error: %s", e)
-        if on_status:
-            on_status(f"Sitemap error: {e}")
-        return urls
+        yield "status", f"Sitemap error: {e}"
 
-    soup = BeautifulSoup(sitemap_body, "xml")
 
-    # Sitemap index (contains nested sitemaps)
-    sitemap_tags = soup.find_all("sitemap")
-    if sitemap_tags:
-        logger.info("Sitemap index found: %d sitemaps", len(sitemap_tags))
-        if on_status:
-            on_status(f"Sitemap index found: {len(sitemap_tags)} sitemaps")
-        for sitemap in sitemap_tags[:MAX_SUB_SITEMAPS]:  # Limit sub-sitemaps (fix #90)
-            # Fix #124: stop if limit reached during sub-sitemap iteration
-            if _total_count[0] >= MAX_TOTAL_URLS:
-                logger.warning("URL limit reached (%d), stopping sub-sitemaps", MAX_TOTAL_URLS)
-                break
-            loc = sitemap.find("loc")
+def _sitemap_events(parser, sitemap_url: str) -> Iterator[tuple[str, object]]:
+    """Turn the ``<url>`` / ``<sitemap>`` elements completed so far into events, then free them."""
+    for _event, element in parser.read_events():
+        if not isinstance(element.tag, str):
+            continue
+        name = _local_name(element.tag)
+        if name == "url":
+            entry = _sitemap_entry(element, sitemap_url)
+            if entry is not None:
+                yield "url", entry
+        elif name == "sitemap":
+            loc = _child_text(element, "loc")
             if loc:
-                sub_url = urljoin(sitemap_url, loc.text.strip())
-                # Anti-SSRF validation: verify that sub-URL is public
-                safe, reason = validate_public_url(sub_url)
-                if not safe:
-                    logger.warning("Unsafe sub-sitemap URL ignored: %s (%s)", sub_url, reason)
-                    if on_status:
-                        on_status(f"Sub-sitemap skipped (unsafe): {sub_url}")
-                    continue
-                # Fix #122: reuse session; fix #124: pass the counter
-                sub_urls = fetch_sitemap(
-                    sub_url,
-                    on_status=on_status,
-                    _depth=_depth + 1,
-                    _total_count=_total_count,
-                    session=session,
-                )
-                urls.extend(sub_urls)
-        return urls
-
-    # Regular sitemap
-    url_tags = soup.find_all("url")
-    logger.info("URLs found: %d", len(url_tags))
-    if on_status:
-        on_status(f"URLs found: {len(url_tags)}")
-
-    for url_tag in url_tags:
-        # Fix #124: stop if limit reached during URL iteration
-        if _total_count[0] >= MAX_TOTAL_URLS:
-            logger.warning("URL limit reached (%d), stopping sitemap parsing: %s", MAX_TOTAL_URLS, sitemap_url)
-            if on_status:
-                on_status(f"URL limit reached ({MAX_TOTAL_URLS}), stopping")
-            break
-
-        loc = url_tag.find("loc")
-        if not loc:
+                yield "sitemap", urljoin(sitemap_url, loc)
+        else:
             continue
+        # Drop the element and the siblings already handled: memory stays flat
+        element.clear()
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+
+def _sitemap_entry(element, sitemap_url: str) -> SitemapUrl | None:
+    """Build a :class:`SitemapUrl` from a ``<url>`` element (None without ``<loc>``)."""
+    loc = _child_text(element, "loc")
+    if not loc:
+        return None
+    entry = SitemapUrl(url=urljoin(sitemap_url, loc))
 
-        entry = SitemapUrl(
-            url=urljoin(sitemap_url, loc.text.strip()),
-        )
-
-        lastmod = url_tag.find("lastmod")
-        if lastmod:
-            entry.lastmod = lastmod.text.strip()
+    lastmod = _child_text(element, "lastmod")
+    if lastmod is not None:
+        entry.lastmod = lastmod
 
-        priority = url_tag.find("priority")
-        if priority:
-            try:
-                entry.priority = float(priority.text.strip())
-            except ValueError:
-                pass
-
-        # gap #11: parse <changefreq> for freshness-aware URL ordering
-        changefreq = url_tag.find("changefreq")
-        if changefreq:
-            entry.changefreq = changefreq.text.strip().lower()
+    priority = _child_text(element, "priority")
+    if priority:
+        try:
+            entry.priority = float(priority)
+        except ValueError:
+            pass
+
+    # gap #11: parse <changefreq> for freshness-aware URL ordering
+    changefreq = _child_text(element, "changefreq")
+    if changefreq is not None:
+        entry.changefreq = changefreq.lower()
+    return entry
+
+
+def _child_text(element, name: str) -> str | None:
+    """Stripped text of the first direct child called ``name`` (any namespace), or None."""
+    for child in element:
+        if isinstance(child.tag, str) and _local_name(child.tag) == name:
+            return (child.text or "").strip()
+    return None
 
-        urls.append(entry)
-        _total_count[0] += 1
 
-    return urls
+def _local_name(tag: str) -> str:
+    """``{namespace}name`` -> ``name``."""
+    return tag.rsplit("}", 1)[-1]
 
 
 # ---------------------------------------------------------------------------
@@ -302,7 +480,7 @@ def fetch_page_title(url: str) -> str | None:
         r, err = fetch_url(url, timeout=5)
         if err or not r or r.status_code != 200:
             return None
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = parse_html(r.text)
         title = soup.find("title")
         if title:
             return title.text.strip()
@@ -3,14 +3,41 @@ Server log analyzer for AI crawler activity (#227).
 
 Parses Apache/Nginx combined log format and JSON logs to detect
 AI bot visits, aggregate statistics, and identify top crawled pages.
+
+Built for logs of tens of GB:
+
+- only streaming aggregates are kept (counters, first/last date per bot,
+  a HyperLogLog sketch of the unique pages per bot, a bounded space-saving
+  summary of the most crawled pages), never one record per visit, and
+  there is no line limit;
+- plain logs are memory-mapped and read in blocks of whole lines; a bytes
+  search for a few short anchors that cover every ``AI_BOTS`` fragment finds
+  the candidate lines, and only those are decoded and parsed, with the
+  format (JSON or combined) detected once per file;
+- user agents are matched against every ``AI_BOTS`` fragment in one pass of
+  a single compiled prefix-trie regex;
+- a large plain log is split into byte ranges scanned by worker processes
+  whose aggregates are merged;
+- ``.gz`` and ``.zst`` rotated logs are read directly (detected by their
+  magic bytes; zstd needs the ``logs`` extra) in a single stream.
 """
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import io
 import json
+import math
+import mmap
+import multiprocessing
+import os
 import re
-from collections import Counter, defaultdict
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import BinaryIO
 
 from geo_optimizer.models.config import AI_BOTS
 from geo_optimizer.models.results import BotStats, CrawledPage, LogAnalysisResult
@@ -22,21 +49,116 @@ _COMBINED_RE = re.compile(
 )
 
 _TOP_PAGES_LIMIT = 10
-_DEFAULT_MAX_LINES = 1_000_000
 
-# Build lowercase UA fragments for matching
+# Per-path visit counters kept for the top pages (space-saving summary): past
+# this many paths the least visited half is dropped. Counts are then upper
+# bounds, off by at most the error recorded per path (CrawledPage.visits_error)
+_MAX_TRACKED_PAGES = 100_000
+
+# Unique pages per bot: exact up to this many paths, HyperLogLog beyond
+# (2**_HLL_PRECISION registers, about 1.6% standard error)
+_EXACT_UNIQUE_LIMIT = 1024
+_HLL_PRECISION = 12
+
+# Smallest byte range worth a worker process; smaller logs are scanned in-process
+_PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+# Size of the blocks of whole lines handed to the prefilter
+_BLOCK_BYTES = 16 * 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Build lowercase UA fragments for matching; the rank (AI_BOTS order) decides
+# which bot a user agent belongs to when it contains several fragments
 _BOT_UA_FRAGMENTS: dict[str, str] = {}
 for bot_name in AI_BOTS:
     _BOT_UA_FRAGMENTS[bot_name.lower()] = bot_name
+_BOT_RANKS = {fragment: rank for rank, fragment in enumerate(_BOT_UA_FRAGMENTS)}
+# Fragments contained at the start of each fragment ("applebot" in "applebot-extended")
+_BOT_PREFIXES = {fragment: [f for f in _BOT_UA_FRAGMENTS if fragment.startswith(f)] for fragment in _BOT_UA_FRAGMENTS}
+_BOT_NAMES = list(_BOT_UA_FRAGMENTS.values())
+
+# Shortest anchor accepted by the prefilter (shorter ones match too many lines)
+_MIN_ANCHOR = 3
+
+
+def _prefilter_anchors(fragments: Iterable[str]) -> tuple[bytes, ...]:
+    """A few substrings that together occur in every fragment (greedy set cover).
+
+    ``bytes.find`` costs the same for any needle, so searching a block for
+    "bot", "-user", ... is several times cheaper than for all 27 fragments.
+    """
+    uncovered = set(fragments)
+    anchors: list[str] = []
+    while uncovered:
+        counts = Counter(
+            sub
+            for fragment in uncovered
+            for sub in {fragment[i:j] for i in range(len(fragment)) for j in range(i + _MIN_ANCHOR, len(fragment) + 1)}
+        )
+        best = max(counts, key=lambda sub: (counts[sub], len(sub), sub))
+        anchors.append(best)
+        uncovered = {fragment for fragment in uncovered if best not in fragment}
+    return tuple(anchor.encode() for anchor in anchors)
 
 
-def analyze_log_file(file_path: str | Path, *, max_lines: int = _DEFAULT_MAX_LINES) -> LogAnalysisResult:
+_PREFILTER_ANCHORS = _prefilter_anchors(_BOT_UA_FRAGMENTS)
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex matching any of ``words``, with shared prefixes factored into a trie.
+
+    The regex engine then walks the trie once from each position of the
+    string, instead of trying every word in turn.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = []
+        for char, child in sorted(node.items()):
+            if not char:
+                continue
+            # Collapse single-child chains into one literal
+            literal = re.escape(char)
+            while len(child) == 1 and "" not in child:
+                ((char, child),) = child.items()
+                literal += re.escape(char)
+            branches.append(literal + build(child))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# One compiled automaton for every fragment. The lookahead reports, at each
+# position, the fragment starting there (the longest, so "applebot-extended"
+# is seen even where "applebot" also matches); the best rank wins.
+_BOT_RE = re.compile("(?=(" + _trie_pattern(_BOT_UA_FRAGMENTS) + "))")
+_BOT_PREFIX_RE = re.compile(_trie_pattern(_BOT_UA_FRAGMENTS))
+
+
+def analyze_log_file(
+    file_path: str | Path, *, max_lines: int | None = None, workers: int | None = None
+) -> LogAnalysisResult:
     """Analyze a server log file for AI crawler activity.
 
-    Supports Apache/Nginx combined format and JSON lines format.
+    Supports Apache/Nginx combined format and JSON lines format, plain or
+    gzip/zstd compressed.
 
     Args:
         file_path: Path to the log file.
+        max_lines: Stop after this many lines (default: read the whole file).
+        workers: Processes scanning byte ranges of a plain log. None (default)
+            = one per core, each with at least ``_PARALLEL_MIN_BYTES``;
+            0 or 1 = in-process. Compressed logs are always read in one stream.
 
     Returns:
         LogAnalysisResult with bot stats and top crawled pages.
@@ -45,40 +167,128 @@ def analyze_log_file(file_path: str | Path, *, max_lines: int = _DEFAULT_MAX_LIN
     if not path.is_file():
         return LogAnalysisResult(checked=True, log_file=str(path))
 
-    bot_visits: dict[str, list[dict]] = defaultdict(list)
-    total_lines = 0
-    dates: list[str] = []
+    if max_lines is not None:
+        aggregate = _LogAggregate()
+        with _open_log(path) as f:
+            aggregate.scan(f, max_lines=max_lines)
+        return aggregate.to_result(str(path))
+
+    log_format = _detect_format(path)
+    ranges = _byte_ranges(path, workers)
+    if len(ranges) > 1:
+        # spawn: workers only need the path and their range, not this process state
+        with ProcessPoolExecutor(max_workers=len(ranges), mp_context=multiprocessing.get_context("spawn")) as pool:
+            partials = list(pool.map(_scan_range, [str(path)] * len(ranges), *zip(*ranges), [log_format] * len(ranges)))
+        aggregate = partials[0]
+        for partial in partials[1:]:
+            aggregate.merge(partial)
+    elif _is_compressed(path):
+        aggregate = _LogAggregate()
+        with _open_log(path) as f:
+            for block in _stream_blocks(f):
+                aggregate.scan_block(block, _LINE_PARSERS[log_format])
+    else:
+        aggregate = _scan_range(str(path), 0, path.stat().st_size, log_format)
+    return aggregate.to_result(str(path))
 
-    with path.open(encoding="utf-8", errors="replace") as f:
+
+def _is_compressed(path: Path) -> bool:
+    with path.open("rb") as f:
+        return f.read(4).startswith((_GZIP_MAGIC, _ZSTD_MAGIC))
+
+
+def _detect_format(path: Path) -> str:
+    """``"json"`` or ``"combined"``, from the first non-blank line of the log."""
+    with _open_log(path) as f:
         for line in f:
-            total_lines += 1
-            if total_lines > max_lines:
-                break
-            entry = _parse_line(line)
-            if not entry:
-                continue
-            bot = _match_bot(entry["ua"])
-            if bot:
-                bot_visits[bot].append(entry)
-                if entry["date"]:
-                    dates.append(entry["date"])
+            if line.strip():
+                return "json" if line.lstrip().startswith(b"{") else "combined"
+    return "combined"
+
+
+def _byte_ranges(path: Path, workers: int | None) -> list[tuple[int, int]]:
+    """Split a plain log into ``(start, end)`` byte ranges, one per worker."""
+    if _is_compressed(path):
+        return []
+    size = path.stat().st_size
+    if workers is None:
+        workers = min(os.cpu_count() or 1, size // _PARALLEL_MIN_BYTES)
+    if workers <= 1:
+        return []
+    step = -(-size // workers)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _scan_range(path: str, start: int, end: int, log_format: str) -> _LogAggregate:
+    """Worker: aggregate the lines that start inside ``[start, end)`` (must stay at module level)."""
+    aggregate = _LogAggregate()
+    parse = _LINE_PARSERS[log_format]
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return aggregate
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for block in _mapped_blocks(mapped, start, end):
+                aggregate.scan_block(block, parse)
+    return aggregate
 
-    ai_requests = sum(len(v) for v in bot_visits.values())
 
-    bots = _aggregate_bots(bot_visits)
-    top_pages = _aggregate_pages(bot_visits)
+def _line_start(buffer: mmap.mmap, position: int) -> int:
+    """First line start at or after ``position``."""
+    if position <= 0:
+        return 0
+    newline = buffer.find(b"\n", position - 1)
+    return len(buffer) if newline == -1 else newline + 1
 
-    dates.sort()
-    return LogAnalysisResult(
-        checked=True,
-        log_file=str(path),
-        total_lines=total_lines,
-        ai_requests=ai_requests,
-        date_range_start=dates[0] if dates else "",
-        date_range_end=dates[-1] if dates else "",
-        bots=bots,
-        top_pages=top_pages,
-    )
+
+def _mapped_blocks(buffer: mmap.mmap, start: int, end: int) -> Iterator[bytes]:
+    """Blocks of whole lines of a mapped log, for the lines that start in ``[start, end)``.
+
+    The line running across ``start`` belongs to the previous range.
+    """
+    position, end = _line_start(buffer, start), _line_start(buffer, end)
+    while position < end:
+        block_end = _line_start(buffer, min(position + _BLOCK_BYTES, end))
+        yield buffer[position : min(block_end, end)]
+        position = block_end
+
+
+def _stream_blocks(f: BinaryIO) -> Iterator[bytes]:
+    """Blocks of whole lines of a (decompressed) stream."""
+    rest = b""
+    while chunk := f.read(_BLOCK_BYTES):
+        chunk = rest + chunk
+        cut = chunk.rfind(b"\n") + 1
+        if cut:
+            yield chunk[:cut]
+        rest = chunk[cut:]
+    if rest:
+        yield rest
+
+
+def _open_log(path: Path) -> BinaryIO:
+    """Open a log for binary line reading, decompressing gzip or zstd on the fly."""
+    with path.open("rb") as f:
+        magic = f.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rb")
+    if magic.startswith(_ZSTD_MAGIC):
+        return _open_zstd(path)
+    return path.open("rb")
+
+
+def _open_zstd(path: Path) -> BinaryIO:
+    try:
+        from compression import zstd  # Python 3.14+
+
+        return zstd.open(path, "rb")
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError("Reading .zst logs requires zstandard: pip install geo-optimizer-skill[logs]") from exc
+    reader = zstandard.ZstdDecompressor().stream_reader(path.open("rb"), read_across_frames=True, closefd=True)
+    return io.BufferedReader(reader)
 
 
 def _parse_line(line: str) -> dict | None:
@@ -92,6 +302,11 @@ def _parse_line(line: str) -> dict | None:
         return _parse_json_line(line)
 
     # Try combined format
+    return _parse_combined_line(line)
+
+
+def _parse_combined_line(line: str) -> dict | None:
+    """Parse an Apache/Nginx combined log line."""
     m = _COMBINED_RE.match(line)
     if m:
         return {
@@ -122,44 +337,274 @@ def _parse_json_line(line: str) -> dict | None:
     }
 
 
+# Line parser for each format detected by ``_detect_format``
+_LINE_PARSERS: dict[str, Callable[[str], dict | None]] = {
+    "json": _parse_json_line,
+    "combined": _parse_combined_line,
+}
+
+
 def _match_bot(ua: str) -> str | None:
     """Match a user-agent string against known AI bots."""
     ua_lower = ua.lower()
-    for fragment, name in _BOT_UA_FRAGMENTS.items():
-        if fragment in ua_lower:
-            return name
-    return None
+    # Fast rejection: the common case is a browser that matches no fragment
+    if _BOT_PREFIX_RE.search(ua_lower) is None:
+        return None
+    # A longer fragment hides the shorter ones starting at the same position
+    fragments = [prefix for found in _BOT_RE.findall(ua_lower) for prefix in _BOT_PREFIXES[found]]
+    return _BOT_UA_FRAGMENTS[min(fragments, key=_BOT_RANKS.__getitem__)]
 
 
-def _aggregate_bots(bot_visits: dict[str, list[dict]]) -> list[BotStats]:
-    """Aggregate per-bot statistics."""
-    stats: list[BotStats] = []
-    for bot_name, visits in sorted(bot_visits.items(), key=lambda x: len(x[1]), reverse=True):
-        pages = {v["path"] for v in visits}
-        dates = sorted(v["date"] for v in visits if v["date"])
-        stats.append(
-            BotStats(
-                bot_name=bot_name,
-                visits=len(visits),
-                unique_pages=len(pages),
-                first_seen=dates[0] if dates else "",
-                last_seen=dates[-1] if dates else "",
-            )
-        )
-    return stats
+_MONTHS = {
+    "jan": "01",
+    "feb": "02",
+    "mar": "03",
+    "apr": "04",
+    "may": "05",
+    "jun": "06",
+    "jul": "07",
+    "aug": "08",
+    "sep": "09",
+    "oct": "10",
+    "nov": "11",
+    "dec": "12",
+}
+
+
+def _date_sort_key(date: str) -> str:
+    """Chronological sort key: ``16/Apr/2026:10:00:00 +0200`` -> ``2026-04-16T10:00:00``; ISO dates as-is."""
+    if len(date) >= 20 and date[2] == "/" and date[6] == "/":
+        month = _MONTHS.get(date[3:6].lower())
+        if month:
+            return f"{date[7:11]}-{month}-{date[0:2]}T{date[12:20]}"
+    return date
+
+
+class _UniqueCounter:
+    """Distinct-value counter: an exact set while small, then a HyperLogLog sketch.
+
+    The hash is an unkeyed BLAKE2b, stable across processes, so the
+    counters of parallel workers can be merged.
+    """
+
+    __slots__ = ("_exact", "_registers")
+
+    def __init__(self):
+        self._exact: set[str] | None = set()
+        self._registers: bytearray | None = None
+
+    def add(self, value: str) -> None:
+        if self._exact is not None:
+            self._exact.add(value)
+            if len(self._exact) > _EXACT_UNIQUE_LIMIT:
+                self._to_sketch()
+            return
+        self._add_hash(value)
+
+    def _to_sketch(self) -> None:
+        self._registers = bytearray(1 << _HLL_PRECISION)
+        for value in self._exact or ():
+            self._add_hash(value)
+        self._exact = None
+
+    def _add_hash(self, value: str) -> None:
+        h = int.from_bytes(hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=8).digest(), "big")
+        index = h >> (64 - _HLL_PRECISION)
+        rest = h & ((1 << (64 - _HLL_PRECISION)) - 1)
+        rank = (64 - _HLL_PRECISION) - rest.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def merge(self, other: _UniqueCounter) -> None:
+        if self._exact is not None and other._exact is not None:
+            self._exact |= other._exact
+            if len(self._exact) > _EXACT_UNIQUE_LIMIT:
+                self._to_sketch()
+            return
+        if self._exact is not None:
+            self._to_sketch()
+        if other._exact is not None:
+            for value in other._exact:
+                self._add_hash(value)
+            return
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def __len__(self) -> int:
+        if self._exact is not None:
+            return len(self._exact)
+        m = len(self._registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / sum(2.0**-r for r in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class _BotAggregate:
+    """Visits, first/last date and unique pages of one bot."""
+
+    __slots__ = ("visits", "first_key", "first_seen", "last_key", "last_seen", "pages")
 
+    def __init__(self):
+        self.visits = 0
+        self.first_key = self.first_seen = self.last_key = self.last_seen = ""
+        self.pages = _UniqueCounter()
 
-def _aggregate_pages(bot_visits: dict[str, list[dict]]) -> list[CrawledPage]:
-    """Aggregate top crawled pages across all bots."""
-    page_counter: Counter = Counter()
-    page_bots: dict[str, set[str]] = defaultdict(set)
+    def add_date(self, date: str, key: str) -> None:
+        if not self.first_key or key < self.first_key:
+            self.first_key, self.first_seen = key, date
+        if key > self.last_key:
+            self.last_key, self.last_seen = key, date
 
-    for bot_name, visits in bot_visits.items():
-        for v in visits:
-            page_counter[v["path"]] += 1
-            page_bots[v["path"]].add(bot_name)
+    def merge(self, other: _BotAggregate) -> None:
+        self.visits += other.visits
+        if other.first_key:
+            self.add_date(other.first_seen, other.first_key)
+            self.add_date(other.last_seen, other.last_key)
+        self.pages.merge(other.pages)
 
-    return [
-        CrawledPage(path=path, total_visits=count, bots=sorted(page_bots[path]))
-        for path, count in page_counter.most_common(_TOP_PAGES_LIMIT)
-    ]
+
+class _LogAggregate:
+    """Streaming aggregates of a log (or of one byte range of it); mergeable and picklable."""
+
+    def __init__(self):
+        self.total_lines = 0
+        self.ai_requests = 0
+        self.bots: dict[str, _BotAggregate] = {}
+        # path -> [visits, bitmask of the bot ranks that visited it, max overcount of visits]
+        self.pages: dict[str, list[int]] = {}
+        # Most visits a path missing from ``pages`` can have had
+        self.pages_floor = 0
+
+    def scan(self, lines: Iterable[bytes], max_lines: int | None = None) -> None:
+        for raw in lines:
+            if max_lines is not None and self.total_lines >= max_lines:
+                break
+            self.total_lines += 1
+            entry = _parse_line(raw.decode("utf-8", "replace"))
+            if not entry:
+                continue
+            bot = _match_bot(entry["ua"])
+            if bot:
+                self.add(bot, entry["path"], entry["date"])
+
+    def scan_block(self, block: bytes, parse: Callable[[str], dict | None]) -> None:
+        """Aggregate a block of whole lines, parsing only those that contain a prefilter anchor."""
+        if not block:
+            return
+        self.total_lines += block.count(b"\n") + (not block.endswith(b"\n"))
+        # bytes.lower() folds ASCII only, which is all the fragments contain
+        lowered = block.lower()
+        candidates: set[tuple[int, int]] = set()
+        for anchor in _PREFILTER_ANCHORS:
+            found = lowered.find(anchor)
+            while found != -1:
+                end = lowered.find(b"\n", found)
+                if end == -1:
+                    end = len(lowered)
+                candidates.add((lowered.rfind(b"\n", 0, found) + 1, end))
+                found = lowered.find(anchor, end)
+        for start, end in sorted(candidates):
+            entry = parse(block[start:end].decode("utf-8", "replace").strip())
+            if not entry:
+                continue
+            bot = _match_bot(entry["ua"])
+            if bot:
+                self.add(bot, entry["path"], entry["date"])
+
+    def add(self, bot: str, path: str, date: str, visits: int = 1) -> None:
+        self.ai_requests += visits
+        stats = self.bots.get(bot)
+        if stats is None:
+            stats = self.bots[bot] = _BotAggregate()
+        stats.visits += visits
+        stats.pages.add(path)
+        if date:
+            stats.add_date(date, _date_sort_key(date))
+        self._count_page(path, visits, 1 << _BOT_RANKS[bot.lower()])
+
+    def _count_page(self, path: str, visits: int, bot_mask: int) -> None:
+        page = self.pages.get(path)
+        if page is None:
+            # A path seen before may have been dropped with up to pages_floor visits
+            self.pages[path] = [visits + self.pages_floor, bot_mask, self.pages_floor]
+            if len(self.pages) > _MAX_TRACKED_PAGES:
+                self._prune_pages()
+        else:
+            page[0] += visits
+            page[1] |= bot_mask
+
+    def _prune_pages(self) -> None:
+        """Drop the least visited half of the paths (space-saving, in batches).
+
+        The floor becomes the highest count dropped, so every path visited
+        more often than the floor stays tracked and no count is ever below
+        the true one.
+        """
+        ranked = sorted(self.pages.items(), key=lambda item: item[1][0], reverse=True)
+        keep = _MAX_TRACKED_PAGES // 2
+        self.pages_floor = max(self.pages_floor, ranked[keep][1][0])
+        self.pages = dict(ranked[:keep])
+
+    def merge(self, other: _LogAggregate) -> None:
+        self.total_lines += other.total_lines
+        self.ai_requests += other.ai_requests
+        for bot, stats in other.bots.items():
+            if bot in self.bots:
+                self.bots[bot].merge(stats)
+            else:
+                self.bots[bot] = stats
+        self._merge_pages(other)
+
+    def _merge_pages(self, other: _LogAggregate) -> None:
+        """Merge the page summaries: a path tracked on one side only may have had up to the other side's floor."""
+        if other.pages_floor:
+            for path, page in self.pages.items():
+                if path not in other.pages:
+                    page[0] += other.pages_floor
+                    page[2] += other.pages_floor
+        for path, (visits, bot_mask, error) in other.pages.items():
+            page = self.pages.get(path)
+            if page is None:
+                self.pages[path] = [visits + self.pages_floor, bot_mask, error + self.pages_floor]
+            else:
+                page[0] += visits
+                page[1] |= bot_mask
+                page[2] += error
+        self.pages_floor += other.pages_floor
+        if len(self.pages) > _MAX_TRACKED_PAGES:
+            self._prune_pages()
+
+    def to_result(self, log_file: str) -> LogAnalysisResult:
+        bots = [
+            BotStats(
+                bot_name=name,
+                visits=stats.visits,
+                unique_pages=len(stats.pages),
+                first_seen=stats.first_seen,
+                last_seen=stats.last_seen,
+            )
+            for name, stats in sorted(self.bots.items(), key=lambda item: item[1].visits, reverse=True)
+        ]
+        top = sorted(self.pages.items(), key=lambda item: item[1][0], reverse=True)[:_TOP_PAGES_LIMIT]
+        top_pages = [
+            CrawledPage(
+                path=path,
+                total_visits=visits,
+                visits_error=error,
+                bots=sorted(name for rank, name in enumerate(_BOT_NAMES) if bot_mask >> rank & 1),
+            )
+            for path, (visits, bot_mask, error) in top
+        ]
+        dated = [stats for stats in self.bots.values() if stats.first_key]
+        return LogAnalysisResult(
+            checked=True,
+            log_file=log_file,
+            total_lines=self.total_lines,
+            ai_requests=self.ai_requests,
+            date_range_start=min(dated, key=lambda s: s.first_key).first_seen if dated else "",
+            date_range_end=max(dated, key=lambda s: s.last_key).last_seen if dated else "",
+            bots=bots,
+            top_pages=top_pages,
+        )
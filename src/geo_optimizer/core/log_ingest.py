@@ -0,0 +1,343 @@
+"""Ingestione incrementale dei log server nello storage locale dei crawler AI.
+
+``geo logs ingest`` ricorda per ogni file di log device, inode e offset già
+letto (più i primi byte, per riconoscere un file troncato o sostituito) e a
+ogni giro legge solo le righe nuove. Le visite dei bot AI finiscono in
+contatori per sito, giorno, bot e path nel database di tracking locale
+(``TRACKING_DB_PATH``), aggiornati nella stessa transazione del checkpoint:
+un'ingestione interrotta non conta mai due volte le stesse righe.
+
+Il sito (``geo logs ingest --site``) è l'host servito dal log: i log di
+solito non lo contengono, e senza di esso le visite di più siti ingeriti
+nello stesso database finirebbero sommate. Le visite ingerite senza sito
+(o da versioni precedenti) restano con sito ``""``.
+
+Rotazione: se l'inode cambia (``mv`` + nuovo file) o il file si accorcia
+(``copytruncate``), le righe rimaste nel file ruotato vengono lette prima
+di ripartire da zero, a patto che il file ruotato sia ancora in chiaro nella
+stessa directory (``delaycompress`` di logrotate).
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import BinaryIO
+from urllib.parse import urlparse
+
+from geo_optimizer.core.log_analyzer import (
+    _GZIP_MAGIC,
+    _ZSTD_MAGIC,
+    _date_sort_key,
+    _match_bot,
+    _open_log,
+    _parse_line,
+)
+from geo_optimizer.models.config import TRACKING_DB_PATH
+from geo_optimizer.models.results import LogIngestResult
+
+# Byte iniziali salvati nel checkpoint per riconoscere lo stesso file
+_HEAD_BYTES = 256
+
+# Contatori (giorno, bot, path) tenuti in memoria prima di un commit intermedio
+_FLUSH_KEYS = 50_000
+
+_DAY_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+_CRAWLER_HITS_TABLE = """
+CREATE TABLE IF NOT EXISTS crawler_hits (
+    site TEXT NOT NULL DEFAULT '',
+    day TEXT NOT NULL,
+    bot TEXT NOT NULL,
+    path TEXT NOT NULL,
+    hits INTEGER NOT NULL,
+    PRIMARY KEY (site, day, bot, path)
+)
+"""
+
+
+def normalize_log_site(site: str | None) -> str:
+    """Host di un sito (dominio o URL) come chiave delle visite: minuscolo, senza ``www.``; "" se assente."""
+    raw = (site or "").strip()
+    if not raw:
+        return ""
+    if "://" not in raw:
+        raw = f"https://{raw}"
+    host = (urlparse(raw).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+@dataclass
+class LogCheckpoint:
+    """Posizione già ingerita di un file di log."""
+
+    file_path: str
+    device: int
+    inode: int
+    offset: int
+    head: bytes
+
+
+class CrawlerLogStore:
+    """Storage SQLite locale di checkpoint e contatori giornalieri dei crawler AI."""
+
+    def __init__(self, db_path: Path | None = None):
+        self.db_path = db_path or TRACKING_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS log_checkpoints (
+                    file_path TEXT PRIMARY KEY,
+                    device INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    byte_offset INTEGER NOT NULL,
+                    head BLOB NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(crawler_hits)")}
+            if columns and "site" not in columns:
+                # Tabella senza sito (versione precedente): le visite passano al sito ""
+                conn.execute("ALTER TABLE crawler_hits RENAME TO crawler_hits_unsited")
+                conn.execute(_CRAWLER_HITS_TABLE)
+                conn.execute(
+                    "INSERT INTO crawler_hits (site, day, bot, path, hits) "
+                    "SELECT '', day, bot, path, hits FROM crawler_hits_unsited"
+                )
+                conn.execute("DROP TABLE crawler_hits_unsited")
+            else:
+                conn.execute(_CRAWLER_HITS_TABLE)
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_crawler_hits_site_bot_path_day
+                ON crawler_hits (site, bot, path, day)
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_crawler_hits_site_path_day
+                ON crawler_hits (site, path, day)
+                """
+            )
+
+    def get_checkpoint(self, file_path: str) -> LogCheckpoint | None:
+        """Checkpoint salvato per ``file_path``, o None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT device, inode, byte_offset, head FROM log_checkpoints WHERE file_path = ?",
+                (file_path,),
+            ).fetchone()
+        if row is None:
+            return None
+        return LogCheckpoint(file_path, row["device"], row["inode"], row["byte_offset"], bytes(row["head"]))
+
+    def commit(self, checkpoint: LogCheckpoint, hits: Counter, site: str = "") -> None:
+        """Somma i contatori ``(giorno, bot, path) -> visite`` di ``site`` e salva il checkpoint in una transazione."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO crawler_hits (site, day, bot, path, hits) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (site, day, bot, path) DO UPDATE SET hits = hits + excluded.hits
+                    """,
+                    ((site, day, bot, path, count) for (day, bot, path), count in hits.items()),
+                )
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO log_checkpoints
+                        (file_path, device, inode, byte_offset, head, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        checkpoint.file_path,
+                        checkpoint.device,
+                        checkpoint.inode,
+                        checkpoint.offset,
+                        checkpoint.head,
+                        datetime.now(timezone.utc).isoformat(),
+                    ),
+                )
+        finally:
+            conn.close()
+
+    def count_hits(
+        self,
+        *,
+        site: str | None = None,
+        bot: str | None = None,
+        path: str | None = None,
+        days: int = 30,
+        until: date | None = None,
+    ) -> int:
+        """Visite dei crawler negli ultimi ``days`` giorni (fino a ``until``, default oggi UTC).
+
+        ``site`` limita le visite a quelle ingerite per quel sito (``None``: tutti i siti).
+        """
+        where, params = self._filters(site, bot, path, days, until)
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT COALESCE(SUM(hits), 0) FROM crawler_hits WHERE {where}", params).fetchone()
+        return int(row[0])
+
+    def bot_hits(
+        self, *, site: str | None = None, path: str | None = None, days: int = 30, until: date | None = None
+    ) -> dict[str, int]:
+        """Visite per bot negli ultimi ``days`` giorni, in ordine decrescente (``site``: vedi ``count_hits``)."""
+        where, params = self._filters(site, None, path, days, until)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT bot, SUM(hits) AS total FROM crawler_hits WHERE {where} GROUP BY bot ORDER BY total DESC, bot",
+                params,
+            ).fetchall()
+        return {row["bot"]: int(row["total"]) for row in rows}
+
+    @staticmethod
+    def _filters(
+        site: str | None, bot: str | None, path: str | None, days: int, until: date | None
+    ) -> tuple[str, list]:
+        last_day = until or datetime.now(timezone.utc).date()
+        clauses = ["day BETWEEN ? AND ?"]
+        params: list = [(last_day - timedelta(days=max(days, 1) - 1)).isoformat(), last_day.isoformat()]
+        if site is not None:
+            clauses.append("site = ?")
+            params.append(normalize_log_site(site))
+        if bot:
+            clauses.append("bot = ?")
+            params.append(bot)
+        if path:
+            clauses.append("path = ?")
+            params.append(path)
+        return " AND ".join(clauses), params
+
+
+def ingest_log_file(
+    file_path: str | Path, store: CrawlerLogStore | None = None, site: str | None = None
+) -> LogIngestResult:
+    """Ingerisce le righe nuove di un log dal checkpoint salvato, gestendo la rotazione.
+
+    ``site`` è il sito servito dal log (dominio o URL, vedi ``normalize_log_site``).
+    """
+    path = Path(file_path).absolute()
+    store = store or CrawlerLogStore()
+    key = str(path)
+    stat = path.stat()
+    checkpoint = store.get_checkpoint(key)
+    result = LogIngestResult(log_file=key, site=normalize_log_site(site))
+
+    start = 0
+    if checkpoint is not None:
+        if _is_same_file(path, stat, checkpoint):
+            start = checkpoint.offset
+        else:
+            result.rotated = True
+            rotated = _find_rotated(path, checkpoint)
+            if rotated is not None:
+                # Righe scritte nel vecchio file dopo l'ultima ingestione
+                result.rotated_file = str(rotated)
+                _ingest_from(rotated, key, checkpoint.offset, store, result)
+
+    result.start_offset = start
+    result.end_offset = _ingest_from(path, key, start, store, result)
+    return result
+
+
+def _is_same_file(path: Path, stat, checkpoint: LogCheckpoint) -> bool:
+    if (stat.st_dev, stat.st_ino) != (checkpoint.device, checkpoint.inode):
+        return False
+    # Un file più corto dell'offset è stato troncato (l'offset di un .gz/.zst è sul contenuto decompresso)
+    if stat.st_size < checkpoint.offset and not _is_compressed(path):
+        return False
+    return _read_head(path, len(checkpoint.head)) == checkpoint.head
+
+
+def _find_rotated(path: Path, checkpoint: LogCheckpoint) -> Path | None:
+    """File ruotato (``access.log.1``...) che contiene le righe del checkpoint, se è ancora in chiaro."""
+    by_head = None
+    for candidate in sorted(path.parent.glob(f"{path.name}?*")):
+        try:
+            stat = candidate.stat()
+        except OSError:
+            continue
+        if not candidate.is_file() or stat.st_size < checkpoint.offset:
+            continue
+        if _read_head(candidate, len(checkpoint.head)) != checkpoint.head:
+            continue
+        if (stat.st_dev, stat.st_ino) == (checkpoint.device, checkpoint.inode):
+            return candidate
+        # copytruncate: copia con inode nuovo ma stessi byte iniziali
+        by_head = by_head or candidate
+    return by_head
+
+
+def _read_head(path: Path, size: int) -> bytes:
+    with path.open("rb") as f:
+        return f.read(size)
+
+
+def _is_compressed(path: Path) -> bool:
+    return _read_head(path, 4).startswith((_GZIP_MAGIC, _ZSTD_MAGIC))
+
+
+def _ingest_from(path: Path, key: str, start: int, store: CrawlerLogStore, result: LogIngestResult) -> int:
+    """Legge le righe complete di ``path`` da ``start``; restituisce l'offset finale salvato."""
+    stat = path.stat()
+    head = _read_head(path, _HEAD_BYTES)
+    compressed = _is_compressed(path)
+    hits: Counter = Counter()
+    offset = start
+    with _open_log(path) as f:
+        _seek(f, start, compressed)
+        for line in iter(f.readline, b""):
+            if not line.endswith(b"\n") and not compressed:
+                # Riga ancora in scrittura: la legge il prossimo giro
+                break
+            offset += len(line)
+            result.lines_read += 1
+            entry = _parse_line(line.decode("utf-8", "replace"))
+            bot = _match_bot(entry["ua"]) if entry else None
+            if bot:
+                result.ai_requests += 1
+                hits[(_log_day(entry["date"]), bot, entry["path"])] += 1
+                if len(hits) >= _FLUSH_KEYS:
+                    store.commit(_checkpoint(key, stat, offset, head), hits, result.site)
+                    hits.clear()
+    store.commit(_checkpoint(key, stat, offset, head), hits, result.site)
+    return offset
+
+
+def _seek(f: BinaryIO, offset: int, compressed: bool) -> None:
+    if not compressed:
+        f.seek(offset)
+        return
+    # Gli offset di un log compresso sono sul contenuto decompresso
+    while offset > 0:
+        chunk = f.read(min(offset, 1 << 20))
+        if not chunk:
+            return
+        offset -= len(chunk)
+
+
+def _checkpoint(key: str, stat, offset: int, head: bytes) -> LogCheckpoint:
+    return LogCheckpoint(key, stat.st_dev, stat.st_ino, offset, head[: min(offset, _HEAD_BYTES)])
+
+
+def _log_day(log_date: str) -> str:
+    """Giorno ``YYYY-MM-DD`` di una data di log (combined o ISO); oggi (UTC) se non interpretabile."""
+    day = _date_sort_key(log_date)[:10]
+    if _DAY_RE.fullmatch(day):
+        return day
+    return datetime.now(timezone.utc).date().isoformat()
@@ -39,8 +39,14 @@ def run_passive_monitor(
     save_history: bool = True,
     retention_days: int = DEFAULT_HISTORY_RETENTION_DAYS,
     history_db: Path | None = None,
+    crawler_days: int | None = None,
 ) -> MonitorResult:
-    """Esegue il monitor passivo per un dominio riusando audit + history locale."""
+    """Esegue il monitor passivo per un dominio riusando audit + history locale.
+
+    Con ``crawler_days`` aggiunge le visite dei crawler AI degli ultimi N
+    giorni ingerite con ``geo logs ingest --site`` per questo dominio (stesso
+    database di tracking).
+    """
     normalized = normalize_monitor_domain(domain)
     audit_result = run_full_audit(normalized, use_cache=use_cache, project_config=project_config)
 
@@ -50,13 +56,22 @@ def run_passive_monitor(
         store.save_audit_result(audit_result, retention_days=retention_days)
     history_result = store.build_history_result(normalized, retention_days=retention_days)
 
-    return build_passive_monitor_result(audit_result, history_result)
+    crawler_hits = None
+    if crawler_days is not None:
+        from geo_optimizer.core.log_ingest import CrawlerLogStore
+
+        crawler_hits = CrawlerLogStore(history_db).bot_hits(site=normalized, days=crawler_days)
+
+    return build_passive_monitor_result(audit_result, history_result, crawler_hits, crawler_days or 0)
 
 
 def build_passive_monitor_result(
-    audit_result: AuditResult, history_result: HistoryResult | None = None
+    audit_result: AuditResult,
+    history_result: HistoryResult | None = None,
+    crawler_hits: dict[str, int] | None = None,
+    crawler_days: int = 0,
 ) -> MonitorResult:
-    """Costruisce uno snapshot di monitoraggio da audit e history opzionale."""
+    """Costruisce uno snapshot di monitoraggio da audit, history e visite dei crawler opzionali."""
     signals = [
         _citation_bot_signal(audit_result),
         _user_fetch_signal(audit_result),
@@ -66,6 +81,8 @@ def build_passive_monitor_result(
         _trust_signal(audit_result),
         _momentum_signal(history_result),
     ]
+    if crawler_hits is not None:
+        signals.append(_crawler_activity_signal(crawler_hits, crawler_days))
     visibility_score = sum(signal.score for signal in signals)
     recommendations = _build_monitor_recommendations(audit_result, history_result, signals)
     parsed = urlparse(audit_result.url)
@@ -265,6 +282,25 @@ def _momentum_signal(history_result: HistoryResult | None) -> MonitorSignal:
     )
 
 
+def _crawler_activity_signal(crawler_hits: dict[str, int], days: int) -> MonitorSignal:
+    """Riporta le visite reali dei crawler AI dai log ingeriti (informativo, fuori dallo score)."""
+    citation_hits = {bot: hits for bot, hits in crawler_hits.items() if bot in CITATION_BOTS}
+    status = "strong" if citation_hits else "partial" if crawler_hits else "missing"
+    return MonitorSignal(
+        key="crawler_activity",
+        label="AI crawler hits (server logs)",
+        score=0,
+        max_score=0,
+        status=status,
+        details={
+            "days": days,
+            "total_hits": sum(crawler_hits.values()),
+            "citation_bot_hits": sum(citation_hits.values()),
+            "bots": crawler_hits,
+        },
+    )
+
+
 def _build_monitor_recommendations(
     audit_result: AuditResult,
     history_result: HistoryResult | None,
@@ -286,6 +322,10 @@ def _build_monitor_recommendations(
         recommendations.append(
             "Strengthen brand/entity signals with sameAs links, About page, and Organization schema."
         )
+    if "crawler_activity" in signal_map and signal_map["crawler_activity"].status != "strong":
+        recommendations.append(
+            "No citation bot hits in the ingested server logs; check CDN/WAF rules that may block AI crawlers."
+        )
     if history_result and history_result.regression_detected:
         recommendations.append(
             "Latest local snapshot regressed vs previous run; review recent deploys before visibility drops compound."
@@ -0,0 +1,377 @@
+"""
+Single-pass DOM index shared by all sub-audits.
+
+``audit_citability`` alone runs ~47 detectors and each used to walk the whole
+soup again with ``find_all``; schema, meta, trust stack, prompt injection,
+negative signals, hallucination bait and intent mapping added their own
+walks on top. ``PageIndex`` walks the tree once and keeps:
+
+- every tag in document order, grouped by name and by attribute key
+- the subtree extent of each tag, so ``within=`` queries need no new walk
+- memoized ``get_text()`` results per tag
+- the page text, the clean text (no script/style/nav/header/footer) and the
+  per-heading section text
+- the parsed JSON-LD graph (``JsonLdGraph``) and the serialised HTML
+
+``find_all()``/``find()`` take the same arguments as BeautifulSoup and match
+with BeautifulSoup's own ``SoupStrainer``; only the candidate list is
+narrowed through the index, so results are identical and in document order.
+
+The index assumes the soup is not mutated after it is built — sub-audits
+only read the DOM (copies are decomposed, never the shared soup).
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import CData, NavigableString, Tag
+
+from geo_optimizer.core.jsonld_graph import JsonLdGraph
+
+# Tags whose text is dropped from the clean text (same set as the old
+# deepcopy + decompose in citability._get_clean_text)
+CLEAN_TEXT_EXCLUDE = ("script", "style", "nav", "footer", "header")
+
+# Elements that never carry visible page text (the old soup_clean)
+NON_CONTENT_TAGS = ("script", "style")
+
+# Tag.find_all keywords that are not attribute filters: the index would
+# silently match them as attributes named "string", "text"...
+_UNSUPPORTED_FIND_KWARGS = ("string", "text", "recursive")
+
+_HEADING_NAMES = ("h1", "h2", "h3", "h4", "h5", "h6")
+_DEFAULT_STRING_TYPES = {NavigableString, CData}
+
+# Shared empty candidate list: candidate lists must outlive the query (their
+# positions are cached by id), so never hand out a fresh ``[]``
+_NO_TAGS: list[Tag] = []
+
+
+def _requires_attribute(value: Any) -> bool:
+    """True if a BeautifulSoup attribute rule can only match a present attribute."""
+    if value is True or isinstance(value, (str, bytes, re.Pattern)):
+        return True
+    if isinstance(value, (list, tuple)) and value:
+        return all(_requires_attribute(v) for v in value)
+    if callable(value):
+        # BeautifulSoup calls the rule with None when the attribute is missing
+        try:
+            return not value(None)
+        except Exception:
+            return False
+    return False
+
+
+class PageIndex:
+    """Precomputed view of a parsed page, built in one traversal.
+
+    Args:
+        soup: BeautifulSoup of the full HTML document. Must not be mutated
+            while the index is in use.
+    """
+
+    def __init__(self, soup):
+        self.soup = soup
+        self.tags: list[Tag] = []
+        self._by_name: dict[str, list[Tag]] = {}
+        self._by_attr: dict[str, list[Tag]] = {}
+        self._pos: dict[int, int] = {}
+        self._end: dict[int, int] = {}
+        self._text_cache: dict[tuple, str] = {}
+        self._clean_text: str | None = None
+        self._jsonld: JsonLdGraph | None = None
+        self._sections: dict[int, list[str]] = {}
+        self._html: str | None = None
+        self._merged: dict[tuple, list[Tag]] = {}
+        self._positions: dict[int, list[int]] = {}
+
+        # One walk over the tree: document order + subtree extent (end = first
+        # position after the last descendant) via the chain of open ancestors.
+        open_tags: list[Tag] = []
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            parent = element.parent
+            while open_tags and open_tags[-1] is not parent:
+                self._end[id(open_tags.pop())] = len(self.tags)
+            self._pos[id(element)] = len(self.tags)
+            self.tags.append(element)
+            self._by_name.setdefault(element.name, []).append(element)
+            for key in element.attrs:
+                self._by_attr.setdefault(key, []).append(element)
+            open_tags.append(element)
+        for tag in open_tags:
+            self._end[id(tag)] = len(self.tags)
+
+    # ─── Queries ─────────────────────────────────────────────────────────────
+
+    def find_all(self, name=None, attrs=None, within=None, limit=None, **kwargs) -> list:
+        """Indexed equivalent of ``within.find_all(name, attrs, **kwargs)``.
+
+        Args:
+            name: Tag name, list of names, regex or True — as in BeautifulSoup.
+            attrs: Attribute filter dict — as in BeautifulSoup.
+            within: Restrict to descendants of this tag (default: whole page).
+            limit: Stop after this many matches.
+            **kwargs: Attribute filters (``class_``, ``href=True``...).
+
+        Raises:
+            TypeError: ``string=``, ``text=`` or ``recursive=`` was passed; the
+                index matches tags only (search the soup for those).
+        """
+        unsupported = [key for key in _UNSUPPORTED_FIND_KWARGS if key in kwargs]
+        if unsupported:
+            raise TypeError(f"PageIndex.find_all() does not support {', '.join(unsupported)}=: search the soup instead")
+        if within is not None and not isinstance(within, BeautifulSoup) and id(within) not in self._pos:
+            # Not part of the indexed tree (e.g. a copy): plain BeautifulSoup search
+            return list(within.find_all(name, attrs or {}, limit=limit, **kwargs))
+
+        attrs = attrs or {}
+        candidates = self._restrict(self._candidates(name, attrs, kwargs), within)
+
+        if (
+            not attrs
+            and not kwargs
+            and (name is None or name is True or isinstance(name, str) or self._is_name_list(name))
+        ):
+            return candidates[:limit] if limit else candidates
+
+        strainer = SoupStrainer(name, attrs, **kwargs)
+        if hasattr(strainer, "matches_tag"):
+            matches = strainer.matches_tag
+        else:  # bs4 < 4.13
+            matches = lambda tag: strainer.search_tag(tag) is not None  # noqa: E731
+        found = []
+        for tag in candidates:
+            if matches(tag):
+                found.append(tag)
+                if limit and len(found) >= limit:
+                    break
+        return found
+
+    def find(self, name=None, attrs=None, within=None, **kwargs):
+        """Indexed equivalent of ``within.find(name, attrs, **kwargs)``."""
+        found = self.find_all(name, attrs, within=within, limit=1, **kwargs)
+        return found[0] if found else None
+
+    def contains(self, ancestor, tag) -> bool:
+        """True if ``tag`` is a descendant of ``ancestor``."""
+        if ancestor is None or isinstance(ancestor, BeautifulSoup):
+            return True
+        start = self._pos.get(id(ancestor))
+        pos = self._pos.get(id(tag))
+        if start is None or pos is None:
+            return False
+        return start < pos < self._end[id(ancestor)]
+
+    @property
+    def headings(self) -> list[Tag]:
+        """h1-h6 in document order."""
+        return self.find_all(list(_HEADING_NAMES))
+
+    @property
+    def paragraphs(self) -> list[Tag]:
+        return self.find_all("p")
+
+    @property
+    def links(self) -> list[Tag]:
+        """``<a href>`` elements."""
+        return self.find_all("a", href=True)
+
+    @property
+    def images(self) -> list[Tag]:
+        return self.find_all("img")
+
+    @property
+    def meta_tags(self) -> list[Tag]:
+        return self.find_all("meta")
+
+    # ─── Text ────────────────────────────────────────────────────────────────
+
+    def text(self, tag=None, separator: str = "", strip: bool = False, exclude=()) -> str:
+        """Memoized ``tag.get_text(separator, strip)``.
+
+        Args:
+            tag: Element to read (default: the whole page).
+            separator: As in ``get_text``.
+            strip: As in ``get_text``.
+            exclude: Tag names whose subtrees are skipped, as if they had
+                been decomposed from a copy — without copying anything.
+        """
+        tag = self.soup if tag is None else tag
+        exclude = tuple(exclude)
+        # Only elements of the indexed tree are memoized: their id() is stable
+        cacheable = tag is self.soup or id(tag) in self._pos
+        key = (id(tag), separator, strip, exclude)
+        if cacheable and key in self._text_cache:
+            return self._text_cache[key]
+        if exclude:
+            value = separator.join(self.iter_strings(tag, strip=strip, exclude_names=exclude))
+        else:
+            value = tag.get_text(separator=separator, strip=strip)
+        if cacheable:
+            self._text_cache[key] = value
+        return value
+
+    def iter_strings(self, tag=None, strip: bool = False, exclude_names=(), exclude_tags=None):
+        """Yield the strings ``tag.get_text()`` would join, skipping excluded subtrees.
+
+        Args:
+            tag: Element to read (default: the whole page).
+            strip: Strip each string and drop empty ones.
+            exclude_names: Tag names whose subtrees are skipped.
+            exclude_tags: Specific elements whose subtrees are skipped.
+        """
+        tag = self.soup if tag is None else tag
+        types = tag.interesting_string_types or _DEFAULT_STRING_TYPES
+        names = set(exclude_names)
+        skip = {id(t) for t in exclude_tags} if exclude_tags else set()
+        stack = [iter(tag.contents)]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            if isinstance(child, Tag):
+                if child.name in names or id(child) in skip:
+                    continue
+                stack.append(iter(child.contents))
+            elif isinstance(child, NavigableString) and type(child) in types:
+                if strip:
+                    child = child.strip()
+                    if not child:
+                        continue
+                yield child
+
+    @property
+    def clean_text(self) -> str:
+        """Page text without script/style/nav/header/footer, space-separated and stripped."""
+        if self._clean_text is None:
+            self._clean_text = self.clean_text_of(self.soup)
+        return self._clean_text
+
+    def clean_text_of(self, tag) -> str:
+        """``clean_text`` of one subtree: a view over the tree, nothing is copied or decomposed."""
+        return self.text(tag, separator=" ", strip=True, exclude=CLEAN_TEXT_EXCLUDE)
+
+    def sections(self, within=None) -> list[str]:
+        """Text of each heading section: the heading's following siblings up to the next heading.
+
+        Args:
+            within: Container whose headings delimit the sections (default: ``<body>``
+                or the whole page). Script and style siblings are ignored.
+        """
+        if within is None:
+            within = self.find("body") or self.soup
+        key = id(within)
+        if key in self._sections:
+            return self._sections[key]
+
+        headings = self.find_all(re.compile(r"^h[1-6]$"), within=within)
+        if not headings:
+            text = self.text(within, " ", True, exclude=NON_CONTENT_TAGS)
+            result = [text] if text else []
+        else:
+            heading_ids = {id(h) for h in headings}
+            result = []
+            for heading in headings:
+                parts: list[str] = []
+                for sibling in heading.next_siblings:
+                    if id(sibling) in heading_ids:
+                        break
+                    if isinstance(sibling, Tag):
+                        if sibling.name in NON_CONTENT_TAGS:
+                            continue
+                        t = self.text(sibling, " ", True, exclude=NON_CONTENT_TAGS)
+                    elif hasattr(sibling, "get_text"):
+                        t = sibling.get_text(separator=" ", strip=True)
+                    else:
+                        t = str(sibling).strip()
+                    if t:
+                        parts.append(t)
+                combined = " ".join(parts)
+                if combined:
+                    result.append(combined)
+        self._sections[key] = result
+        return result
+
+    @property
+    def html(self) -> str:
+        """``str(soup)``, serialised once."""
+        if self._html is None:
+            self._html = str(self.soup)
+        return self._html
+
+    # ─── Structured data ─────────────────────────────────────────────────────
+
+    @property
+    def jsonld(self) -> JsonLdGraph:
+        """JSON-LD graph of the page, every ``application/ld+json`` script parsed once."""
+        if self._jsonld is None:
+            self._jsonld = JsonLdGraph(self.find_all("script", type="application/ld+json"))
+        return self._jsonld
+
+    # ─── Internals ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _is_name_list(name) -> bool:
+        return isinstance(name, (list, tuple, set)) and all(isinstance(n, str) for n in name)
+
+    def _merge(self, groups: list[list[Tag]]) -> list[Tag]:
+        groups = [g for g in groups if g]
+        if not groups:
+            return _NO_TAGS
+        if len(groups) == 1:
+            return list(groups[0])
+        pos = self._pos
+        return sorted((t for g in groups for t in g), key=lambda t: pos[id(t)])
+
+    def _candidates(self, name, attrs: dict, kwargs: dict) -> list[Tag]:
+        """Smallest list of tags that can possibly match the query."""
+        if isinstance(name, str):
+            options = [self._by_name.get(name, _NO_TAGS)]
+        elif self._is_name_list(name):
+            key = tuple(sorted(set(name)))
+            if key not in self._merged:
+                self._merged[key] = self._merge([self._by_name.get(n, _NO_TAGS) for n in key])
+            options = [self._merged[key]]
+        elif isinstance(name, re.Pattern):
+            key = (name.pattern, name.flags)
+            if key not in self._merged:
+                self._merged[key] = self._merge([tags for n, tags in self._by_name.items() if name.search(n)])
+            options = [self._merged[key]]
+        else:
+            options = [self.tags]
+
+        rules = dict(attrs) if isinstance(attrs, dict) else {}
+        for key, value in kwargs.items():
+            rules["class" if key == "class_" else key] = value
+        for key, value in rules.items():
+            if _requires_attribute(value):
+                options.append(self._by_attr.get(key, _NO_TAGS))
+        return min(options, key=len)
+
+    def _restrict(self, candidates: list[Tag], within) -> list[Tag]:
+        """Slice of ``candidates`` (in document order) inside ``within``'s subtree."""
+        if within is None or isinstance(within, BeautifulSoup):
+            return list(candidates)
+        # Candidate lists live as long as the index, so their positions are cached
+        positions = self._positions.get(id(candidates))
+        if positions is None:
+            positions = [self._pos[id(t)] for t in candidates]
+            self._positions[id(candidates)] = positions
+        start = self._pos[id(within)]
+        lo = bisect_right(positions, start)
+        hi = bisect_left(positions, self._end[id(within)], lo)
+        return candidates[lo:hi]
+
+
+def get_page_index(soup, index: PageIndex | None = None) -> PageIndex:
+    """Return ``index`` when the caller already built one for ``soup``, else build it."""
+    if index is not None and index.soup is soup:
+        return index
+    return PageIndex(soup)
@@ -9,13 +9,13 @@ from __future__ import annotations
 
 import asyncio
 
-from bs4 import BeautifulSoup
-
 from geo_optimizer.core.coherence_analyzer import analyze_coherence
 from geo_optimizer.core.llms_generator import fetch_sitemap
 from geo_optimizer.core.term_extractor import extract_page_terms
 from geo_optimizer.models.results import PageTermExtract, SemanticCoherenceResult
+from geo_optimizer.utils.html_parser import parse_html
 from geo_optimizer.utils.http import fetch_url
+from geo_optimizer.utils.politeness import FetchScheduler, robots_txt_url, use_fetch_scheduler
 
 _DEFAULT_MAX_PAGES = 20
 
@@ -39,7 +39,10 @@ def run_site_coherence(
         return SemanticCoherenceResult(checked=True, pages_analyzed=0, coherence_score=0)
 
     urls = _dedupe_urls(entries, max_pages)
-    extracts = _fetch_and_extract(urls)
+    with use_fetch_scheduler(FetchScheduler()):
+        # robots.txt first, so its Crawl-delay paces the page fetches
+        fetch_url(robots_txt_url(sitemap_url))
+        extracts = _fetch_and_extract(urls)
     return analyze_coherence(extracts)
 
 
@@ -58,15 +61,19 @@ async def run_site_coherence_async(
     try:
         from geo_optimizer.utils.http_async import fetch_urls_async
 
-        responses = await fetch_urls_async(urls)
+        # The pages are fetched together: the scheduler caps them per host
+        with use_fetch_scheduler(FetchScheduler()):
+            await fetch_urls_async([robots_txt_url(sitemap_url)])
+            responses = await fetch_urls_async(urls)
         extracts: list[PageTermExtract] = []
         for url in urls:
             resp, err = responses.get(url, (None, None))
             if resp and not err:
-                soup = BeautifulSoup(resp.text, "html.parser")
+                soup = parse_html(resp.text)
                 extracts.append(extract_page_terms(soup, url=url))
     except ImportError:
-        extracts = await asyncio.to_thread(_fetch_and_extract, urls)
+        with use_fetch_scheduler(FetchScheduler()):
+            extracts = await asyncio.to_thread(_fetch_and_extract, urls)
 
     return analyze_coherence(extracts)
 
@@ -90,6 +97,6 @@ def _fetch_and_extract(urls: list[str]) -> list[PageTermExtract]:
     for url in urls:
         resp, err = fetch_url(url)
         if resp and not err:
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = parse_html(resp.text)
             extracts.append(extract_page_terms(soup, url=url))
     return extracts
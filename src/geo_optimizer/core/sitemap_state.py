@@ -0,0 +1,148 @@
+"""Stato persistente delle pagine di sitemap per gli audit batch incrementali (``--changed-only``).
+
+Per ogni pagina auditata con successo salva il ``lastmod`` letto nella
+sitemap, il fingerprint di ciò che l'audit ha scaricato (``audit_fingerprint``
+senza le sonde CDN: pagina, header letti dall'audit, robots.txt, llms.txt e
+gli altri file di sito), la chiave della configurazione di audit
+(``audit_config_key``) e la sintesi ``BatchAuditPageResult``. Al giro
+successivo una pagina viene riauditata se è nuova, se il suo ``lastmod`` è
+più recente, se il fingerprint è cambiato, se è cambiata la configurazione
+(versione, pesi, plugin, bot, parser) o se il risultato salvato è più vecchio
+di ``SITEMAP_STATE_MAX_AGE_DAYS``; altrimenti si riusa il risultato salvato.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from geo_optimizer.core.audit import audit_url_key
+from geo_optimizer.models.config import SITEMAP_STATE_DB_PATH
+from geo_optimizer.models.results import BatchAuditPageResult, SitemapPageState
+
+
+def _parse_lastmod(value: str) -> datetime | None:
+    """Interpreta un ``<lastmod>`` W3C Datetime (data, data e ora, ``Z``); None se non valido."""
+    candidate = value.strip()
+    if candidate.endswith(("Z", "z")):
+        candidate = candidate[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(candidate)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def lastmod_is_newer(current: str | None, previous: str | None) -> bool:
+    """True se il ``lastmod`` attuale è più recente di quello salvato.
+
+    Senza ``lastmod`` attuale decide solo il fingerprint. Un ``lastmod``
+    comparso ora, o non interpretabile e diverso dal precedente, conta come
+    più recente.
+    """
+    if not current:
+        return False
+    if not previous:
+        return True
+    current_date, previous_date = _parse_lastmod(current), _parse_lastmod(previous)
+    if current_date is None or previous_date is None:
+        return current.strip() != previous.strip()
+    return current_date > previous_date
+
+
+def state_is_expired(state: SitemapPageState, max_age_days: float) -> bool:
+    """True se il risultato salvato ha più di ``max_age_days`` giorni (o una data non interpretabile)."""
+    try:
+        audited_at = datetime.fromisoformat(state.audited_at)
+    except (TypeError, ValueError):
+        return True
+    if audited_at.tzinfo is None:
+        audited_at = audited_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - audited_at >= timedelta(days=max_age_days)
+
+
+class SitemapStateStore:
+    """Storage SQLite locale dello stato delle pagine di sitemap, per URL (``audit_url_key``)."""
+
+    def __init__(self, db_path: Path | None = None):
+        self.db_path = db_path or SITEMAP_STATE_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(sitemap_pages)")}
+            if "body_hash" in columns:
+                # Stato salvato col solo hash del body: non coinciderebbe mai, si riaudita tutto
+                conn.execute("DROP TABLE sitemap_pages")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sitemap_pages (
+                    url_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    lastmod TEXT,
+                    fingerprint TEXT NOT NULL,
+                    config_key TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    audited_at TEXT NOT NULL
+                )
+                """
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Una connessione per operazione: il batch legge e scrive da più thread
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, url: str) -> SitemapPageState | None:
+        """Stato salvato per la pagina di ``url``, o None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT url, lastmod, fingerprint, config_key, result, audited_at FROM sitemap_pages WHERE url_key = ?",
+                (audit_url_key(url),),
+            ).fetchone()
+        if row is None:
+            return None
+        url, lastmod, fingerprint, config_key, result, audited_at = row
+        try:
+            page = BatchAuditPageResult(**json.loads(result))
+        except (TypeError, ValueError):
+            # Riga scritta da una versione con campi diversi: pagina da riauditare
+            return None
+        return SitemapPageState(
+            url=url, lastmod=lastmod, fingerprint=fingerprint, config_key=config_key, result=page, audited_at=audited_at
+        )
+
+    def save(self, state: SitemapPageState) -> None:
+        """Salva (o sostituisce) lo stato di una pagina."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO sitemap_pages
+                    (url_key, url, lastmod, fingerprint, config_key, result, audited_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    audit_url_key(state.url),
+                    state.url,
+                    state.lastmod,
+                    state.fingerprint,
+                    state.config_key,
+                    json.dumps(dataclasses.asdict(state.result)),
+                    state.audited_at,
+                ),
+            )
+
+    def clear(self) -> int:
+        """Cancella tutto lo stato salvato; restituisce il numero di pagine rimosse."""
+        with self._connect() as conn:
+            return int(conn.execute("DELETE FROM sitemap_pages").rowcount or 0)
@@ -21,7 +21,9 @@ from bs4 import BeautifulSoup
 from geo_optimizer.core.llms_generator import fetch_sitemap
 from geo_optimizer.core.term_extractor import extract_page_terms
 from geo_optimizer.models.results import PageTermExtract, TopicAuthorityResult, TopicCluster
+from geo_optimizer.utils.html_parser import parse_html
 from geo_optimizer.utils.http import fetch_url
+from geo_optimizer.utils.politeness import FetchScheduler, robots_txt_url, use_fetch_scheduler
 
 _DEFAULT_MAX_PAGES = 20
 _MAX_CLUSTERS = 10
@@ -223,13 +225,16 @@ def run_topic_authority(
 
     extracts: list[PageTermExtract] = []
     page_links: dict[str, set[str]] = {}
-    for url in urls:
-        resp, err = fetch_url(url)
-        if not resp or err:
-            continue
-        soup = BeautifulSoup(resp.text, "html.parser")
-        extracts.append(extract_page_terms(soup, url=url))
-        page_links[url] = _extract_internal_links(soup, url)
+    with use_fetch_scheduler(FetchScheduler()):
+        # robots.txt first, so its Crawl-delay paces the page fetches
+        fetch_url(robots_txt_url(sitemap_url))
+        for url in urls:
+            resp, err = fetch_url(url)
+            if not resp or err:
+                continue
+            soup = parse_html(resp.text)
+            extracts.append(extract_page_terms(soup, url=url))
+            page_links[url] = _extract_internal_links(soup, url)
 
     if not extracts:
         return TopicAuthorityResult(checked=True, skipped_reason="No pages could be fetched")
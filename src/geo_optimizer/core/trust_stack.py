@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import re
 
+from geo_optimizer.core.page_index import PageIndex, get_page_index
 from geo_optimizer.models.config import (
     ACADEMIC_AUTHORITY_DOMAINS,
     ACADEMIC_STATISTICS_MIN_MATCHES,
@@ -138,27 +139,29 @@ def _score_identity(
 # ─── Layer 3: Social Trust ────────────────────────────────────────────────────
 
 
-def _detect_testimonials(soup) -> bool:
+def _detect_testimonials(soup, index: PageIndex | None = None) -> bool:
     """Detect reviews/testimonials in the DOM."""
+    idx = get_page_index(soup, index)
     # Look for common CSS classes for testimonials/reviews
     for cls_name in ["review", "testimonial", "testimony", "recensione"]:
-        if soup.find(attrs={"class": lambda c, _cn=cls_name: c and _cn in str(c).lower()}):
+        if idx.find(attrs={"class": lambda c, _cn=cls_name: c and _cn in str(c).lower()}):
             return True
     # Schema itemprop review
-    if soup.find(attrs={"itemprop": "review"}):
+    if idx.find(attrs={"itemprop": "review"}):
         return True
     # Blockquote with substantial text (possible testimonial)
-    for bq in soup.find_all("blockquote"):
-        text = bq.get_text(strip=True)
+    for bq in idx.find_all("blockquote"):
+        text = idx.text(bq, strip=True)
         if len(text.split()) >= 20:
             return True
     return False
 
 
-def _detect_social_links(soup) -> list[str]:
+def _detect_social_links(soup, index: PageIndex | None = None) -> list[str]:
     """Detect unique social domains linked in the DOM (used for Social Trust layer)."""
+    idx = get_page_index(soup, index)
     found_domains: list[str] = []
-    for a_tag in soup.find_all("a", href=True):
+    for a_tag in idx.find_all("a", href=True):
         href = a_tag["href"].lower()
         for domain in SOCIAL_PROOF_DOMAINS:
             if domain in href and domain not in found_domains:
@@ -166,14 +169,15 @@ def _detect_social_links(soup) -> list[str]:
     return found_domains
 
 
-def _count_social_links(soup) -> int:
+def _count_social_links(soup, index: PageIndex | None = None) -> int:
     """Count total <a> tags pointing to social media domains (fix #390).
 
     Unlike _detect_social_links (which returns unique domains), this counts
     every individual link, matching the cardinality of external_links_count.
     """
+    idx = get_page_index(soup, index)
     count = 0
-    for a_tag in soup.find_all("a", href=True):
+    for a_tag in idx.find_all("a", href=True):
         href = a_tag["href"].lower()
         if any(domain in href for domain in SOCIAL_PROOF_DOMAINS):
             count += 1
@@ -184,8 +188,10 @@ def _score_social(
     schema: SchemaResult,
     brand_entity: BrandEntityResult,
     soup,
+    index: PageIndex | None = None,
 ) -> TrustLayerScore:
     """Evaluate social trust: external presence and reputation."""
+    idx = get_page_index(soup, index)
     layer = TrustLayerScore(name="social", label="Social Trust")
 
     # sameAs present (+1)
@@ -208,14 +214,14 @@ def _score_social(
         layer.signals_missing.append("No Knowledge Graph pillar links")
 
     # Testimonials/reviews in the DOM (+1)
-    if _detect_testimonials(soup):
+    if _detect_testimonials(soup, index=idx):
         layer.score += 1
         layer.signals_found.append("Reviews/testimonials")
     else:
         layer.signals_missing.append("No reviews or testimonials found")
 
     # Social profile links (+1)
-    social_links = _detect_social_links(soup)
+    social_links = _detect_social_links(soup, index=idx)
     if social_links:
         layer.score += 1
         layer.signals_found.append(f"Social profiles ({', '.join(social_links[:3])})")
@@ -229,10 +235,11 @@ def _score_social(
 # ─── Layer 4: Academic Trust ──────────────────────────────────────────────────
 
 
-def _detect_authoritative_links(soup) -> list[str]:
+def _detect_authoritative_links(soup, index: PageIndex | None = None) -> list[str]:
     """Detect links to authoritative academic sources."""
+    idx = get_page_index(soup, index)
     found: list[str] = []
-    for a_tag in soup.find_all("a", href=True):
+    for a_tag in idx.find_all("a", href=True):
         href = a_tag["href"].lower()
         for domain in ACADEMIC_AUTHORITY_DOMAINS:
             if domain in href and domain not in found:
@@ -240,26 +247,29 @@ def _detect_authoritative_links(soup) -> list[str]:
     return found
 
 
-def _detect_references_section(soup) -> bool:
+def _detect_references_section(soup, index: PageIndex | None = None) -> bool:
     """Detect a References/Sources section via headings."""
-    for tag in soup.find_all(["h2", "h3", "h4"]):
-        heading_text = tag.get_text(strip=True).lower()
+    idx = get_page_index(soup, index)
+    for tag in idx.find_all(["h2", "h3", "h4"]):
+        heading_text = idx.text(tag, strip=True).lower()
         if any(pattern in heading_text for pattern in REFERENCES_HEADING_PATTERNS):
             return True
     return False
 
 
-def _count_statistics(soup) -> int:
+def _count_statistics(soup, index: PageIndex | None = None) -> int:
     """Count statistical patterns in the page text."""
-    body = soup.find("body")
+    idx = get_page_index(soup, index)
+    body = idx.find("body")
     if not body:
         return 0
-    text = body.get_text(separator=" ", strip=True)
+    text = idx.text(body, separator=" ", strip=True)
     return len(_STATISTICS_RE.findall(text))
 
 
-def _score_academic(content: ContentResult, soup) -> TrustLayerScore:
+def _score_academic(content: ContentResult, soup, index: PageIndex | None = None) -> TrustLayerScore:
     """Evaluate academic trust: data, citations, sources."""
+    idx = get_page_index(soup, index)
     layer = TrustLayerScore(name="academic", label="Academic Trust")
 
     # Cited data/numbers (+1)
@@ -273,7 +283,7 @@ def _score_academic(content: ContentResult, soup) -> TrustLayerScore:
     # Social links belong in Social Trust, not Academic Trust.
     # Use _count_social_links (counts individual <a> tags) to match the
     # cardinality of content.external_links_count.
-    social_link_count = _count_social_links(soup) if soup else 0
+    social_link_count = _count_social_links(soup, index=idx) if soup else 0
     academic_external_count = max(content.external_links_count - social_link_count, 0)
     if academic_external_count >= 2:
         layer.score += 1
@@ -282,7 +292,7 @@ def _score_academic(content: ContentResult, soup) -> TrustLayerScore:
         layer.signals_missing.append("Few external source links")
 
     # Links to authoritative sources (+1)
-    auth_links = _detect_authoritative_links(soup)
+    auth_links = _detect_authoritative_links(soup, index=idx)
     if auth_links:
         layer.score += 1
         layer.signals_found.append(f"Authoritative sources ({', '.join(auth_links[:3])})")
@@ -290,14 +300,14 @@ def _score_academic(content: ContentResult, soup) -> TrustLayerScore:
         layer.signals_missing.append("No links to authoritative sources (DOI, PubMed, Scholar)")
 
     # References/Sources section (+1)
-    if _detect_references_section(soup):
+    if _detect_references_section(soup, index=idx):
         layer.score += 1
         layer.signals_found.append("References section")
     else:
         layer.signals_missing.append("No References/Sources section")
 
     # Original statistics (+1)
-    stats_count = _count_statistics(soup)
+    stats_count = _count_statistics(soup, index=idx)
     if stats_count >= ACADEMIC_STATISTICS_MIN_MATCHES:
         layer.score += 1
         layer.signals_found.append(f"Original statistics ({stats_count} patterns)")
@@ -379,6 +389,7 @@ def audit_trust_stack(
     meta: MetaResult,
     content: ContentResult,
     negative_signals: NegativeSignalsResult,
+    index: PageIndex | None = None,
 ) -> TrustStackResult:
     """Aggregate trust signals across 5 layers.
 
@@ -393,17 +404,19 @@ def audit_trust_stack(
         meta: meta tags audit result.
         content: content audit result.
         negative_signals: negative signals audit result.
+        index: Optional PageIndex of ``soup`` shared with the other sub-audits.
 
     Returns:
         TrustStackResult with per-layer and composite scores.
     """
+    idx = get_page_index(soup, index)
     result = TrustStackResult(checked=True)
 
     # Compute the 5 layers
     result.technical = _score_technical(base_url, response_headers)
     result.identity = _score_identity(brand_entity, schema, negative_signals)
-    result.social = _score_social(schema, brand_entity, soup)
-    result.academic = _score_academic(content, soup)
+    result.social = _score_social(schema, brand_entity, soup, index=idx)
+    result.academic = _score_academic(content, soup, index=idx)
     result.consistency = _score_consistency(brand_entity, negative_signals, schema)
 
     # Composite score
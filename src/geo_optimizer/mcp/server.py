@@ -39,6 +39,8 @@ from urllib.parse import urlparse
 
 from mcp.server.fastmcp import FastMCP
 
+from geo_optimizer.utils.singleflight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
 mcp = FastMCP("geo-optimizer")
@@ -219,9 +221,8 @@ def geo_citability(url: str) -> str:
         return json.dumps({"error": f"Unsafe URL: {reason}", "url": url})
 
     try:
-        from bs4 import BeautifulSoup
-
         from geo_optimizer.core.citability import audit_citability
+        from geo_optimizer.utils.html_parser import parse_html
         from geo_optimizer.utils.http import fetch_url
 
         r, err = fetch_url(url)
@@ -230,7 +231,7 @@ def geo_citability(url: str) -> str:
         if err or r is None:
             return json.dumps({"error": f"Cannot reach {url}: {err or 'connection failed'}", "url": url})
 
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = parse_html(r.text)
         result = audit_citability(soup, url)
         return _to_json(result)
     except Exception as e:
@@ -278,6 +279,17 @@ def geo_schema_validate(json_string: str, schema_type: str = "") -> str:
 
 # ─── Tool 6: geo_compare ──────────────────────────────────────────────────────
 
+# Single-flight: concurrent geo_compare calls (tools run in worker threads)
+# share one audit per page instead of starting their own
+_compare_flights = SingleFlight()
+
+
+def _compare_audit(url: str):
+    """Full audit of ``url``, joined with any audit of the same page already running."""
+    from geo_optimizer.core.audit import audit_url_key, run_full_audit
+
+    return _compare_flights.run(audit_url_key(url), lambda: run_full_audit(url))
+
 
 @mcp.tool()
 def geo_compare(urls: str) -> str:
@@ -296,7 +308,11 @@ def geo_compare(urls: str) -> str:
     if len(url_list) > 5:
         return json.dumps({"error": "Maximum 5 URLs per comparison"})
 
+    from geo_optimizer.core.audit import audit_url_key
+
     results = []
+    # The same site listed twice ("a.com, https://a.com/") is audited once
+    audited = {}
     for u in url_list:
         u = _normalize_url(u)
         safe, reason = validate_public_url(u)
@@ -304,9 +320,10 @@ def geo_compare(urls: str) -> str:
             results.append({"url": u, "error": f"Unsafe URL: {reason}"})
             continue
         try:
-            from geo_optimizer.core.audit import run_full_audit
-
-            result = run_full_audit(u)
+            key = audit_url_key(u)
+            if key not in audited:
+                audited[key] = _compare_audit(u)
+            result = audited[key]
             results.append(
                 {
                     "url": u,
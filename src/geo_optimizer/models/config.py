@@ -24,6 +24,20 @@ MAX_SUB_SITEMAPS: int = 10
 # Total URL limit extracted from all sitemaps — fix #124 (sitemap bomb)
 MAX_TOTAL_URLS: int = 10_000
 
+# Worker threads used by run_full_audit to fetch robots/llms/AI discovery files concurrently
+SIDECAR_FETCH_WORKERS: int = 4
+
+# AI bot User-Agent probes sent concurrently by the CDN/WAF check (#225)
+CDN_PROBE_WORKERS: int = 6
+
+# ─── HTML parsing ────────────────────────────────────────────────────────────
+
+# BeautifulSoup tree builder for page analysis: "html.parser", "lxml" or "auto"
+# (lxml when installed). Overridden by GEO_HTML_PARSER or audit.parser in
+# .geo-optimizer.yml — see utils/html_parser.py
+DEFAULT_HTML_PARSER = "html.parser"
+HTML_PARSER_ENV = "GEO_HTML_PARSER"
+
 # ─── Local history / tracking ────────────────────────────────────────────────
 
 # Performance budget: warn if a single-page audit exceeds this threshold (#290)
@@ -32,6 +46,10 @@ AUDIT_TIMEOUT_SECONDS: int = 10
 GEO_OPTIMIZER_HOME = Path.home() / ".geo-optimizer"
 TRACKING_DB_PATH = GEO_OPTIMIZER_HOME / "tracking.db"
 SNAPSHOTS_DB_PATH = GEO_OPTIMIZER_HOME / "snapshots.db"
+SITEMAP_STATE_DB_PATH = GEO_OPTIMIZER_HOME / "sitemap-state.db"
+# --changed-only: a stored result older than this is re-audited even if the page
+# looks unchanged (the CDN/WAF probes are not part of the change check)
+SITEMAP_STATE_MAX_AGE_DAYS = 7
 DEFAULT_HISTORY_RETENTION_DAYS = 90
 DEFAULT_HISTORY_LIMIT = 12
 DEFAULT_SNAPSHOT_LIMIT = 20
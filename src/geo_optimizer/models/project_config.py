@@ -14,6 +14,8 @@ import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from geo_optimizer.models.config import CDN_PROBE_WORKERS
+
 logger = logging.getLogger(__name__)
 
 # Name of the configuration file searched in the current directory
@@ -39,6 +41,9 @@ class AuditConfig:
     min_score: int = 0
     cache: bool = False
     verbose: bool = False
+    parser: str | None = None  # HTML parser backend: html.parser, lxml or auto
+    cdn_workers: int = CDN_PROBE_WORKERS  # CDN/WAF bot probes sent concurrently (1 = sequential)
+    cdn_stop_on_challenge: bool = False  # Stop the bot probes at the first WAF challenge page
 
 
 @dataclass
@@ -138,6 +143,9 @@ def _parse_config(raw: dict) -> ProjectConfig:
             min_score=_safe_int(audit_raw.get("min_score", 0)),
             cache=bool(audit_raw.get("cache", False)),
             verbose=bool(audit_raw.get("verbose", False)),
+            parser=str(audit_raw["parser"]) if audit_raw.get("parser") else None,
+            cdn_workers=max(1, _safe_int(audit_raw.get("cdn_workers", CDN_PROBE_WORKERS), CDN_PROBE_WORKERS)),
+            cdn_stop_on_challenge=bool(audit_raw.get("cdn_stop_on_challenge", False)),
         )
 
     # llms section
@@ -19,7 +19,7 @@ class CachedResponse:
     """Synthetic HTTP response built from the on-disk cache (fix #83).
 
     Used by run_full_audit() when use_cache=True and the response
-    is already in the FileCache, avoiding a new HTTP request.
+    is already in the HTTP cache, avoiding a new HTTP request.
     """
 
     status_code: int
@@ -254,11 +254,12 @@ class CdnAiCrawlerResult:
     browser_content_length: int = 0
     bot_results: list[dict] = field(default_factory=list)
     # bot_results: [{"bot": "GPTBot", "status": 200, "content_length": 12345,
-    #                "blocked": False, "challenge_detected": False}]
+    #                "blocked": False, "challenge_detected": False, "elapsed_ms": 120}]
     any_blocked: bool = False
     cdn_detected: str = ""  # "cloudflare", "akamai", "aws", "" if none
     cdn_headers: dict[str, str] = field(default_factory=dict)
     error: str = ""  # fix #304: error message (unsafe URL, timeout, etc.)
+    early_abort: bool = False  # True if stop_on_challenge skipped the remaining probes
 
 
 # ─── JS Rendering Check (#226) ──────────────────────────────────────────────
@@ -580,6 +581,10 @@ class CrawledPage:
     path: str = ""
     total_visits: int = 0
     bots: list[str] = field(default_factory=list)
+    # total_visits may overcount by up to this many (0 = exact); past the page
+    # tracking limit the counts come from a space-saving summary, and bots
+    # lists only those seen since the path was last tracked
+    visits_error: int = 0
 
 
 @dataclass
@@ -596,6 +601,20 @@ class LogAnalysisResult:
     top_pages: list[CrawledPage] = field(default_factory=list)
 
 
+@dataclass
+class LogIngestResult:
+    """Outcome of one incremental ingestion of a server log into the crawler store."""
+
+    log_file: str = ""
+    site: str = ""
+    start_offset: int = 0
+    end_offset: int = 0
+    lines_read: int = 0
+    ai_requests: int = 0
+    rotated: bool = False
+    rotated_file: str = ""
+
+
 # ─── Multi-Platform Citation Profile (v4.7) ─────────────────────────────────
 
 
@@ -1029,6 +1048,20 @@ class BatchAuditResult:
     worst_pages: list[BatchAuditPageResult] = field(default_factory=list)
     # gap #6: warning when sitemap has more URLs than max_urls cap
     truncated_warning: str = ""
+    # --changed-only: pages whose stored result was reused instead of re-audited
+    unchanged_urls: int = 0
+
+
+@dataclass
+class SitemapPageState:
+    """Stato salvato di una pagina di sitemap per gli audit batch ``--changed-only``."""
+
+    url: str
+    lastmod: str | None
+    fingerprint: str
+    config_key: str
+    result: BatchAuditPageResult
+    audited_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 
 # ─── Audit diff ──────────────────────────────────────────────────────────────
@@ -4,6 +4,26 @@ Local HTTP cache on filesystem.
 Saves HTTP responses in ``~/.geo-cache/`` to avoid repeated fetches
 during development. Disabled by default, enabled with ``--cache``.
 
+Two backends share the same ``get``/``put``/``clear``/``stats`` interface:
+
+- ``SqliteCache`` (used by the audit): one SQLite file with an index on the
+  URL hash, zlib-compressed bodies and the response metadata (status,
+  headers, ETag, Last-Modified, fetch time). get/put are single indexed
+  statements, the total size is kept by triggers and LRU eviction walks an
+  index, so no operation scans the cache. WAL mode lets the processes of a
+  batch read and write it concurrently.
+- ``FileCache``: the original one-JSON-file-per-URL cache, kept for callers
+  that use it directly. Its ``put`` and ``stats`` scan the whole directory.
+
+Expired entries that carry an ETag or Last-Modified are not dropped: ``lookup``
+still returns them, ``fetch_url``/``fetch_url_async`` send ``If-None-Match`` /
+``If-Modified-Since``, and a ``304 Not Modified`` refreshes the entry and is
+served from the cache (see ``store_response``).
+
+``AuditResultCache`` sits one level up: finished ``AuditResult`` objects keyed
+by a fingerprint of the fetched content and the scoring configuration, so a
+repeat audit of an unchanged page skips parsing and analysis.
+
 Usage:
     geo audit --url https://example.com --cache
     geo audit --url https://example.com --clear-cache
@@ -11,21 +31,99 @@ Usage:
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import json
+import os
 import shutil
+import sqlite3
+import sys
+import threading
 import time
+import zlib
+from dataclasses import dataclass
 from pathlib import Path
 
+from geo_optimizer.models.results import CachedResponse
+
 # Cache directory in the user's home
 CACHE_DIR = Path.home() / ".geo-cache"
 
+# SQLite cache file inside CACHE_DIR
+CACHE_DB_NAME = "http-cache.sqlite3"
+
 # Default TTL: 1 hour
 DEFAULT_TTL = 3600
 
 # Disk cache size limit: 500 MB (fix #192)
 MAX_CACHE_SIZE_BYTES = 500 * 1024 * 1024
 
+# Audit result cache: SQLite file inside CACHE_DIR, entry limit and TTL.
+# Results are keyed by content, but freshness and decay checks compare page
+# dates with today, so a result is not reused for more than a day.
+RESULT_CACHE_DB_NAME = "audit-results.sqlite3"
+RESULT_TTL = 24 * 3600
+MAX_RESULT_ENTRIES = 2000
+
+
+@dataclass
+class CacheEntry:
+    """A cached response with its validators, fresh or stale."""
+
+    url: str
+    status_code: int
+    text: str
+    headers: dict
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
+
+    def is_fresh(self, ttl: int) -> bool:
+        """True while the entry is younger than ``ttl`` seconds (served without a request)."""
+        return time.time() - self.fetched_at <= ttl
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that revalidate the entry (empty without validators)."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> CachedResponse:
+        """Response-like object for the cached body (fix #83: use dataclass)."""
+        return CachedResponse(
+            status_code=self.status_code, text=self.text, content=self.text.encode("utf-8"), headers=self.headers
+        )
+
+
+def _validators(headers: dict) -> tuple[str | None, str | None]:
+    """(ETag, Last-Modified) from response headers, whatever their case."""
+    lowered = {str(name).lower(): value for name, value in headers.items()}
+    return lowered.get("etag"), lowered.get("last-modified")
+
+
+def store_response(cache, url: str, entry: CacheEntry | None, r, err: str | None):
+    """Apply a live fetch of ``url`` to ``cache``; return the (response, error) to use.
+
+    A 304 answers the conditional request made for ``entry``: the entry is
+    refreshed and its cached body is returned. Other responses replace the
+    entry, except server errors, which are not cached.
+    """
+    if err or r is None:
+        return r, err
+    if r.status_code == 304 and entry is not None:
+        cache.refresh(url, dict(r.headers))
+        return entry.to_response(), None
+    if r.status_code < 500:
+        cache.put(url, r.status_code, r.text, dict(r.headers))
+    return r, None
+
 
 class FileCache:
     """HTTP cache on filesystem with TTL."""
@@ -69,6 +167,37 @@ class FileCache:
             data.get("headers", {}),
         )
 
+    def lookup(self, url: str) -> CacheEntry | None:
+        """Return the cached entry, fresh or stale (for revalidation), or None."""
+        try:
+            data = json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        headers = data.get("headers", {})
+        etag, last_modified = _validators(headers)
+        return CacheEntry(
+            url=url,
+            status_code=data.get("status_code", 200),
+            text=data.get("text", ""),
+            headers=headers,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=data.get("cached_at", 0),
+        )
+
+    def refresh(self, url: str, headers: dict) -> None:
+        """Mark a revalidated (304) entry as fresh again."""
+        entry = self.lookup(url)
+        if entry is None:
+            return
+        etag, last_modified = _validators(headers)
+        merged = dict(entry.headers)
+        if etag:
+            merged["ETag"] = etag
+        if last_modified:
+            merged["Last-Modified"] = last_modified
+        self.put(url, entry.status_code, entry.text, merged)
+
     def put(self, url: str, status_code: int, text: str, headers: dict) -> None:
         """Save response to cache. Evicts oldest if over disk limit (fix #192)."""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -124,3 +253,415 @@ class FileCache:
         files = list(self.cache_dir.glob("*.json"))
         total_size = sum(f.stat().st_size for f in files)
         return {"files": len(files), "size_bytes": total_size}
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, size_bytes = size_bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, size_bytes = size_bytes - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET size_bytes = size_bytes - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+
+class _SqliteStore:
+    """One SQLite file in ``cache_dir``, opened lazily with ``schema``.
+
+    Thread-safe (one connection per instance, behind a lock) and process-safe
+    (SQLite locking in WAL mode, with a busy timeout for concurrent writers).
+    A closed or forked instance reconnects on next use.
+    """
+
+    schema = ""
+
+    def __init__(self, cache_dir: Path | None, db_name: str):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.db_path = self.cache_dir / db_name
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reopen after fork/close) the connection; call with the lock held."""
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: autocommit, transactions are explicit
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(self.schema)
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def close(self) -> None:
+        """Close the connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SqliteCache(_SqliteStore):
+    """HTTP cache in a single SQLite file with TTL and size-bounded LRU eviction.
+
+    Entries are keyed by the SHA-256 of the URL. ``get`` refreshes the entry's
+    access time, ``put`` evicts least recently used entries once the stored
+    size (compressed bodies + headers) exceeds ``max_size_bytes``.
+    """
+
+    schema = _SCHEMA
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        ttl: int = DEFAULT_TTL,
+        max_size_bytes: int = MAX_CACHE_SIZE_BYTES,
+    ):
+        super().__init__(cache_dir, CACHE_DB_NAME)
+        self.ttl = ttl
+        self.max_size_bytes = max_size_bytes
+
+    def _key(self, url: str) -> str:
+        """Generate cache key from URL (SHA-256 hash)."""
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def get(self, url: str) -> tuple[int, str, dict] | None:
+        """Retrieve response from cache if valid.
+
+        Expired entries without validators are deleted; expired entries with
+        an ETag or Last-Modified are kept so ``fetch_url`` can revalidate them.
+
+        Returns:
+            Tuple (status_code, text, headers) or None if not cached/expired.
+        """
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        if not entry.is_fresh(self.ttl):
+            if not entry.has_validators:
+                self._delete(url)
+            return None
+        return entry.status_code, entry.text, entry.headers
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """Return the cached entry, fresh or stale (for revalidation), or None."""
+        key = self._key(url)
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT status_code, headers, etag, last_modified, body, fetched_at FROM entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            status_code, headers, etag, last_modified, body, fetched_at = row
+            return CacheEntry(
+                url=url,
+                status_code=status_code,
+                text=zlib.decompress(body).decode("utf-8"),
+                headers=json.loads(headers),
+                etag=etag,
+                last_modified=last_modified,
+                fetched_at=fetched_at,
+            )
+        except (sqlite3.Error, zlib.error, ValueError):
+            return None
+
+    def refresh(self, url: str, headers: dict) -> None:
+        """Mark a revalidated (304) entry as fresh again, updating validators the server resent."""
+        etag, last_modified = _validators(headers)
+        now = time.time()
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "UPDATE entries SET fetched_at = ?, accessed_at = ?, etag = COALESCE(?, etag), "
+                    "last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                    (now, now, etag, last_modified, self._key(url)),
+                )
+        except sqlite3.Error:
+            pass
+
+    def _delete(self, url: str) -> None:
+        try:
+            with self._lock:
+                self._connect().execute("DELETE FROM entries WHERE key = ?", (self._key(url),))
+        except sqlite3.Error:
+            pass
+
+    def put(self, url: str, status_code: int, text: str, headers: dict) -> None:
+        """Save response to cache, then evict least recently used entries if over the size limit."""
+        headers = dict(headers)
+        etag, last_modified = _validators(headers)
+        body = zlib.compress(text.encode("utf-8"))
+        headers_json = json.dumps(headers, ensure_ascii=False)
+        now = time.time()
+        row = (
+            self._key(url),
+            url,
+            status_code,
+            headers_json,
+            etag,
+            last_modified,
+            body,
+            len(body) + len(headers_json),
+            now,
+            now,
+        )
+        try:
+            with self._lock:
+                conn = self._connect()
+                # One write transaction: other processes never see the cache over its limit
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "INSERT INTO entries (key, url, status_code, headers, etag, last_modified, body, size, "
+                        "fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET url = excluded.url, status_code = excluded.status_code, "
+                        "headers = excluded.headers, etag = excluded.etag, last_modified = excluded.last_modified, "
+                        "body = excluded.body, size = excluded.size, fetched_at = excluded.fetched_at, "
+                        "accessed_at = excluded.accessed_at",
+                        row,
+                    )
+                    self._evict_if_needed(conn)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            pass  # A cache write failure must never fail the audit
+
+    def _evict_if_needed(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the total size fits ``max_size_bytes``."""
+        excess = conn.execute("SELECT size_bytes FROM totals WHERE id = 0").fetchone()[0] - self.max_size_bytes
+        if excess <= 0:
+            return
+        # Walks the LRU index from the oldest entry and stops as soon as enough is freed
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number of entries removed."""
+        if not self.db_path.exists():
+            return 0
+        with self._lock:
+            conn = self._connect()
+            count = conn.execute("SELECT entries FROM totals WHERE id = 0").fetchone()[0]
+            conn.execute("DELETE FROM entries")
+            conn.execute("VACUUM")
+        return count
+
+    def stats(self) -> dict[str, int]:
+        """Cache statistics: entry count, total stored size."""
+        if not self.db_path.exists():
+            return {"entries": 0, "size_bytes": 0}
+        with self._lock:
+            entries, size_bytes = (
+                self._connect().execute("SELECT entries, size_bytes FROM totals WHERE id = 0").fetchone()
+            )
+        return {"entries": entries, "size_bytes": size_bytes}
+
+
+_shared_cache: SqliteCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> SqliteCache:
+    """Return the process-wide ``SqliteCache`` in ``CACHE_DIR`` (created on first use)."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = SqliteCache()
+        return _shared_cache
+
+
+_RESULT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    result BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_lru ON results (accessed_at);
+CREATE INDEX IF NOT EXISTS results_created ON results (created_at);
+"""
+
+
+class AuditResultCache(_SqliteStore):
+    """Finished audit results keyed by a fingerprint of everything they were computed from.
+
+    The fingerprint (``core.audit.audit_fingerprint``) covers the fetched
+    content, the scoring weights, the package version and the plugin set, so
+    a hit is the result the analysis would produce again: changing any of
+    them changes the key and the old entry is never read. Entries expire after
+    ``ttl`` seconds and the least recently used ones are evicted past
+    ``max_entries``.
+
+    Results are stored as zlib-compressed JSON (``_result_to_json``): the
+    web app reads the same file, so an entry must never be able to run code
+    when it is loaded. An entry that no longer decodes is a miss.
+    """
+
+    schema = _RESULT_SCHEMA
+
+    def __init__(self, cache_dir: Path | None = None, ttl: int = RESULT_TTL, max_entries: int = MAX_RESULT_ENTRIES):
+        super().__init__(cache_dir, RESULT_CACHE_DB_NAME)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get(self, fingerprint: str):
+        """Return the cached ``AuditResult`` for ``fingerprint``, or None."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT result FROM results WHERE fingerprint = ? AND created_at >= ?",
+                    (fingerprint, time.time() - self.ttl),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE results SET accessed_at = ? WHERE fingerprint = ?", (time.time(), fingerprint))
+            return _result_from_json(zlib.decompress(row[0]))
+        except (sqlite3.Error, OSError, zlib.error, ValueError, TypeError):
+            # Database errors and unreadable entries (corrupted, or a field that changed) are misses
+            return None
+
+    def put(self, fingerprint: str, url: str, result) -> None:
+        """Store ``result``, dropping expired entries and the least recently used ones over the limit."""
+        try:
+            blob = zlib.compress(_result_to_json(result))
+        except (TypeError, ValueError):
+            return  # Plugin details that are not JSON: the result is not cached
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (fingerprint, url, result, created_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (fingerprint, url, blob, now, now),
+                    )
+                    conn.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl,))
+                    excess = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+                    if excess > 0:
+                        conn.execute(
+                            "DELETE FROM results WHERE fingerprint IN "
+                            "(SELECT fingerprint FROM results ORDER BY accessed_at LIMIT ?)",
+                            (excess,),
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except (sqlite3.Error, OSError):
+            pass  # A cache write failure must never fail the audit
+
+    def clear(self) -> int:
+        """Remove every stored result. Returns the number of results removed."""
+        if not self.db_path.exists():
+            return 0
+        with self._lock:
+            conn = self._connect()
+            count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            conn.execute("DELETE FROM results")
+            conn.execute("VACUUM")
+        return count
+
+    def stats(self) -> dict[str, int]:
+        """Cache statistics: stored result count."""
+        if not self.db_path.exists():
+            return {"entries": 0}
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {"entries": entries}
+
+
+# Markers of the JSON encoding of a result: the dataclass name, and tuples
+# (JSON would turn them into lists and the result would no longer compare equal)
+_TYPE_KEY = "__result__"
+_TUPLE_KEY = "__tuple__"
+
+
+def _to_jsonable(value):
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        data = {f.name: _to_jsonable(getattr(value, f.name)) for f in dataclasses.fields(value)}
+        data[_TYPE_KEY] = f"{type(value).__module__}:{type(value).__qualname__}"
+        return data
+    if isinstance(value, tuple):
+        return {_TUPLE_KEY: [_to_jsonable(item) for item in value]}
+    if isinstance(value, list):
+        return [_to_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_jsonable(item) for key, item in value.items()}
+    return value
+
+
+def _from_jsonable(data: dict):
+    if _TUPLE_KEY in data:
+        return tuple(data[_TUPLE_KEY])
+    name = data.pop(_TYPE_KEY, None)
+    if name is None:
+        return data
+    # Only dataclasses of this package can be built, and only from modules
+    # already loaded: the name is looked up, never imported
+    module_name, _, qualname = name.partition(":")
+    module = sys.modules.get(module_name) if module_name.startswith("geo_optimizer.") else None
+    cls = getattr(module, qualname, None) if module is not None else None
+    if not (isinstance(cls, type) and dataclasses.is_dataclass(cls) and cls.__module__ == module_name):
+        raise ValueError(f"not a result type: {name!r}")
+    return cls(**data)
+
+
+def _result_to_json(result) -> bytes:
+    """``AuditResult`` (or any result dataclass) as JSON that ``_result_from_json`` turns back into an equal one."""
+    return json.dumps(_to_jsonable(result), separators=(",", ":")).encode("utf-8")
+
+
+def _result_from_json(blob: bytes):
+    """Inverse of ``_result_to_json``; raises ValueError or TypeError on an entry it cannot rebuild."""
+    return json.loads(blob.decode("utf-8"), object_hook=_from_jsonable)
+
+
+_shared_result_cache: AuditResultCache | None = None
+
+
+def get_result_cache() -> AuditResultCache:
+    """Return the process-wide ``AuditResultCache`` in ``CACHE_DIR`` (created on first use)."""
+    global _shared_result_cache
+    with _shared_cache_lock:
+        if _shared_result_cache is None:
+            _shared_result_cache = AuditResultCache()
+        return _shared_result_cache
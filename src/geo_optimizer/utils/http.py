@@ -11,15 +11,24 @@ Implements anti-SSRF protections:
 - DNS pinning: single DNS resolution, connection forced to the pre-validated IP
 - Manual redirect with anti-SSRF revalidation on each hop
 - Streaming with size check to prevent DoS from huge responses
+
+Connection reuse: ``http_pool()`` activates an ``HttpClientPool`` for the
+current context, so every ``fetch_url`` issued inside it (one audit, one
+batch) shares keep-alive sessions keyed by host and pinned IP instead of
+paying a new TCP/TLS handshake per request.
 """
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import functools
 import logging
 import socket
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
 from urllib.parse import urlparse
 
 import requests
@@ -27,6 +36,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from geo_optimizer.models.config import HEADERS
+from geo_optimizer.utils.politeness import THROTTLE_STATUS_CODES, active_scheduler, observe_response
 
 _logger = logging.getLogger(__name__)
 
@@ -48,6 +58,9 @@ _MAX_RETRIES: int = 3
 _BACKOFF_BASE: int = 2
 _RETRYABLE_STATUS_CODES: list[int] = [408, 429, 500, 502, 503, 504]
 
+# Maximum number of keep-alive sessions held by one HttpClientPool (LRU beyond this)
+_POOL_MAX_SESSIONS = 32
+
 
 def create_session_with_retry(
     total_retries=3,
@@ -67,6 +80,11 @@ def create_session_with_retry(
         pinned_ips: List of pre-validated IPs to force the connection to.
                     If provided, uses _PinnedIPAdapter to prevent DNS rebinding.
 
+    With a ``FetchScheduler`` active, 429 and 503 are left out of
+    ``status_forcelist`` and ``Retry-After`` is ignored: urllib3 would sleep
+    on them while holding the scheduler slot, and the scheduler would never
+    see the throttling. ``_execute_request`` retries them through the scheduler.
+
     Returns:
         requests.Session: Configured session with retry adapter
     """
@@ -74,6 +92,9 @@ def create_session_with_retry(
         status_forcelist = _RETRYABLE_STATUS_CODES
     if allowed_methods is None:
         allowed_methods = ["GET", "HEAD"]
+    scheduled = active_scheduler() is not None
+    if scheduled:
+        status_forcelist = [code for code in status_forcelist if code not in THROTTLE_STATUS_CODES]
 
     session = requests.Session()
     session.headers.update(HEADERS)
@@ -84,6 +105,7 @@ def create_session_with_retry(
         status_forcelist=status_forcelist,
         allowed_methods=allowed_methods,
         raise_on_status=False,
+        respect_retry_after_header=not scheduled,
     )
 
     # If pinned IPs were provided, use the adapter with DNS pinning
@@ -98,7 +120,7 @@ def create_session_with_retry(
     return session
 
 
-def with_retry(max_retries: int = _MAX_RETRIES, backoff_base: int = _BACKOFF_BASE):
+def with_retry(max_retries: int = _MAX_RETRIES, backoff_base: int = _BACKOFF_BASE, url_arg: int | None = None):
     """Decorator per retry con backoff esponenziale sui transient failures.
 
     Riprova solo per errori transitori (timeout, connection error).
@@ -108,6 +130,10 @@ def with_retry(max_retries: int = _MAX_RETRIES, backoff_base: int = _BACKOFF_BAS
     Args:
         max_retries: Numero massimo di tentativi (default: 3).
         backoff_base: Base per l'esponenziale: delay = base ** attempt (default: 2).
+        url_arg: Indice posizionale dell'URL. Se impostato e c'è un
+            ``FetchScheduler`` attivo, il backoff blocca l'host nello scheduler
+            (aspettano anche le altre richieste verso lo stesso host) invece di
+            fare ``time.sleep`` in questo thread.
     """
 
     def decorator(func):
@@ -129,7 +155,12 @@ def with_retry(max_retries: int = _MAX_RETRIES, backoff_base: int = _BACKOFF_BAS
                             delay,
                             exc,
                         )
-                        time.sleep(delay)
+                        scheduler = active_scheduler() if url_arg is not None and len(args) > url_arg else None
+                        if scheduler is not None:
+                            # The next attempt waits for the host in the scheduler
+                            scheduler.penalize(args[url_arg], delay)
+                        else:
+                            time.sleep(delay)
             # Tutti i retry esauriti
             raise last_exception
 
@@ -138,14 +169,29 @@ def with_retry(max_retries: int = _MAX_RETRIES, backoff_base: int = _BACKOFF_BAS
     return decorator
 
 
-@with_retry()
-def _execute_request(session, url: str, timeout: int) -> requests.Response:
+@with_retry(url_arg=1)
+def _execute_request(session, url: str, timeout: int, headers: dict[str, str] | None = None) -> requests.Response:
     """Esegue la richiesta HTTP con retry esponenziale sui transient failures.
 
     Questa funzione e' wrappata da @with_retry per separare la logica di retry
-    dalla logica di gestione redirect e streaming.
+    dalla logica di gestione redirect e streaming. ``headers`` si aggiungono a
+    quelli della sessione (es. If-None-Match per la rivalidazione della cache).
+    Con un ``FetchScheduler`` attivo ogni tentativo attende il proprio turno
+    per l'host e ne riporta lo status: una risposta 429/503 rallenta l'host e
+    viene ritentata (fino a ``max_retries`` dello scheduler) quando il backoff
+    è scaduto, come in ``fetch_url_async``; l'ultima risposta torna così com'è.
     """
-    return session.get(url, timeout=timeout, allow_redirects=False, stream=True)
+    scheduler = active_scheduler()
+    if scheduler is None:
+        return session.get(url, headers=headers, timeout=timeout, allow_redirects=False, stream=True)
+    attempts = scheduler.max_retries + 1
+    for attempt in range(attempts):
+        with scheduler.slot(url):
+            r = session.get(url, headers=headers, timeout=timeout, allow_redirects=False, stream=True)
+        scheduler.record(url, r.status_code, r.headers.get("Retry-After"))
+        if r.status_code not in THROTTLE_STATUS_CODES or attempt == attempts - 1:
+            return r
+        r.close()
 
 
 # Fix #330: DNS pinning via thread-local instead of a global lock.
@@ -196,6 +242,147 @@ class _PinnedIPAdapter(HTTPAdapter):
             return super().send(request, *args, **kwargs)
 
 
+class HttpClientPool:
+    """Keep-alive ``requests`` sessions shared across the fetches of an audit or batch.
+
+    Sessions are keyed by ``(scheme, host, port, pinned IP)``: a session is only
+    ever used to reach the IP that ``resolve_and_validate_url`` validated for
+    that host, so DNS pinning and the per-hop redirect revalidation in
+    ``fetch_url`` are unchanged — only the TCP/TLS connection is reused.
+
+    Thread-safe: the same pool can serve the worker threads of a batch.
+    """
+
+    def __init__(self, max_sessions: int = _POOL_MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self.sessions_created = 0
+        self.sessions_reused = 0
+        self._sessions: OrderedDict[tuple, requests.Session] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str, pinned_ips: list[str] | None) -> tuple:
+        parsed = urlparse(url)
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        pinned_ip = pinned_ips[0] if pinned_ips else None
+        # Sessions built under a FetchScheduler retry differently (see create_session_with_retry)
+        scheduled = active_scheduler() is not None
+        return (parsed.scheme, (parsed.hostname or "").lower(), port, pinned_ip, scheduled)
+
+    def session_for(self, url: str, pinned_ips: list[str] | None) -> requests.Session:
+        """Return the pooled session for the URL's origin and pinned IP, creating it if needed."""
+        key = self._key(url, pinned_ips)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                self.sessions_reused += 1
+                return session
+
+            session = create_session_with_retry(
+                total_retries=3,
+                backoff_factor=1.0,
+                status_forcelist=_RETRYABLE_STATUS_CODES,
+                pinned_ips=pinned_ips if pinned_ips else None,
+            )
+            self._sessions[key] = session
+            self.sessions_created += 1
+
+            # LRU eviction: release the pooled connections of the oldest origin
+            while len(self._sessions) > self.max_sessions:
+                _old_key, old_session = self._sessions.popitem(last=False)
+                old_session.close()
+            return session
+
+    def stats(self) -> dict[str, int]:
+        """Pool counters: open sessions, sessions created, sessions reused."""
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "created": self.sessions_created,
+                "reused": self.sessions_reused,
+            }
+
+    def close(self) -> None:
+        """Close every pooled session and release its connections."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> HttpClientPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Pool active for the current context (audit, batch). ContextVar rather than a
+# module global: asyncio.to_thread() copies the context, so worker threads of a
+# batch inherit the batch pool while unrelated callers keep the unpooled path.
+_active_pool: contextvars.ContextVar[HttpClientPool | None] = contextvars.ContextVar("_active_pool", default=None)
+
+_shared_pool: HttpClientPool | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool() -> HttpClientPool:
+    """Return the process-wide pool (created on first use, never closed)."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = HttpClientPool()
+        return _shared_pool
+
+
+@contextlib.contextmanager
+def http_pool(shared: bool = False) -> Iterator[HttpClientPool]:
+    """Activate a connection pool for every ``fetch_url`` in this context.
+
+    Nested calls reuse the outer pool, so a batch that wraps its audits in
+    ``http_pool()`` shares connections with each ``run_full_audit`` inside it.
+
+    Args:
+        shared: If True, use the process-wide pool from ``get_shared_pool()``
+            instead of a private pool closed on exit.
+    """
+    current = _active_pool.get()
+    if current is not None:
+        yield current
+        return
+
+    pool = get_shared_pool() if shared else HttpClientPool()
+    token = _active_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _active_pool.reset(token)
+        if not shared:
+            pool.close()
+
+
+@contextlib.contextmanager
+def use_http_pool(pool: HttpClientPool) -> Iterator[HttpClientPool]:
+    """Activate an existing pool for this context, without closing it on exit.
+
+    For a pool that outlives a single ``with`` block, e.g. the pool of a batch
+    whose pages run as separate asyncio tasks: each task activates it in its
+    own copy of the context. Nested calls reuse the outer pool, like
+    ``http_pool()``.
+    """
+    current = _active_pool.get()
+    if current is not None:
+        yield current
+        return
+
+    token = _active_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _active_pool.reset(token)
+
+
 def _stream_response(response: requests.Response, max_size: int) -> tuple[bytes | None, str | None]:
     """Read the body in streaming while checking the size limit.
 
@@ -222,7 +409,11 @@ def _stream_response(response: requests.Response, max_size: int) -> tuple[bytes
 
 
 def fetch_url(
-    url: str, timeout: int = 10, max_size: int = MAX_RESPONSE_SIZE
+    url: str,
+    timeout: int = 10,
+    max_size: int = MAX_RESPONSE_SIZE,
+    pool: HttpClientPool | None = None,
+    cache=None,
 ) -> tuple[requests.Response | None, str | None]:
     """
     Fetch a URL with automatic retry on transient failures.
@@ -236,6 +427,12 @@ def fetch_url(
         url: URL to fetch.
         timeout: Request timeout in seconds.
         max_size: Maximum response size in bytes (default: 10 MB).
+        pool: Connection pool to reuse; defaults to the one activated by
+            ``http_pool()``, if any.
+        cache: Optional HTTP cache (``utils.cache``). A fresh entry is
+            returned without a request; a stale one is revalidated with
+            ``If-None-Match`` / ``If-Modified-Since`` and a 304 answer serves
+            the cached body. Any other response replaces the entry.
 
     Returns:
         tuple: (response, error_msg) where response is None on failure
@@ -243,13 +440,31 @@ def fetch_url(
     # Import here to avoid circular import (http ← validators ← http)
     from geo_optimizer.utils.validators import resolve_and_validate_url
 
+    entry = None
+    if cache is not None:
+        entry = cache.lookup(url)
+        if entry is not None and entry.is_fresh(cache.ttl):
+            r = entry.to_response()
+            observe_response(url, r)
+            return r, None
+
     # Phase 1: Anti-SSRF validation with single DNS resolution
     ok, err, pinned_ips = resolve_and_validate_url(url)
     if not ok:
         return None, f"Unsafe URL: {err}"
 
     # Phase 2: Fetch with DNS pinning + manual redirect + streaming
-    return _fetch_with_manual_redirects(url, timeout, max_size, pinned_ips)
+    if pool is None:
+        pool = _active_pool.get()
+    headers = entry.conditional_headers() if entry is not None else None
+    r, err = _fetch_with_manual_redirects(url, timeout, max_size, pinned_ips, pool=pool, headers=headers)
+    observe_response(url, r)
+    if cache is None:
+        return r, err
+
+    from geo_optimizer.utils.cache import store_response
+
+    return store_response(cache, url, entry, r, err)
 
 
 def _fetch_with_manual_redirects(
@@ -257,6 +472,8 @@ def _fetch_with_manual_redirects(
     timeout: int,
     max_size: int,
     pinned_ips: list[str],
+    pool: HttpClientPool | None = None,
+    headers: dict[str, str] | None = None,
 ) -> tuple[requests.Response | None, str | None]:
     """Perform the fetch with manual redirect and SSRF revalidation on each hop.
 
@@ -268,6 +485,8 @@ def _fetch_with_manual_redirects(
         timeout: Timeout in seconds.
         max_size: Response size limit in bytes.
         pinned_ips: Pre-resolved IPs for the starting URL.
+        pool: Optional pool providing keep-alive sessions per host and pinned IP.
+        headers: Extra request headers sent on every hop (conditional requests).
 
     Returns:
         (response, error)
@@ -280,17 +499,20 @@ def _fetch_with_manual_redirects(
     redirect_count = 0
 
     # Reuse the same session until the pinned IPs change (fix #122)
-    session = create_session_with_retry(
-        total_retries=3,
-        backoff_factor=1.0,
-        status_forcelist=[408, 429, 500, 502, 503, 504],
-        pinned_ips=current_ips if current_ips else None,
-    )
+    if pool is not None:
+        session = pool.session_for(current_url, current_ips)
+    else:
+        session = create_session_with_retry(
+            total_retries=3,
+            backoff_factor=1.0,
+            status_forcelist=[408, 429, 500, 502, 503, 504],
+            pinned_ips=current_ips if current_ips else None,
+        )
 
     while redirect_count <= _MAX_REDIRECTS:
         try:
             # stream=True: il body non viene scaricato immediatamente in RAM
-            r = _execute_request(session, current_url, timeout)
+            r = _execute_request(session, current_url, timeout, headers)
         except requests.exceptions.Timeout as e:
             _logger.warning("Timeout per %s dopo retry esponenziale: %s", current_url, e)
             return None, f"Timeout ({timeout}s) dopo retry esponenziale"
@@ -336,6 +558,13 @@ def _fetch_with_manual_redirects(
             if not ok:
                 return None, f"Redirect to unsafe URL: {err}"
 
+            # Pooled sessions are keyed per host: look up the target's own session
+            if pool is not None:
+                current_url = location
+                current_ips = next_ips
+                session = pool.session_for(current_url, current_ips)
+                continue
+
             current_url = location
             # Recreate session only if IPs have changed (redirect to different host)
             if next_ips != current_ips:
@@ -7,6 +7,11 @@ Speeds up the audit by fetching robots.txt, llms.txt and homepage in parallel
 Implements anti-SSRF protection with manual redirect: each redirect
 is revalidated with validate_public_url() before following it (fix #179).
 
+DNS is resolved off the event loop and every connection goes to the IP that
+validation returned (``PinnedAsyncTransport`` in ``utils.http_transport``).
+``create_async_client()`` builds such a client; ``use_async_client()`` makes
+one long-lived pooled client serve every fetch of a batch.
+
 Requires httpx as an optional dependency:
     pip install geo-optimizer-skill[async]
 """
@@ -14,8 +19,11 @@ Requires httpx as an optional dependency:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import contextvars
+from collections.abc import Iterator
 from typing import Any
+from urllib.parse import urlparse
 
 from geo_optimizer.models.config import HEADERS
 from geo_optimizer.utils.http import MAX_RESPONSE_SIZE
@@ -27,7 +35,11 @@ _MAX_REDIRECTS = 10
 # threading.local is per-thread, NOT per-coroutine. In asyncio, multiple coroutines
 # share the same thread, so the last coroutine to set the pin before an await wins.
 # contextvars.ContextVar is per-task in asyncio, preventing cross-coroutine leaks.
-_pinning_ctx: contextvars.ContextVar[dict | None] = contextvars.ContextVar("_pinning_ctx", default=None)
+# Maps lowercase hostname -> validated IP; read by PinnedAsyncTransport on connect.
+_pinning_ctx: contextvars.ContextVar[dict[str, str] | None] = contextvars.ContextVar("_pinning_ctx", default=None)
+
+# Client used by fetch_url_async when the caller passes none (see use_async_client)
+_active_client: contextvars.ContextVar[Any | None] = contextvars.ContextVar("_active_client", default=None)
 
 
 def is_httpx_available() -> bool:
@@ -40,11 +52,53 @@ def is_httpx_available() -> bool:
         return False
 
 
+def create_async_client(timeout: int = 10, max_connections: int = 100, max_keepalive: int = 20):
+    """Create an ``httpx.AsyncClient`` that connects only to validated, pinned IPs.
+
+    Redirects are not followed by httpx: ``fetch_url_async`` revalidates each
+    hop itself (fix #179). Connections are pooled per origin and kept alive,
+    so one client can serve a whole batch; the caller closes it.
+
+    Args:
+        timeout: Default timeout in seconds (``fetch_url_async`` passes its own).
+        max_connections: Open connections across all hosts.
+        max_keepalive: Idle connections kept for reuse.
+    """
+    import httpx
+
+    from geo_optimizer.utils.http_transport import PinnedAsyncTransport
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive)
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        follow_redirects=False,  # Manual redirect with SSRF revalidation (fix #179)
+        timeout=httpx.Timeout(timeout),
+        limits=limits,
+        transport=PinnedAsyncTransport(_pinning_ctx, limits=limits),
+    )
+
+
+@contextlib.contextmanager
+def use_async_client(client) -> Iterator[Any]:
+    """Make ``client`` the default of every ``fetch_url_async`` in this context.
+
+    The ContextVar is copied into tasks created inside the block, so the
+    sidecar fetches of an audit share the client too. The caller owns and
+    closes it; ``fetch_url_async`` never does.
+    """
+    token = _active_client.set(client)
+    try:
+        yield client
+    finally:
+        _active_client.reset(token)
+
+
 async def fetch_url_async(
     url: str,
     client=None,
     timeout: int = 10,
     max_size: int = MAX_RESPONSE_SIZE,
+    cache=None,
 ) -> tuple[object | None, str | None]:
     """Async fetch of a URL with httpx.
 
@@ -55,50 +109,69 @@ async def fetch_url_async(
 
     Args:
         url: URL to download.
-        client: Optional httpx.AsyncClient (reuses connections).
+        client: Optional httpx.AsyncClient (reuses connections). Defaults to
+            the client of ``use_async_client()``, else a new pinned client.
+            Only clients from ``create_async_client()`` enforce DNS pinning.
         timeout: Timeout in seconds.
         max_size: Maximum response size in bytes.
+        cache: Optional HTTP cache (``utils.cache``), same semantics as
+            ``fetch_url``: fresh entries skip the request, stale ones are
+            revalidated and a 304 answer serves the cached body.
 
     Returns:
         Tuple (response, error_msg) — response is None on error.
     """
-    from geo_optimizer.utils.validators import resolve_and_validate_url
+    from geo_optimizer.utils.politeness import observe_response
 
-    # Fix #414: use resolve_and_validate_url for DNS pinning (prevents TOCTOU rebinding)
-    ok, reason, pinned_ips = resolve_and_validate_url(url)
+    if cache is None:
+        r, err = await _fetch_url_async(url, client, timeout, max_size)
+        observe_response(url, r)
+        return r, err
+
+    from geo_optimizer.utils.cache import store_response
+
+    # SQLite calls are blocking: keep them off the event loop
+    entry = await asyncio.to_thread(cache.lookup, url)
+    if entry is not None and entry.is_fresh(cache.ttl):
+        r = entry.to_response()
+        observe_response(url, r)
+        return r, None
+    headers = entry.conditional_headers() if entry is not None else None
+    r, err = await _fetch_url_async(url, client, timeout, max_size, headers)
+    observe_response(url, r)
+    return await asyncio.to_thread(store_response, cache, url, entry, r, err)
+
+
+async def _fetch_url_async(
+    url: str,
+    client,
+    timeout: int,
+    max_size: int,
+    headers: dict[str, str] | None = None,
+) -> tuple[object | None, str | None]:
+    """Network part of ``fetch_url_async``; ``headers`` are sent on every hop."""
+    from geo_optimizer.utils.validators import resolve_and_validate_url_async
+
+    # Fix #414: use resolve_and_validate_url for DNS pinning (prevents TOCTOU rebinding),
+    # in its async form: a DNS lookup must not block the other coroutines
+    ok, reason, pinned_ips = await resolve_and_validate_url_async(url)
     if not ok:
         return None, f"Unsafe URL: {reason}"
 
     import httpx
 
+    if client is None:
+        client = _active_client.get()
     own_client = client is None
 
     try:
-        # Fix H-1: use contextvars for async-safe DNS pinning instead of threading.local
-        from urllib.parse import urlparse as _urlparse
-
-        from geo_optimizer.utils.http import _pinning_local
-
-        _parsed = _urlparse(url)
-        _pinned_ip = pinned_ips[0] if pinned_ips else None
-        if _pinned_ip:
-            _target_port = _parsed.port or (443 if _parsed.scheme == "https" else 80)
-            pin_data = {"host": _parsed.hostname, "ip": _pinned_ip, "port": _target_port}
-            # Set both: threading.local for the patched getaddrinfo, contextvar for safety
-            _pinning_local.pin = pin_data
-            _pinning_ctx.set(pin_data)
-
         if own_client:
-            client = httpx.AsyncClient(
-                headers=HEADERS,
-                follow_redirects=False,  # Manual redirect with SSRF revalidation (fix #179)
-                timeout=httpx.Timeout(timeout),
-            )
+            client = create_async_client(timeout)
 
         # Manual redirect with anti-SSRF revalidation on each hop
         current_url = url
         for _ in range(_MAX_REDIRECTS):
-            r = await client.get(current_url)
+            r = await _get_hop(client, current_url, pinned_ips, headers, timeout)
 
             # Non-redirect response: verify size and return
             if r.status_code not in (301, 302, 303, 307, 308):
@@ -135,7 +208,7 @@ async def fetch_url_async(
 
                 location = urljoin(current_url, location)
 
-            ok_redir, reason_redir, _redir_ips = resolve_and_validate_url(location)
+            ok_redir, reason_redir, pinned_ips = await resolve_and_validate_url_async(location)
             if not ok_redir:
                 return None, f"Redirect to unsafe URL: {reason_redir}"
 
@@ -150,13 +223,41 @@ async def fetch_url_async(
     except Exception as e:
         return None, str(e)
     finally:
-        # Fix H-1: clear both pin stores
-        _pinning_local.pin = None
-        _pinning_ctx.set(None)
         if own_client and client:
             await client.aclose()
 
 
+async def _get_hop(client, url: str, pinned_ips: list[str] | None, headers: dict[str, str] | None, timeout: int):
+    """GET one hop, pinned to its validated IP and paced by the active ``FetchScheduler``.
+
+    With a scheduler, a 429/503 answer is retried (up to its ``max_retries``)
+    once the host's backoff has elapsed; the last answer is returned as is.
+    """
+    from geo_optimizer.utils.politeness import THROTTLE_STATUS_CODES, active_scheduler
+
+    scheduler = active_scheduler()
+    attempts = scheduler.max_retries + 1 if scheduler is not None else 1
+    for attempt in range(attempts):
+        # Fix H-1: the pin lives in this task's context only, for this hop only
+        token = _pinning_ctx.set(_pins_for(url, pinned_ips))
+        try:
+            if scheduler is None:
+                return await client.get(url, headers=headers, timeout=timeout)
+            async with scheduler.slot_async(url):
+                r = await client.get(url, headers=headers, timeout=timeout)
+        finally:
+            _pinning_ctx.reset(token)
+        scheduler.record(url, r.status_code, r.headers.get("retry-after"))
+        if r.status_code not in THROTTLE_STATUS_CODES or attempt == attempts - 1:
+            return r
+
+
+def _pins_for(url: str, pinned_ips: list[str] | None) -> dict[str, str]:
+    """Pin map for one hop: the URL's hostname -> first validated IP."""
+    hostname = (urlparse(url).hostname or "").lower()
+    return {hostname: pinned_ips[0]} if pinned_ips else {}
+
+
 async def fetch_urls_async(
     urls: list[str],
     timeout: int = 10,
@@ -172,15 +273,9 @@ async def fetch_urls_async(
     Returns:
         Dict {url: (response, error_msg)} for each URL.
     """
-    import httpx
-
     results = {}
 
-    async with httpx.AsyncClient(
-        headers=HEADERS,
-        follow_redirects=False,  # Redirect handled in fetch_url_async (fix #179)
-        timeout=httpx.Timeout(timeout),
-    ) as client:
+    async with create_async_client(timeout) as client:
         tasks = {url: fetch_url_async(url, client=client, timeout=timeout, max_size=max_size) for url in urls}
 
         gathered = await asyncio.gather(*tasks.values(), return_exceptions=True)
@@ -0,0 +1,66 @@
+"""
+httpx transport that connects to the IP validated by the anti-SSRF check.
+
+``fetch_url_async`` resolves every hop with ``resolve_and_validate_url_async``
+and publishes the validated IP in a ContextVar (``http_async._pinning_ctx``)
+for the duration of the request. ``PinnedAsyncTransport`` reads it when httpcore opens
+a TCP connection, so the socket goes to that IP and DNS is never asked again
+(no TOCTOU rebinding). The URL keeps its hostname: ``Host``, TLS SNI and
+certificate verification are unchanged, and pooled connections stay keyed by
+origin, so one transport can safely serve every host of a batch.
+
+A ContextVar is per asyncio task, unlike the thread-local pin of the
+``requests`` path (whose patched ``getaddrinfo`` never saw the async fetches:
+anyio resolves names in a worker thread).
+
+Requires httpx (imported at module level): import this module lazily.
+"""
+
+from __future__ import annotations
+
+import contextvars
+
+import httpcore
+import httpx
+
+
+class _PinnedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that only connects to hosts pinned in the ``pins`` ContextVar."""
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, pins: contextvars.ContextVar):
+        self._backend = backend
+        self._pins = pins
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        pins = self._pins.get() or {}
+        pinned_ip = pins.get(host.lower())
+        if pinned_ip is None:
+            # Refuse rather than resolve: an unvalidated name could point anywhere
+            raise httpcore.ConnectError(f"No validated IP for host {host!r}")
+        return await self._backend.connect_tcp(
+            pinned_ip, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+        )
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        raise httpcore.ConnectError("Unix sockets are not allowed")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PinnedAsyncTransport(httpx.AsyncHTTPTransport):
+    """``httpx.AsyncHTTPTransport`` whose connections go to the pinned IP of each host.
+
+    Args:
+        pins: ContextVar holding ``{hostname: ip}`` for the current request.
+        **kwargs: Passed to ``httpx.AsyncHTTPTransport``.
+
+    Requests made outside ``fetch_url_async`` (no pin for the host) fail with
+    ``ConnectError``.
+    """
+
+    def __init__(self, pins: contextvars.ContextVar, **kwargs):
+        super().__init__(**kwargs)
+        # httpx does not expose httpcore's network_backend: wrap the pool's own
+        # backend so every other pool setting (limits, TLS, HTTP/2) is kept
+        self._pool._network_backend = _PinnedNetworkBackend(self._pool._network_backend, pins)
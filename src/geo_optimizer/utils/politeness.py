@@ -0,0 +1,431 @@
+"""
+Per-host politeness scheduler for crawls that hit one site many times.
+
+A ``FetchScheduler`` activated with ``use_fetch_scheduler()`` is consulted by
+``fetch_url`` and ``fetch_url_async`` before every request:
+
+- a token bucket per host, refilled at ``1 / Crawl-delay`` when the site's
+  robots.txt sets one (learnt by ``observe_response()``), unlimited otherwise;
+- a cap on requests in flight per host and across all hosts;
+- adaptive backoff: a 429/503 answer blocks the host until ``Retry-After``
+  (or an exponential delay) and slows its bucket down; successful answers
+  speed it back up to the robots.txt rate;
+- counters of requests waiting per host (queue depth) for ``stats()``.
+
+``wait_for_excluding_queue()`` is the per-page timeout of a crawl: the time
+a page's fetches spend queued here (Crawl-delay, backoff, caps) does not
+count against it, only the time spent on the network and in analysis.
+
+The state is shared by threads and asyncio tasks alike (one lock, no awaits
+while holding it), so the sync and async fetch paths of a batch see the same
+buckets. Without an active scheduler the fetch functions behave as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+from urllib.parse import urlparse
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_PER_HOST_CONCURRENCY = 6
+DEFAULT_MAX_BACKOFF = 60.0  # seconds; also caps Retry-After and Crawl-delay
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Adaptive rate: first interval imposed on a host with no Crawl-delay that
+# throttles us, and how fast the interval shrinks again on success
+_THROTTLE_MIN_INTERVAL = 0.25
+_RECOVERY_FACTOR = 0.8
+# Re-check period while a host or the whole scheduler is at its concurrency cap
+_SLOT_POLL_INTERVAL = 0.02
+
+
+@dataclass
+class _HostState:
+    """Token bucket, in-flight count and backoff of one host."""
+
+    floor_interval: float = 0.0  # Crawl-delay: never go faster than this
+    interval: float = 0.0  # current seconds per request (0 = unlimited)
+    tokens: float = 1.0
+    refilled_at: float = 0.0
+    blocked_until: float = 0.0
+    strikes: int = 0
+    in_flight: int = 0
+    waiting: int = 0
+    requests: int = 0
+    throttled: int = 0
+
+
+class FetchScheduler:
+    """Rate, concurrency and backoff limits per host for one crawl.
+
+    Args:
+        max_concurrency: Requests in flight across all hosts.
+        per_host_concurrency: Requests in flight to the same host.
+        max_backoff: Upper bound in seconds for any single wait imposed on a host.
+        max_retries: Times ``fetch_url_async`` retries a throttled (429/503) request.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        max_retries: int = 2,
+    ):
+        if max_concurrency <= 0 or per_host_concurrency <= 0:
+            raise ValueError("concurrency limits must be greater than 0")
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+        self._hosts: dict[str, _HostState] = {}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Scheduling key of a URL: lowercase ``host[:port]``."""
+        return urlparse(url).netloc.lower()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(refilled_at=time.monotonic())
+        return state
+
+    def set_crawl_delay(self, url: str, delay: float | None) -> None:
+        """Limit the host of ``url`` to one request every ``delay`` seconds (robots.txt Crawl-delay)."""
+        if not delay or delay <= 0:
+            return
+        delay = min(float(delay), self.max_backoff)
+        with self._lock:
+            state = self._state(self.host_key(url))
+            state.floor_interval = delay
+            state.interval = max(state.interval, delay)
+
+    # ─── Acquire / release ────────────────────────────────────────────────────
+
+    def _try_acquire(self, host: str, now: float) -> float:
+        """Take a slot for ``host`` if possible; return 0.0 on success, else seconds to wait."""
+        state = self._state(host)
+        if now < state.blocked_until:
+            return state.blocked_until - now
+        if state.interval > 0:
+            # Bucket of one token: a Crawl-delay host gets no bursts
+            state.tokens = min(1.0, state.tokens + (now - state.refilled_at) / state.interval)
+            state.refilled_at = now
+            if state.tokens < 1.0:
+                return (1.0 - state.tokens) * state.interval
+        if state.in_flight >= self.per_host_concurrency or self._in_flight >= self.max_concurrency:
+            return _SLOT_POLL_INTERVAL
+        if state.interval > 0:
+            state.tokens -= 1.0
+        state.in_flight += 1
+        state.requests += 1
+        self._in_flight += 1
+        return 0.0
+
+    def _poll(self, host: str, waiting: bool) -> float:
+        with self._lock:
+            state = self._state(host)
+            delay = self._try_acquire(host, time.monotonic())
+            if delay and not waiting:
+                state.waiting += 1
+            elif not delay and waiting:
+                state.waiting -= 1
+            return delay
+
+    def _abandon(self, host: str) -> None:
+        with self._lock:
+            self._state(host).waiting -= 1
+
+    def release(self, url: str) -> None:
+        """Give back the slot taken by ``acquire`` / ``acquire_async`` for ``url``."""
+        with self._lock:
+            state = self._state(self.host_key(url))
+            state.in_flight -= 1
+            self._in_flight -= 1
+
+    def acquire(self, url: str) -> None:
+        """Block the calling thread until a request to ``url`` may start."""
+        host = self.host_key(url)
+        delay = self._poll(host, waiting=False)
+        if not delay:
+            return
+        with queued():
+            try:
+                while delay:
+                    time.sleep(delay)
+                    delay = self._poll(host, waiting=True)
+            except BaseException:
+                self._abandon(host)
+                raise
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait, without blocking the event loop, until a request to ``url`` may start."""
+        host = self.host_key(url)
+        delay = self._poll(host, waiting=False)
+        if not delay:
+            return
+        with queued():
+            try:
+                while delay:
+                    await asyncio.sleep(delay)
+                    delay = self._poll(host, waiting=True)
+            except BaseException:
+                self._abandon(host)
+                raise
+
+    @contextlib.contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """``acquire`` / ``release`` around one request."""
+        self.acquire(url)
+        try:
+            yield
+        finally:
+            self.release(url)
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self, url: str) -> AsyncIterator[None]:
+        """``acquire_async`` / ``release`` around one request."""
+        await self.acquire_async(url)
+        try:
+            yield
+        finally:
+            self.release(url)
+
+    # ─── Feedback ─────────────────────────────────────────────────────────────
+
+    def record(self, url: str, status_code: int, retry_after: str | None = None) -> float:
+        """Adapt the host's rate to an answer; return the backoff imposed (0.0 if none).
+
+        429 and 503 block the host for ``Retry-After`` seconds (HTTP-date or
+        delta), or for an exponential delay without the header, and double its
+        request interval. Any other answer clears the strikes and shrinks the
+        interval back towards the Crawl-delay floor.
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(self.host_key(url))
+            if status_code not in THROTTLE_STATUS_CODES:
+                state.strikes = 0
+                if state.interval > state.floor_interval:
+                    state.interval = state.interval * _RECOVERY_FACTOR
+                    if state.interval < max(state.floor_interval, _THROTTLE_MIN_INTERVAL / 2):
+                        state.interval = state.floor_interval
+                return 0.0
+
+            state.strikes += 1
+            state.throttled += 1
+            wait = parse_retry_after(retry_after)
+            if wait is None:
+                wait = float(2 ** (state.strikes - 1))
+            wait = min(wait, self.max_backoff)
+            state.blocked_until = max(state.blocked_until, now + wait)
+            state.interval = min(max(state.interval * 2, _THROTTLE_MIN_INTERVAL), self.max_backoff)
+            state.tokens = 0.0
+            state.refilled_at = now + wait
+        _logger.info("%s answered %d: backing off %.1fs", self.host_key(url), status_code, wait)
+        return wait
+
+    def penalize(self, url: str, delay: float) -> None:
+        """Block the host of ``url`` for ``delay`` seconds (e.g. after a timeout)."""
+        with self._lock:
+            state = self._state(self.host_key(url))
+            state.blocked_until = max(state.blocked_until, time.monotonic() + min(delay, self.max_backoff))
+
+    def stats(self) -> dict:
+        """Queue depth and counters, overall and per host."""
+        now = time.monotonic()
+        with self._lock:
+            hosts = {
+                host: {
+                    "in_flight": state.in_flight,
+                    "waiting": state.waiting,
+                    "requests": state.requests,
+                    "throttled": state.throttled,
+                    "interval": round(state.interval, 3),
+                    "blocked_for": round(max(0.0, state.blocked_until - now), 3),
+                }
+                for host, state in self._hosts.items()
+            }
+            return {
+                "in_flight": self._in_flight,
+                "waiting": sum(state.waiting for state in self._hosts.values()),
+                "throttled": sum(state.throttled for state in self._hosts.values()),
+                "hosts": hosts,
+            }
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment is None or moment.tzinfo is None:
+        return None
+    return max(0.0, moment.timestamp() - time.time())
+
+
+# Scheduler active for the current context (one crawl). Like the HTTP pool,
+# copied into asyncio tasks and asyncio.to_thread workers started inside it.
+_active_scheduler: contextvars.ContextVar[FetchScheduler | None] = contextvars.ContextVar(
+    "_active_scheduler", default=None
+)
+
+
+def active_scheduler() -> FetchScheduler | None:
+    """Return the scheduler of the current context, if any."""
+    return _active_scheduler.get()
+
+
+@contextlib.contextmanager
+def use_fetch_scheduler(scheduler: FetchScheduler) -> Iterator[FetchScheduler]:
+    """Route every ``fetch_url`` / ``fetch_url_async`` in this context through ``scheduler``.
+
+    Nested calls keep the outer scheduler, so a batch that activates one
+    also governs the fetches of each audit and sub-check inside it.
+    """
+    current = _active_scheduler.get()
+    if current is not None:
+        yield current
+        return
+
+    token = _active_scheduler.set(scheduler)
+    try:
+        yield scheduler
+    finally:
+        _active_scheduler.reset(token)
+
+
+class _QueueClock:
+    """Time during which at least one fetch of a task was queued in the scheduler.
+
+    Overlapping waits of parallel fetches (homepage and sidecars) count once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters = 0
+        self._since = 0.0
+        self._total = 0.0
+
+    def enter(self) -> None:
+        with self._lock:
+            if self._waiters == 0:
+                self._since = time.monotonic()
+            self._waiters += 1
+
+    def leave(self) -> None:
+        with self._lock:
+            self._waiters -= 1
+            if self._waiters == 0:
+                self._total += time.monotonic() - self._since
+
+    def total(self) -> float:
+        with self._lock:
+            if self._waiters:
+                return self._total + time.monotonic() - self._since
+            return self._total
+
+
+_queue_clock: contextvars.ContextVar[_QueueClock | None] = contextvars.ContextVar("_queue_clock", default=None)
+
+
+@contextlib.contextmanager
+def queued() -> Iterator[None]:
+    """Count the enclosed wait as queued for ``wait_for_excluding_queue``, if one is running.
+
+    ``acquire`` uses it around its sleeps; a caller waiting for a fetch that
+    another page started (a shared robots.txt) uses it too.
+    """
+    clock = _queue_clock.get()
+    if clock is None:
+        yield
+        return
+    clock.enter()
+    try:
+        yield
+    finally:
+        clock.leave()
+
+
+async def wait_for_excluding_queue(aw: Awaitable[T], timeout: float) -> T:
+    """``asyncio.wait_for`` whose ``timeout`` does not run while ``aw``'s fetches are queued.
+
+    On a Crawl-delay site a page may wait in the scheduler far longer than
+    its own fetches take; only the time outside the queue is charged, so the
+    page fails on a slow server but not on a polite pace. The wait is tracked
+    in ``aw``'s context, so threads started with ``asyncio.to_thread`` or a
+    copied context are covered too.
+
+    Raises:
+        asyncio.TimeoutError: ``aw`` ran for ``timeout`` seconds outside the queue
+            (it is cancelled).
+    """
+    clock = _QueueClock()
+    token = _queue_clock.set(clock)
+    try:
+        # The task copies the current context, clock included
+        task = asyncio.ensure_future(aw)
+    finally:
+        _queue_clock.reset(token)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            remaining = deadline + clock.total() - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError
+            done, _ = await asyncio.wait({task}, timeout=remaining)
+            if done:
+                return task.result()
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+def robots_txt_url(url: str) -> str:
+    """URL of the robots.txt that governs ``url``."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+
+def observe_response(url: str, response) -> None:
+    """Let the active scheduler learn the Crawl-delay of a robots.txt that was just fetched.
+
+    Called by ``fetch_url`` / ``fetch_url_async`` for every successful answer:
+    a crawl learns the delay from the robots.txt its audits fetch anyway, and
+    a crawl that fetches only pages can fetch ``robots_txt_url()`` first.
+    """
+    scheduler = _active_scheduler.get()
+    if scheduler is None or response is None or urlparse(url).path != "/robots.txt":
+        return
+    if getattr(response, "status_code", None) != 200:
+        return
+    # Import here to keep this module free of parser imports on the fetch path
+    from geo_optimizer.utils.robots_parser import parse_robots_txt
+
+    rules = parse_robots_txt(response.text).get("*")
+    if rules is not None and rules.crawl_delay:
+        scheduler.set_crawl_delay(url, rules.crawl_delay)
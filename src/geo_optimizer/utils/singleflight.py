@@ -0,0 +1,105 @@
+"""
+Single-flight call coalescing.
+
+Concurrent callers that ask for the same key while a call for it is still
+running share that call instead of starting their own: N simultaneous
+requests for an uncached URL run one audit, and all N get its result (or its
+exception). Nothing is remembered once the call finishes — caching results is
+the caller's job.
+
+- ``AsyncSingleFlight``: for coroutines on one event loop (web app).
+- ``SingleFlight``: for threads (MCP tools, which run in worker threads).
+
+Both count calls started and callers coalesced, for monitoring.
+
+Usage:
+    flights = AsyncSingleFlight()
+    result = await flights.run(url, lambda: asyncio.to_thread(run_full_audit, url))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent coroutine calls by key.
+
+    The shared call runs as its own task: a caller that is cancelled (client
+    disconnect, ``asyncio.wait_for`` timeout) stops waiting, but the call goes
+    on for the callers still waiting on it.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, asyncio.Future] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()``, or the call already running for ``key``."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self._flights[key] = flight
+            self.started += 1
+            flight.add_done_callback(lambda done: self._land(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(flight)
+
+    def _land(self, key: Hashable, flight: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the exception retrieved: every waiter may have gone already
+        if not flight.cancelled():
+            flight.exception()
+
+    def stats(self) -> dict[str, int]:
+        """Calls started, callers that joined a running call, calls running now."""
+        return {"started": self.started, "coalesced": self.coalesced, "in_flight": len(self._flights)}
+
+
+class SingleFlight:
+    """Coalesce concurrent calls by key across threads (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.coalesced = 0
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return ``fn()``, or wait for the call another thread is running for ``key``."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+                self.started += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    def stats(self) -> dict[str, int]:
+        """Calls started, callers that joined a running call, calls running now."""
+        with self._lock:
+            return {"started": self.started, "coalesced": self.coalesced, "in_flight": len(self._flights)}
@@ -3,14 +3,22 @@ Input validators for GEO Optimizer.
 
 Checks URLs (anti-SSRF) and file paths (anti-path-traversal)
 before performing network or filesystem operations.
+
+Host resolutions that passed the anti-SSRF check are cached per process for
+``DNS_CACHE_TTL`` seconds, so the redirect hops, sidecar fetches and repeated
+validations of one audit resolve each host once.
 """
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 import os
 import socket
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -54,6 +62,81 @@ _BLOCKED_HOSTNAMES = {
 }
 
 
+# Resolution cache: short TTL, since getaddrinfo does not expose the record's
+# own TTL and a host may legitimately move
+DNS_CACHE_TTL = 60  # seconds
+DNS_CACHE_MAX_ENTRIES = 4096
+
+
+class DnsCache:
+    """Per-process cache of hostname → public IPs, filled only with validated resolutions.
+
+    Only resolutions whose every IP passed the anti-SSRF check are stored, so
+    a hit is as safe as a fresh lookup; failures and blocked hosts are never
+    cached. Thread-safe. ``hits`` counts answers from the cache, ``misses``
+    the DNS lookups made.
+    """
+
+    def __init__(self, ttl: float = DNS_CACHE_TTL, max_entries: int = DNS_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, list[str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, hostname: str) -> list[str] | None:
+        """Return the cached public IPs for ``hostname``, or None if missing or expired."""
+        key = hostname.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[1])
+
+    def put(self, hostname: str, ips: list[str]) -> None:
+        """Store a validated resolution of ``hostname``."""
+        key = hostname.lower()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, list(ips))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_miss(self) -> None:
+        """Count a DNS lookup made because the host was not cached."""
+        with self._lock:
+            self.misses += 1
+
+    def clear(self) -> None:
+        """Forget every cached resolution."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Cached hosts, answers from the cache, DNS lookups made."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_dns_cache = DnsCache()
+
+
+def dns_cache_stats() -> dict[str, int]:
+    """Counters of the process-wide DNS cache: entries, hits, misses."""
+    return _dns_cache.stats()
+
+
+def clear_dns_cache() -> None:
+    """Forget every cached resolution (the counters are kept)."""
+    _dns_cache.clear()
+
+
 def _is_ip_blocked(ip_obj) -> bool:
     """Check whether an IP is private/reserved using Python's standard APIs.
 
@@ -125,6 +208,8 @@ def resolve_and_validate_url(url: str) -> tuple[bool, str | None, list[str]]:
     Resolves DNS ONCE and returns the validated IPs.
     This prevents TOCTOU DNS rebinding attacks: the caller must
     use these IPs for the actual connection without a second DNS resolution.
+    A host resolved and validated in the last ``DNS_CACHE_TTL`` seconds is
+    answered from the cache.
 
     Returns:
         (valid, error, resolved_ip_list)
@@ -135,7 +220,12 @@ def resolve_and_validate_url(url: str) -> tuple[bool, str | None, list[str]]:
     if not ok:
         return False, err, []
 
+    cached = _dns_cache.get(hostname)
+    if cached is not None:
+        return True, None, cached
+
     # Resolve DNS and verify that every resolved IP is public
+    _dns_cache.record_miss()
     try:
         infos = socket.getaddrinfo(hostname, None)
     except socket.gaierror:
@@ -158,9 +248,25 @@ def resolve_and_validate_url(url: str) -> tuple[bool, str | None, list[str]]:
             )
         ip_validi.append(ip_str)
 
+    _dns_cache.put(hostname, ip_validi)
     return True, None, ip_validi
 
 
+async def resolve_and_validate_url_async(url: str) -> tuple[bool, str | None, list[str]]:
+    """``resolve_and_validate_url`` for coroutines: never blocks the event loop.
+
+    A cached host is answered directly; otherwise the blocking
+    ``getaddrinfo`` runs in a worker thread.
+    """
+    ok, err, hostname = _validate_url_structure(url)
+    if not ok:
+        return False, err, []
+    cached = _dns_cache.get(hostname)
+    if cached is not None:
+        return True, None, cached
+    return await asyncio.to_thread(resolve_and_validate_url, url)
+
+
 def validate_public_url(url: str) -> tuple[bool, str | None]:
     """
     Verify that the URL points to a public host, not internal networks.
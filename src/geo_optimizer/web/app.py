@@ -21,6 +21,7 @@ import os
 import re
 import secrets
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -47,6 +48,9 @@ from geo_optimizer.core.telemetry import (
     geo_score_improved,
 )
 from geo_optimizer.models.results import SitemapUrl
+from geo_optimizer.utils.singleflight import AsyncSingleFlight
+from geo_optimizer.utils.validators import dns_cache_stats
+from geo_optimizer.web.store import create_store
 
 logger = logging.getLogger(__name__)
 
@@ -54,12 +58,23 @@ logger = logging.getLogger(__name__)
 # matching the output of sha256().hexdigest()[:32] (fix #210)
 _HEX_ID_RE = re.compile(r"^[0-9a-f]{32}$")
 
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    """Run the badge pre-warming job for the lifetime of the server."""
+    prewarm = asyncio.create_task(_prewarm_badges()) if _BADGE_PREWARM_COUNT > 0 else None
+    yield
+    if prewarm is not None:
+        prewarm.cancel()
+
+
 app = FastAPI(
     title="GEO Optimizer",
     description="Audit your website's visibility to AI search engines",
     version=__version__,
     docs_url="/docs",
     redoc_url=None,
+    lifespan=_lifespan,
 )
 
 # Directory dei file statici del frontend Astro (buildato in Docker o via env)
@@ -69,6 +84,7 @@ static_dir = Path(os.environ.get("GEO_STATIC_DIR", str(Path(__file__).parent / "
 # ─── Middleware: POST body size limit ─────────────────────────────────────────
 _MAX_BODY_BYTES = 4 * 1024  # 4 KB — prevents DoS from unlimited POST bodies
 _MAX_LOG_UPLOAD_BYTES = 10 * 1024 * 1024  # 10 MB for /api/logs/analyze
+_MAX_LOG_UPLOAD_LINES = 1_000_000  # lines analyzed per upload
 _LOG_UPLOAD_PATH = "/api/logs/analyze"
 
 
@@ -227,11 +243,10 @@ def _verify_bearer_token(request: Request) -> bool:
     return secrets.compare_digest(provided_token, _API_TOKEN)
 
 
-# ─── In-memory rate limiter ───────────────────────────────────────────────────
-_rate_limit_store: dict = {}  # {ip: [timestamp, ...]}
+# ─── Rate limiter ─────────────────────────────────────────────────────────────
 _RATE_LIMIT_WINDOW = 60  # seconds
 _RATE_LIMIT_MAX_REQUESTS = 30  # requests per window per IP
-_RATE_LIMIT_MAX_IPS = 10000  # maximum number of tracked IPs
+_RATE_LIMIT_MAX_IPS = 10000  # maximum number of tracked IPs (memory backend)
 
 # Locks are created lazily inside the running event loop. On Python 3.9
 # asyncio.Lock() binds the current event loop at construction time, so building
@@ -287,53 +302,41 @@ def _get_client_ip(request: Request) -> str:
     return proxy_ip
 
 
-def _evict_oldest_rate_limit_entries(count: int = 1) -> None:
-    """Remove the `count` oldest entries from the rate limit store (LRU eviction).
-
-    Fix #70/#99: instead of _rate_limit_store.clear() which resets everything,
-    we remove only the entries with the oldest last request.
-    """
-    if not _rate_limit_store:
-        return
-    # Sort by last request timestamp (the most recent in the array)
-    sorted_keys = sorted(
-        _rate_limit_store,
-        key=lambda ip: _rate_limit_store[ip][-1] if _rate_limit_store[ip] else 0,
-    )
-    for key in sorted_keys[:count]:
-        _rate_limit_store.pop(key, None)
+async def _store_call(method: str, *args):
+    """Call a ``_web_store`` method; a shared backend does disk I/O, so it runs in a thread."""
+    if _web_store.shared:
+        return await asyncio.to_thread(getattr(_web_store, method), *args)
+    return getattr(_web_store, method)(*args)
 
 
 async def _check_rate_limit(client_ip: str) -> bool:
     """Check rate limit for IP. Returns True if allowed.
 
-    Fix race condition: uses asyncio.Lock to make the read-modify-write
-    operation on the shared _rate_limit_store dict atomic (fix #209).
+    The check-and-count is one store operation, atomic within the process
+    (memory backend) or across workers (shared backend) — fix #209.
     Fix #312: unknown IP receives a stricter limit (5 req/min) instead of the normal one.
     """
     # Fix #312: stricter limit for unknown IP (prevents bypass with client None)
     max_requests = 5 if client_ip == "unknown" else _RATE_LIMIT_MAX_REQUESTS
-    async with _get_lock("rate_limit"):
-        now = time.time()
-        timestamps = _rate_limit_store.get(client_ip, [])
-        # Remove timestamps outside the time window
-        timestamps = [t for t in timestamps if (now - t) < _RATE_LIMIT_WINDOW]
-        if len(timestamps) >= max_requests:
-            _rate_limit_store[client_ip] = timestamps
-            return False
-        timestamps.append(now)
-        _rate_limit_store[client_ip] = timestamps
-        # Fix #70/#99: LRU eviction — remove only the oldest entries, not everything
-        if len(_rate_limit_store) > _RATE_LIMIT_MAX_IPS:
-            entries_to_remove = len(_rate_limit_store) - _RATE_LIMIT_MAX_IPS
-            _evict_oldest_rate_limit_entries(entries_to_remove)
-        return True
+    return await _store_call("hit_rate_limit", client_ip, max_requests)
 
 
-# In-memory cache for audit results (TTL 1 hour, max 500 entries)
-_audit_cache: dict = {}
+# Cache for audit results (TTL 1 hour, max 500 entries and GEO_WEB_CACHE_MB of
+# compressed audits, least recently used evicted)
 _CACHE_TTL = 3600
 _MAX_CACHE_SIZE = 500
+_MAX_CACHE_BYTES = int(os.environ.get("GEO_WEB_CACHE_MB", "64")) * 1024 * 1024
+
+# Audit cache and rate limits. GEO_WEB_STORE=sqlite:<path> shares them between
+# the uvicorn workers of a host; the default keeps them in this process.
+_web_store = create_store(
+    os.environ.get("GEO_WEB_STORE", ""),
+    ttl=_CACHE_TTL,
+    max_audits=_MAX_CACHE_SIZE,
+    max_bytes=_MAX_CACHE_BYTES,
+    window=_RATE_LIMIT_WINDOW,
+    max_ips=_RATE_LIMIT_MAX_IPS,
+)
 
 
 def _cache_key(url: str) -> str:
@@ -346,46 +349,152 @@ def _cache_key(url: str) -> str:
 
 
 async def _get_cached(url: str) -> dict | None:
-    """Retrieve result from cache if valid.
-
-    Fix race condition: uses asyncio.Lock to protect the atomic
-    read/remove on _audit_cache (fix #209).
-    """
-    async with _get_lock("audit_cache"):
-        key = _cache_key(url)
-        entry = _audit_cache.get(key)
-        if entry and (time.time() - entry["cached_at"]) < _CACHE_TTL:
-            return entry["data"]
-        # Remove expired entry
-        if entry:
-            _audit_cache.pop(key, None)
-        return None
+    """Retrieve result from cache if valid (expired entries are dropped)."""
+    return await _store_call("get_audit", _cache_key(url))
 
 
 def _evict_expired() -> None:
-    """Remove expired entries from cache. Caller must hold the audit_cache lock."""
-    now = time.time()
-    expired = [k for k, v in _audit_cache.items() if (now - v["cached_at"]) >= _CACHE_TTL]
-    for k in expired:
-        _audit_cache.pop(k, None)
+    """Remove expired entries from the audit cache."""
+    _web_store.evict_expired()
 
 
 async def _set_cached(url: str, data: dict) -> str:
-    """Save result in cache with size limit. Returns the report ID.
+    """Save result in cache with size limit. Returns the report ID."""
+    key = _cache_key(url)
+    await _store_call("set_audit", key, data)
+    return key
+
+
+def _run_full_audit(url: str):
+    """Full audit for the web endpoints, through the shared audit result cache.
+
+    ``_web_store`` answers repeat requests for a URL within the hour; past
+    that, the page is fetched again and, if its content did not change, the
+    stored result is reused instead of re-running every sub-audit.
+    """
+    from geo_optimizer.core.audit import run_full_audit
+    from geo_optimizer.utils.cache import get_result_cache
+
+    return run_full_audit(url, result_cache=get_result_cache())
+
+
+# Single-flight: concurrent requests for the same uncached URL share one audit
+# instead of starting one each (a badge in a busy README gets hit in bursts)
+_audit_flights = AsyncSingleFlight()
+
+
+async def _audit_and_cache(url: str):
+    """Audit ``url`` and store it in ``_web_store``; returns (AuditResult, data dict).
+
+    Concurrent callers for the same URL (any endpoint) await the same audit.
+    The returned dict is shared between them: copy it before changing it.
+    """
+
+    async def _audit():
+        result = await asyncio.to_thread(_run_full_audit, url)
+        data = _audit_result_to_dict(result)
+        key = await _set_cached(url, data)
+        # A failed refresh must not replace the last good badge score
+        if not result.error:
+            await _store_call("set_badge", key, url, data["score"], data["band"])
+        return result, data
+
+    return await _audit_flights.run(("audit", _cache_key(url)), _audit)
+
+
+# ─── Badges: stale-while-revalidate and pre-warming ──────────────────────────
+# Badges are fetched by GitHub's camo proxy on every README render and camo
+# gives up long before a full audit finishes. Once a badge has been audited it
+# is always answered at once with its last known score; past _CACHE_TTL that
+# score is marked stale and refreshed by a background audit.
+_BADGE_PREWARM_COUNT = int(os.environ.get("GEO_BADGE_PREWARM", "50"))  # 0 disables
+_BADGE_PREWARM_INTERVAL = 300  # seconds between pre-warming passes
+_BADGE_STALE_MAX_AGE = 60  # Cache-Control max-age of a stale badge
+# At most one refresh per badge per lease, across workers: a failed refresh
+# leaves the badge stale, and a dead host must not be re-audited on every hit
+_BADGE_REFRESH_LEASE = _BADGE_PREWARM_INTERVAL
+
+# Strong references to fire-and-forget tasks (the event loop keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> None:
+    """Run ``coro`` in the background, keeping the task alive until it ends."""
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _refresh_badge(url: str) -> None:
+    """Re-audit ``url`` for its badge; joins an audit of the same URL already running."""
+    try:
+        await _audit_and_cache(url)
+    except Exception as exc:
+        logger.warning("Badge refresh failed for %s: %s", url, exc)
 
-    Fix race condition: uses asyncio.Lock to protect the
-    check-size / evict / insert block on _audit_cache (fix #209).
+
+async def _badge_score(url: str) -> tuple[int, str, int, bool]:
+    """Score, band, age in seconds and staleness of the badge for ``url``.
+
+    A known badge is answered from the store (a stale one also starts a
+    background refresh, if nobody holds its refresh lease); an unknown one is answered from the audit cache or
+    waits for its first audit, up to 60s.
+
+    Raises:
+        asyncio.TimeoutError: first audit did not finish in time.
+        Exception: whatever the first audit raised.
     """
-    async with _get_lock("audit_cache"):
-        key = _cache_key(url)
-        # Avoid unbounded growth: evict expired entries, then remove oldest
-        if len(_audit_cache) >= _MAX_CACHE_SIZE:
-            _evict_expired()
-        if len(_audit_cache) >= _MAX_CACHE_SIZE:
-            oldest_key = min(_audit_cache, key=lambda k: _audit_cache[k]["cached_at"])
-            _audit_cache.pop(oldest_key, None)
-        _audit_cache[key] = {"data": data, "cached_at": time.time()}
-        return key
+    key = _cache_key(url)
+    badge = await _store_call("hit_badge", key)
+    if badge is None:
+        # A failed audit leaves no badge but is cached like any other result:
+        # without this check every request for a dead host would re-audit it
+        data = await _get_cached(url)
+        if data is None:
+            # Timeout 60s to avoid blocking the event loop (fix #82)
+            _result, data = await asyncio.wait_for(_audit_and_cache(url), timeout=60.0)
+        return data["score"], data["band"], 0, False
+    age = max(0, int(time.time() - badge["audited_at"]))
+    stale = age >= _CACHE_TTL
+    if stale and await _store_call("claim_badge_refresh", key, _BADGE_REFRESH_LEASE):
+        _spawn(_refresh_badge(url))
+    return badge["score"], badge["band"], age, stale
+
+
+def _badge_cache_control(stale: bool) -> str:
+    """Cache-Control for a badge: a stale one is re-fetched soon, to pick up the refresh."""
+    return f"public, max-age={_BADGE_STALE_MAX_AGE if stale else _CACHE_TTL}"
+
+
+async def _prewarm_badges_once() -> int:
+    """Refresh the most requested badges of the last 24h that would go stale before the next pass.
+
+    Runs the audits one at a time. Every worker runs this job: the refresh
+    lease makes sure only one of them re-audits a given badge. Returns the
+    number of badges refreshed.
+    """
+    refreshed = 0
+    for badge in await _store_call("popular_badges", _BADGE_PREWARM_COUNT):
+        if time.time() - badge["audited_at"] + _BADGE_PREWARM_INTERVAL < _CACHE_TTL:
+            continue
+        if not await _store_call("claim_badge_refresh", _cache_key(badge["url"]), _BADGE_REFRESH_LEASE):
+            continue
+        await _refresh_badge(badge["url"])
+        refreshed += 1
+    return refreshed
+
+
+async def _prewarm_badges() -> None:
+    """Background job: keep popular badges fresh, every ``_BADGE_PREWARM_INTERVAL`` seconds."""
+    while True:
+        await asyncio.sleep(_BADGE_PREWARM_INTERVAL)
+        try:
+            refreshed = await _prewarm_badges_once()
+        except Exception as exc:
+            logger.warning("Badge pre-warming failed: %s", exc)
+        else:
+            if refreshed:
+                logger.info("Pre-warmed %d badges", refreshed)
 
 
 # @app.get("/", response_class=HTMLResponse)
@@ -648,8 +757,14 @@ def _increment_remote_stat(key: str, amount: int = 1) -> None:
 
 @app.get("/health")
 async def health():
-    """Health check for monitoring."""
-    return {"status": "ok", "version": __version__}
+    """Health check for monitoring, with the audit store's and the DNS cache's counters."""
+    return {
+        "status": "ok",
+        "version": __version__,
+        "audit_flights": _audit_flights.stats(),
+        "store": await _store_call("stats"),
+        "dns_cache": dns_cache_stats(),
+    }
 
 
 @app.get("/api/stats")
@@ -1093,23 +1208,17 @@ async def report_audit_page():
 
 @app.get("/report/{report_id}", response_class=HTMLResponse)
 async def report(report_id: str):
-    """Temporary report valid for 1 hour, kept in memory. Restarting the server clears all reports."""
+    """Temporary report valid for 1 hour, read from the web store (any worker, with a shared store)."""
     # Validate that report_id is exactly 32 lowercase hex characters
     # matching the output of _cache_key() — fix #210: isalnum() was
     # too permissive (accepted uppercase and other invalid charsets)
     if not _HEX_ID_RE.match(report_id):
         raise HTTPException(status_code=400, detail="Invalid report ID format")
 
-    # Fix #286: cache access protected by lock to avoid race condition
-    # Fix #343: check TTL — expired reports are no longer served
-    # Fix #457: extract data inside lock to prevent concurrent mutation
-    async with _get_lock("audit_cache"):
-        entry = _audit_cache.get(report_id)
-        if entry and (time.time() - entry.get("cached_at", 0)) >= _CACHE_TTL:
-            entry = None
-        if not entry:
-            raise HTTPException(status_code=404, detail="Report not found or expired")
-        data = entry["data"]
+    # Fix #343: the store checks the TTL — expired reports are no longer served
+    data = await _store_call("get_audit", report_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Report not found or expired")
 
     from geo_optimizer.cli.html_formatter import format_audit_html
 
@@ -1169,15 +1278,7 @@ async def audit_pdf(
         result = _dict_to_audit_result(cached)
     else:
         try:
-            from geo_optimizer.core.audit import run_full_audit
-
-            audit_result = await asyncio.wait_for(
-                asyncio.to_thread(run_full_audit, url),
-                timeout=60.0,
-            )
-            data = _audit_result_to_dict(audit_result)
-            await _set_cached(url, data)
-            result = audit_result
+            result, _data = await asyncio.wait_for(_audit_and_cache(url), timeout=60.0)
         except asyncio.TimeoutError as exc:
             raise HTTPException(
                 status_code=504,
@@ -1235,46 +1336,30 @@ async def badge(
     if not safe:
         raise HTTPException(status_code=400, detail=f"Unsafe URL: {reason}")
 
-    # Check cache or run audit
-    cached = await _get_cached(url)
-    if cached:
-        score = cached.get("score", 0)
-        band = cached.get("band", "critical")
-    else:
-        try:
-            from geo_optimizer.core.audit import run_full_audit
-
-            # Run in separate thread to avoid blocking the event loop
-            # Timeout 60s to avoid blocking the event loop (fix #82)
-            result = await asyncio.wait_for(
-                asyncio.to_thread(run_full_audit, url),
-                timeout=60.0,
-            )
-            data = _audit_result_to_dict(result)
-            await _set_cached(url, data)
-            score = data["score"]
-            band = data["band"]
-        except asyncio.TimeoutError:
-            # Timeout: show badge with "Error" text (fix #152)
-            logger.warning("Badge audit timeout (60s) per URL: %s", url)
-            from geo_optimizer.web.badge import generate_badge_svg
-
-            svg = generate_badge_svg(0, "critical", label=label, error=True)
-            return Response(
-                content=svg,
-                media_type="image/svg+xml",
-                headers={"Cache-Control": "no-store"},
-            )
-        except Exception:
-            # Generic error: show badge with "Error" text (fix #152)
-            from geo_optimizer.web.badge import generate_badge_svg
-
-            svg = generate_badge_svg(0, "critical", label=label, error=True)
-            return Response(
-                content=svg,
-                media_type="image/svg+xml",
-                headers={"Cache-Control": "no-store"},
-            )
+    # Last known score (stale-while-revalidate) or first audit
+    try:
+        score, band, age, stale = await _badge_score(url)
+    except asyncio.TimeoutError:
+        # Timeout: show badge with "Error" text (fix #152)
+        logger.warning("Badge audit timeout (60s) per URL: %s", url)
+        from geo_optimizer.web.badge import generate_badge_svg
+
+        svg = generate_badge_svg(0, "critical", label=label, error=True)
+        return Response(
+            content=svg,
+            media_type="image/svg+xml",
+            headers={"Cache-Control": "no-store"},
+        )
+    except Exception:
+        # Generic error: show badge with "Error" text (fix #152)
+        from geo_optimizer.web.badge import generate_badge_svg
+
+        svg = generate_badge_svg(0, "critical", label=label, error=True)
+        return Response(
+            content=svg,
+            media_type="image/svg+xml",
+            headers={"Cache-Control": "no-store"},
+        )
 
     from geo_optimizer.web.badge import generate_badge_svg
 
@@ -1286,7 +1371,7 @@ async def badge(
         content=svg,
         media_type="image/svg+xml",
         headers={
-            "Cache-Control": "public, max-age=3600",
+            "Cache-Control": _badge_cache_control(stale),
             "ETag": f'"{_cache_key(url)}-{score}"',
         },
     )
@@ -1302,8 +1387,10 @@ async def badge_endpoint(
     Usage with shields.io:
         ![GEO Score](https://img.shields.io/endpoint?url=https://geoready.dev/badge/endpoint?url=https://yoursite.com)
 
-    Returns JSON in shields.io schema:
-        {"schemaVersion": 1, "label": "GEO Score", "message": "77/100", "color": "green"}
+    Returns JSON in shields.io schema, plus the age of the score in seconds
+    and whether it is stale (being refreshed in the background):
+        {"schemaVersion": 1, "label": "GEO Score", "message": "77/100", "color": "green",
+         "stale": false, "age": 120}
     """
     from geo_optimizer.utils.validators import validate_public_url
 
@@ -1330,36 +1417,29 @@ async def badge_endpoint(
             status_code=400,
         )
 
-    # Cache o audit
-    cached = await _get_cached(url)
-    if cached:
-        score = cached.get("score", 0)
-        band = cached.get("band", "critical")
-    else:
-        try:
-            from geo_optimizer.core.audit import run_full_audit
-
-            result = await asyncio.wait_for(
-                asyncio.to_thread(run_full_audit, url),
-                timeout=60.0,
-            )
-            data = _audit_result_to_dict(result)
-            await _set_cached(url, data)
-            score = data["score"]
-            band = data["band"]
-        except (asyncio.TimeoutError, Exception):
-            return JSONResponse(
-                {"schemaVersion": 1, "label": "GEO Score", "message": "error", "color": "lightgrey"},
-                status_code=503,
-            )
+    # Last known score (stale-while-revalidate) or first audit
+    try:
+        score, band, age, stale = await _badge_score(url)
+    except (asyncio.TimeoutError, Exception):
+        return JSONResponse(
+            {"schemaVersion": 1, "label": "GEO Score", "message": "error", "color": "lightgrey"},
+            status_code=503,
+        )
 
     # Fix #459: use hex codes to match direct SVG badge colors (cyan for "good", not green)
     color_map = {"excellent": "22c55e", "good": "06b6d4", "foundation": "eab308", "critical": "ef4444"}
     color = color_map.get(band, "lightgrey")
 
     return JSONResponse(
-        {"schemaVersion": 1, "label": "GEO Score", "message": f"{score}/100", "color": color},
-        headers={"Cache-Control": "public, max-age=3600"},
+        {
+            "schemaVersion": 1,
+            "label": "GEO Score",
+            "message": f"{score}/100",
+            "color": color,
+            "stale": stale,
+            "age": age,
+        },
+        headers={"Cache-Control": _badge_cache_control(stale)},
     )
 
 
@@ -1412,17 +1492,20 @@ async def _run_audit(url: str) -> JSONResponse:
             response_data["history"] = history_summary
         return JSONResponse(content=response_data)
 
+    # Concurrent requests for the same URL share the audit and its bookkeeping
+    # (history snapshot, telemetry, audit counter), which then run once
+    data = await _audit_flights.run(("report", _cache_key(url)), lambda: _audit_report(url))
+    return JSONResponse(content=data)
+
+
+async def _audit_report(url: str) -> dict:
+    """Run the audit for ``_run_audit`` and record it; returns the response data."""
     # v4.10: telemetry — capture duration for geo_audit_run event
     t_start = time.perf_counter()
     # Run audit
     try:
-        from geo_optimizer.core.audit import run_full_audit
-
         # Run in separate thread with 60s timeout to avoid blocking the event loop (fix #82)
-        result = await asyncio.wait_for(
-            asyncio.to_thread(run_full_audit, url),
-            timeout=60.0,
-        )
+        result, data = await asyncio.wait_for(_audit_and_cache(url), timeout=60.0)
     except asyncio.TimeoutError as exc:
         logger.warning("Audit timeout (60s) for URL: %s", url)
         raise HTTPException(
@@ -1438,8 +1521,8 @@ async def _run_audit(url: str) -> JSONResponse:
 
     duration_ms = int((time.perf_counter() - t_start) * 1000)
 
-    # Serialize result
-    data = _audit_result_to_dict(result)
+    # Shared with the other callers of _audit_and_cache: add history on a copy
+    data = dict(data)
     history_summary = await asyncio.to_thread(_save_and_load_history_summary, result)
     if history_summary:
         data["history"] = history_summary
@@ -1469,7 +1552,7 @@ async def _run_audit(url: str) -> JSONResponse:
     report_id = await _set_cached(url, data)
     data["report_url"] = f"/report/{report_id}"
 
-    return JSONResponse(content=data)
+    return data
 
 
 def _load_history_summary(url: str) -> dict | None:
@@ -1754,6 +1837,7 @@ def _dict_to_audit_result(data: dict):
             cdn_detected=cdn.get("cdn_detected", ""),
             cdn_headers=cdn.get("cdn_headers", {}),
             error=cdn.get("error", ""),
+            early_abort=cdn.get("early_abort", False),
         )
 
     # Fix #309: rebuild js_rendering if present in cache
@@ -2300,12 +2384,11 @@ async def gap_analysis(request: Request, body: GapAnalysisRequest):
 
         result = await asyncio.to_thread(run_gap_analysis, url1=url1, url2=url2)
 
-        from geo_optimizer.core.audit import run_full_audit
         from geo_optimizer.core.gap_analysis import build_gap_analysis
 
         # Full audit for both
-        result1 = await asyncio.to_thread(run_full_audit, url1)
-        result2 = await asyncio.to_thread(run_full_audit, url2)
+        result1 = await asyncio.to_thread(_run_full_audit, url1)
+        result2 = await asyncio.to_thread(_run_full_audit, url2)
         result = build_gap_analysis(result1, result2)
     except Exception as exc:
         logger.error("Gap analysis error: %s", exc)
@@ -2361,7 +2444,9 @@ async def analyze_logs(request: Request):
     """Analyze a server log file for AI crawler activity.
 
     Accepts a multipart file upload (Apache/Nginx combined or JSON lines format).
-    Field name: 'file'. Max 10 MB — enforced by BodySizeLimitMiddleware.
+    Field name: 'file'. Max 10 MB — enforced by BodySizeLimitMiddleware — and
+    the first _MAX_LOG_UPLOAD_LINES lines. Compressed (gzip/zstd) uploads are
+    rejected: their decompressed size is not bounded by the upload limit.
     Returns LogAnalysisResult as JSON.
     """
     import tempfile
@@ -2390,6 +2475,11 @@ async def analyze_logs(request: Request):
     if len(content) > _MAX_LOG_UPLOAD_BYTES:
         raise HTTPException(status_code=413, detail=f"File too large. Limit: {_MAX_LOG_UPLOAD_BYTES} bytes.")
 
+    from geo_optimizer.core.log_analyzer import _GZIP_MAGIC, _ZSTD_MAGIC, analyze_log_file
+
+    if content.startswith((_GZIP_MAGIC, _ZSTD_MAGIC)):
+        raise HTTPException(status_code=415, detail="Compressed logs are not accepted. Upload the plain log.")
+
     try:
         with tempfile.NamedTemporaryFile(delete=False, suffix=".log") as tmp:
             tmp.write(content)
@@ -2398,9 +2488,7 @@ async def analyze_logs(request: Request):
         raise HTTPException(status_code=500, detail="Failed to create temporary file.") from exc
 
     try:
-        from geo_optimizer.core.log_analyzer import analyze_log_file
-
-        result = await asyncio.to_thread(analyze_log_file, tmp_path)
+        result = await asyncio.to_thread(analyze_log_file, tmp_path, max_lines=_MAX_LOG_UPLOAD_LINES)
     except Exception as exc:
         logger.error("Log analysis error: %s", exc)
         raise HTTPException(status_code=500, detail="Log analysis failed. Check file format.") from exc
@@ -0,0 +1,556 @@
+"""
+Audit report cache, badge scores and rate-limit counters for the web app.
+
+It also keeps the last known score of every badge, with hourly request
+counts, so a badge can be served stale while it is re-audited and the most
+requested ones can be kept fresh.
+
+Two backends behind one interface:
+
+- ``MemoryStore`` (default): per-process dicts with O(1) LRU eviction and a
+  byte budget for cached audits, stored zlib-compressed. Each uvicorn worker
+  has its own cache and its own rate limits.
+- ``SqliteStore``: one SQLite file in WAL mode on local disk, shared by every
+  worker process on the host, so a report cached by one worker is served by
+  any other (``/report/{id}``) and rate limits are per client, not per worker.
+
+Selected with the ``GEO_WEB_STORE`` environment variable: ``memory`` (or
+unset) or ``sqlite:<path>``.
+
+Usage:
+    store = create_store(os.environ.get("GEO_WEB_STORE", ""))
+    store.set_audit(key, data)
+    allowed = store.hit_rate_limit(client_ip, max_requests=30)
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+
+from geo_optimizer.utils.cache import _SqliteStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600  # seconds an audit report stays valid
+DEFAULT_MAX_AUDITS = 500
+DEFAULT_MAX_AUDIT_BYTES = 64 * 1024 * 1024  # memory backend: budget for cached audits
+DEFAULT_WINDOW = 60  # rate-limit window, seconds
+DEFAULT_MAX_IPS = 10000  # clients tracked by the memory backend
+DEFAULT_BADGE_TTL = 30 * 24 * 3600  # a badge not requested for this long is forgotten
+DEFAULT_MAX_BADGES = 10000
+POPULAR_WINDOW_HOURS = 24  # request counts behind popular_badges()
+
+
+class WebStore(ABC):
+    """Interface of the web app's audit cache, badge scores and rate limiter.
+
+    Audits are JSON-serializable dicts keyed by report ID; they expire after
+    ``ttl`` seconds and the least recently used ones are dropped past
+    ``max_audits``. Rate limits are sliding windows of ``window`` seconds.
+    Badges (``{"url", "score", "band", "audited_at"}``) never expire on age:
+    they are dropped once unrequested for ``badge_ttl`` seconds or past
+    ``max_badges``.
+
+    Audit lookups and evictions are counted (``hits``, ``misses``,
+    ``evictions``) for monitoring; the counters belong to the process.
+    """
+
+    #: True when the backend does blocking I/O (run it off the event loop)
+    shared = False
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        max_audits: int = DEFAULT_MAX_AUDITS,
+        window: int = DEFAULT_WINDOW,
+        max_ips: int = DEFAULT_MAX_IPS,
+        badge_ttl: int = DEFAULT_BADGE_TTL,
+        max_badges: int = DEFAULT_MAX_BADGES,
+    ):
+        self.ttl = ttl
+        self.max_audits = max_audits
+        self.window = window
+        self.max_ips = max_ips
+        self.badge_ttl = badge_ttl
+        self.max_badges = max_badges
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @abstractmethod
+    def get_audit(self, key: str) -> dict | None:
+        """Return the cached audit for ``key``, or None if missing or expired."""
+
+    @abstractmethod
+    def set_audit(self, key: str, data: dict) -> None:
+        """Cache ``data`` under ``key``, evicting the least recently used audit if full."""
+
+    @abstractmethod
+    def evict_expired(self) -> int:
+        """Drop every expired audit. Returns the number removed."""
+
+    @abstractmethod
+    def hit_rate_limit(self, client_ip: str, max_requests: int) -> bool:
+        """Count a request from ``client_ip``. Returns False if it is over the limit."""
+
+    @abstractmethod
+    def hit_badge(self, key: str) -> dict | None:
+        """Count a request for badge ``key`` and return its last known score, however old."""
+
+    @abstractmethod
+    def set_badge(self, key: str, url: str, score: int, band: str) -> None:
+        """Record a freshly audited score for badge ``key``."""
+
+    @abstractmethod
+    def popular_badges(self, limit: int) -> list[dict]:
+        """The ``limit`` most requested badges of the last 24 hours, most requested first.
+
+        Each item is ``{"url", "audited_at", "hits"}``.
+        """
+
+    @abstractmethod
+    def claim_badge_refresh(self, key: str, lease: int) -> bool:
+        """Take the refresh lease of badge ``key`` for ``lease`` seconds.
+
+        Returns False while another caller (any worker, with a shared backend)
+        holds it: one refresh attempt per badge per lease, failed or not.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every audit, badge and rate-limit counter."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Backend name, counts of audits, badges and tracked clients, audit counters and bytes."""
+
+    def _counters(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+def _hour(now: float) -> int:
+    """Hour bucket of a timestamp, for badge request counts."""
+    return int(now // 3600)
+
+
+class MemoryStore(WebStore):
+    """Per-process store: ordered dicts, most recently used last.
+
+    ``audits`` maps report ID to ``{"data", "size", "cached_at"}``, where
+    ``data`` is the audit as zlib-compressed JSON (or the dict itself with
+    ``compress=False``) and ``size`` its serialized bytes: audits are kept
+    within ``max_bytes`` as well as ``max_audits``. ``rate_limits`` maps
+    client IP to its request timestamps in ascending order. ``badges`` maps
+    badge key to its record, plus ``hits`` (requests per hour bucket). All
+    are kept in LRU order, so eviction pops the first item.
+    Meant for a single event loop: no method awaits, so none interleave.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_AUDIT_BYTES, compress: bool = True, **kwargs):
+        super().__init__(**kwargs)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.audit_bytes = 0
+        self.audits: OrderedDict[str, dict] = OrderedDict()
+        self.rate_limits: OrderedDict[str, list[float]] = OrderedDict()
+        self.badges: OrderedDict[str, dict] = OrderedDict()
+
+    def _drop_audit(self, key: str) -> None:
+        self.audit_bytes -= self.audits.pop(key)["size"]
+
+    def get_audit(self, key: str) -> dict | None:
+        entry = self.audits.get(key)
+        if entry is None or time.time() - entry["cached_at"] >= self.ttl:
+            if entry is not None:
+                self._drop_audit(key)
+            self.misses += 1
+            return None
+        self.audits.move_to_end(key)
+        self.hits += 1
+        return json.loads(zlib.decompress(entry["data"])) if self.compress else entry["data"]
+
+    def set_audit(self, key: str, data: dict) -> None:
+        try:
+            raw = json.dumps(data, separators=(",", ":")).encode()
+        except (TypeError, ValueError) as exc:
+            logger.warning("Audit not cached, not serializable: %s", exc)
+            return
+        value = zlib.compress(raw) if self.compress else data
+        size = len(value) if self.compress else len(raw)
+        if key in self.audits:
+            self._drop_audit(key)
+        if size > self.max_bytes:
+            logger.warning("Audit not cached, %d bytes is over the %d byte budget", size, self.max_bytes)
+            return
+        while self.audits and (len(self.audits) >= self.max_audits or self.audit_bytes + size > self.max_bytes):
+            self._drop_audit(next(iter(self.audits)))
+            self.evictions += 1
+        self.audits[key] = {"data": value, "size": size, "cached_at": time.time()}
+        self.audit_bytes += size
+
+    def evict_expired(self) -> int:
+        cutoff = time.time() - self.ttl
+        expired = [key for key, entry in self.audits.items() if entry["cached_at"] <= cutoff]
+        for key in expired:
+            self._drop_audit(key)
+        return len(expired)
+
+    def hit_rate_limit(self, client_ip: str, max_requests: int) -> bool:
+        now = time.time()
+        timestamps = self.rate_limits.pop(client_ip, None) or []
+        # Timestamps are ascending: drop the ones outside the window in one slice
+        del timestamps[: bisect_right(timestamps, now - self.window)]
+        allowed = len(timestamps) < max_requests
+        if allowed:
+            timestamps.append(now)
+        self.rate_limits[client_ip] = timestamps
+        while len(self.rate_limits) > self.max_ips:
+            self.rate_limits.popitem(last=False)
+        return allowed
+
+    def hit_badge(self, key: str) -> dict | None:
+        badge = self.badges.get(key)
+        if badge is None:
+            return None
+        now = time.time()
+        if now - badge["accessed_at"] >= self.badge_ttl:
+            del self.badges[key]
+            return None
+        hour = _hour(now)
+        hits = badge["hits"]
+        hits[hour] = hits.get(hour, 0) + 1
+        for old in [h for h in hits if h <= hour - POPULAR_WINDOW_HOURS]:
+            del hits[old]
+        badge["accessed_at"] = now
+        self.badges.move_to_end(key)
+        return {name: badge[name] for name in ("url", "score", "band", "audited_at")}
+
+    def claim_badge_refresh(self, key: str, lease: int) -> bool:
+        badge = self.badges.get(key)
+        now = time.time()
+        if badge is None or badge.get("refresh_until", 0) > now:
+            return False
+        badge["refresh_until"] = now + lease
+        return True
+
+    def set_badge(self, key: str, url: str, score: int, band: str) -> None:
+        now = time.time()
+        badge = self.badges.pop(key, None)
+        hits = badge["hits"] if badge else {}
+        while len(self.badges) >= self.max_badges:
+            self.badges.popitem(last=False)
+        self.badges[key] = {
+            "url": url,
+            "score": score,
+            "band": band,
+            "audited_at": now,
+            "accessed_at": now,
+            "hits": hits,
+        }
+
+    def popular_badges(self, limit: int) -> list[dict]:
+        since = _hour(time.time()) - POPULAR_WINDOW_HOURS
+        counted = [
+            {"url": badge["url"], "audited_at": badge["audited_at"], "hits": hits}
+            for badge in self.badges.values()
+            if (hits := sum(n for hour, n in badge["hits"].items() if hour > since))
+        ]
+        return heapq.nlargest(limit, counted, key=lambda badge: badge["hits"])
+
+    def clear(self) -> None:
+        self.audits.clear()
+        self.audit_bytes = 0
+        self.rate_limits.clear()
+        self.badges.clear()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "audits": len(self.audits),
+            "badges": len(self.badges),
+            "tracked_ips": len(self.rate_limits),
+            **self._counters(),
+            "bytes": self.audit_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audits (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    cached_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audits_cached_at ON audits(cached_at);
+CREATE INDEX IF NOT EXISTS idx_audits_accessed_at ON audits(accessed_at);
+CREATE TABLE IF NOT EXISTS rate_limits (
+    ip TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rate_limits_ip ON rate_limits(ip, ts);
+CREATE INDEX IF NOT EXISTS idx_rate_limits_ts ON rate_limits(ts);
+CREATE TABLE IF NOT EXISTS badges (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    band TEXT NOT NULL,
+    audited_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_badges_accessed_at ON badges(accessed_at);
+CREATE TABLE IF NOT EXISTS badge_hits (
+    key TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    hits INTEGER NOT NULL,
+    PRIMARY KEY (key, hour)
+);
+CREATE INDEX IF NOT EXISTS idx_badge_hits_hour ON badge_hits(hour);
+CREATE TABLE IF NOT EXISTS badge_refreshes (
+    key TEXT PRIMARY KEY,
+    lease_until REAL NOT NULL
+);
+"""
+
+
+class SqliteStore(_SqliteStore, WebStore):
+    """Store in one SQLite file shared by every worker process on the host.
+
+    Each rate-limit check is one ``BEGIN IMMEDIATE`` transaction, so
+    concurrent workers never both let the last allowed request through.
+    Database errors are logged and degrade to a cache miss or an allowed
+    request: the store must never take the web app down.
+    """
+
+    schema = _SCHEMA
+    shared = True
+
+    def __init__(self, path: Path | str, **kwargs):
+        path = Path(path)
+        _SqliteStore.__init__(self, path.parent, path.name)
+        WebStore.__init__(self, **kwargs)
+
+    def get_audit(self, key: str) -> dict | None:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT data FROM audits WHERE key = ? AND cached_at > ?", (key, now - self.ttl)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE audits SET accessed_at = ? WHERE key = ?", (now, key))
+                self.hits += 1
+            return json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            logger.warning("Web store read failed: %s", exc)
+            return None
+
+    def set_audit(self, key: str, data: dict) -> None:
+        now = time.time()
+        try:
+            blob = json.dumps(data)
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO audits (key, data, cached_at, accessed_at) VALUES (?, ?, ?, ?)",
+                        (key, blob, now, now),
+                    )
+                    conn.execute("DELETE FROM audits WHERE cached_at <= ?", (now - self.ttl,))
+                    excess = conn.execute("SELECT COUNT(*) FROM audits").fetchone()[0] - self.max_audits
+                    if excess > 0:
+                        conn.execute(
+                            "DELETE FROM audits WHERE key IN (SELECT key FROM audits ORDER BY accessed_at LIMIT ?)",
+                            (excess,),
+                        )
+                        self.evictions += excess
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except (sqlite3.Error, OSError, TypeError, ValueError) as exc:
+            logger.warning("Web store write failed: %s", exc)
+
+    def evict_expired(self) -> int:
+        try:
+            with self._lock:
+                cursor = self._connect().execute("DELETE FROM audits WHERE cached_at <= ?", (time.time() - self.ttl,))
+            return cursor.rowcount
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Web store eviction failed: %s", exc)
+            return 0
+
+    def hit_rate_limit(self, client_ip: str, max_requests: int) -> bool:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Expired rows of every client go here: the table only holds the current window
+                    conn.execute("DELETE FROM rate_limits WHERE ts <= ?", (now - self.window,))
+                    count = conn.execute("SELECT COUNT(*) FROM rate_limits WHERE ip = ?", (client_ip,)).fetchone()[0]
+                    allowed = count < max_requests
+                    if allowed:
+                        conn.execute("INSERT INTO rate_limits (ip, ts) VALUES (?, ?)", (client_ip, now))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            return allowed
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Web store rate limit check failed, allowing the request: %s", exc)
+            return True
+
+    def hit_badge(self, key: str) -> dict | None:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT url, score, band, audited_at FROM badges WHERE key = ? AND accessed_at > ?",
+                        (key, now - self.badge_ttl),
+                    ).fetchone()
+                    if row is not None:
+                        conn.execute("UPDATE badges SET accessed_at = ? WHERE key = ?", (now, key))
+                        conn.execute(
+                            "INSERT INTO badge_hits (key, hour, hits) VALUES (?, ?, 1) "
+                            "ON CONFLICT (key, hour) DO UPDATE SET hits = hits + 1",
+                            (key, _hour(now)),
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Web store read failed: %s", exc)
+            return None
+        if row is None:
+            return None
+        return dict(zip(("url", "score", "band", "audited_at"), row))
+
+    def set_badge(self, key: str, url: str, score: int, band: str) -> None:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO badges (key, url, score, band, audited_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, url, score, band, now, now),
+                    )
+                    conn.execute("DELETE FROM badges WHERE accessed_at <= ?", (now - self.badge_ttl,))
+                    excess = conn.execute("SELECT COUNT(*) FROM badges").fetchone()[0] - self.max_badges
+                    if excess > 0:
+                        conn.execute(
+                            "DELETE FROM badges WHERE key IN (SELECT key FROM badges ORDER BY accessed_at LIMIT ?)",
+                            (excess,),
+                        )
+                    conn.execute("DELETE FROM badge_hits WHERE hour <= ?", (_hour(now) - POPULAR_WINDOW_HOURS,))
+                    conn.execute("DELETE FROM badge_refreshes WHERE lease_until <= ?", (now,))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Web store write failed: %s", exc)
+
+    def popular_badges(self, limit: int) -> list[dict]:
+        try:
+            with self._lock:
+                rows = (
+                    self._connect()
+                    .execute(
+                        "SELECT b.url, b.audited_at, SUM(h.hits) AS total FROM badge_hits h "
+                        "JOIN badges b ON b.key = h.key WHERE h.hour > ? "
+                        "GROUP BY h.key ORDER BY total DESC LIMIT ?",
+                        (_hour(time.time()) - POPULAR_WINDOW_HOURS, limit),
+                    )
+                    .fetchall()
+                )
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Web store read failed: %s", exc)
+            return []
+        return [{"url": url, "audited_at": audited_at, "hits": hits} for url, audited_at, hits in rows]
+
+    def claim_badge_refresh(self, key: str, lease: int) -> bool:
+        now = time.time()
+        try:
+            with self._lock:
+                # One statement: of two workers racing for an expired lease, only one updates the row
+                cursor = self._connect().execute(
+                    "INSERT INTO badge_refreshes (key, lease_until) VALUES (?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET lease_until = excluded.lease_until WHERE lease_until <= ?",
+                    (key, now + lease, now),
+                )
+            return cursor.rowcount == 1
+        except (sqlite3.Error, OSError) as exc:
+            # Same trade-off as the rate limiter: a broken store must not freeze the badges
+            logger.warning("Web store refresh lease failed, refreshing anyway: %s", exc)
+            return True
+
+    def clear(self) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                for table in ("audits", "rate_limits", "badges", "badge_hits", "badge_refreshes"):
+                    conn.execute(f"DELETE FROM {table}")  # noqa: S608 - fixed table names
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Web store clear failed: %s", exc)
+
+    def stats(self) -> dict:
+        try:
+            with self._lock:
+                conn = self._connect()
+                audits, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM audits").fetchone()
+                badges = conn.execute("SELECT COUNT(*) FROM badges").fetchone()[0]
+                ips = conn.execute(
+                    "SELECT COUNT(DISTINCT ip) FROM rate_limits WHERE ts > ?", (time.time() - self.window,)
+                ).fetchone()[0]
+        except (sqlite3.Error, OSError) as exc:
+            # /health must answer even when the file is unreadable: report zeroed counts
+            logger.warning("Web store stats failed: %s", exc)
+            audits = size = badges = ips = 0
+        return {
+            "backend": "sqlite",
+            "audits": audits,
+            "badges": badges,
+            "tracked_ips": ips,
+            **self._counters(),
+            "bytes": size,
+        }
+
+
+def create_store(spec: str, max_bytes: int = DEFAULT_MAX_AUDIT_BYTES, compress: bool = True, **kwargs) -> WebStore:
+    """Build the store named by ``spec`` (``GEO_WEB_STORE``): ``memory`` or ``sqlite:<path>``.
+
+    ``max_bytes`` and ``compress`` apply to the memory backend; the SQLite
+    file is bounded by ``max_audits`` only.
+
+    Raises:
+        ValueError: unknown backend or missing SQLite path.
+    """
+    spec = spec.strip()
+    if spec in ("", "memory"):
+        return MemoryStore(max_bytes=max_bytes, compress=compress, **kwargs)
+    backend, _, target = spec.partition(":")
+    if backend == "sqlite" and target:
+        return SqliteStore(Path(target).expanduser(), **kwargs)
+    raise ValueError(f"Invalid GEO_WEB_STORE {spec!r}: use 'memory' or 'sqlite:<path>'")
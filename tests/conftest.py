@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+import pytest
+
 # Set GEO_STATIC_DIR before any web app module import so StaticFiles finds
 # the Astro dist directory. Without this, FastAPI returns 404 on GET /.
 _FRONTEND_DIST = Path(__file__).parent.parent / "frontend" / "dist"
@@ -12,3 +14,23 @@ _FRONTEND_DIST = Path(__file__).parent.parent / "frontend" / "dist"
 # the web app module imports cleanly during collection.
 _FRONTEND_DIST.mkdir(parents=True, exist_ok=True)
 os.environ.setdefault("GEO_STATIC_DIR", str(_FRONTEND_DIST))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep the disk caches (HTTP responses, audit results) out of ~/.geo-cache and apart per test."""
+    from geo_optimizer.utils import cache
+
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path_factory.mktemp("geo-cache"))
+    monkeypatch.setattr(cache, "_shared_cache", None)
+    monkeypatch.setattr(cache, "_shared_result_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_dns_cache():
+    """Resolutions cached by one test (often under a patched getaddrinfo) must not answer the next."""
+    from geo_optimizer.utils.validators import clear_dns_cache
+
+    clear_dns_cache()
+    yield
+    clear_dns_cache()
@@ -3,10 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
-from geo_optimizer.core.batch_audit import run_batch_audit_async
-from geo_optimizer.models.results import AuditResult, SitemapUrl
+import pytest
+
+from geo_optimizer.core.audit import (
+    _SIDECAR_PATHS,
+    AuditInputs,
+    analyze_audit_inputs,
+    fetch_audit_inputs_async,
+    run_audit_pipeline_async,
+)
+from geo_optimizer.core.batch_audit import (
+    BatchAuditStats,
+    _analyze_in_worker,
+    _select_urls,
+    iter_batch_audit,
+    run_batch_audit_async,
+)
+from geo_optimizer.models.config import AI_BOTS
+from geo_optimizer.models.results import (
+    AuditResult,
+    BatchAuditPageResult,
+    CachedResponse,
+    CdnAiCrawlerResult,
+    SitemapUrl,
+)
+from geo_optimizer.utils.http import _active_pool
+
+_PAGE = (Path(__file__).parent / "fixtures" / "pages" / "blog_article.html").read_text(encoding="utf-8")
 
 
 def _make_audit_result(url: str, score: int, band: str, breakdown: dict[str, int]) -> AuditResult:
@@ -85,16 +112,43 @@ class TestBatchAudit:
 
         mock_fetch_sitemap.assert_called_once()
 
+    @patch("geo_optimizer.core.batch_audit.fetch_sitemap")
+    @patch("geo_optimizer.core.batch_audit.run_full_audit_async")
+    def test_run_batch_audit_async_passes_cache_to_async_engine(
+        self,
+        mock_run_full_audit_async,
+        mock_fetch_sitemap,
+    ):
+        """Con cache attiva il batch resta sul path async: la cache è gestita dal fetcher."""
+        mock_fetch_sitemap.return_value = [SitemapUrl(url="https://example.com/")]
+        mock_run_full_audit_async.return_value = _make_audit_result(
+            "https://example.com/",
+            77,
+            "good",
+            {"robots": 18, "llms": 11},
+        )
+
+        result = asyncio.run(run_batch_audit_async("https://example.com/sitemap.xml", use_cache=True))
+
+        assert result.average_score == 77.0
+        mock_run_full_audit_async.assert_called_once_with(
+            "https://example.com/",
+            use_cache=True,
+            project_config=None,
+        )
+
+    @patch("geo_optimizer.core.batch_audit._async_runtime_available", return_value=False)
     @patch("geo_optimizer.core.batch_audit.asyncio.to_thread", new_callable=AsyncMock)
     @patch("geo_optimizer.core.batch_audit.fetch_sitemap")
     @patch("geo_optimizer.core.batch_audit.run_full_audit")
-    def test_run_batch_audit_async_uses_sync_path_with_cache(
+    def test_run_batch_audit_async_uses_sync_path_without_httpx(
         self,
         mock_run_full_audit,
         mock_fetch_sitemap,
         mock_to_thread,
+        _mock_runtime,
     ):
-        """Con cache attiva il batch usa il path sincrono per rispettare il caching HTTP."""
+        """Senza httpx il batch ripiega sul path sincrono in un thread."""
         mock_to_thread.side_effect = lambda func, *args, **kwargs: func(*args, **kwargs)
         mock_fetch_sitemap.return_value = [SitemapUrl(url="https://example.com/")]
         mock_run_full_audit.return_value = _make_audit_result(
@@ -112,3 +166,200 @@ class TestBatchAudit:
             use_cache=True,
             project_config=None,
         )
+
+
+def _response(text: str, status_code: int = 200) -> CachedResponse:
+    return CachedResponse(
+        status_code=status_code, text=text, content=text.encode(), headers={"Content-Type": "text/html"}
+    )
+
+
+def _inputs(url: str) -> AuditInputs:
+    sidecars = dict.fromkeys(_SIDECAR_PATHS)
+    sidecars["/robots.txt"] = _response("User-agent: *\nAllow: /\n")
+    return AuditInputs(base_url=url, response=_response(_PAGE), sidecars=sidecars, cdn_result=CdnAiCrawlerResult())
+
+
+class _FakeAsyncFetcher:
+    """Async fetcher serving the fixture page and robots.txt without any network."""
+
+    async def fetch_homepage(self, base_url):
+        return _response(_PAGE), None
+
+    def start_sidecars(self, base_url):
+        pass
+
+    async def sidecars(self):
+        return _inputs("https://example.com").sidecars
+
+    async def cdn_check(self, base_url):
+        return CdnAiCrawlerResult()
+
+
+def _comparable(result: AuditResult) -> dict:
+    data = dataclasses.asdict(result)
+    data.pop("timestamp", None)
+    data.pop("audit_duration_ms", None)
+    return data
+
+
+class TestDetachedStages:
+    """Fetch and analyze split at the process boundary give the same audit as the pipeline."""
+
+    def test_fetch_then_analyze_matches_pipeline(self):
+        inputs = asyncio.run(fetch_audit_inputs_async("https://example.com/", _FakeAsyncFetcher()))
+        assert isinstance(inputs, AuditInputs)
+        detached = analyze_audit_inputs(inputs, bots=AI_BOTS)
+        piped = asyncio.run(run_audit_pipeline_async("https://example.com/", _FakeAsyncFetcher()))
+        assert _comparable(detached) == _comparable(piped)
+
+    def test_homepage_failure_returns_error_result(self):
+        fetcher = _FakeAsyncFetcher()
+        fetcher.fetch_homepage = AsyncMock(return_value=(None, "Connection refused"))
+        result = asyncio.run(fetch_audit_inputs_async("https://example.com", fetcher))
+        assert isinstance(result, AuditResult)
+        assert result.error
+
+
+class TestSelectUrls:
+    def test_same_page_is_selected_once(self):
+        entries = [
+            SitemapUrl(url="https://example.com/a"),
+            SitemapUrl(url="https://example.com/a/"),
+            SitemapUrl(url="https://EXAMPLE.com/a#top"),
+            SitemapUrl(url="https://example.com/b"),
+        ]
+
+        assert _select_urls(entries, max_urls=10) == ["https://example.com/a", "https://example.com/b"]
+
+
+class TestBatchAuditWorkers:
+    """--workers: fetch in the event loop, parse + analysis in a process pool."""
+
+    def test_negative_workers_rejected(self):
+        with pytest.raises(ValueError, match="workers"):
+            asyncio.run(run_batch_audit_async("https://example.com/sitemap.xml", workers=-1))
+
+    @patch("geo_optimizer.core.batch_audit._fetch_inputs", new_callable=AsyncMock)
+    @patch("geo_optimizer.core.batch_audit.fetch_sitemap")
+    def test_pool_results_match_in_process_analysis(self, mock_fetch_sitemap, mock_fetch_inputs):
+        """Pages analysed by worker processes summarise exactly like an in-process analysis."""
+        urls = ["https://example.com/", "https://example.com/a", "https://example.com/down"]
+        mock_fetch_sitemap.return_value = [SitemapUrl(url=url) for url in urls]
+        failure = AuditResult(url="https://example.com/down", error="Connection refused", band="critical")
+        mock_fetch_inputs.side_effect = lambda url, use_cache, project_config: (
+            failure if url.endswith("down") else _inputs(url)
+        )
+
+        result = asyncio.run(
+            run_batch_audit_async("https://example.com/sitemap.xml", concurrency=3, workers=2, use_cache=True)
+        )
+
+        assert result.audited_urls == 3
+        assert result.successful_urls == 2
+        assert result.failed_urls == 1
+        by_url = {page.url: page for page in result.pages}
+        for url in urls[:2]:
+            assert by_url[url] == _analyze_in_worker(_inputs(url), AI_BOTS, "html.parser")
+        assert by_url["https://example.com/down"].error == "Connection refused"
+        mock_fetch_inputs.assert_any_call("https://example.com/", use_cache=True, project_config=None)
+
+
+def _page(url: str, score: int, band: str = "good", error: str | None = None) -> BatchAuditPageResult:
+    return BatchAuditPageResult(
+        url=url, score=score, band=band, error=error, score_breakdown={} if error else {"robots": score % 7}
+    )
+
+
+class TestBatchAuditStats:
+    """Aggregati incrementali: stessi valori del calcolo sull'elenco completo."""
+
+    def test_matches_full_list_ranking(self):
+        scores = [70, 40, 70, 90, 40, 55, 70, 10, 90, 40, 65]
+        pages = [_page(f"https://example.com/{i}", score) for i, score in enumerate(scores)]
+        pages.insert(3, _page("https://example.com/down", 0, band="critical", error="HTTP 500"))
+
+        stats = BatchAuditStats(sitemap_url="https://example.com/sitemap.xml", discovered_urls=20)
+        # Out-of-order arrival, as in a streaming batch: position is the URL index
+        for position in [5, 0, 11, 3, 8, 1, 10, 2, 7, 4, 9, 6]:
+            stats.add(pages[position], position=position)
+        result = stats.to_result()
+
+        ranked = sorted((page for page in pages if not page.error), key=lambda page: page.score, reverse=True)
+        assert result.top_pages == ranked[:5]
+        assert result.worst_pages == list(reversed(ranked[-5:]))
+        assert result.audited_urls == 12
+        assert result.failed_urls == 1
+        assert result.average_score == round(sum(scores) / len(scores), 2)
+        assert result.band_counts == {"good": 11}
+        assert result.average_score_breakdown == {"robots": round(sum(score % 7 for score in scores) / len(scores), 2)}
+        assert result.pages == []
+        assert "20 URLs but only 12" in result.truncated_warning
+
+    def test_no_successful_pages(self):
+        stats = BatchAuditStats()
+        stats.add(_page("https://example.com/", 0, error="Timeout"))
+        assert stats.average_score == 0.0
+        assert stats.average_band == "critical"
+        assert stats.average_score_breakdown == {}
+        assert stats.top_pages == []
+
+
+class TestIterBatchAudit:
+    """Streaming: ogni pagina arriva appena finisce, con gli aggregati aggiornati."""
+
+    @patch("geo_optimizer.core.batch_audit.fetch_sitemap")
+    @patch("geo_optimizer.core.batch_audit.run_full_audit_async")
+    def test_yields_in_completion_order(self, mock_run_full_audit_async, mock_fetch_sitemap):
+        delays = {"https://example.com/slow": 0.05, "https://example.com/fast": 0.0}
+        mock_fetch_sitemap.return_value = [SitemapUrl(url=url) for url in delays]
+        pools = []
+
+        async def fake_audit(url, **kwargs):
+            await asyncio.sleep(delays[url])
+            pools.append(_active_pool.get())
+            return _make_audit_result(url, 50 if "slow" in url else 80, "good", {"robots": 10})
+
+        mock_run_full_audit_async.side_effect = fake_audit
+        stats = BatchAuditStats()
+
+        async def collect():
+            return [page.url async for page in iter_batch_audit("https://example.com/sitemap.xml", stats=stats)]
+
+        assert asyncio.run(collect()) == ["https://example.com/fast", "https://example.com/slow"]
+        assert stats.audited_urls == 2
+        assert stats.average_score == 65.0
+        assert stats.to_result().sitemap_url == "https://example.com/sitemap.xml"
+        # Both pages share the batch keep-alive pool, the caller's context stays clean
+        assert pools[0] is not None and pools[0] is pools[1]
+        assert _active_pool.get() is None
+
+    @patch("geo_optimizer.core.batch_audit.fetch_sitemap")
+    @patch("geo_optimizer.core.batch_audit.run_full_audit_async")
+    def test_bounded_in_flight_and_cancel_on_break(self, mock_run_full_audit_async, mock_fetch_sitemap):
+        urls = [f"https://example.com/{i}" for i in range(10)]
+        mock_fetch_sitemap.return_value = [SitemapUrl(url=url) for url in urls]
+        started, cancelled = [], []
+
+        async def fake_audit(url, **kwargs):
+            started.append(url)
+            try:
+                await asyncio.sleep(0 if url.endswith("/0") else 10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+            return _make_audit_result(url, 80, "good", {})
+
+        mock_run_full_audit_async.side_effect = fake_audit
+
+        async def first_page():
+            pages = iter_batch_audit("https://example.com/sitemap.xml", concurrency=3, max_urls=10)
+            async for page in pages:
+                await pages.aclose()
+                return page
+
+        assert asyncio.run(first_page()).url == urls[0]
+        # At most 3 in flight plus the one queued when the first finished; the rest never ran
+        assert started[0] == urls[0]
+        assert set(started) <= set(urls[:4])
+        assert sorted(cancelled) == sorted(started[1:])
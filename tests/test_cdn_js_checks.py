@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
 from bs4 import BeautifulSoup
 
-from geo_optimizer.core.audit import audit_cdn_ai_crawler, audit_js_rendering
+from geo_optimizer.core.audit import audit_cdn_ai_crawler, audit_cdn_ai_crawler_async, audit_js_rendering
+from geo_optimizer.utils.http_async import is_httpx_available
 
 # ─── JS Rendering Check (#226) ──────────────────────────────────────────────
 
@@ -280,3 +285,322 @@ class TestCdnAiCrawlerCheck:
 
         assert result.checked is True
         assert "x-vercel-id" in result.cdn_headers
+
+    @patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, ["93.184.216.34"]))
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_bot_probes_run_concurrently_with_timing(self, mock_session_factory, mock_validate):
+        """Bot probes overlap in time and each entry records elapsed_ms."""
+        in_flight = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def side_effect(url, **kwargs):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.text = "x" * 5000
+            resp.content = b"x" * 5000
+            resp.headers = {}
+            if "Chrome/" in kwargs["headers"]["User-Agent"]:
+                return resp
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            return resp
+
+        mock_session = MagicMock()
+        mock_session.get.side_effect = side_effect
+        mock_session_factory.return_value = mock_session
+
+        result = audit_cdn_ai_crawler("https://example.com", max_workers=6)
+
+        assert in_flight["max"] > 1
+        assert [b["bot"] for b in result.bot_results] == [
+            "GPTBot",
+            "OAI-SearchBot",
+            "PerplexityBot",
+            "Claude-SearchBot",
+            "Googlebot",
+            "Applebot",
+        ]
+        assert all(b["elapsed_ms"] >= 40 for b in result.bot_results)
+        assert result.early_abort is False
+
+    @patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, ["93.184.216.34"]))
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_stop_on_challenge_skips_remaining_probes(self, mock_session_factory, mock_validate):
+        """With stop_on_challenge, a confirmed WAF challenge stops further probes."""
+
+        def side_effect(url, **kwargs):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {}
+            if "GPTBot" in kwargs["headers"]["User-Agent"]:
+                resp.text = "Just a moment... checking your browser"
+            else:
+                resp.text = "x" * 5000
+            resp.content = resp.text.encode()
+            return resp
+
+        mock_session = MagicMock()
+        mock_session.get.side_effect = side_effect
+        mock_session_factory.return_value = mock_session
+
+        result = audit_cdn_ai_crawler("https://example.com", max_workers=1, stop_on_challenge=True)
+
+        assert result.checked is True
+        assert result.any_blocked is True
+        assert result.early_abort is True
+        assert [b["bot"] for b in result.bot_results] == ["GPTBot"]
+        # 1 browser baseline + 1 bot probe
+        assert mock_session.get.call_count == 2
+
+    @patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, ["93.184.216.34"]))
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_stop_on_challenge_with_parallel_probes(self, mock_session_factory, mock_validate):
+        """With fewer workers than bots, a challenge stops the queued probes; running ones finish."""
+
+        def side_effect(url, **kwargs):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {}
+            ua = kwargs["headers"]["User-Agent"]
+            if "GPTBot" in ua:
+                resp.text = "Just a moment... checking your browser"
+            else:
+                if "Chrome/" not in ua:
+                    time.sleep(0.05)
+                resp.text = "x" * 5000
+            resp.content = resp.text.encode()
+            return resp
+
+        mock_session = MagicMock()
+        mock_session.get.side_effect = side_effect
+        mock_session_factory.return_value = mock_session
+
+        result = audit_cdn_ai_crawler("https://example.com", max_workers=2, stop_on_challenge=True)
+
+        bots = [b["bot"] for b in result.bot_results]
+        assert result.early_abort is True
+        assert bots[:2] == ["GPTBot", "OAI-SearchBot"]
+        # At most one more probe starts on the freed worker before the queue is cancelled
+        assert len(bots) <= 3
+        assert mock_session.get.call_count == 1 + len(bots)
+
+    @patch("geo_optimizer.core.audit.audit_cdn_ai_crawler")
+    def test_project_config_sets_probe_options(self, mock_cdn):
+        """audit.cdn_workers / audit.cdn_stop_on_challenge reach the probes through the fetcher."""
+        from geo_optimizer.core.audit import SyncAuditFetcher, cdn_probe_options
+        from geo_optimizer.models.config import CDN_PROBE_WORKERS
+        from geo_optimizer.models.project_config import _parse_config
+
+        assert cdn_probe_options(None) == {"cdn_workers": CDN_PROBE_WORKERS, "cdn_stop_on_challenge": False}
+        config = _parse_config({"audit": {"cdn_workers": 2, "cdn_stop_on_challenge": True}})
+        options = cdn_probe_options(config)
+        assert options == {"cdn_workers": 2, "cdn_stop_on_challenge": True}
+
+        SyncAuditFetcher(**options).cdn_check("https://example.com")
+
+        mock_cdn.assert_called_once_with("https://example.com", max_workers=2, stop_on_challenge=True)
+
+    @patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, ["93.184.216.34"]))
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_probes_go_through_the_active_scheduler(self, mock_session_factory, mock_validate):
+        """Inside a crawl every probe takes a scheduler slot and reports its status, without retries."""
+        from geo_optimizer.utils.politeness import FetchScheduler, use_fetch_scheduler
+
+        in_flight = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def side_effect(url, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.01)
+            with lock:
+                in_flight["now"] -= 1
+            throttled = "GPTBot" in kwargs["headers"]["User-Agent"]
+            return MagicMock(status_code=429 if throttled else 200, text="x" * 5000, content=b"x", headers={})
+
+        mock_session = MagicMock()
+        mock_session.get.side_effect = side_effect
+        mock_session_factory.return_value = mock_session
+        scheduler = FetchScheduler(per_host_concurrency=2, max_backoff=0.05)
+
+        with use_fetch_scheduler(scheduler):
+            result = audit_cdn_ai_crawler("https://example.com")
+
+        host = scheduler.stats()["hosts"]["example.com"]
+        assert (host["requests"], host["throttled"]) == (7, 1)
+        assert mock_session.get.call_count == 7
+        assert in_flight["max"] <= 2
+        assert next(b for b in result.bot_results if b["bot"] == "GPTBot")["blocked"] is True
+
+
+# ─── CDN AI Crawler Check — async variant ────────────────────────────────────
+
+
+def _mock_client(handler):
+    import httpx
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=False)
+
+
+@pytest.mark.skipif(not is_httpx_available(), reason="httpx not installed (pip install httpx)")
+class TestCdnAiCrawlerCheckAsync:
+    """Tests for audit_cdn_ai_crawler_async()."""
+
+    @patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, ["93.184.216.34"]))
+    def test_async_probes_connect_to_pinned_ip(self, mock_validate):
+        """Every probe keeps the original URL and runs with the validated IP pinned for its host."""
+        import httpx
+
+        from geo_optimizer.utils.http_async import _pinning_ctx
+
+        seen = []
+
+        def handler(request):
+            seen.append((request.url.host, _pinning_ctx.get(), request.headers["user-agent"]))
+            if "GPTBot" in request.headers["user-agent"]:
+                return httpx.Response(403, text="Forbidden", headers={"server": "cloudflare"})
+            return httpx.Response(200, text="x" * 5000, headers={"server": "cloudflare"})
+
+        async def _run():
+            async with _mock_client(handler) as client:
+                return await audit_cdn_ai_crawler_async("https://example.com", client=client)
+
+        result = asyncio.run(_run())
+
+        assert result.checked is True
+        assert result.cdn_detected == "cloudflare"
+        assert len(result.bot_results) == 6
+        gptbot = next(b for b in result.bot_results if b["bot"] == "GPTBot")
+        assert gptbot["blocked"] is True
+        assert "elapsed_ms" in gptbot
+        assert len(seen) == 7
+        assert all(host == "example.com" and pins == {"example.com": "93.184.216.34"} for host, pins, _ in seen)
+
+    @patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, ["93.184.216.34"]))
+    def test_async_stop_on_challenge(self, mock_validate):
+        import httpx
+
+        def handler(request):
+            if "GPTBot" in request.headers["user-agent"]:
+                return httpx.Response(200, text="cf-browser-verification")
+            return httpx.Response(200, text="x" * 5000)
+
+        async def _run():
+            async with _mock_client(handler) as client:
+                return await audit_cdn_ai_crawler_async(
+                    "https://example.com", client=client, max_concurrency=1, stop_on_challenge=True
+                )
+
+        result = asyncio.run(_run())
+
+        assert result.early_abort is True
+        assert [b["bot"] for b in result.bot_results] == ["GPTBot"]
+
+    @patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, ["93.184.216.34"]))
+    def test_async_probes_go_through_the_active_scheduler(self, mock_validate):
+        import httpx
+
+        from geo_optimizer.utils.politeness import FetchScheduler, use_fetch_scheduler
+
+        def handler(request):
+            if "GPTBot" in request.headers["user-agent"]:
+                return httpx.Response(429, text="Too many requests")
+            return httpx.Response(200, text="x" * 5000)
+
+        scheduler = FetchScheduler(per_host_concurrency=2, max_backoff=0.05)
+
+        async def _run():
+            with use_fetch_scheduler(scheduler):
+                async with _mock_client(handler) as client:
+                    return await audit_cdn_ai_crawler_async("https://example.com", client=client)
+
+        result = asyncio.run(_run())
+
+        host = scheduler.stats()["hosts"]["example.com"]
+        assert (host["requests"], host["throttled"]) == (7, 1)
+        assert len(result.bot_results) == 6
+
+    @patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, ["93.184.216.34"]))
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_sync_and_async_variants_agree(self, mock_session_factory, mock_validate):
+        """Same answers give the same result, and neither variant retries a throttled probe."""
+        import httpx
+
+        def answer(user_agent):
+            if "GPTBot" in user_agent:
+                return 429, "Too many requests", {"retry-after": "120"}
+            if "PerplexityBot" in user_agent:
+                return 200, "Just a moment...", {}
+            return 200, "x" * 5000, {"server": "cloudflare"}
+
+        def sync_get(url, **kwargs):
+            status, text, headers = answer(kwargs["headers"]["User-Agent"])
+            return MagicMock(status_code=status, text=text, content=text.encode(), headers=headers)
+
+        mock_session = MagicMock()
+        mock_session.get.side_effect = sync_get
+        mock_session_factory.return_value = mock_session
+
+        def handler(request):
+            status, text, headers = answer(request.headers["user-agent"])
+            return httpx.Response(status, text=text, headers=headers)
+
+        async def _run():
+            async with _mock_client(handler) as client:
+                return await audit_cdn_ai_crawler_async("https://example.com", client=client)
+
+        sync_result = audit_cdn_ai_crawler("https://example.com")
+        async_result = asyncio.run(_run())
+
+        def without_timing(result):
+            return [{k: v for k, v in entry.items() if k != "elapsed_ms"} for entry in result.bot_results]
+
+        assert without_timing(sync_result) == without_timing(async_result)
+        assert (sync_result.cdn_detected, sync_result.any_blocked) == (async_result.cdn_detected, True)
+        assert mock_session_factory.call_args.kwargs["total_retries"] == 0
+
+    @pytest.mark.parametrize(
+        ("pinned_ips", "expected"),
+        [(["93.184.216.34"], [("93.184.216.34", 443)]), ([], [])],
+    )
+    def test_async_probes_only_reach_the_pinned_ip(self, pinned_ips, expected):
+        """The default client is a pinned one: no pin for the host, no connection at all."""
+        import httpcore
+
+        from geo_optimizer.utils import http_async
+
+        connects = []
+
+        class _OfflineBackend(httpcore.AsyncNetworkBackend):
+            async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+                connects.append((host, port))
+                raise httpcore.ConnectError("offline")
+
+        def _offline_client(*args, **kwargs):
+            client = create_async_client(*args, **kwargs)
+            client._transport._pool._network_backend._backend = _OfflineBackend()
+            return client
+
+        create_async_client = http_async.create_async_client
+        with (
+            patch("geo_optimizer.utils.validators.resolve_and_validate_url", return_value=(True, None, pinned_ips)),
+            patch.object(http_async, "create_async_client", _offline_client),
+        ):
+            result = asyncio.run(audit_cdn_ai_crawler_async("https://example.com"))
+
+        assert result.checked is False
+        assert connects == expected
+
+    @patch(
+        "geo_optimizer.utils.validators.resolve_and_validate_url",
+        return_value=(False, "URL points to a non-public address.", []),
+    )
+    def test_async_unsafe_url(self, mock_validate):
+        result = asyncio.run(audit_cdn_ai_crawler_async("https://internal.example"))
+        assert result.checked is False
+        assert result.error.startswith("Unsafe URL")
@@ -531,7 +531,7 @@ class TestAuditCommand:
         call_args = mock_batch_audit.call_args
         assert call_args[0][0] == "https://example.com/sitemap.xml"
         assert call_args[1]["max_urls"] == 50
-        assert call_args[1]["concurrency"] == 5
+        assert call_args[1]["concurrency"] == 10
 
     @patch("geo_optimizer.cli.audit_cmd.validate_public_url", return_value=(True, None))
     @patch("geo_optimizer.cli.audit_cmd.run_batch_audit")
@@ -552,8 +552,79 @@ class TestAuditCommand:
         mock_batch_audit.assert_called_once()
         assert mock_batch_audit.call_args[1]["max_urls"] == 10
 
+    @patch("geo_optimizer.cli.audit_cmd.validate_public_url", return_value=(True, None))
+    @patch("geo_optimizer.cli.audit_cmd.run_batch_audit")
+    def test_audit_sitemap_workers_option(self, mock_batch_audit, _mock_validate, runner, sample_batch_audit_result):
+        """geo audit --sitemap --workers sets the CPU processes separately from --concurrency."""
+        mock_batch_audit.return_value = sample_batch_audit_result
+        result = runner.invoke(
+            cli,
+            ["audit", "--sitemap", "https://example.com/sitemap.xml", "--workers", "4", "--concurrency", "20"],
+        )
+        assert result.exit_code == 0
+        assert mock_batch_audit.call_args[1]["workers"] == 4
+        assert mock_batch_audit.call_args[1]["concurrency"] == 20
+
+    @patch("geo_optimizer.cli.audit_cmd.validate_public_url", return_value=(True, None))
+    @patch("geo_optimizer.cli.audit_cmd.run_batch_audit")
+    def test_audit_sitemap_ndjson_streams_pages_then_summary(
+        self, mock_batch_audit, _mock_validate, runner, sample_batch_audit_result
+    ):
+        """geo audit --sitemap --format ndjson writes one line per page and a final summary line."""
+        pages = sample_batch_audit_result.pages
+
+        async def fake_iter_batch_audit(sitemap_url, *, stats=None, **kwargs):
+            stats.sitemap_url = sitemap_url
+            stats.discovered_urls = 12
+            for page in pages:
+                stats.add(page)
+                yield page
+
+        with patch("geo_optimizer.cli.audit_cmd.iter_batch_audit", fake_iter_batch_audit):
+            result = runner.invoke(cli, ["audit", "--sitemap", "https://example.com/sitemap.xml", "--format", "ndjson"])
+        assert result.exit_code == 0
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert [line["type"] for line in lines] == ["page", "page", "page", "summary"]
+        assert [line["url"] for line in lines[:3]] == [page.url for page in pages]
+        summary = lines[-1]
+        assert summary["mode"] == "batch"
+        assert summary["average_score"] == 68.5
+        assert summary["band_counts"] == {"good": 1, "foundation": 1}
+        assert summary["failed_urls"] == 1
+        assert "pages" not in summary
+        assert "truncated_warning" in summary
+        mock_batch_audit.assert_not_called()
+
+    @patch("geo_optimizer.cli.audit_cmd.validate_public_url", return_value=(True, None))
+    def test_audit_sitemap_ndjson_to_output_file(self, _mock_validate, runner, sample_batch_audit_result, tmp_path):
+        async def fake_iter_batch_audit(sitemap_url, *, stats=None, **kwargs):
+            for page in sample_batch_audit_result.pages:
+                stats.add(page)
+                yield page
+
+        out = tmp_path / "batch.ndjson"
+        with patch("geo_optimizer.cli.audit_cmd.iter_batch_audit", fake_iter_batch_audit):
+            result = runner.invoke(
+                cli,
+                ["audit", "--sitemap", "https://example.com/sitemap.xml", "--format", "ndjson", "--output", str(out)],
+            )
+        assert result.exit_code == 0
+        assert "Report written to" in result.output
+        lines = out.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 4
+        assert json.loads(lines[-1])["type"] == "summary"
+
+    def test_audit_ndjson_requires_sitemap(self, runner):
+        result = runner.invoke(cli, ["audit", "--url", "https://example.com", "--format", "ndjson"])
+        assert result.exit_code != 0
+        assert "only with '--sitemap'" in result.output
+
+    def test_audit_sitemap_rejects_negative_workers(self, runner):
+        result = runner.invoke(cli, ["audit", "--sitemap", "https://example.com/sitemap.xml", "--workers", "-1"])
+        assert result.exit_code != 0
+
     def test_audit_sitemap_rejects_unsupported_formats(self, runner):
-        """Sitemap mode allows only text/json output formats."""
+        """Sitemap mode allows only text/json/ndjson output formats."""
         result = runner.invoke(cli, ["audit", "--sitemap", "https://example.com/sitemap.xml", "--format", "html"])
         assert result.exit_code != 0
         assert "supports only" in result.output
@@ -1664,16 +1664,14 @@ class TestRunFullAudit:
             text="# My Site\n\n> Desc\n\n## Section\n\n- [Link](https://example.com)\n",
         )
 
-        mock_fetch.side_effect = [
-            (mock_homepage, None),  # homepage
-            (mock_robots, None),  # robots.txt
-            (mock_llms, None),  # llms.txt
-            (None, "Not found"),  # llms-full.txt (optional, 404)
-            (None, "Not found"),  # /.well-known/ai.txt (AI discovery)
-            (None, "Not found"),  # /ai/summary.json (AI discovery)
-            (None, "Not found"),  # /ai/faq.json (AI discovery)
-            (None, "Not found"),  # /ai/service.json (AI discovery)
-        ]
+        # Keyed by URL: sidecar files are fetched concurrently, so call order is not fixed
+        responses = {
+            "https://example.com": (mock_homepage, None),  # homepage
+            "https://example.com/robots.txt": (mock_robots, None),  # robots.txt
+            "https://example.com/llms.txt": (mock_llms, None),  # llms.txt
+        }
+        # llms-full.txt and AI discovery files: optional, 404
+        mock_fetch.side_effect = lambda url: responses.get(url, (None, "Not found"))
 
         result = run_full_audit("https://example.com")
         assert isinstance(result, AuditResult)
@@ -1705,6 +1703,55 @@ class TestRunFullAudit:
         result = run_full_audit("https://example.com/")
         assert result.url == "https://example.com"
 
+    @patch("geo_optimizer.core.audit.fetch_url")
+    def test_full_audit_fetches_sidecars_concurrently(self, mock_fetch):
+        """robots/llms/AI discovery files are fetched in parallel after the homepage."""
+        import threading
+        import time
+
+        html = "<html><head><title>T</title></head><body><p>Hello</p></body></html>"
+        in_flight = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def _fetch(url):
+            if url == "https://example.com":
+                return Mock(status_code=200, text=html, headers={}), None
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            return None, "Not found"
+
+        mock_fetch.side_effect = _fetch
+        result = run_full_audit("https://example.com")
+
+        assert result.http_status == 200
+        assert mock_fetch.call_count == 8
+        assert in_flight["max"] > 1
+
+    @patch("geo_optimizer.core.audit.fetch_url")
+    def test_full_audit_sidecar_threads_share_the_audit_pool(self, mock_fetch):
+        """Worker threads see the http_pool() activated by run_full_audit."""
+        from geo_optimizer.utils.http import _active_pool
+
+        html = "<html><head><title>T</title></head><body><p>Hello</p></body></html>"
+        pools = []
+
+        def _fetch(url):
+            pools.append(_active_pool.get())
+            if url == "https://example.com":
+                return Mock(status_code=200, text=html, headers={}), None
+            return None, "Not found"
+
+        mock_fetch.side_effect = _fetch
+        run_full_audit("https://example.com")
+
+        assert len(pools) == 8
+        assert pools[0] is not None
+        assert all(pool is pools[0] for pool in pools)
+
 
 # ============================================================================
 # 9. LLMS GENERATOR (geo_optimizer.core.llms_generator)
@@ -0,0 +1,138 @@
+"""Tests for the DNS resolution cache of resolve_and_validate_url (utils/validators)."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from geo_optimizer.utils.validators import (
+    DnsCache,
+    dns_cache_stats,
+    resolve_and_validate_url,
+    resolve_and_validate_url_async,
+    validate_public_url,
+)
+
+
+def _answer(*ips: str):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0)) for ip in ips]
+
+
+@pytest.fixture
+def dns():
+    """Patched getaddrinfo: example.com is public, internal.example resolves to a private IP."""
+    answers = {"example.com": _answer("93.184.216.34"), "internal.example": _answer("10.0.0.5")}
+    calls = []
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        calls.append((host, threading.get_ident()))
+        if host not in answers:
+            raise socket.gaierror("unknown host")
+        return answers[host]
+
+    with patch("geo_optimizer.utils.validators.socket.getaddrinfo", side_effect=fake_getaddrinfo):
+        yield calls
+
+
+class TestResolveAndValidateUrl:
+    def test_validated_host_is_resolved_once(self, dns):
+        before = dns_cache_stats()
+        first = resolve_and_validate_url("https://example.com/robots.txt")
+        second = resolve_and_validate_url("https://EXAMPLE.com/llms.txt")
+        assert validate_public_url("http://example.com/") == (True, None)
+
+        assert first == second == (True, None, ["93.184.216.34"])
+        assert len(dns) == 1
+        after = dns_cache_stats()
+        assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (2, 1)
+
+    @pytest.mark.parametrize("url", ["https://internal.example/", "https://unknown.example/"])
+    def test_blocked_and_unresolvable_hosts_are_not_cached(self, dns, url):
+        for _ in range(2):
+            ok, _err, ips = resolve_and_validate_url(url)
+            assert (ok, ips) == (False, [])
+
+        assert len(dns) == 2
+        assert dns_cache_stats()["entries"] == 0
+
+    def test_expired_entry_is_resolved_again(self, dns):
+        resolve_and_validate_url("https://example.com/")
+        with patch("geo_optimizer.utils.validators.time.monotonic", return_value=time.monotonic() + 61):
+            resolve_and_validate_url("https://example.com/")
+
+        assert len(dns) == 2
+
+    def test_invalid_url_never_reaches_dns(self, dns):
+        assert resolve_and_validate_url("ftp://example.com/")[0] is False
+        assert resolve_and_validate_url("http://localhost/")[0] is False
+        assert dns == []
+
+
+class TestResolveAndValidateUrlAsync:
+    def test_lookup_runs_off_the_event_loop(self, dns):
+        async def main():
+            loop_thread = threading.get_ident()
+            first = await resolve_and_validate_url_async("https://example.com/")
+            second = await resolve_and_validate_url_async("https://example.com/sitemap.xml")
+            return loop_thread, first, second
+
+        loop_thread, first, second = asyncio.run(main())
+
+        assert first == second == (True, None, ["93.184.216.34"])
+        assert len(dns) == 1
+        assert dns[0][1] != loop_thread
+
+    def test_slow_lookup_does_not_stall_other_coroutines(self):
+        def slow_getaddrinfo(host, port, *args, **kwargs):
+            time.sleep(0.2)
+            return _answer("93.184.216.34")
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.ensure_future(ticker())
+            result = await resolve_and_validate_url_async("https://slow.example/")
+            task.cancel()
+            return result, ticks
+
+        with patch("geo_optimizer.utils.validators.socket.getaddrinfo", side_effect=slow_getaddrinfo):
+            result, ticks = asyncio.run(main())
+
+        assert result[0] is True
+        assert ticks >= 5
+
+    def test_blocked_host(self, dns):
+        ok, err, ips = asyncio.run(resolve_and_validate_url_async("https://internal.example/"))
+        assert (ok, ips) == (False, [])
+        assert "non-public" in err
+
+
+class TestDnsCache:
+    def test_least_recently_used_hosts_are_dropped(self):
+        cache = DnsCache(max_entries=2)
+        cache.put("a.example", ["93.184.216.1"])
+        cache.put("b.example", ["93.184.216.2"])
+        cache.get("a.example")
+        cache.put("c.example", ["93.184.216.3"])
+
+        assert cache.get("b.example") is None
+        assert cache.get("a.example") == ["93.184.216.1"]
+        assert cache.stats() == {"entries": 2, "hits": 2, "misses": 0}
+
+    def test_returned_list_is_a_copy(self):
+        cache = DnsCache()
+        cache.put("a.example", ["93.184.216.1"])
+        cache.get("a.example").append("10.0.0.1")
+
+        assert cache.get("a.example") == ["93.184.216.1"]
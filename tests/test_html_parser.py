@@ -0,0 +1,94 @@
+"""Tests for the HTML parser backend (utils/html_parser) and the html.parser/lxml differential."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from pathlib import Path
+
+import pytest
+
+from geo_optimizer.core import audit as audit_mod
+from geo_optimizer.models.project_config import ProjectConfig, _parse_config
+from geo_optimizer.models.results import CdnAiCrawlerResult
+from geo_optimizer.utils.html_parser import parse_html, resolve_html_parser
+
+_PAGES = Path(__file__).parent / "fixtures" / "pages"
+
+# Pages whose markup both builders read the same way: the audit must not change at all
+_WELL_FORMED = ["blog_article.html", "faq_howto.html", "product_page.html", "spa_shell.html"]
+
+
+class _Response:
+    status_code = 200
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode()
+
+
+def _audit(html: str, parser: str) -> dict:
+    page = audit_mod._parse_homepage(_Response(html), parser)
+    result = audit_mod._analyze(
+        "https://example.com", page, dict.fromkeys(audit_mod._SIDECAR_PATHS), CdnAiCrawlerResult(), {}
+    )
+    data = dataclasses.asdict(result)
+    data.pop("timestamp", None)
+    return data
+
+
+@pytest.fixture(autouse=True)
+def _no_env(monkeypatch):
+    monkeypatch.delenv("GEO_HTML_PARSER", raising=False)
+
+
+class TestResolveHtmlParser:
+    def test_default_is_html_parser(self):
+        assert resolve_html_parser() == "html.parser"
+
+    def test_env_var_and_argument(self, monkeypatch):
+        monkeypatch.setenv("GEO_HTML_PARSER", "LXML")
+        assert resolve_html_parser() == "lxml"
+        assert resolve_html_parser("html.parser") == "html.parser"
+
+    def test_auto_is_lxml(self):
+        assert resolve_html_parser("auto") == "lxml"
+
+    def test_unknown_parser_falls_back_with_warning(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="geo_optimizer.utils.html_parser"):
+            assert resolve_html_parser("selectolax") == "html.parser"
+        assert "Unknown HTML parser" in caplog.text
+
+
+class TestProjectConfig:
+    def test_audit_parser_is_read_from_yaml(self):
+        assert _parse_config({"audit": {"parser": "lxml"}}).audit.parser == "lxml"
+        assert _parse_config({"audit": {}}).audit.parser is None
+
+    def test_pipeline_uses_configured_parser(self):
+        config = ProjectConfig()
+        config.audit.parser = "html.parser"
+        assert audit_mod._html_parser(config) == "html.parser"
+        assert audit_mod._html_parser(None) is None
+
+
+class TestDifferential:
+    """Audits parsed with lxml must score exactly like the html.parser default."""
+
+    def test_parse_html_uses_lxml_builder(self):
+        assert parse_html("<p>x</p>", "lxml").builder.NAME == "lxml"
+
+    @pytest.mark.parametrize("name", _WELL_FORMED)
+    def test_well_formed_pages_score_the_same(self, name):
+        html = (_PAGES / name).read_text(encoding="utf-8")
+        assert _audit(html, "lxml") == _audit(html, "html.parser")
+
+    def test_broken_markup_keeps_the_overall_score(self):
+        # Unclosed <p> tags nest under html.parser and are closed by lxml, so the
+        # citability detectors see different paragraphs; the GEO score does not move.
+        html = (_PAGES / "messy_cms.html").read_text(encoding="utf-8")
+        fast, default = _audit(html, "lxml"), _audit(html, "html.parser")
+        assert fast["score"] == default["score"]
+        for section in ("robots", "llms", "schema", "meta", "content", "signals", "js_rendering"):
+            assert fast[section] == default[section], section
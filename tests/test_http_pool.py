@@ -0,0 +1,141 @@
+"""Tests for the keep-alive HTTP client pool (HttpClientPool / http_pool)."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from geo_optimizer.utils.http import HttpClientPool, _active_pool, fetch_url, get_shared_pool, http_pool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):  # noqa: N802
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/robots.txt")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = f"path={self.path}".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Local keep-alive server; loopback is allowed by lifting the SSRF block for the test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with patch("geo_optimizer.utils.validators._check_ip_blocked", return_value=(False, None)):
+        yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpClientPool:
+    """Session keying and lifecycle."""
+
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_same_host_and_ip_reuses_session(self, mock_create):
+        mock_create.side_effect = lambda **kwargs: MagicMock()
+        pool = HttpClientPool()
+        s1 = pool.session_for("https://example.com/", ["93.184.216.34"])
+        s2 = pool.session_for("https://example.com/robots.txt", ["93.184.216.34"])
+        assert s1 is s2
+        assert pool.stats() == {"sessions": 1, "created": 1, "reused": 1}
+
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_different_pinned_ip_gets_own_session(self, mock_create):
+        """A new pinned IP never reuses a connection opened to the previous one."""
+        mock_create.side_effect = lambda **kwargs: MagicMock()
+        pool = HttpClientPool()
+        s1 = pool.session_for("https://example.com/", ["93.184.216.34"])
+        s2 = pool.session_for("https://example.com/", ["93.184.216.35"])
+        assert s1 is not s2
+        assert mock_create.call_args.kwargs["pinned_ips"] == ["93.184.216.35"]
+
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_lru_eviction_closes_oldest_session(self, mock_create):
+        mock_create.side_effect = lambda **kwargs: MagicMock()
+        pool = HttpClientPool(max_sessions=2)
+        first = pool.session_for("https://a.example/", ["93.184.216.1"])
+        pool.session_for("https://b.example/", ["93.184.216.2"])
+        pool.session_for("https://c.example/", ["93.184.216.3"])
+        first.close.assert_called_once()
+        assert pool.stats()["sessions"] == 2
+
+    @patch("geo_optimizer.utils.http.create_session_with_retry")
+    def test_close_releases_all_sessions(self, mock_create):
+        session = MagicMock()
+        mock_create.return_value = session
+        with HttpClientPool() as pool:
+            pool.session_for("https://example.com/", ["93.184.216.34"])
+        session.close.assert_called_once()
+
+
+class TestHttpPoolContext:
+    """http_pool() activation, nesting and shared mode."""
+
+    def test_nested_http_pool_reuses_outer_pool(self):
+        with http_pool() as outer, http_pool() as inner:
+            assert inner is outer
+        assert _active_pool.get() is None
+
+    def test_shared_pool_is_process_wide(self):
+        with http_pool(shared=True) as pool:
+            assert pool is get_shared_pool()
+        assert _active_pool.get() is None
+
+
+class TestFetchUrlPooled:
+    """fetch_url over real keep-alive connections to a local stub server."""
+
+    def test_unpooled_fetches_open_one_connection_each(self, stub_server):
+        server, base = stub_server
+        for path in ("/", "/robots.txt", "/llms.txt"):
+            r, err = fetch_url(base + path)
+            assert err is None
+        assert server.connections == 3
+
+    def test_pooled_fetches_share_one_connection(self, stub_server):
+        server, base = stub_server
+        with http_pool() as pool:
+            for path in ("/", "/robots.txt", "/llms.txt", "/ai/faq.json"):
+                r, err = fetch_url(base + path)
+                assert err is None
+                assert r.text == f"path={path}"
+        assert server.connections == 1
+        assert pool.stats()["created"] == 1
+
+    def test_pooled_redirect_still_revalidated(self, stub_server):
+        """Redirect hops inside a pool still go through resolve_and_validate_url."""
+        _server, base = stub_server
+        from geo_optimizer.utils import validators
+
+        with (
+            http_pool(),
+            patch.object(validators, "resolve_and_validate_url", wraps=validators.resolve_and_validate_url) as spy,
+        ):
+            r, err = fetch_url(base + "/redirect")
+        assert err is None
+        assert r.text == "path=/robots.txt"
+        assert spy.call_count == 2
@@ -0,0 +1,181 @@
+"""Tests for conditional revalidation (ETag / Last-Modified) in fetch_url and fetch_url_async."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from geo_optimizer.models.results import CachedResponse
+from geo_optimizer.utils.cache import FileCache, SqliteCache
+from geo_optimizer.utils.http import fetch_url
+
+_LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+class _ValidatorHandler(BaseHTTPRequestHandler):
+    """/etag and /modified answer conditional requests with 304; /plain has no validators."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.server.requests.append((self.path, dict(self.headers)))
+        if self.path == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+            return self._reply(304, b"", {"ETag": '"v1"'})
+        if self.path == "/modified" and self.headers.get("If-Modified-Since") == _LAST_MODIFIED:
+            return self._reply(304, b"", {})
+        if self.path == "/error":
+            return self._reply(503, b"busy", {})
+        validators = {"/etag": {"ETag": '"v1"'}, "/modified": {"Last-Modified": _LAST_MODIFIED}}
+        self._reply(200, f"body of {self.path}".encode(), validators.get(self.path, {}))
+
+    def _reply(self, status: int, body: bytes, headers: dict) -> None:
+        self.send_response(status)
+        for name, value in {"Content-Type": "text/plain; charset=utf-8", **headers}.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Local server; loopback is allowed by lifting the SSRF block for the test."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ValidatorHandler)
+    httpd.daemon_threads = True
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    with patch("geo_optimizer.utils.validators._check_ip_blocked", return_value=(False, None)):
+        yield httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestFetchUrlRevalidation:
+    def test_fresh_entry_skips_the_request(self, server, tmp_path):
+        httpd, base = server
+        cache = SqliteCache(cache_dir=tmp_path)
+        first, _ = fetch_url(base + "/etag", cache=cache)
+        second, err = fetch_url(base + "/etag", cache=cache)
+
+        assert err is None
+        assert first.text == second.text == "body of /etag"
+        assert isinstance(second, CachedResponse)
+        assert len(httpd.requests) == 1
+
+    @pytest.mark.parametrize(
+        ("path", "header", "value"),
+        [("/etag", "If-None-Match", '"v1"'), ("/modified", "If-Modified-Since", _LAST_MODIFIED)],
+    )
+    def test_stale_entry_is_revalidated(self, server, tmp_path, path, header, value):
+        httpd, base = server
+        cache = SqliteCache(cache_dir=tmp_path)
+        fetch_url(base + path, cache=cache)
+        cache.ttl = 0
+        time.sleep(0.01)
+
+        r, err = fetch_url(base + path, cache=cache)
+
+        assert err is None
+        assert r.status_code == 200
+        assert r.text == f"body of {path}"
+        sent = httpd.requests[-1][1]
+        assert sent[header] == value
+        # The 304 made the entry fresh again: the next call needs no request
+        cache.ttl = 60
+        fetch_url(base + path, cache=cache)
+        assert len(httpd.requests) == 2
+
+    def test_entry_without_validators_is_refetched(self, server, tmp_path):
+        httpd, base = server
+        cache = SqliteCache(cache_dir=tmp_path, ttl=0)
+        fetch_url(base + "/plain", cache=cache)
+        time.sleep(0.01)
+        r, _ = fetch_url(base + "/plain", cache=cache)
+
+        assert r.text == "body of /plain"
+        assert "If-None-Match" not in httpd.requests[-1][1]
+        assert len(httpd.requests) == 2
+
+    def test_server_errors_are_not_cached(self, server, tmp_path):
+        _httpd, base = server
+        cache = SqliteCache(cache_dir=tmp_path)
+        r, _ = fetch_url(base + "/error", cache=cache)
+        assert r.status_code == 503
+        assert cache.lookup(base + "/error") is None
+
+    def test_file_cache_revalidates_too(self, server, tmp_path):
+        httpd, base = server
+        cache = FileCache(cache_dir=tmp_path, ttl=0)
+        fetch_url(base + "/etag", cache=cache)
+        time.sleep(0.01)
+        r, _ = fetch_url(base + "/etag", cache=cache)
+
+        assert r.text == "body of /etag"
+        assert httpd.requests[-1][1]["If-None-Match"] == '"v1"'
+
+
+class TestFetchUrlAsyncRevalidation:
+    @pytest.fixture(autouse=True)
+    def _httpx(self):
+        pytest.importorskip("httpx")
+
+    def test_stale_entry_is_revalidated(self, server, tmp_path):
+        from geo_optimizer.utils.http_async import fetch_url_async
+
+        httpd, base = server
+        cache = SqliteCache(cache_dir=tmp_path, ttl=0)
+
+        async def fetch_twice():
+            first = await fetch_url_async(base + "/etag", cache=cache)
+            await asyncio.sleep(0.01)
+            return first, await fetch_url_async(base + "/etag", cache=cache)
+
+        (first, _), (second, err) = asyncio.run(fetch_twice())
+
+        assert err is None
+        assert first.text == second.text == "body of /etag"
+        assert isinstance(second, CachedResponse)
+        assert httpd.requests[-1][1]["If-None-Match"] == '"v1"'
+
+    def test_fresh_entry_skips_the_request(self, server, tmp_path):
+        from geo_optimizer.utils.http_async import fetch_url_async
+
+        httpd, base = server
+        cache = SqliteCache(cache_dir=tmp_path)
+        asyncio.run(fetch_url_async(base + "/plain", cache=cache))
+        r, _ = asyncio.run(fetch_url_async(base + "/plain", cache=cache))
+
+        assert r.text == "body of /plain"
+        assert len(httpd.requests) == 1
+
+
+class TestCacheRefresh:
+    def test_sqlite_expired_entry_with_validators_is_kept(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path, ttl=0)
+        cache.put("https://example.com/a", 200, "a", {"ETag": '"a"'})
+        cache.put("https://example.com/b", 200, "b", {})
+        time.sleep(0.01)
+
+        assert cache.get("https://example.com/a") is None
+        assert cache.get("https://example.com/b") is None
+        assert cache.lookup("https://example.com/a").etag == '"a"'
+        assert cache.lookup("https://example.com/b") is None
+
+    def test_refresh_updates_validators(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path, ttl=60)
+        cache.put("https://example.com/", 200, "x", {"ETag": '"old"'})
+        cache.refresh("https://example.com/", {"etag": '"new"'})
+
+        entry = cache.lookup("https://example.com/")
+        assert entry.etag == '"new"'
+        assert entry.is_fresh(60)
+        assert entry.conditional_headers() == {"If-None-Match": '"new"'}
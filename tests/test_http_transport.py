@@ -0,0 +1,134 @@
+"""Tests for the pinned httpx transport and the shared async client (utils/http_transport, utils/http_async)."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from geo_optimizer.utils.http_async import (  # noqa: E402
+    _pinning_ctx,
+    create_async_client,
+    fetch_url_async,
+    use_async_client,
+)
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Answers with the local IP the connection arrived on; /hop redirects to b.example."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.server.requests.append((self.connection.getsockname()[0], self.headers.get("Host")))
+        if self.path == "/hop":
+            self.send_response(302)
+            self.send_header("Location", f"http://b.example:{self.server.server_address[1]}/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = self.connection.getsockname()[0].encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Server on every loopback address; a.example -> 127.0.0.1, b.example -> 127.0.0.2.
+
+    The names exist only in the patched validator DNS: a connection that
+    resolved them again instead of using the pin would fail.
+    """
+    httpd = ThreadingHTTPServer(("", 0), _EchoHandler)
+    httpd.daemon_threads = True
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    answers = {"a.example": "127.0.0.1", "b.example": "127.0.0.2"}
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        if host not in answers:
+            raise socket.gaierror("unknown host")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (answers[host], 0))]
+
+    with (
+        patch("geo_optimizer.utils.validators.socket.getaddrinfo", side_effect=fake_getaddrinfo),
+        patch("geo_optimizer.utils.validators._check_ip_blocked", return_value=(False, None)),
+    ):
+        yield httpd, httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestPinnedTransport:
+    def test_connection_goes_to_the_validated_ip(self, server):
+        httpd, port = server
+
+        r, err = asyncio.run(fetch_url_async(f"http://a.example:{port}/"))
+
+        assert err is None
+        assert r.text == "127.0.0.1"
+        assert httpd.requests == [("127.0.0.1", f"a.example:{port}")]
+
+    def test_concurrent_fetches_keep_their_own_pin(self, server):
+        httpd, port = server
+
+        async def main():
+            async with create_async_client() as client:
+                return await asyncio.gather(
+                    *(
+                        fetch_url_async(f"http://{host}:{port}/", client=client)
+                        for host in ["a.example", "b.example"] * 5
+                    )
+                )
+
+        results = asyncio.run(main())
+
+        assert [r.text for r, _err in results] == ["127.0.0.1", "127.0.0.2"] * 5
+        assert _pinning_ctx.get() is None
+
+    def test_redirect_is_pinned_to_the_new_host(self, server):
+        httpd, port = server
+
+        r, err = asyncio.run(fetch_url_async(f"http://a.example:{port}/hop"))
+
+        assert err is None
+        assert [ip for ip, _host in httpd.requests] == ["127.0.0.1", "127.0.0.2"]
+
+    def test_request_without_a_pin_is_refused(self, server):
+        _httpd, port = server
+
+        async def main():
+            async with create_async_client() as client:
+                await client.get(f"http://127.0.0.1:{port}/")
+
+        with pytest.raises(httpx.ConnectError, match="No validated IP"):
+            asyncio.run(main())
+
+
+class TestUseAsyncClient:
+    def test_active_client_is_reused_and_left_open(self, server):
+        httpd, port = server
+
+        async def main():
+            async with create_async_client() as client:
+                with use_async_client(client):
+                    first, _ = await fetch_url_async(f"http://a.example:{port}/")
+                    second, _ = await fetch_url_async(f"http://a.example:{port}/")
+                return first, second, client.is_closed
+
+        first, second, closed = asyncio.run(main())
+
+        assert first.text == second.text == "127.0.0.1"
+        assert closed is False
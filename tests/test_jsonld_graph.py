@@ -0,0 +1,80 @@
+"""Tests for the per-page JSON-LD graph (JsonLdGraph)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from geo_optimizer.core.audit_schema import audit_schema
+from geo_optimizer.core.citability import detect_blog_structure
+from geo_optimizer.core.jsonld_graph import JsonLdGraph
+from geo_optimizer.core.page_index import PageIndex
+
+_YOAST_GRAPH = {
+    "@context": "https://schema.org",
+    "@graph": [
+        {"@type": "Organization", "@id": "https://example.com/#org", "name": "Acme", "sameAs": ["https://x.com/a"]},
+        {"@type": "WebSite", "@id": "https://example.com/#website", "name": "Acme", "inLanguage": "en"},
+        {
+            "@type": ["Article", "BlogPosting"],
+            "@id": "https://example.com/post#article",
+            "headline": "Hello",
+            "author": {"@id": "https://example.com/#person"},
+            "datePublished": "2026-01-10",
+        },
+        {"@graph": [{"@type": "Person", "@id": "https://example.com/#person", "name": "Jane"}]},
+    ],
+}
+
+
+def _soup(*blocks: str) -> BeautifulSoup:
+    scripts = "".join(f'<script type="application/ld+json">{b}</script>' for b in blocks)
+    return BeautifulSoup(f"<html><head>{scripts}</head><body><p>x</p></body></html>", "html.parser")
+
+
+class TestJsonLdGraph:
+    def test_graph_is_unpacked_in_document_order(self):
+        graph = JsonLdGraph.from_soup(_soup(json.dumps(_YOAST_GRAPH), '{"@type": "Product", "name": "Widget"}'))
+        assert [e.get("name") or e.get("headline") for e in graph] == ["Acme", "Acme", "Hello", "Jane", "Widget"]
+        assert graph.types == ["Organization", "WebSite", "Article", "BlogPosting", "Person", "Product"]
+
+    def test_type_id_and_property_lookups(self):
+        graph = JsonLdGraph.from_soup(_soup(json.dumps(_YOAST_GRAPH)))
+        article = graph.first_of_type("NewsArticle", "BlogPosting", "Article")
+        assert article["headline"] == "Hello"
+        assert graph.of_type("BlogPosting", "Article") == [article]
+        assert graph.get(article["author"]["@id"])["name"] == "Jane"
+        assert graph.first("inLanguage") == "en"
+        assert [e["name"] for e in graph.with_property("sameAs")] == ["Acme"]
+        assert graph.has_type("Person") and not graph.has_type("Product")
+        assert graph.first_of_type("Product") is None
+
+    def test_blank_malformed_and_oversized_blocks(self):
+        with patch("geo_optimizer.core.jsonld_graph.SCHEMA_JSONLD_MAX_BYTES", 40):
+            graph = JsonLdGraph.from_soup(
+                _soup("   ", "{broken", '{"@type": "Thing"}', json.dumps({"@type": "Thing", "name": "x" * 50}))
+            )
+        assert graph.blocks == [{"@type": "Thing"}]
+        assert graph.parse_errors == 1
+
+    def test_non_dict_items_are_dropped(self):
+        graph = JsonLdGraph.from_soup(_soup('[1, "x", {"@type": "Thing"}]'))
+        assert len(graph) == 1
+
+
+class TestSharedGraph:
+    def test_each_script_parsed_once_per_page(self):
+        soup = _soup(json.dumps(_YOAST_GRAPH))
+        index = PageIndex(soup)
+        with patch("geo_optimizer.core.jsonld_graph.json.loads", wraps=json.loads) as spy:
+            schema = audit_schema(soup, "https://example.com", index=index)
+            detect_blog_structure(soup, index=index)
+        assert spy.call_count == 1
+        assert schema.has_organization and schema.has_article
+
+    def test_audit_schema_counts_parse_errors_from_graph(self):
+        result = audit_schema(_soup("{broken", '{"@type": "Organization", "name": "Acme"}'), "https://example.com")
+        assert result.json_parse_errors == 1
+        assert result.has_organization
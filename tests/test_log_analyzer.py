@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from geo_optimizer.core.log_analyzer import _match_bot, _parse_line, analyze_log_file
+import gzip
+from unittest.mock import patch
+
+import pytest
+
+from geo_optimizer.core.log_analyzer import (
+    _BOT_UA_FRAGMENTS,
+    _PREFILTER_ANCHORS,
+    _LogAggregate,
+    _match_bot,
+    _parse_line,
+    _scan_range,
+    _UniqueCounter,
+    analyze_log_file,
+)
 
 _COMBINED_LINES = [
     '1.2.3.4 - - [16/Apr/2026:10:00:00 +0200] "GET /blog/guide HTTP/1.1" 200 5432 "-" "Mozilla/5.0 (compatible; GPTBot/1.0)"',
@@ -52,6 +66,12 @@ class TestMatchBot:
     def test_case_insensitive(self):
         assert _match_bot("gptbot/1.0") == "GPTBot"
 
+    def test_registry_order_decides_between_overlapping_fragments(self):
+        # "Applebot-Extended" contains "applebot" and is listed first in AI_BOTS
+        assert _match_bot("Mozilla/5.0 (Applebot-Extended/0.1)") == "Applebot-Extended"
+        assert _match_bot("Applebot/0.1") == "Applebot"
+        assert _match_bot("ClaudeBot/1.0 GPTBot/1.0") == "GPTBot"
+
 
 class TestAnalyzeLogFile:
     def test_combined_log(self, tmp_path):
@@ -105,3 +125,199 @@ class TestAnalyzeLogFile:
         claude = next(b for b in result.bots if b.bot_name == "ClaudeBot")
         assert claude.visits == 2
         assert claude.unique_pages == 2
+
+
+def _bot_lines(count: int) -> list[str]:
+    bots = ["GPTBot/1.0", "ClaudeBot/1.0", "Mozilla/5.0 (Windows NT 10.0)", "PerplexityBot/1.0"]
+    return [
+        f'1.2.3.4 - - [{1 + i % 28:02d}/Apr/2026:10:00:00 +0200] "GET /p{i % 37} HTTP/1.1" 200 1 "-" "{bots[i % 4]}"'
+        for i in range(count)
+    ]
+
+
+def _summary(result):
+    return (
+        result.total_lines,
+        result.ai_requests,
+        result.date_range_start,
+        result.date_range_end,
+        [(b.bot_name, b.visits, b.unique_pages, b.first_seen, b.last_seen) for b in result.bots],
+        sorted((p.path, p.total_visits, tuple(p.bots)) for p in result.top_pages),
+    )
+
+
+class TestLargeLogs:
+    def test_byte_ranges_cover_every_line_once(self, tmp_path):
+        log = tmp_path / "access.log"
+        log.write_text("\n".join(_bot_lines(500)) + "\n")
+        size = log.stat().st_size
+
+        for workers in (2, 3, 7):
+            step = -(-size // workers)
+            aggregate = _LogAggregate()
+            for start in range(0, size, step):
+                aggregate.merge(_scan_range(str(log), start, min(start + step, size), "combined"))
+            assert _summary(aggregate.to_result(str(log))) == _summary(analyze_log_file(log, workers=0))
+
+    def test_parallel_scan_matches_sequential(self, tmp_path):
+        log = tmp_path / "access.log"
+        log.write_text("\n".join(_bot_lines(400)))
+
+        with patch("geo_optimizer.core.log_analyzer._PARALLEL_MIN_BYTES", 1):
+            parallel = analyze_log_file(log, workers=2)
+
+        assert _summary(parallel) == _summary(analyze_log_file(log, workers=0))
+        assert parallel.total_lines == 400
+
+    def test_no_line_ceiling_and_max_lines(self, tmp_path):
+        log = tmp_path / "access.log"
+        log.write_text("\n".join(_bot_lines(2000)))
+
+        assert analyze_log_file(log).total_lines == 2000
+        assert analyze_log_file(log, max_lines=10).total_lines == 10
+
+    def test_dates_are_ordered_chronologically(self, tmp_path):
+        log = tmp_path / "access.log"
+        log.write_text(
+            "\n".join(
+                [
+                    _COMBINED_LINES[1].replace("16/Apr/2026", "02/May/2026"),
+                    _COMBINED_LINES[2].replace("16/Apr/2026", "30/Apr/2026"),
+                ]
+            )
+        )
+
+        claude = analyze_log_file(log).bots[0]
+
+        assert (claude.first_seen[:11], claude.last_seen[:11]) == ("30/Apr/2026", "02/May/2026")
+
+    def test_gzip_log(self, tmp_path):
+        log = tmp_path / "access.log.1.gz"
+        log.write_bytes(gzip.compress("\n".join(_COMBINED_LINES).encode()))
+
+        result = analyze_log_file(log)
+
+        assert (result.total_lines, result.ai_requests) == (5, 4)
+
+    def test_zstd_log(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        log = tmp_path / "access.log.1.zst"
+        log.write_bytes(zstandard.ZstdCompressor().compress("\n".join(_COMBINED_LINES).encode()))
+
+        result = analyze_log_file(log)
+
+        assert (result.total_lines, result.ai_requests) == (5, 4)
+
+
+class TestPrefilter:
+    def test_anchors_cover_every_fragment(self):
+        assert all(any(anchor.decode() in fragment for anchor in _PREFILTER_ANCHORS) for fragment in _BOT_UA_FRAGMENTS)
+        assert len(_PREFILTER_ANCHORS) < len(_BOT_UA_FRAGMENTS)
+
+    def test_prefiltered_scan_matches_parsing_every_line(self, tmp_path):
+        lines = _bot_lines(300) + [
+            "",
+            "garbage without a user agent",
+            '1.2.3.4 - - [18/Apr/2026:10:00:00 +0200] "GET /robots.txt HTTP/1.1" 200 1 "-" "meta-externalagent/1.1"',
+            '1.2.3.4 - - [18/Apr/2026:10:00:00 +0200] "GET /bot-page HTTP/1.1" 200 1 "-" "Mozilla/5.0"',
+            '1.2.3.4 - - [18/Apr/2026:11:00:00 +0200] "GET /x HTTP/1.1" 200 1 "-" "CHATGPT-USER/1.0"',
+        ]
+        log = tmp_path / "access.log"
+        log.write_text("\n".join(lines))
+        every_line = _LogAggregate()
+        every_line.scan(log.read_bytes().splitlines(keepends=True))
+
+        with patch("geo_optimizer.core.log_analyzer._BLOCK_BYTES", 1000):
+            prefiltered = analyze_log_file(log)
+
+        assert _summary(prefiltered) == _summary(every_line.to_result(str(log)))
+        assert prefiltered.total_lines == len(lines)
+
+    def test_json_format_is_detected_once_per_file(self, tmp_path):
+        log = tmp_path / "access.json"
+        log.write_text("\n" + "\n".join(_JSON_LINES * 3) + "\n")
+
+        result = analyze_log_file(log)
+
+        assert (result.total_lines, result.ai_requests) == (7, 6)
+
+
+class TestUniqueCounter:
+    def test_exact_while_small(self):
+        counter = _UniqueCounter()
+        for i in range(500):
+            counter.add(f"/p{i % 100}")
+        assert len(counter) == 100
+
+    def test_sketch_estimate_and_merge(self):
+        left, right = _UniqueCounter(), _UniqueCounter()
+        for i in range(30_000):
+            left.add(f"/left/{i}")
+            right.add(f"/shared/{i % 10_000}")
+        left.merge(right)
+
+        assert abs(len(left) - 40_000) < 40_000 * 0.05
+
+    def test_merge_of_small_counters_stays_exact(self):
+        left, right = _UniqueCounter(), _UniqueCounter()
+        left.add("/a")
+        right.add("/a")
+        right.add("/b")
+        left.merge(right)
+
+        assert len(left) == 2
+
+
+class TestTopPagesSummary:
+    """Past the tracking limit the page counts are a space-saving summary with an error bound."""
+
+    @staticmethod
+    def _stream(seed: int, n: int) -> list[str]:
+        import random
+
+        rng = random.Random(seed)
+        # A few heavy pages among a long tail of pages visited about once
+        return [f"/hot/{rng.randrange(5)}" if rng.random() < 0.2 else f"/tail/{seed}/{i}" for i in range(n)]
+
+    @staticmethod
+    def _assert_bounds(aggregate: _LogAggregate, paths: list[str]) -> None:
+        from collections import Counter
+
+        truth = Counter(paths)
+        for path, visits in truth.items():
+            page = aggregate.pages.get(path)
+            if page is None:
+                assert visits <= aggregate.pages_floor
+            else:
+                assert page[0] - page[2] <= visits <= page[0]
+        top = aggregate.to_result("access.log").top_pages
+        assert {p.path for p in top[:5]} == {f"/hot/{i}" for i in range(5)}
+
+    def test_single_stream_keeps_heavy_pages_with_error_bound(self):
+        paths = self._stream(1, 3000)
+        aggregate = _LogAggregate()
+        with patch("geo_optimizer.core.log_analyzer._MAX_TRACKED_PAGES", 100):
+            for path in paths:
+                aggregate.add("GPTBot", path, "")
+
+        assert aggregate.pages_floor > 0
+        assert len(aggregate.pages) <= 100
+        self._assert_bounds(aggregate, paths)
+
+    def test_merge_of_pruned_workers_keeps_error_bound(self):
+        streams = [self._stream(seed, 2000) for seed in (1, 2, 3)]
+        merged = _LogAggregate()
+        with patch("geo_optimizer.core.log_analyzer._MAX_TRACKED_PAGES", 100):
+            for paths in streams:
+                worker = _LogAggregate()
+                for path in paths:
+                    worker.add("GPTBot", path, "")
+                merged.merge(worker)
+
+        self._assert_bounds(merged, [path for paths in streams for path in paths])
+
+    def test_small_logs_are_exact(self, tmp_path):
+        log = tmp_path / "access.log"
+        log.write_text("\n".join(_COMBINED_LINES))
+        result = analyze_log_file(log)
+        assert all(page.visits_error == 0 for page in result.top_pages)
@@ -0,0 +1,202 @@
+"""Tests for incremental log ingestion (core/log_ingest) and `geo logs ingest` / `geo logs hits`."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, timedelta
+
+import pytest
+from click.testing import CliRunner
+
+from geo_optimizer.cli.main import cli
+from geo_optimizer.core.log_ingest import CrawlerLogStore, ingest_log_file
+from geo_optimizer.core.monitor import build_passive_monitor_result
+from geo_optimizer.models.results import AuditResult
+
+
+def _line(day: int, path: str, ua: str) -> str:
+    return f'1.2.3.4 - - [{day:02d}/Apr/2026:10:00:00 +0200] "GET {path} HTTP/1.1" 200 1 "-" "{ua}"\n'
+
+
+_APRIL_30 = date(2026, 4, 30)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CrawlerLogStore(tmp_path / "tracking.db")
+
+
+def _append(log, *lines: str) -> None:
+    with log.open("a") as f:
+        f.write("".join(lines))
+
+
+class TestIngest:
+    def test_only_new_complete_lines_are_read(self, tmp_path, store):
+        log = tmp_path / "access.log"
+        _append(log, _line(1, "/pricing", "GPTBot/1.0"), _line(1, "/", "Mozilla/5.0"))
+
+        first = ingest_log_file(log, store)
+        again = ingest_log_file(log, store)
+        _append(log, _line(2, "/pricing", "GPTBot/1.0"), _line(2, "/docs", "ClaudeBot/1.0")[:30])
+        partial = ingest_log_file(log, store)
+        _append(log, _line(2, "/docs", "ClaudeBot/1.0")[30:])
+        rest = ingest_log_file(log, store)
+
+        assert (first.lines_read, first.ai_requests) == (2, 1)
+        assert (again.lines_read, again.start_offset) == (0, first.end_offset)
+        assert (partial.lines_read, rest.lines_read) == (1, 1)
+        assert rest.end_offset == log.stat().st_size
+        assert store.count_hits(bot="GPTBot", path="/pricing", days=30, until=_APRIL_30) == 2
+        assert store.count_hits(bot="GPTBot", path="/pricing", days=29, until=_APRIL_30) == 1
+        assert store.bot_hits(days=30, until=_APRIL_30) == {"GPTBot": 2, "ClaudeBot": 1}
+
+    def test_rename_rotation_drains_the_old_file(self, tmp_path, store):
+        log = tmp_path / "access.log"
+        _append(log, _line(1, "/a", "GPTBot/1.0"))
+        ingest_log_file(log, store)
+        _append(log, _line(1, "/b", "GPTBot/1.0"))
+        os.rename(log, tmp_path / "access.log.1")
+        _append(log, _line(2, "/c", "GPTBot/1.0"))
+
+        result = ingest_log_file(log, store)
+
+        assert result.rotated is True
+        assert result.rotated_file.endswith("access.log.1")
+        assert (result.lines_read, result.start_offset) == (2, 0)
+        assert store.count_hits(bot="GPTBot", days=30, until=_APRIL_30) == 3
+
+    def test_copytruncate_rotation(self, tmp_path, store):
+        log = tmp_path / "access.log"
+        _append(log, _line(1, "/a", "GPTBot/1.0"))
+        ingest_log_file(log, store)
+        _append(log, _line(1, "/b", "GPTBot/1.0"))
+        (tmp_path / "access.log.1").write_bytes(log.read_bytes())
+        log.write_text("")
+        _append(log, _line(2, "/c", "ClaudeBot/1.0"))
+
+        result = ingest_log_file(log, store)
+
+        assert result.rotated is True
+        assert store.bot_hits(days=30, until=_APRIL_30) == {"GPTBot": 2, "ClaudeBot": 1}
+
+    def test_replaced_file_without_rotated_copy_restarts(self, tmp_path, store):
+        log = tmp_path / "access.log"
+        _append(log, _line(1, "/a", "GPTBot/1.0"), _line(1, "/b", "GPTBot/1.0"))
+        ingest_log_file(log, store)
+        log.unlink()
+        _append(log, _line(3, "/new", "GPTBot/1.0"))
+
+        result = ingest_log_file(log, store)
+
+        assert (result.rotated, result.rotated_file, result.lines_read) == (True, "", 1)
+        assert store.count_hits(path="/new", days=30, until=_APRIL_30) == 1
+
+    def test_hits_are_kept_per_site(self, tmp_path, store):
+        shop, blog = tmp_path / "shop.log", tmp_path / "blog.log"
+        _append(shop, _line(1, "/", "GPTBot/1.0"), _line(1, "/", "GPTBot/1.0"))
+        _append(blog, _line(1, "/", "GPTBot/1.0"))
+
+        assert ingest_log_file(shop, store, site="https://www.Shop.example/").site == "shop.example"
+        ingest_log_file(blog, store, site="blog.example")
+
+        assert store.count_hits(site="shop.example", path="/", days=30, until=_APRIL_30) == 2
+        assert store.bot_hits(site="www.blog.example", days=30, until=_APRIL_30) == {"GPTBot": 1}
+        assert store.count_hits(path="/", days=30, until=_APRIL_30) == 3
+        assert store.bot_hits(site="other.example", days=30, until=_APRIL_30) == {}
+
+    def test_table_without_site_is_migrated(self, tmp_path):
+        import sqlite3
+
+        db = tmp_path / "tracking.db"
+        with sqlite3.connect(db) as conn:
+            conn.execute(
+                "CREATE TABLE crawler_hits (day TEXT NOT NULL, bot TEXT NOT NULL, path TEXT NOT NULL, "
+                "hits INTEGER NOT NULL, PRIMARY KEY (day, bot, path))"
+            )
+            conn.execute("INSERT INTO crawler_hits VALUES ('2026-04-01', 'GPTBot', '/', 4)")
+        conn.close()
+
+        store = CrawlerLogStore(db)
+        log = tmp_path / "access.log"
+        _append(log, _line(1, "/", "GPTBot/1.0"))
+        ingest_log_file(log, store, site="example.com")
+
+        assert store.count_hits(site="", days=30, until=_APRIL_30) == 4
+        assert store.count_hits(site="example.com", days=30, until=_APRIL_30) == 1
+        assert store.count_hits(days=30, until=_APRIL_30) == 5
+
+
+class TestCli:
+    def test_ingest_and_hits(self, tmp_path):
+        log = tmp_path / "access.log"
+        _append(log, _line(1, "/pricing", "GPTBot/1.0"), _line(1, "/pricing", "ClaudeBot/1.0"))
+        db = str(tmp_path / "tracking.db")
+        runner = CliRunner()
+
+        ingested = runner.invoke(
+            cli,
+            ["logs", "ingest", "--file", str(log), "--site", "example.com", "--tracking-db", db, "--format", "json"],
+        )
+        hits = runner.invoke(cli, ["logs", "hits", "--path", "/pricing", "--days", "10000", "--tracking-db", db])
+        other = runner.invoke(
+            cli, ["logs", "hits", "--site", "other.example", "--days", "10000", "--tracking-db", db, "--format", "json"]
+        )
+
+        assert ingested.exit_code == 0, ingested.output
+        assert json.loads(ingested.output)[0]["ai_requests"] == 2
+        assert json.loads(ingested.output)[0]["site"] == "example.com"
+        assert hits.exit_code == 0, hits.output
+        assert "hits on /pricing in the last 10000 days: 2" in hits.output
+        assert json.loads(other.output)["hits"] == 0
+
+    def test_one_shot_analysis_still_works(self, tmp_path):
+        log = tmp_path / "access.log"
+        _append(log, _line(1, "/pricing", "GPTBot/1.0"))
+
+        result = CliRunner().invoke(cli, ["logs", "--file", str(log), "--format", "json"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["ai_requests"] == 1
+
+    def test_file_is_required_without_subcommand(self):
+        result = CliRunner().invoke(cli, ["logs"])
+
+        assert result.exit_code != 0
+        assert "Missing option '--file'" in result.output
+
+
+class TestMonitorSignal:
+    def test_crawler_activity_is_reported_outside_the_score(self):
+        audit = AuditResult(url="https://example.com", score=70, band="good")
+
+        without = build_passive_monitor_result(audit)
+        quiet = build_passive_monitor_result(audit, crawler_hits={"Bytespider": 3}, crawler_days=30)
+
+        signal = quiet.signals[-1]
+        assert (signal.key, signal.status, signal.details["total_hits"]) == ("crawler_activity", "partial", 3)
+        assert quiet.visibility_score == without.visibility_score
+        assert any("citation bot hits" in item for item in quiet.recommendations)
+
+    def test_monitor_counts_only_the_monitored_site(self, tmp_path):
+        from unittest.mock import patch
+
+        from geo_optimizer.core.monitor import run_passive_monitor
+
+        # Yesterday: inside the window whatever the offset between local time and UTC
+        day = date.today() - timedelta(days=1)
+        line = _line(day.day, "/", "GPTBot/1.0").replace("Apr/2026", day.strftime("%b/%Y"))
+        store = CrawlerLogStore(tmp_path / "tracking.db")
+        for site, visits in (("example.com", 2), ("other.example", 5)):
+            log = tmp_path / f"{site}.log"
+            _append(log, *[line] * visits)
+            ingest_log_file(log, store, site=site)
+
+        audit = AuditResult(url="https://example.com", score=70, band="good")
+        with patch("geo_optimizer.core.monitor.run_full_audit", return_value=audit):
+            result = run_passive_monitor(
+                "www.example.com", save_history=False, history_db=tmp_path / "tracking.db", crawler_days=30
+            )
+
+        assert result.signals[-1].details["total_hits"] == 2
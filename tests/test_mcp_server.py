@@ -107,6 +107,21 @@ class TestGeoCompareToolAdditional:
         assert has_error
         assert has_score
 
+    @patch("geo_optimizer.core.audit.run_full_audit")
+    def test_compare_audits_duplicate_sites_once(self, mock_audit):
+        """The same site listed twice (with and without trailing slash) is audited once."""
+        mock_result = MagicMock()
+        mock_result.score = 80
+        mock_result.band = "good"
+        mock_result.score_breakdown = {}
+        mock_result.recommendations = []
+        mock_audit.return_value = mock_result
+
+        data = json.loads(geo_compare("example.com, https://EXAMPLE.com/, https://www.example.com"))
+
+        assert [item["score"] for item in data["comparison"]] == [80, 80, 80]
+        assert mock_audit.call_count == 2
+
 
 # ─── Tests: geo_negative_signals (not covered by test_mcp.py) ─────────────────
 
@@ -0,0 +1,213 @@
+"""Tests for the single-pass DOM index shared by the sub-audits (PageIndex)."""
+
+from __future__ import annotations
+
+import copy
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from geo_optimizer.core import audit as audit_mod
+from geo_optimizer.core.audit_content import audit_content_quality
+from geo_optimizer.core.audit_rag import audit_rag_readiness
+from geo_optimizer.core.citability import audit_citability
+from geo_optimizer.core.page_index import CLEAN_TEXT_EXCLUDE, PageIndex, get_page_index
+
+_HTML = """<!DOCTYPE html>
+<html lang="en"><head>
+<title>Acme</title>
+<meta name="description" content="Acme analytics">
+<meta property="og:title" content="Acme">
+<link rel="canonical" href="https://example.com/">
+<script type="application/ld+json">{"@type": "Organization", "name": "Acme"}</script>
+<script type="application/ld+json">{not json</script>
+<style>p { color: red }</style>
+</head><body>
+<header><nav><a href="/">Home</a><a href="/about">About</a></nav></header>
+<main id="content">
+  <h1 class="title main">Acme Analytics</h1>
+  <p>Acme is a data platform. It was founded in 2019.</p>
+  <h2>Pricing</h2>
+  <p class="lead">Plans start at <a href="https://stripe.com/pricing" rel="nofollow">$10</a> per month.</p>
+  <script>var hidden = "not content";</script>
+  <ul><li>Fast</li><li>Private</li></ul>
+  <h2>FAQ</h2>
+  <details><summary>Is it free?</summary><p>There is a free tier.</p></details>
+  <img src="/a.png" alt="Dashboard">
+  <div data-role="card" aria-hidden="true"><p>Nested <b>bold</b> text</p></div>
+</main>
+<footer><p>Copyright Acme</p><a href="https://twitter.com/acme">Twitter</a></footer>
+</body></html>"""
+
+
+@pytest.fixture
+def soup():
+    return BeautifulSoup(_HTML, "html.parser")
+
+
+@pytest.fixture
+def index(soup):
+    return PageIndex(soup)
+
+
+class TestFindAll:
+    """Indexed queries return exactly what BeautifulSoup returns, in document order."""
+
+    @pytest.mark.parametrize(
+        "args, kwargs",
+        [
+            (("p",), {}),
+            ((["h1", "h2", "h3"],), {}),
+            ((re.compile(r"^h[1-6]$"),), {}),
+            ((True,), {}),
+            (("a",), {"href": True}),
+            (("a",), {"href": re.compile(r"^https://")}),
+            (("meta",), {"attrs": {"name": "description"}}),
+            (("p",), {"class_": "lead"}),
+            ((), {"class_": "main"}),
+            ((), {"attrs": {"class": lambda c: c and "title" in str(c)}}),
+            ((), {"attrs": {"aria-hidden": "true"}}),
+            (("script",), {"type": "application/ld+json"}),
+            (("a",), {"rel": "nofollow"}),
+            (("span",), {}),
+        ],
+    )
+    def test_matches_beautifulsoup(self, soup, index, args, kwargs):
+        assert index.find_all(*args, **kwargs) == soup.find_all(*args, **kwargs)
+        assert all(a is b for a, b in zip(index.find_all(*args, **kwargs), soup.find_all(*args, **kwargs)))
+
+    def test_within_restricts_to_subtree(self, soup, index):
+        main = soup.find("main")
+        assert index.find_all("p", within=main) == main.find_all("p")
+        assert index.find_all("a", href=True, within=soup.find("footer")) == soup.find("footer").find_all(
+            "a", href=True
+        )
+
+    def test_within_foreign_tag_falls_back_to_beautifulsoup(self, soup, index):
+        main_copy = copy.deepcopy(soup.find("main"))
+        assert index.find_all("p", within=main_copy) == main_copy.find_all("p")
+
+    def test_find_and_limit(self, soup, index):
+        assert index.find("h2") is soup.find("h2")
+        assert index.find("table") is None
+        assert len(index.find_all("p", limit=2)) == 2
+
+    @pytest.mark.parametrize("kwargs", [{"string": "Fast"}, {"text": re.compile("Acme")}, {"recursive": False}])
+    def test_non_attribute_keywords_are_rejected(self, soup, index, kwargs):
+        with pytest.raises(TypeError, match=next(iter(kwargs))):
+            index.find_all("li", **kwargs)
+        with pytest.raises(TypeError):
+            index.find("li", within=soup.find("main"), **kwargs)
+
+    def test_contains(self, soup, index):
+        main = soup.find("main")
+        assert index.contains(main, soup.find("h1"))
+        assert not index.contains(main, soup.find("footer").find("p"))
+        assert not index.contains(main, main)
+
+    def test_shortcut_properties(self, soup, index):
+        assert index.headings == soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
+        assert index.links == soup.find_all("a", href=True)
+        assert index.images == soup.find_all("img")
+        assert index.meta_tags == soup.find_all("meta")
+        assert index.paragraphs == soup.find_all("p")
+
+
+class TestText:
+    def test_text_matches_get_text_and_is_memoized(self, soup, index):
+        main = soup.find("main")
+        first = index.text(main, separator=" ", strip=True)
+        assert first == main.get_text(separator=" ", strip=True)
+        assert index.text(main, separator=" ", strip=True) is first
+
+    def test_clean_text_matches_decomposed_copy(self, soup, index):
+        clean = copy.deepcopy(soup)
+        for tag in clean(list(CLEAN_TEXT_EXCLUDE)):
+            tag.decompose()
+        assert index.clean_text == clean.get_text(separator=" ", strip=True)
+        assert "Home" not in index.clean_text
+        assert "not content" not in index.clean_text
+
+    def test_clean_text_of_subtree_matches_decomposed_copy(self, soup, index):
+        main = soup.find("main")
+        clean = copy.deepcopy(main)
+        for tag in clean(list(CLEAN_TEXT_EXCLUDE)):
+            tag.decompose()
+        assert index.clean_text_of(main) == clean.get_text(separator=" ", strip=True)
+        assert "not content" not in index.clean_text_of(main)
+
+    def test_text_does_not_mutate_soup(self, soup, index):
+        before = str(soup)
+        _ = index.clean_text
+        _ = index.sections()
+        assert str(soup) == before
+
+    def test_sections_split_on_headings(self, index):
+        sections = index.sections()
+        assert len(sections) == 3
+        assert sections[1].startswith("Plans start at $10")
+        assert "not content" not in sections[1]
+
+
+class TestStructuredData:
+    def test_jsonld_skips_malformed_blocks(self, index):
+        assert index.jsonld.blocks == [{"@type": "Organization", "name": "Acme"}]
+        assert index.jsonld.parse_errors == 1
+        assert index.jsonld is index.jsonld
+
+    def test_html_is_serialised_once(self, soup, index):
+        assert index.html == str(soup)
+        assert index.html is index.html
+
+
+class TestSharing:
+    def test_get_page_index_reuses_matching_index(self, soup, index):
+        assert get_page_index(soup, index) is index
+        other = BeautifulSoup(_HTML, "html.parser")
+        assert get_page_index(other, index) is not index
+
+    def test_citability_same_with_and_without_shared_index(self, soup, index):
+        shared = audit_citability(soup, "https://example.com", index=index)
+        fresh = audit_citability(BeautifulSoup(_HTML, "html.parser"), "https://example.com")
+        assert shared.total_score == fresh.total_score
+        assert [(m.name, m.score, m.detected) for m in shared.methods] == [
+            (m.name, m.score, m.detected) for m in fresh.methods
+        ]
+
+    def test_rag_same_with_index_and_soup_clean(self, soup, index):
+        clean = copy.deepcopy(soup)
+        for tag in clean(["script", "style"]):
+            tag.decompose()
+        assert audit_rag_readiness(soup, soup_clean=clean) == audit_rag_readiness(soup, index=index)
+
+
+class TestNoCopies:
+    """The audit reads clean text through the index view, never from a deep copy of the soup."""
+
+    def test_parse_and_analyze_never_deepcopy(self, monkeypatch):
+        class _Response:
+            text = _HTML
+            status_code = 200
+            headers = {"Content-Type": "text/html"}
+
+        def _no_copy(*args, **kwargs):
+            raise AssertionError("the audit must not deep-copy the soup")
+
+        monkeypatch.setattr(copy, "deepcopy", _no_copy)
+        page = audit_mod._parse_homepage(_Response())
+        result = audit_mod._analyze(
+            "https://example.com", page, dict.fromkeys(audit_mod._SIDECAR_PATHS), audit_mod.CdnAiCrawlerResult(), {}
+        )
+        assert result.content.word_count > 0
+        assert result.citability.total_score > 0
+
+    def test_content_same_with_and_without_shared_index(self, soup, index):
+        clean = copy.deepcopy(soup)
+        for tag in clean(["script", "style"]):
+            tag.decompose()
+        shared = audit_content_quality(soup, "https://example.com", index=index)
+        fresh = audit_content_quality(BeautifulSoup(_HTML, "html.parser"), "https://example.com")
+        legacy = audit_content_quality(soup, "https://example.com", soup_clean=clean)
+        assert shared == fresh == legacy
+        assert shared.word_count == len(clean.get_text(separator=" ", strip=True).split())
@@ -0,0 +1,246 @@
+"""Tests for the per-host politeness scheduler (utils/politeness) and its use by the fetch functions."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+import requests
+
+from geo_optimizer.utils.http import _execute_request, create_session_with_retry
+from geo_optimizer.utils.politeness import (
+    FetchScheduler,
+    active_scheduler,
+    observe_response,
+    parse_retry_after,
+    robots_txt_url,
+    use_fetch_scheduler,
+    wait_for_excluding_queue,
+)
+
+
+def _timed_requests(scheduler: FetchScheduler, url: str, count: int) -> float:
+    started = time.monotonic()
+    for _ in range(count):
+        with scheduler.slot(url):
+            pass
+    return time.monotonic() - started
+
+
+class TestRateAndConcurrency:
+    def test_crawl_delay_spaces_requests_to_its_host_only(self):
+        scheduler = FetchScheduler()
+        scheduler.set_crawl_delay("https://slow.example/robots.txt", 0.1)
+
+        assert _timed_requests(scheduler, "https://slow.example/a", 3) >= 0.19
+        assert _timed_requests(scheduler, "https://fast.example/a", 3) < 0.05
+
+    def test_in_flight_requests_are_capped_per_host(self):
+        scheduler = FetchScheduler(per_host_concurrency=2)
+        peak = {"a.example": 0, "b.example": 0}
+        lock = threading.Lock()
+
+        def fetch(host):
+            with scheduler.slot(f"https://{host}/"):
+                with lock:
+                    peak[host] = max(peak[host], scheduler.stats()["hosts"][host]["in_flight"])
+                time.sleep(0.02)
+
+        threads = [threading.Thread(target=fetch, args=(host,)) for host in ["a.example", "b.example"] * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == {"a.example": 2, "b.example": 2}
+        assert scheduler.stats()["in_flight"] == 0
+
+    def test_global_cap_and_queue_depth(self):
+        scheduler = FetchScheduler(max_concurrency=1)
+
+        async def main():
+            async def fetch(url):
+                async with scheduler.slot_async(url):
+                    await asyncio.sleep(0.05)
+
+            tasks = [
+                asyncio.ensure_future(fetch(f"https://{host}/")) for host in ("a.example", "b.example", "c.example")
+            ]
+            await asyncio.sleep(0.01)
+            stats = scheduler.stats()
+            await asyncio.gather(*tasks)
+            return stats
+
+        stats = asyncio.run(main())
+
+        assert (stats["in_flight"], stats["waiting"]) == (1, 2)
+        assert scheduler.stats()["waiting"] == 0
+
+    def test_cancelled_waiter_leaves_the_queue(self):
+        scheduler = FetchScheduler(per_host_concurrency=1)
+
+        async def main():
+            await scheduler.acquire_async("https://a.example/")
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(scheduler.acquire_async("https://a.example/"), timeout=0.05)
+
+        asyncio.run(main())
+
+        assert scheduler.stats()["hosts"]["a.example"]["waiting"] == 0
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            FetchScheduler(per_host_concurrency=0)
+
+
+class TestAdaptiveBackoff:
+    def test_retry_after_blocks_the_host(self):
+        scheduler = FetchScheduler(max_backoff=0.1)
+
+        assert scheduler.record("https://a.example/x", 429, "30") == 0.1
+        assert _timed_requests(scheduler, "https://a.example/y", 1) >= 0.09
+        assert _timed_requests(scheduler, "https://b.example/y", 1) < 0.05
+        assert scheduler.stats()["throttled"] == 1
+
+    def test_backoff_grows_without_retry_after_and_recovers(self):
+        scheduler = FetchScheduler()
+        waits = [scheduler.record("https://a.example/", 503) for _ in range(3)]
+        assert waits == [1.0, 2.0, 4.0]
+        assert scheduler.stats()["hosts"]["a.example"]["interval"] == 1.0
+
+        for _ in range(30):
+            scheduler.record("https://a.example/", 200)
+        assert scheduler.stats()["hosts"]["a.example"]["interval"] == 0.0
+
+    def test_recovery_stops_at_the_crawl_delay(self):
+        scheduler = FetchScheduler()
+        scheduler.set_crawl_delay("https://a.example/", 0.5)
+        scheduler.record("https://a.example/", 429, "0")
+        for _ in range(30):
+            scheduler.record("https://a.example/", 200)
+
+        assert scheduler.stats()["hosts"]["a.example"]["interval"] == 0.5
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("120", 120.0), (" 7 ", 7.0), (None, None), ("", None), ("soon", None), ("-3", None)],
+    )
+    def test_parse_retry_after_seconds(self, value, expected):
+        assert parse_retry_after(value) == expected
+
+    def test_parse_retry_after_http_date(self):
+        assert 25 < parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+        assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+
+
+class TestContext:
+    def test_nested_activation_keeps_the_outer_scheduler(self):
+        outer, inner = FetchScheduler(), FetchScheduler()
+        with use_fetch_scheduler(outer), use_fetch_scheduler(inner) as active:
+            assert active is outer
+        assert active_scheduler() is None
+
+    def test_robots_txt_crawl_delay_is_learnt(self):
+        scheduler = FetchScheduler()
+        robots = Mock(status_code=200, text="User-agent: *\nCrawl-delay: 5\n")
+
+        observe_response("https://a.example/robots.txt", robots)  # no active scheduler: ignored
+        with use_fetch_scheduler(scheduler):
+            observe_response("https://a.example/page", robots)  # not a robots.txt
+            observe_response(robots_txt_url("https://b.example/sitemap.xml"), robots)
+
+        assert list(scheduler.stats()["hosts"]) == ["b.example"]
+        assert scheduler.stats()["hosts"]["b.example"]["interval"] == 5.0
+
+
+class TestPageTimeout:
+    def test_crawl_delay_wait_is_not_charged_to_the_timeout(self):
+        scheduler = FetchScheduler()
+        scheduler.set_crawl_delay("https://slow.example/robots.txt", 0.1)
+
+        async def page():
+            # Three fetches 0.1s apart: twice the timeout, all of it queued
+            for _ in range(2):
+                async with scheduler.slot_async("https://slow.example/a"):
+                    pass
+            await asyncio.to_thread(scheduler.acquire, "https://slow.example/b")
+            scheduler.release("https://slow.example/b")
+            return "done"
+
+        assert asyncio.run(wait_for_excluding_queue(page(), timeout=0.1)) == "done"
+
+    def test_time_outside_the_queue_still_times_out(self):
+        async def main():
+            with pytest.raises(asyncio.TimeoutError):
+                await wait_for_excluding_queue(asyncio.sleep(1), timeout=0.05)
+
+        started = time.monotonic()
+        asyncio.run(main())
+
+        assert time.monotonic() - started < 0.5
+
+
+class TestFetchIntegration:
+    def test_sync_request_is_recorded(self):
+        scheduler = FetchScheduler()
+        session = MagicMock()
+        ok = Mock(status_code=200, headers={})
+        session.get.side_effect = [Mock(status_code=429, headers={"Retry-After": "0"}), ok]
+
+        with use_fetch_scheduler(scheduler):
+            r = _execute_request(session, "https://a.example/", timeout=10)
+
+        assert r is ok
+        assert session.get.call_count == 2
+        assert scheduler.stats()["hosts"]["a.example"]["throttled"] == 1
+
+    def test_sync_session_leaves_throttling_to_the_scheduler(self):
+        without = create_session_with_retry().get_adapter("https://a.example/").max_retries
+        with use_fetch_scheduler(FetchScheduler()):
+            scheduled = create_session_with_retry().get_adapter("https://a.example/").max_retries
+
+        assert {429, 503} <= set(without.status_forcelist)
+        assert without.respect_retry_after_header is True
+        assert not {429, 503} & set(scheduled.status_forcelist)
+        assert 500 in scheduled.status_forcelist
+        assert scheduled.respect_retry_after_header is False
+
+    def test_sync_retry_waits_in_the_scheduler(self):
+        scheduler = FetchScheduler(max_backoff=0.05)
+        session = MagicMock()
+        session.get.side_effect = [requests.exceptions.Timeout("slow"), Mock(status_code=200, headers={})]
+
+        started = time.monotonic()
+        with use_fetch_scheduler(scheduler):
+            r = _execute_request(session, "https://a.example/", timeout=10)
+
+        assert r.status_code == 200
+        assert session.get.call_count == 2
+        assert 0.04 <= time.monotonic() - started < 0.5
+
+    def test_async_fetch_retries_throttled_answer(self):
+        from geo_optimizer.utils.http_async import fetch_url_async
+
+        throttled = Mock(status_code=429, headers={"retry-after": "0"}, content=b"")
+        ok = Mock(status_code=200, headers={}, content=b"ok")
+        client = AsyncMock()
+        client.get = AsyncMock(side_effect=[throttled, ok])
+        scheduler = FetchScheduler()
+
+        async def main():
+            with use_fetch_scheduler(scheduler):
+                return await fetch_url_async("https://a.example/", client=client)
+
+        with patch(
+            "geo_optimizer.utils.validators.resolve_and_validate_url_async",
+            AsyncMock(return_value=(True, None, ["93.184.216.34"])),
+        ):
+            r, err = asyncio.run(main())
+
+        assert (r, err) == (ok, None)
+        assert client.get.await_count == 2
+        assert scheduler.stats()["hosts"]["a.example"]["requests"] == 2
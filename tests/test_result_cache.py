@@ -0,0 +1,280 @@
+"""Tests for the audit result cache (utils/cache.AuditResultCache, core/audit.audit_fingerprint)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import pickle
+import sqlite3
+import time
+import zlib
+from unittest.mock import Mock, patch
+
+import pytest
+
+from geo_optimizer.core import audit
+from geo_optimizer.core.audit import (
+    _SIDECAR_PATHS,
+    AuditInputs,
+    audit_fingerprint,
+    run_full_audit,
+    run_full_audit_async,
+)
+from geo_optimizer.core.registry import CheckRegistry, CheckResult
+from geo_optimizer.models.results import AuditResult, CachedResponse, CdnAiCrawlerResult
+from geo_optimizer.utils.cache import AuditResultCache
+
+_HOMEPAGE = "<html lang='en'><head><title>Example</title></head><body><h1>Example</h1><p>Hello.</p></body></html>"
+
+
+def _response(text: str, headers: dict | None = None, status: int = 200) -> CachedResponse:
+    return CachedResponse(status_code=status, text=text, content=b"", headers=headers or {})
+
+
+def _inputs(homepage: str = _HOMEPAGE, headers: dict | None = None, robots: str = "User-agent: *\n") -> AuditInputs:
+    sidecars = dict.fromkeys(_SIDECAR_PATHS)
+    sidecars["/robots.txt"] = _response(robots)
+    return AuditInputs(
+        base_url="https://example.com",
+        response=_response(homepage, headers),
+        sidecars=sidecars,
+        cdn_result=CdnAiCrawlerResult(
+            checked=True, bot_results=[{"bot": "GPTBot", "blocked": False, "elapsed_ms": 12}]
+        ),
+    )
+
+
+class _StaticCheck:
+    name = "static_check"
+    description = "Always passes"
+    max_score = 10
+
+    def run(self, url, soup=None, **kwargs):
+        return CheckResult(name=self.name, score=10, passed=True)
+
+
+_unpickled: list[str] = []
+
+
+def _record_unpickling():
+    _unpickled.append("called")
+
+
+class _PickledPayload:
+    def __reduce__(self):
+        return _record_unpickling, ()
+
+
+class TestAuditResultCache:
+    def test_round_trip(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path)
+        cache.put("abc", "https://example.com", AuditResult(url="https://example.com", score=71, band="good"))
+
+        hit = cache.get("abc")
+        assert (hit.url, hit.score, hit.band) == ("https://example.com", 71, "good")
+        assert cache.get("other") is None
+        assert cache.stats() == {"entries": 1}
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path, ttl=60)
+        cache.put("abc", "https://example.com", AuditResult(url="https://example.com"))
+
+        with patch("geo_optimizer.utils.cache.time.time", return_value=time.time() + 3600):
+            assert cache.get("abc") is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path, max_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, "https://example.com", AuditResult(url=key))
+            time.sleep(0.01)
+        assert cache.get("a") is not None  # "b" becomes the least recently used
+
+        cache.put("c", "https://example.com", AuditResult(url="c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").url == "a"
+        assert cache.get("c").url == "c"
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path)
+        cache.put("abc", "https://example.com", AuditResult(url="https://example.com"))
+        conn = sqlite3.connect(cache.db_path)
+        conn.execute("UPDATE results SET result = ?", (b"not a pickle",))
+        conn.commit()
+        conn.close()
+
+        assert cache.get("abc") is None
+
+    def test_full_result_is_stored_as_json(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path)
+        result = audit.analyze_audit_inputs(_inputs())
+        result.extra_checks = {"static_check": {"score": 10, "details": {"pair": ("a", 1)}}}
+        cache.put("abc", "https://example.com", result)
+
+        conn = sqlite3.connect(cache.db_path)
+        blob = conn.execute("SELECT result FROM results").fetchone()[0]
+        conn.close()
+
+        assert json.loads(zlib.decompress(blob))["url"] == "https://example.com"
+        assert cache.get("abc") == result
+
+    def test_pickled_entry_is_a_miss_and_never_loaded(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path)
+        cache.put("abc", "https://example.com", AuditResult(url="https://example.com"))
+        conn = sqlite3.connect(cache.db_path)
+        conn.execute("UPDATE results SET result = ?", (zlib.compress(pickle.dumps(_PickledPayload())),))
+        conn.commit()
+        conn.close()
+
+        assert cache.get("abc") is None
+        assert _unpickled == []
+
+    def test_entry_naming_a_foreign_type_is_a_miss(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path)
+        cache.put("abc", "https://example.com", AuditResult(url="https://example.com"))
+        conn = sqlite3.connect(cache.db_path)
+        payload = json.dumps({"__result__": "pathlib:Path", "url": "x"}).encode()
+        conn.execute("UPDATE results SET result = ?", (zlib.compress(payload),))
+        conn.commit()
+        conn.close()
+
+        assert cache.get("abc") is None
+
+    def test_clear(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path / "missing")
+        assert cache.clear() == 0
+        cache.put("a", "https://example.com", AuditResult(url="a"))
+        assert cache.clear() == 1
+        assert cache.stats() == {"entries": 0}
+
+
+class TestAuditFingerprint:
+    def test_stable_for_the_same_content(self):
+        assert audit_fingerprint(_inputs()) == audit_fingerprint(_inputs())
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            _inputs(homepage=_HOMEPAGE.replace("Hello", "Ciao")),
+            _inputs(robots="User-agent: GPTBot\nDisallow: /\n"),
+            _inputs(headers={"X-Robots-Tag": "noindex"}),
+            _inputs(headers={"Strict-Transport-Security": "max-age=31536000"}),
+        ],
+    )
+    def test_changes_with_what_the_audit_reads(self, changed):
+        assert audit_fingerprint(changed) != audit_fingerprint(_inputs())
+
+    def test_ignores_volatile_details(self):
+        inputs = _inputs(headers={"Date": "Wed, 01 Jan 2025 00:00:00 GMT", "CF-Ray": "abc"})
+        inputs.cdn_result.bot_results[0]["elapsed_ms"] = 999
+        inputs.cdn_result.bot_results[0]["content_length"] = 12345
+
+        assert audit_fingerprint(inputs) == audit_fingerprint(_inputs())
+
+    def test_cdn_outcome_can_be_left_out(self):
+        blocked = _inputs()
+        blocked.cdn_result.bot_results[0]["blocked"] = True
+
+        assert audit_fingerprint(blocked) != audit_fingerprint(_inputs())
+        assert audit_fingerprint(blocked, cdn=False) == audit_fingerprint(_inputs(), cdn=False)
+        assert audit_fingerprint(_inputs(robots="User-agent: GPTBot\nDisallow: /\n"), cdn=False) != audit_fingerprint(
+            _inputs(), cdn=False
+        )
+
+    def test_changes_with_scoring_version_and_plugins(self, monkeypatch):
+        baseline = audit_fingerprint(_inputs())
+
+        with patch.dict(audit.SCORING, {"robots_found": audit.SCORING["robots_found"] + 1}):
+            assert audit_fingerprint(_inputs()) != baseline
+
+        monkeypatch.setattr("geo_optimizer.__version__", "0.0.0-test")
+        assert audit_fingerprint(_inputs()) != baseline
+        monkeypatch.undo()
+
+        CheckRegistry.register(_StaticCheck())
+        try:
+            assert audit_fingerprint(_inputs()) != baseline
+        finally:
+            CheckRegistry.unregister("static_check")
+
+    def test_changes_with_bots_and_parser(self):
+        baseline = audit_fingerprint(_inputs(), parser="html.parser")
+        assert audit_fingerprint(_inputs(), bots={"GPTBot": "OpenAI"}, parser="html.parser") != baseline
+        with patch("geo_optimizer.core.audit.resolve_html_parser", return_value="lxml"):
+            assert audit_fingerprint(_inputs(), parser="lxml") != baseline
+
+
+def _fake_fetch(pages: dict[str, str]):
+    def fetch(url, **kwargs):
+        text = pages.get(url.rstrip("/"), "")
+        return Mock(status_code=200 if text else 404, text=text, content=text.encode(), headers={}), None
+
+    return fetch
+
+
+class TestRunFullAuditWithResultCache:
+    def test_unchanged_page_skips_the_analysis(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path)
+        pages = {"https://example.com": _HOMEPAGE, "https://example.com/robots.txt": "User-agent: *\nAllow: /\n"}
+
+        with (
+            patch("geo_optimizer.core.audit.fetch_url", side_effect=_fake_fetch(pages)),
+            patch("geo_optimizer.core.audit.audit_cdn_ai_crawler", return_value=CdnAiCrawlerResult(checked=True)),
+            patch("geo_optimizer.core.audit._analyze", wraps=audit._analyze) as analyze,
+        ):
+            first = run_full_audit("https://example.com", result_cache=cache)
+            second = run_full_audit("https://example.com", result_cache=cache)
+            assert analyze.call_count == 1
+
+            pages["https://example.com"] = _HOMEPAGE.replace("Hello.", "Hello, changed.")
+            third = run_full_audit("https://example.com", result_cache=cache)
+            assert analyze.call_count == 2
+
+        assert second.score == first.score
+        assert second.recommendations == first.recommendations
+        assert second.timestamp >= first.timestamp
+        assert third.page_size != first.page_size
+
+    def test_failed_audit_is_not_cached(self, tmp_path):
+        cache = AuditResultCache(cache_dir=tmp_path)
+        with patch("geo_optimizer.core.audit.fetch_url", return_value=(None, "Connection refused")):
+            result = run_full_audit("https://example.com", result_cache=cache)
+
+        assert result.error == "Connection refused"
+        assert cache.stats() == {"entries": 0}
+
+    def test_use_cache_enables_the_shared_result_cache(self):
+        pages = {"https://example.com": _HOMEPAGE}
+        with (
+            patch("geo_optimizer.core.audit.fetch_url", side_effect=_fake_fetch(pages)),
+            patch("geo_optimizer.core.audit.audit_cdn_ai_crawler", return_value=CdnAiCrawlerResult()),
+            patch("geo_optimizer.core.audit._analyze", wraps=audit._analyze) as analyze,
+        ):
+            run_full_audit("https://example.com", use_cache=True)
+            run_full_audit("https://example.com", use_cache=True)
+
+        assert analyze.call_count == 1
+
+    def test_async_audit_shares_the_cache(self, tmp_path):
+        pytest.importorskip("httpx")
+        cache = AuditResultCache(cache_dir=tmp_path)
+        pages = {"https://example.com": _HOMEPAGE}
+
+        async def fake_fetch_async(url, client=None, timeout=10):
+            return _fake_fetch(pages)(url)
+
+        async def fake_cdn_async(base_url, **kwargs):
+            return CdnAiCrawlerResult()
+
+        with (
+            patch("geo_optimizer.core.audit.fetch_url", side_effect=_fake_fetch(pages)),
+            patch("geo_optimizer.utils.http_async.fetch_url_async", new=fake_fetch_async),
+            patch("geo_optimizer.core.audit.audit_cdn_ai_crawler", return_value=CdnAiCrawlerResult()),
+            patch("geo_optimizer.core.audit.audit_cdn_ai_crawler_async", new=fake_cdn_async),
+            patch("geo_optimizer.core.audit._analyze", wraps=audit._analyze) as analyze,
+        ):
+            sync_result = run_full_audit("https://example.com", result_cache=cache)
+            async_result = asyncio.run(run_full_audit_async("https://example.com", result_cache=cache))
+
+        assert analyze.call_count == 1
+        assert async_result.score == sync_result.score
@@ -22,11 +22,10 @@ from geo_optimizer.core.schema_injector import generate_astro_snippet
 # web.app richiede FastAPI (dipendenza opzionale [web])
 app_module = pytest.importorskip("geo_optimizer.web.app", reason="FastAPI non installato")
 _MAX_CACHE_SIZE = app_module._MAX_CACHE_SIZE
-_audit_cache = app_module._audit_cache
 _check_rate_limit = app_module._check_rate_limit
 _evict_expired = app_module._evict_expired
-_rate_limit_store = app_module._rate_limit_store
 _set_cached = app_module._set_cached
+_web_store = app_module._web_store
 
 
 # ============================================================================
@@ -99,36 +98,36 @@ class TestCacheLimits:
     """Test limiti cache in-memory."""
 
     def setup_method(self):
-        _audit_cache.clear()
+        _web_store.clear()
 
     def teardown_method(self):
-        _audit_cache.clear()
+        _web_store.clear()
 
     def test_cache_non_supera_max_size(self):
         """La cache non cresce oltre _MAX_CACHE_SIZE."""
         for i in range(_MAX_CACHE_SIZE + 10):
             asyncio.run(_set_cached(f"https://example-{i}.com", {"score": i, "band": "good"}))
-        assert len(_audit_cache) <= _MAX_CACHE_SIZE
+        assert _web_store.stats()["audits"] <= _MAX_CACHE_SIZE
 
     def test_evict_rimuove_scadute(self):
         """_evict_expired() rimuove entry con TTL scaduto."""
-        _audit_cache["old"] = {"data": {}, "cached_at": time.time() - 7200}
-        _audit_cache["new"] = {"data": {}, "cached_at": time.time()}
+        with patch("geo_optimizer.web.store.time.time", return_value=time.time() - 7200):
+            old_key = asyncio.run(_set_cached("https://old.example", {}))
+        new_key = asyncio.run(_set_cached("https://new.example", {}))
         _evict_expired()
-        assert "old" not in _audit_cache
-        assert "new" in _audit_cache
+        assert _web_store.get_audit(old_key) is None
+        assert _web_store.get_audit(new_key) is not None
 
     def test_eviction_preserva_recenti(self):
         """Quando piena, la cache rimuove la entry più vecchia."""
         # Riempi cache
-        for i in range(_MAX_CACHE_SIZE):
-            _audit_cache[f"key-{i}"] = {
-                "data": {"score": i},
-                "cached_at": time.time() + i * 0.001,
-            }
+        keys = [asyncio.run(_set_cached(f"https://key-{i}.com", {"score": i})) for i in range(_MAX_CACHE_SIZE)]
         # Aggiungi una nuova
-        asyncio.run(_set_cached("https://new-entry.com", {"score": 99, "band": "excellent"}))
-        assert len(_audit_cache) <= _MAX_CACHE_SIZE
+        new_key = asyncio.run(_set_cached("https://new-entry.com", {"score": 99, "band": "excellent"}))
+        assert _web_store.stats()["audits"] <= _MAX_CACHE_SIZE
+        assert _web_store.get_audit(keys[0]) is None
+        assert _web_store.get_audit(keys[-1]) is not None
+        assert _web_store.get_audit(new_key) is not None
 
 
 # ============================================================================
@@ -140,10 +139,10 @@ class TestRateLimiting:
     """Test rate limiter in-memory."""
 
     def setup_method(self):
-        _rate_limit_store.clear()
+        _web_store.clear()
 
     def teardown_method(self):
-        _rate_limit_store.clear()
+        _web_store.clear()
 
     def test_richieste_sotto_limite_passano(self):
         """Richieste sotto il limite vengono accettate."""
@@ -0,0 +1,123 @@
+"""Tests for single-flight call coalescing (utils/singleflight)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from geo_optimizer.utils.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestAsyncSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def audit(url):
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return f"result for {url}"
+
+        async def main():
+            return await asyncio.gather(
+                *(flights.run("a", lambda: audit("a")) for _ in range(5)),
+                flights.run("b", lambda: audit("b")),
+            )
+
+        results = asyncio.run(main())
+
+        assert results == ["result for a"] * 5 + ["result for b"]
+        assert calls == ["a", "b"]
+        assert flights.stats() == {"started": 2, "coalesced": 4, "in_flight": 0}
+
+    def test_finished_call_is_not_reused(self):
+        flights = AsyncSingleFlight()
+        counter = iter(range(10))
+
+        async def call():
+            return next(counter)
+
+        async def main():
+            return [await flights.run("k", call), await flights.run("k", call)]
+
+        assert asyncio.run(main()) == [0, 1]
+
+    def test_exception_reaches_every_caller(self):
+        flights = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def main():
+            return await asyncio.gather(*(flights.run("k", fail) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert [str(r) for r in results] == ["boom"] * 3
+        assert flights.stats()["in_flight"] == 0
+
+    def test_cancelled_caller_does_not_cancel_the_call(self):
+        flights = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def main():
+            first = asyncio.ensure_future(flights.run("k", slow))
+            second = asyncio.ensure_future(flights.run("k", slow))
+            await asyncio.sleep(0)
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(first, timeout=0.01)
+            return await second
+
+        assert asyncio.run(main()) == "done"
+
+
+class TestSingleFlight:
+    def test_threads_share_one_call(self):
+        flights = SingleFlight()
+        calls = []
+        entered = threading.Barrier(4, timeout=5)
+
+        def audit():
+            calls.append(threading.get_ident())
+            time.sleep(0.1)
+            return "result"
+
+        def caller():
+            entered.wait()
+            return flights.run("https://example.com", audit)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: caller(), range(4)))
+
+        assert results == ["result"] * 4
+        assert len(calls) == 1
+        assert flights.stats() == {"started": 1, "coalesced": 3, "in_flight": 0}
+
+    def test_exception_reaches_waiters_and_key_is_released(self):
+        flights = SingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait(5)
+            raise ValueError("bad page")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flights.run, "k", fail)
+            while flights.stats()["in_flight"] == 0:
+                time.sleep(0.001)
+            follower = pool.submit(flights.run, "k", fail)
+            while flights.stats()["coalesced"] == 0:
+                time.sleep(0.001)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(ValueError, match="bad page"):
+                    future.result()
+
+        assert flights.run("k", lambda: "again") == "again"
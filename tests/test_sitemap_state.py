@@ -0,0 +1,229 @@
+"""Tests for the sitemap state store (core/sitemap_state) and the batch --changed-only mode."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import sqlite3
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import pytest
+
+from geo_optimizer.core.audit import _SIDECAR_PATHS, AuditInputs, _record_audit_inputs
+from geo_optimizer.core.batch_audit import run_batch_audit_async
+from geo_optimizer.core.sitemap_state import SitemapStateStore, lastmod_is_newer
+from geo_optimizer.models.results import (
+    AuditResult,
+    BatchAuditPageResult,
+    CachedResponse,
+    CdnAiCrawlerResult,
+    SitemapPageState,
+    SitemapUrl,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SitemapStateStore(tmp_path / "sitemap-state.db")
+
+
+class TestLastmod:
+    @pytest.mark.parametrize(
+        ("current", "previous", "expected"),
+        [
+            ("2024-05-02", "2024-05-01", True),
+            ("2024-05-01", "2024-05-01", False),
+            ("2024-04-30", "2024-05-01", False),
+            ("2024-05-01T10:00:00Z", "2024-05-01T12:00:00+02:00", False),
+            ("2024-05-01T10:30:00Z", "2024-05-01T12:00:00+02:00", True),
+            ("2024-05-01T10:00:00+00:00", "2024-05-01", True),
+            (None, "2024-05-01", False),
+            ("2024-05-01", None, True),
+            ("last week", "yesterday", True),
+            ("yesterday", "yesterday", False),
+        ],
+    )
+    def test_lastmod_is_newer(self, current, previous, expected):
+        assert lastmod_is_newer(current, previous) is expected
+
+
+class TestSitemapStateStore:
+    def test_state_round_trips_by_page_identity(self, store):
+        page = BatchAuditPageResult(url="https://example.com/a", score=80, band="good", score_breakdown={"llms": 12})
+        store.save(SitemapPageState("https://example.com/a", "2024-05-01", "f1", "cfg", page))
+
+        state = store.get("https://EXAMPLE.com/a/")
+
+        assert (state.lastmod, state.fingerprint, state.config_key) == ("2024-05-01", "f1", "cfg")
+        assert state.result == page
+        assert store.get("https://example.com/b") is None
+        assert store.clear() == 1
+        assert store.get("https://example.com/a") is None
+
+    def test_body_hash_layout_is_discarded(self, tmp_path):
+        path = tmp_path / "sitemap-state.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE sitemap_pages (url_key TEXT PRIMARY KEY, url TEXT NOT NULL, lastmod TEXT, "
+                "body_hash TEXT NOT NULL, config_key TEXT NOT NULL, result TEXT NOT NULL, audited_at TEXT NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO sitemap_pages VALUES ('https://example.com/a', 'https://example.com/a', "
+                "NULL, 'h', 'cfg', '{}', '2024-05-01T00:00:00+00:00')"
+            )
+        conn.close()
+
+        store = SitemapStateStore(path)
+
+        assert store.get("https://example.com/a") is None
+        page = BatchAuditPageResult(url="https://example.com/a", score=80, band="good")
+        store.save(SitemapPageState("https://example.com/a", None, "f1", "cfg", page))
+        assert store.get("https://example.com/a").fingerprint == "f1"
+
+
+def _sitemap(lastmods: dict[str, str | None]) -> list[SitemapUrl]:
+    return [SitemapUrl(url=f"https://example.com/{name}", lastmod=lastmod) for name, lastmod in lastmods.items()]
+
+
+def _response(text: str) -> CachedResponse:
+    return CachedResponse(status_code=200, text=text, content=b"", headers={})
+
+
+def _run(store, sitemap, bodies, audited, config_key="cfg", fetched=None, files=None):
+    """One --changed-only batch; ``audited`` collects the URLs that were really audited.
+
+    ``bodies`` are the pages, ``files`` the site files (``/robots.txt``...;
+    missing ones answer 404). ``fetched`` collects the pages fetched only to
+    fingerprint them: an audit records the inputs it fetched, like the real
+    fetch stage.
+    """
+    files = files if files is not None else {"/robots.txt": "User-agent: *"}
+
+    async def audit(url, **kwargs):
+        name = url.rsplit("/", 1)[1]
+        audited.append(name)
+        _record_audit_inputs(
+            AuditInputs(
+                base_url=url,
+                response=_response(bodies[name]),
+                sidecars={path: _response(files[path]) if path in files else None for path in _SIDECAR_PATHS},
+                cdn_result=CdnAiCrawlerResult(checked=True),
+            )
+        )
+        if url.endswith("/broken"):
+            return AuditResult(url=url, error="HTTP 500", band="critical")
+        return AuditResult(url=url, score=len(audited) * 10, band="good", http_status=200, score_breakdown={"llms": 5})
+
+    async def fetch(url, **kwargs):
+        path = urlparse(url).path
+        if path in _SIDECAR_PATHS:
+            return (_response(files[path]), None) if path in files else (None, "HTTP 404")
+        name = path.rsplit("/", 1)[1]
+        if fetched is not None:
+            fetched.append(name)
+        return _response(bodies[name]), None
+
+    with (
+        patch("geo_optimizer.core.batch_audit.fetch_sitemap", return_value=sitemap),
+        patch("geo_optimizer.core.batch_audit.run_full_audit_async", side_effect=audit),
+        patch("geo_optimizer.utils.http_async.fetch_url_async", side_effect=fetch),
+        patch("geo_optimizer.core.batch_audit.audit_config_key", return_value=config_key),
+    ):
+        return asyncio.run(
+            run_batch_audit_async("https://example.com/sitemap.xml", changed_only=True, state_store=store)
+        )
+
+
+class TestChangedOnlyBatch:
+    def test_only_new_and_changed_pages_are_audited(self, store):
+        bodies = {"same": "s", "edited": "e1", "bumped": "b", "broken": "x"}
+        first, first_fetched = [], []
+        _run(
+            store,
+            _sitemap({"same": "2024-05-01", "edited": None, "bumped": "2024-05-01", "broken": None}),
+            bodies,
+            first,
+            fetched=first_fetched,
+        )
+        assert sorted(first) == ["broken", "bumped", "edited", "same"]
+        # Nothing stored yet: every page is audited straight away, its fingerprint taken from the audit
+        assert first_fetched == []
+
+        bodies.update(edited="e2", new="n")
+        second, second_fetched = [], []
+        result = _run(
+            store,
+            _sitemap({"same": "2024-05-01", "edited": None, "bumped": "2024-06-01", "broken": None, "new": None}),
+            bodies,
+            second,
+            fetched=second_fetched,
+        )
+
+        # "broken" failed last time, so it has no stored result to reuse
+        assert sorted(second) == ["broken", "bumped", "edited", "new"]
+        # Only pages with a reusable state are fingerprinted first; "bumped" has a newer lastmod
+        assert sorted(second_fetched) == ["edited", "same"]
+        assert result.unchanged_urls == 1
+        assert (result.audited_urls, result.successful_urls, result.failed_urls) == (5, 4, 1)
+        reused = next(page for page in result.pages if page.url.endswith("/same"))
+        assert reused.score == store.get("https://example.com/same").result.score
+
+    def test_configuration_change_re_audits_everything(self, store):
+        sitemap = _sitemap({"a": "2024-05-01", "b": "2024-05-01"})
+        bodies = {"a": "a", "b": "b"}
+        _run(store, sitemap, bodies, [])
+
+        unchanged, upgraded, upgraded_fetched = [], [], []
+        assert _run(store, sitemap, bodies, unchanged).unchanged_urls == 2
+        assert _run(store, sitemap, bodies, upgraded, "new-version", upgraded_fetched).unchanged_urls == 0
+        assert unchanged == []
+        assert sorted(upgraded) == ["a", "b"]
+        assert upgraded_fetched == []
+
+    def test_site_file_change_re_audits(self, store):
+        sitemap = _sitemap({"a": "2024-05-01", "b": None})
+        bodies = {"a": "a", "b": "b"}
+        _run(store, sitemap, bodies, [], files={"/robots.txt": "User-agent: *"})
+
+        same, edited = [], []
+        unchanged = _run(store, sitemap, bodies, same, files={"/robots.txt": "User-agent: *"})
+        result = _run(store, sitemap, bodies, edited, files={"/robots.txt": "User-agent: GPTBot\nDisallow: /"})
+        llms = _run(
+            store, sitemap, bodies, [], files={"/robots.txt": "User-agent: GPTBot\nDisallow: /", "/llms.txt": "#"}
+        )
+
+        assert (same, unchanged.unchanged_urls) == ([], 2)
+        assert (sorted(edited), result.unchanged_urls) == (["a", "b"], 0)
+        assert llms.unchanged_urls == 0
+
+    def test_old_result_is_re_audited(self, store):
+        sitemap = _sitemap({"a": "2024-05-01", "b": "2024-05-01"})
+        bodies = {"a": "a", "b": "b"}
+        _run(store, sitemap, bodies, [])
+        old = store.get("https://example.com/a")
+        store.save(dataclasses.replace(old, audited_at="2024-01-01T00:00:00+00:00"))
+
+        audited, fetched = [], []
+        result = _run(store, sitemap, bodies, audited, fetched=fetched)
+
+        assert (audited, fetched, result.unchanged_urls) == (["a"], ["b"], 1)
+        assert store.get("https://example.com/a").audited_at > old.audited_at
+
+    def test_slow_fingerprint_fetch_times_out_and_re_audits(self, store):
+        sitemap = _sitemap({"a": "2024-05-01"})
+        bodies = {"a": "a"}
+        _run(store, sitemap, bodies, [])
+
+        audited = []
+        with (
+            patch("geo_optimizer.core.batch_audit.AUDIT_TIMEOUT_SECONDS", 0.05),
+            patch("geo_optimizer.core.batch_audit._fetch_inputs", side_effect=_hang),
+        ):
+            result = _run(store, sitemap, bodies, audited)
+
+        assert (audited, result.unchanged_urls) == (["a"], 0)
+
+
+async def _hang(*args, **kwargs):
+    await asyncio.sleep(5)
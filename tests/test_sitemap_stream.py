@@ -0,0 +1,202 @@
+"""Tests for the streaming sitemap parser (core/llms_generator.iter_sitemap) and batch --sitemap-order."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import socket
+import threading
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from geo_optimizer.core.batch_audit import run_batch_audit_async
+from geo_optimizer.core.llms_generator import fetch_sitemap, iter_sitemap
+from geo_optimizer.models.results import AuditResult, SitemapUrl
+
+_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def _urlset(*paths: str) -> bytes:
+    urls = "".join(f"<url><loc>https://example.com{path}</loc><lastmod>2024-05-01</lastmod></url>" for path in paths)
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {_NS}>{urls}</urlset>'.encode()
+
+
+def _index(*names: str) -> bytes:
+    maps = "".join(f"<sitemap><loc>https://example.com/{name}</loc></sitemap>" for name in names)
+    return f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex {_NS}>{maps}</sitemapindex>'.encode()
+
+
+def _response(body: bytes, delay: float = 0.0) -> Mock:
+    def chunks(chunk_size=8192):
+        if delay:
+            time.sleep(delay)
+        for start in range(0, len(body), 64):
+            yield body[start : start + 64]
+
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.iter_content = Mock(side_effect=chunks)
+    return response
+
+
+@pytest.fixture
+def site():
+    """Session factory serving ``{url: response}``; example.com resolves to a public IP."""
+    pages: dict[str, Mock] = {}
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kwargs: pages[url]
+    with (
+        patch("geo_optimizer.core.llms_generator.create_session_with_retry", return_value=session),
+        patch(
+            "geo_optimizer.utils.validators.socket.getaddrinfo",
+            return_value=[(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))],
+        ),
+    ):
+        yield pages, session
+
+
+class TestStreamingParser:
+    def test_entries_come_out_before_the_download_ends(self, site):
+        pages, _session = site
+        consumed = []
+        body = _urlset(*(f"/p{i}" for i in range(200)))
+
+        def chunks(chunk_size=8192):
+            for start in range(0, len(body), 256):
+                consumed.append(start)
+                yield body[start : start + 256]
+
+        pages["https://example.com/sitemap.xml"] = Mock(raise_for_status=Mock(), iter_content=chunks)
+
+        entries = iter_sitemap("https://example.com/sitemap.xml")
+        first = next(entries)
+        entries.close()
+
+        assert first == SitemapUrl(url="https://example.com/p0", lastmod="2024-05-01")
+        assert len(consumed) < len(body) // 256
+
+    def test_gzip_sitemap_is_inflated(self, site):
+        pages, _session = site
+        pages["https://example.com/sitemap.xml.gz"] = _response(gzip.compress(_urlset("/a", "/b")))
+
+        urls = fetch_sitemap("https://example.com/sitemap.xml.gz")
+
+        assert [u.url for u in urls] == ["https://example.com/a", "https://example.com/b"]
+
+    def test_gzip_bomb_is_aborted(self, site):
+        pages, _session = site
+        pages["https://example.com/sitemap.xml.gz"] = _response(gzip.compress(_urlset(*(["/x"] * 2000))))
+        status = []
+
+        with patch("geo_optimizer.core.llms_generator._MAX_SITEMAP_UNCOMPRESSED", 10_000):
+            urls = fetch_sitemap("https://example.com/sitemap.xml.gz", on_status=status.append)
+
+        assert len(urls) < 2000
+        assert any("too large" in msg for msg in status)
+
+    def test_entity_expansion_is_not_performed(self, site):
+        pages, _session = site
+        body = (
+            b'<?xml version="1.0"?><!DOCTYPE u [<!ENTITY e SYSTEM "file:///etc/passwd">]>'
+            b"<urlset " + _NS.encode() + b"><url><loc>https://example.com/&e;</loc></url></urlset>"
+        )
+        pages["https://example.com/sitemap.xml"] = _response(body)
+
+        urls = fetch_sitemap("https://example.com/sitemap.xml")
+
+        assert all("root:" not in u.url for u in urls)
+
+
+class TestSitemapIndex:
+    def test_children_are_fetched_concurrently_and_yielded_in_order(self, site):
+        pages, _session = site
+        pages["https://example.com/sitemap.xml"] = _response(_index("s1.xml", "s2.xml", "s3.xml"))
+        for n in (1, 2, 3):
+            pages[f"https://example.com/s{n}.xml"] = _response(_urlset(f"/s{n}-a", f"/s{n}-b"), delay=0.2)
+
+        started = time.monotonic()
+        urls = fetch_sitemap("https://example.com/sitemap.xml")
+
+        assert time.monotonic() - started < 0.5
+        assert [u.url.rsplit("/", 1)[1] for u in urls] == ["s1-a", "s1-b", "s2-a", "s2-b", "s3-a", "s3-b"]
+
+    def test_cap_is_enforced_across_children(self, site):
+        pages, _session = site
+        pages["https://example.com/sitemap.xml"] = _response(_index("s1.xml", "s2.xml"))
+        pages["https://example.com/s1.xml"] = _response(_urlset("/a", "/b"))
+        pages["https://example.com/s2.xml"] = _response(_urlset("/c", "/d"))
+        status = []
+
+        urls = list(iter_sitemap("https://example.com/sitemap.xml", on_status=status.append, max_urls=3))
+
+        assert [u.url for u in urls] == ["https://example.com/a", "https://example.com/b", "https://example.com/c"]
+        assert any("URL limit reached (3)" in msg for msg in status)
+
+    def test_total_count_is_shared_with_the_caller(self, site):
+        pages, _session = site
+        pages["https://example.com/sitemap.xml"] = _response(_urlset("/a", "/b", "/c"))
+
+        with patch("geo_optimizer.core.llms_generator.MAX_TOTAL_URLS", 5):
+            urls = fetch_sitemap("https://example.com/sitemap.xml", _total_count=[3])
+
+        assert len(urls) == 2
+
+    def test_closing_early_stops_the_child_fetchers(self, site):
+        pages, _session = site
+        names = [f"s{n}.xml" for n in range(6)]
+        pages["https://example.com/sitemap.xml"] = _response(_index(*names))
+        for name in names:
+            pages[f"https://example.com/{name}"] = _response(_urlset(*(f"/{name}/{i}" for i in range(3000))))
+
+        entries = iter_sitemap("https://example.com/sitemap.xml")
+        next(entries)
+        entries.close()
+
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline and any(t.name.startswith("geo-sitemap") for t in threading.enumerate()):
+            time.sleep(0.02)
+        assert not any(t.name.startswith("geo-sitemap") for t in threading.enumerate())
+
+
+class TestBatchSitemapOrder:
+    def test_audits_start_before_the_sitemap_is_read(self):
+        sitemap_done = threading.Event()
+        started_early = []
+
+        def entries(sitemap_url):
+            for path in ["/a", "/b", "/a/", "/c", "/d"]:
+                yield SitemapUrl(url=f"https://example.com{path}")
+                time.sleep(0.05)
+            sitemap_done.set()
+
+        async def audit(url, **kwargs):
+            started_early.append(not sitemap_done.is_set())
+            return AuditResult(url=url, score=70, band="good", http_status=200)
+
+        with (
+            patch("geo_optimizer.core.batch_audit.iter_sitemap", side_effect=entries),
+            patch("geo_optimizer.core.batch_audit.fetch_sitemap") as mock_fetch_sitemap,
+            patch("geo_optimizer.core.batch_audit.run_full_audit_async", side_effect=audit),
+        ):
+            result = asyncio.run(
+                run_batch_audit_async("https://example.com/sitemap.xml", max_urls=3, sitemap_order=True)
+            )
+
+        mock_fetch_sitemap.assert_not_called()
+        assert started_early[0] is True
+        assert [page.url for page in result.pages] == [
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/c",
+        ]
+        assert result.discovered_urls == 5
+        assert "only 3 were audited" in result.truncated_warning
+
+    def test_empty_sitemap_raises(self):
+        with (
+            patch("geo_optimizer.core.batch_audit.iter_sitemap", side_effect=lambda url: (entry for entry in [])),
+            pytest.raises(ValueError, match="No URLs found in sitemap"),
+        ):
+            asyncio.run(run_batch_audit_async("https://example.com/sitemap.xml", sitemap_order=True))
@@ -0,0 +1,123 @@
+"""Tests for the SQLite HTTP cache (utils/cache.SqliteCache)."""
+
+from __future__ import annotations
+
+import multiprocessing
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from geo_optimizer.utils.cache import CACHE_DB_NAME, SqliteCache
+
+
+def _fill(cache_dir: str, worker: int, count: int) -> int:
+    """Write ``count`` entries from a separate process."""
+    cache = SqliteCache(cache_dir=Path(cache_dir))
+    for i in range(count):
+        cache.put(f"https://example.com/{worker}/{i}", 200, f"body {worker} {i}", {})
+    return count
+
+
+def _row(cache: SqliteCache, url: str) -> sqlite3.Row:
+    conn = sqlite3.connect(cache.db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        return conn.execute("SELECT * FROM entries WHERE url = ?", (url,)).fetchone()
+    finally:
+        conn.close()
+
+
+class TestSqliteCache:
+    def test_put_and_get_round_trip(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path)
+        headers = {"Content-Type": "text/html", "ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        cache.put("https://example.com/", 200, "<html>ciao é</html>", headers)
+
+        assert cache.get("https://example.com/") == (200, "<html>ciao é</html>", headers)
+        assert cache.get("https://example.com/other") is None
+        assert (tmp_path / CACHE_DB_NAME).exists()
+
+    def test_metadata_and_compressed_body_are_stored(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path)
+        text = "<p>repeated paragraph</p>" * 500
+        cache.put("https://example.com/", 200, text, {"etag": 'W/"v1"', "last-modified": "yesterday"})
+
+        row = _row(cache, "https://example.com/")
+        assert row["etag"] == 'W/"v1"'
+        assert row["last_modified"] == "yesterday"
+        assert row["fetched_at"] > 0
+        assert len(row["body"]) < len(text) / 10
+
+    def test_overwrite_keeps_totals_consistent(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path)
+        cache.put("https://example.com/", 200, "a" * 1000, {})
+        cache.put("https://example.com/", 404, "short", {})
+        cache.put("https://example.com/b", 200, "b", {})
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        conn = sqlite3.connect(cache.db_path)
+        assert stats["size_bytes"] == conn.execute("SELECT SUM(size) FROM entries").fetchone()[0]
+        conn.close()
+        assert cache.get("https://example.com/")[0] == 404
+
+    def test_expired_entry_is_removed(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path, ttl=60)
+        cache.put("https://example.com/", 200, "x", {})
+
+        with patch("geo_optimizer.utils.cache.time.time", return_value=time.time() + 3600):
+            assert cache.get("https://example.com/") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path)
+        for name in ("a", "b", "c"):
+            cache.put(f"https://example.com/{name}", 200, name * 10, {})
+            time.sleep(0.01)
+        # Reading "a" makes "b" the least recently used entry
+        assert cache.get("https://example.com/a") is not None
+        cache.max_size_bytes = cache.stats()["size_bytes"]
+
+        cache.put("https://example.com/d", 200, "d" * 10, {})
+
+        assert cache.get("https://example.com/b") is None
+        for name in ("a", "c", "d"):
+            assert cache.get(f"https://example.com/{name}") is not None
+        assert cache.stats()["size_bytes"] <= cache.max_size_bytes
+
+    def test_clear_and_stats_without_database(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path / "missing")
+        assert cache.stats() == {"entries": 0, "size_bytes": 0}
+        assert cache.clear() == 0
+
+        cache.put("https://example.com/a", 200, "a", {})
+        cache.put("https://example.com/b", 200, "b", {})
+        assert cache.clear() == 2
+        assert cache.stats() == {"entries": 0, "size_bytes": 0}
+
+    def test_corrupted_body_is_a_miss(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path)
+        cache.put("https://example.com/", 200, "x", {})
+        conn = sqlite3.connect(cache.db_path)
+        conn.execute("UPDATE entries SET body = ?", (b"not zlib",))
+        conn.commit()
+        conn.close()
+
+        assert cache.get("https://example.com/") is None
+
+    def test_reopens_after_close(self, tmp_path):
+        cache = SqliteCache(cache_dir=tmp_path)
+        cache.put("https://example.com/", 200, "x", {})
+        cache.close()
+        assert cache.get("https://example.com/")[1] == "x"
+
+    def test_shared_between_processes(self, tmp_path):
+        """Concurrent writers in separate processes (a batch run) do not lose entries."""
+        with ProcessPoolExecutor(max_workers=3, mp_context=multiprocessing.get_context("spawn")) as pool:
+            written = sum(pool.map(_fill, [str(tmp_path)] * 3, range(3), [40] * 3))
+
+        cache = SqliteCache(cache_dir=tmp_path)
+        assert cache.stats()["entries"] == written == 120
+        assert cache.get("https://example.com/2/39")[1] == "body 2 39"
@@ -17,9 +17,8 @@ pytest.importorskip("httpx", reason="httpx non installato (pip install httpx)")
 from starlette.testclient import TestClient
 
 from geo_optimizer.web.app import (
-    _audit_cache,
     _check_rate_limit,
-    _rate_limit_store,
+    _web_store,
     app,
     static_dir,
 )
@@ -108,12 +107,10 @@ def _make_mock_audit_result(score=75, band="good"):
 
 @pytest.fixture(autouse=True)
 def clean_state():
-    """Pulisce cache e rate limit store prima di ogni test."""
-    _audit_cache.clear()
-    _rate_limit_store.clear()
+    """Pulisce cache, badge e rate limit store prima di ogni test."""
+    _web_store.clear()
     yield
-    _audit_cache.clear()
-    _rate_limit_store.clear()
+    _web_store.clear()
 
 
 @pytest.fixture
@@ -290,6 +287,49 @@ def test_post_audit_usa_cache_per_secondo_request(client):
     assert mock_audit.call_count == 1
 
 
+def test_richieste_concorrenti_condividono_un_solo_audit():
+    """Badge e audit concorrenti sullo stesso URL non in cache eseguono un solo audit (single-flight)."""
+    import threading
+    import time
+
+    import httpx
+
+    from geo_optimizer.web.app import _audit_flights
+
+    mock_result = _make_mock_audit_result()
+    calls = []
+
+    def _slow_audit(url, **kwargs):
+        calls.append(threading.get_ident())
+        time.sleep(0.2)
+        return mock_result
+
+    async def _burst():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+            return await asyncio.gather(
+                *(ac.get("/badge", params={"url": "https://example.com"}) for _ in range(4)),
+                ac.get("/badge/endpoint", params={"url": "https://example.com"}),
+                ac.post("/api/audit", json={"url": "https://example.com"}),
+                ac.post("/api/audit", json={"url": "https://example.com"}),
+            )
+
+    before = _audit_flights.stats()
+    with (
+        patch("geo_optimizer.utils.validators.validate_public_url", return_value=(True, None)),
+        patch("geo_optimizer.core.audit.run_full_audit", side_effect=_slow_audit),
+    ):
+        responses = asyncio.run(_burst())
+
+    assert [r.status_code for r in responses] == [200] * 7
+    assert len(calls) == 1
+    assert responses[-1].json() == responses[-2].json()
+    after = _audit_flights.stats()
+    assert after["started"] - before["started"] == 2  # one audit + one report bookkeeping
+    assert after["coalesced"] - before["coalesced"] == 6
+    assert after["in_flight"] == 0
+
+
 # ─── Test: rate limiting ──────────────────────────────────────────────────────
 
 
@@ -299,11 +339,9 @@ def test_rate_limit_429_dopo_troppe_richieste(client):
 
     mock_result = _make_mock_audit_result()
 
-    # Riempi il rate limit store con timestamp recenti
-    import time
-
-    now = time.time()
-    _rate_limit_store["testclient"] = [now] * _RATE_LIMIT_MAX_REQUESTS
+    # Riempi il rate limit store con richieste recenti
+    for _ in range(_RATE_LIMIT_MAX_REQUESTS):
+        _web_store.hit_rate_limit("testclient", _RATE_LIMIT_MAX_REQUESTS)
 
     with patch("geo_optimizer.core.audit.run_full_audit", return_value=mock_result):
         # Questa richiesta deve essere bloccata
@@ -316,15 +354,13 @@ def test_rate_limit_429_dopo_troppe_richieste(client):
 
 def test_check_rate_limit_blocca_dopo_limite():
     """_check_rate_limit() ritorna False dopo aver superato il limite."""
-    import time
-
     from geo_optimizer.web.app import _RATE_LIMIT_MAX_REQUESTS
 
     test_ip = "10.0.0.99_test_rate_limit"
-    now = time.time()
 
     # Imposta già al massimo
-    _rate_limit_store[test_ip] = [now] * _RATE_LIMIT_MAX_REQUESTS
+    for _ in range(_RATE_LIMIT_MAX_REQUESTS):
+        _web_store.hit_rate_limit(test_ip, _RATE_LIMIT_MAX_REQUESTS)
 
     # La prossima richiesta deve essere bloccata — _check_rate_limit è async (fix #209)
     result = asyncio.run(_check_rate_limit(test_ip))
@@ -499,6 +535,145 @@ def test_badge_senza_url_ritorna_422(client):
     assert response.status_code == 422
 
 
+def _invecchia_badge(url: str, secondi: int) -> None:
+    """Sposta indietro nel tempo l'ultimo audit del badge di ``url``."""
+    from geo_optimizer.web.app import _cache_key
+
+    _web_store.badges[_cache_key(url)]["audited_at"] -= secondi
+
+
+def test_badge_scaduto_servito_subito_e_aggiornato_in_background():
+    """Un badge scaduto risponde subito con l'ultimo score (stale) e un audit in background lo aggiorna."""
+    import httpx
+
+    from geo_optimizer.web.app import _background_tasks, _cache_key
+
+    _web_store.set_badge(_cache_key("https://example.com"), "https://example.com", 40, "foundation")
+    _invecchia_badge("https://example.com", 7200)
+
+    async def _richieste():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+            stale = await ac.get("/badge/endpoint", params={"url": "https://example.com"})
+            await asyncio.gather(*_background_tasks)
+            fresh = await ac.get("/badge/endpoint", params={"url": "https://example.com"})
+        return stale, fresh
+
+    with (
+        patch("geo_optimizer.utils.validators.validate_public_url", return_value=(True, None)),
+        patch(
+            "geo_optimizer.core.audit.run_full_audit", return_value=_make_mock_audit_result(score=90, band="excellent")
+        ) as mock_audit,
+    ):
+        stale, fresh = asyncio.run(_richieste())
+
+    assert stale.json()["message"] == "40/100"
+    assert stale.json()["stale"] is True
+    assert stale.json()["age"] >= 7200
+    assert stale.headers["cache-control"] == "public, max-age=60"
+    assert mock_audit.call_count == 1
+    assert fresh.json()["message"] == "90/100"
+    assert (fresh.json()["stale"], fresh.json()["age"]) == (False, 0)
+    assert fresh.headers["cache-control"] == "public, max-age=3600"
+
+
+def test_badge_audit_fallito_non_sovrascrive_ultimo_score():
+    """Un refresh fallito (AuditResult.error) non sostituisce l'ultimo score valido del badge."""
+    from geo_optimizer.web.app import _audit_and_cache, _cache_key
+
+    _web_store.set_badge(_cache_key("https://example.com"), "https://example.com", 40, "foundation")
+    failed = _make_mock_audit_result(score=0, band="critical")
+    failed.error = "Connection refused"
+
+    with patch("geo_optimizer.core.audit.run_full_audit", return_value=failed):
+        asyncio.run(_audit_and_cache("https://example.com"))
+
+    assert _web_store.hit_badge(_cache_key("https://example.com"))["score"] == 40
+
+
+def test_badge_audit_fallito_non_viene_ripetuto_a_ogni_richiesta(client):
+    """Un audit fallito resta in cache: richieste ripetute del badge non rilanciano l'audit."""
+    failed = _make_mock_audit_result(score=0, band="critical")
+    failed.error = "Connection refused"
+
+    with (
+        patch("geo_optimizer.utils.validators.validate_public_url", return_value=(True, None)),
+        patch("geo_optimizer.core.audit.run_full_audit", return_value=failed) as mock_audit,
+    ):
+        responses = [client.get("/badge?url=https://dead.example") for _ in range(3)]
+        endpoint = client.get("/badge/endpoint?url=https://dead.example")
+
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert endpoint.json()["message"] == "0/100"
+    assert mock_audit.call_count == 1
+
+
+def test_badge_scaduto_con_refresh_fallito_non_rilancia_audit_a_ogni_richiesta():
+    """Se il refresh di un badge scaduto fallisce, le richieste successive non rilanciano l'audit."""
+    import httpx
+
+    from geo_optimizer.web.app import _background_tasks, _cache_key
+
+    _web_store.set_badge(_cache_key("https://dead.example"), "https://dead.example", 40, "foundation")
+    _invecchia_badge("https://dead.example", 7200)
+    failed = _make_mock_audit_result(score=0, band="critical")
+    failed.error = "Connection refused"
+
+    async def _richieste():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+            responses = []
+            for _ in range(5):
+                responses.append(await ac.get("/badge/endpoint", params={"url": "https://dead.example"}))
+                await asyncio.gather(*_background_tasks)
+        return responses
+
+    with (
+        patch("geo_optimizer.utils.validators.validate_public_url", return_value=(True, None)),
+        patch("geo_optimizer.core.audit.run_full_audit", return_value=failed) as mock_audit,
+    ):
+        responses = asyncio.run(_richieste())
+
+    assert [r.json()["message"] for r in responses] == ["40/100"] * 5
+    assert all(r.json()["stale"] for r in responses)
+    assert mock_audit.call_count == 1
+
+
+def test_prewarm_salta_badge_gia_in_aggiornamento():
+    """Un badge il cui refresh è già preso (da un altro worker) non viene ri-auditato dal pre-warming."""
+    from geo_optimizer.web.app import _BADGE_REFRESH_LEASE, _cache_key, _prewarm_badges_once
+
+    _web_store.set_badge(_cache_key("https://old.example"), "https://old.example", 40, "foundation")
+    _web_store.hit_badge(_cache_key("https://old.example"))
+    _invecchia_badge("https://old.example", 3500)
+    assert _web_store.claim_badge_refresh(_cache_key("https://old.example"), _BADGE_REFRESH_LEASE)
+
+    with patch("geo_optimizer.core.audit.run_full_audit", return_value=_make_mock_audit_result()) as mock_audit:
+        refreshed = asyncio.run(_prewarm_badges_once())
+
+    assert refreshed == 0
+    mock_audit.assert_not_called()
+
+
+def test_prewarm_aggiorna_solo_badge_popolari_in_scadenza():
+    """Il pre-warming ri-esegue l'audit dei badge richiesti che scadrebbero prima del prossimo passaggio."""
+    from geo_optimizer.web.app import _cache_key, _prewarm_badges_once
+
+    for url in ("https://old.example", "https://new.example", "https://unused.example"):
+        _web_store.set_badge(_cache_key(url), url, 40, "foundation")
+    _web_store.hit_badge(_cache_key("https://old.example"))
+    _web_store.hit_badge(_cache_key("https://new.example"))
+    _invecchia_badge("https://old.example", 3500)
+    _invecchia_badge("https://unused.example", 3500)
+
+    with patch("geo_optimizer.core.audit.run_full_audit", return_value=_make_mock_audit_result()) as mock_audit:
+        refreshed = asyncio.run(_prewarm_badges_once())
+
+    assert refreshed == 1
+    assert [call.args[0] for call in mock_audit.call_args_list] == ["https://old.example"]
+    assert _web_store.hit_badge(_cache_key("https://old.example"))["score"] == 75
+
+
 # ─── Test: GET /report/{report_id} ───────────────────────────────────────────
 
 
@@ -538,10 +713,8 @@ def test_report_id_valido_con_report_in_cache_ritorna_html(client):
     data = _audit_result_to_dict(mock_result)
 
     # Inserisce direttamente in cache con un ID noto
-    import time
-
     report_id = "b" * 32  # 32 caratteri hex validi
-    _audit_cache[report_id] = {"data": data, "cached_at": time.time()}
+    _web_store.set_audit(report_id, data)
 
     response = client.get(f"/report/{report_id}")
 
@@ -20,6 +20,7 @@ from starlette.testclient import TestClient
 import geo_optimizer.web.app as web_app
 from geo_optimizer.models.results import CitationCheckEntry, CitationCheckResult
 from geo_optimizer.web.app import app
+from geo_optimizer.web.store import MemoryStore
 
 client = TestClient(app, raise_server_exceptions=False)
 
@@ -53,7 +54,7 @@ def _result(verdict: str = "strong") -> CitationCheckResult:
 @pytest.fixture(autouse=True)
 def _reset_caps(monkeypatch):
     """Fresh rate-limit store, daily counter, and Perplexity key per test."""
-    monkeypatch.setattr(web_app, "_rate_limit_store", {})
+    monkeypatch.setattr(web_app, "_web_store", MemoryStore())
     monkeypatch.setattr(web_app, "_citations_day", "")
     monkeypatch.setattr(web_app, "_citations_count", 0)
     monkeypatch.setenv("PERPLEXITY_API_KEY", "pk-test")
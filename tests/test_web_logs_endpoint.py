@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gzip
 import io
 from unittest.mock import patch
 
@@ -67,6 +68,29 @@ def test_upload_too_large_returns_413():
     assert resp.status_code == 413
 
 
+def test_upload_analysis_is_capped_at_one_million_lines():
+    with patch("geo_optimizer.core.log_analyzer.analyze_log_file", return_value=_FAKE_RESULT) as analyze:
+        client = TestClient(app, raise_server_exceptions=True)
+        resp = client.post(
+            "/api/logs/analyze",
+            files={"file": ("access.log", io.BytesIO(_SAMPLE_LOG), "text/plain")},
+        )
+    assert resp.status_code == 200
+    assert analyze.call_args.kwargs["max_lines"] == 1_000_000
+
+
+@pytest.mark.parametrize("compress", [gzip.compress, lambda data: b"\x28\xb5\x2f\xfd" + data])
+def test_compressed_upload_returns_415(compress):
+    with patch("geo_optimizer.core.log_analyzer.analyze_log_file", return_value=_FAKE_RESULT) as analyze:
+        client = TestClient(app, raise_server_exceptions=False)
+        resp = client.post(
+            "/api/logs/analyze",
+            files={"file": ("access.log.gz", io.BytesIO(compress(_SAMPLE_LOG)), "application/gzip")},
+        )
+    assert resp.status_code == 415
+    analyze.assert_not_called()
+
+
 def test_upload_analyzer_error_returns_500():
     with patch(
         "geo_optimizer.core.log_analyzer.analyze_log_file",
@@ -0,0 +1,266 @@
+"""Tests for the web app's audit cache and rate-limit backends (web/store)."""
+
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from geo_optimizer.web.store import MemoryStore, SqliteStore, create_store
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStore(ttl=60, max_audits=3, window=60)
+        return
+    store = SqliteStore(tmp_path / "web.sqlite3", ttl=60, max_audits=3, window=60)
+    yield store
+    store.close()
+
+
+class TestStoreBackends:
+    def test_audit_round_trip(self, store):
+        store.set_audit("a" * 32, {"url": "https://example.com", "score": 71})
+
+        assert store.get_audit("a" * 32) == {"url": "https://example.com", "score": 71}
+        assert store.get_audit("b" * 32) is None
+        assert store.stats()["audits"] == 1
+
+    def test_expired_audit_is_a_miss(self, store):
+        store.set_audit("k", {"score": 1})
+
+        with patch("geo_optimizer.web.store.time.time", return_value=time.time() + 3600):
+            assert store.evict_expired() == 1
+            assert store.get_audit("k") is None
+        assert store.stats()["audits"] == 0
+
+    def test_least_recently_used_audit_is_evicted(self, store):
+        for key in ("a", "b", "c"):
+            store.set_audit(key, {"key": key})
+            time.sleep(0.01)
+        assert store.get_audit("a") is not None  # "b" becomes the least recently used
+        time.sleep(0.01)
+
+        store.set_audit("d", {"key": "d"})
+
+        assert store.get_audit("b") is None
+        assert [store.get_audit(key)["key"] for key in ("a", "c", "d")] == ["a", "c", "d"]
+
+    def test_rate_limit_window(self, store):
+        assert all(store.hit_rate_limit("10.0.0.1", max_requests=3) for _ in range(3))
+        assert store.hit_rate_limit("10.0.0.1", max_requests=3) is False
+        assert store.hit_rate_limit("10.0.0.2", max_requests=3) is True
+
+        with patch("geo_optimizer.web.store.time.time", return_value=time.time() + 61):
+            assert store.hit_rate_limit("10.0.0.1", max_requests=3) is True
+
+    def test_clear(self, store):
+        store.set_audit("k", {"score": 1})
+        store.hit_rate_limit("10.0.0.1", max_requests=3)
+        store.clear()
+
+        assert store.stats()["audits"] == 0
+        assert store.stats()["tracked_ips"] == 0
+
+
+class TestBadges:
+    def test_last_known_score_is_kept_past_the_audit_ttl(self, store):
+        assert store.hit_badge("k") is None
+        store.set_badge("k", "https://example.com", 77, "good")
+
+        with patch("geo_optimizer.web.store.time.time", return_value=time.time() + 2 * 24 * 3600):
+            badge = store.hit_badge("k")
+
+        assert (badge["url"], badge["score"], badge["band"]) == ("https://example.com", 77, "good")
+        assert store.stats()["badges"] == 1
+
+    def test_unrequested_badge_is_forgotten(self, store):
+        store.set_badge("k", "https://example.com", 77, "good")
+
+        with patch("geo_optimizer.web.store.time.time", return_value=time.time() + store.badge_ttl + 1):
+            assert store.hit_badge("k") is None
+
+    def test_popular_badges_of_the_last_day(self, store):
+        store.set_badge("a", "https://a.example", 50, "foundation")
+        store.set_badge("b", "https://b.example", 90, "excellent")
+        store.set_badge("c", "https://c.example", 10, "critical")  # never requested
+        for key in ("b", "a", "b"):
+            store.hit_badge(key)
+        store.set_badge("b", "https://b.example", 91, "excellent")  # a refresh keeps the counts
+
+        popular = store.popular_badges(10)
+
+        assert [(badge["url"], badge["hits"]) for badge in popular] == [
+            ("https://b.example", 2),
+            ("https://a.example", 1),
+        ]
+        assert store.popular_badges(1)[0]["url"] == "https://b.example"
+        with patch("geo_optimizer.web.store.time.time", return_value=time.time() + 25 * 3600):
+            assert store.popular_badges(10) == []
+
+    def test_refresh_lease(self, store):
+        store.set_badge("k", "https://example.com", 77, "good")
+
+        assert store.claim_badge_refresh("k", lease=300) is True
+        assert store.claim_badge_refresh("k", lease=300) is False
+        with patch("geo_optimizer.web.store.time.time", return_value=time.time() + 301):
+            assert store.claim_badge_refresh("k", lease=300) is True
+
+
+class TestMemoryStore:
+    def test_audits_are_stored_compressed_and_sized(self):
+        store = MemoryStore()
+        data = {"url": "https://example.com", "recommendations": ["Add FAQPage schema"] * 200}
+        store.set_audit("k", data)
+
+        entry = store.audits["k"]
+        assert isinstance(entry["data"], bytes)
+        assert entry["size"] == len(entry["data"]) < len(json.dumps(data))
+        assert store.audit_bytes == entry["size"]
+        assert store.get_audit("k") == data
+
+    def test_uncompressed_entries_are_sized_by_their_json(self):
+        store = MemoryStore(compress=False)
+        data = {"score": 80, "band": "good"}
+        store.set_audit("k", data)
+
+        assert store.get_audit("k") is data
+        assert store.audit_bytes == len(json.dumps(data, separators=(",", ":")))
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        store = MemoryStore(compress=False, max_bytes=250)
+        for key in ("a", "b", "c"):
+            store.set_audit(key, {"blob": key * 90})
+        assert store.get_audit("a") is None
+        assert store.audit_bytes <= 250
+
+        store.set_audit("b", {"blob": "b" * 90})  # replacing an entry re-sizes it
+        store.set_audit("d", {"blob": "d" * 90})
+
+        assert list(store.audits) == ["b", "d"]
+        assert store.audit_bytes == sum(entry["size"] for entry in store.audits.values())
+        assert store.stats()["evictions"] == 2
+
+    def test_audit_over_the_budget_is_not_cached(self):
+        store = MemoryStore(compress=False, max_bytes=50)
+        store.set_audit("small", {"score": 1})
+        store.set_audit("huge", {"blob": "x" * 100})
+
+        assert store.get_audit("huge") is None
+        assert store.get_audit("small") == {"score": 1}
+
+    def test_counters(self):
+        store = MemoryStore()
+        store.set_audit("k", {"score": 1})
+        store.get_audit("k")
+        store.get_audit("k")
+        store.get_audit("missing")
+
+        stats = store.stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 0)
+        assert stats["bytes"] == store.audit_bytes > 0
+        assert stats["max_bytes"] == store.max_bytes
+
+    def test_oldest_clients_are_dropped_past_max_ips(self):
+        store = MemoryStore(max_ips=2)
+        for ip in ("a", "b", "a", "c"):
+            store.hit_rate_limit(ip, max_requests=10)
+
+        assert list(store.rate_limits) == ["a", "c"]
+
+
+class TestSqliteStoreSharing:
+    """Two instances on one file stand in for two uvicorn workers."""
+
+    def test_report_cached_by_one_worker_is_served_by_another(self, tmp_path):
+        first, second = SqliteStore(tmp_path / "web.sqlite3"), SqliteStore(tmp_path / "web.sqlite3")
+        first.set_audit("a" * 32, {"score": 80})
+
+        assert second.get_audit("a" * 32) == {"score": 80}
+
+    def test_rate_limit_is_shared_and_atomic(self, tmp_path):
+        workers = [SqliteStore(tmp_path / "web.sqlite3") for _ in range(4)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda i: workers[i % 4].hit_rate_limit("10.0.0.1", max_requests=30), range(60)))
+
+        assert results.count(True) == 30
+        assert workers[0].stats()["tracked_ips"] == 1
+
+    def test_refresh_lease_is_shared_between_workers(self, tmp_path):
+        workers = [SqliteStore(tmp_path / "web.sqlite3") for _ in range(4)]
+        workers[0].set_badge("k", "https://example.com", 77, "good")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            claims = list(pool.map(lambda worker: worker.claim_badge_refresh("k", lease=300), workers))
+
+        assert claims.count(True) == 1
+
+    def test_unreadable_database_degrades_to_miss_and_allow(self, tmp_path):
+        path = tmp_path / "web.sqlite3"
+        path.write_bytes(b"not a database" * 100)
+        store = SqliteStore(path)
+
+        store.set_audit("k", {"score": 1})
+        assert store.get_audit("k") is None
+        assert store.hit_rate_limit("10.0.0.1", max_requests=1) is True
+
+    def test_unreadable_database_degrades_maintenance_and_stats(self, tmp_path):
+        path = tmp_path / "web.sqlite3"
+        path.write_bytes(b"not a database" * 100)
+        store = SqliteStore(path)
+
+        store.clear()
+        assert store.evict_expired() == 0
+        assert store.popular_badges(5) == []
+        stats = store.stats()
+        assert stats["backend"] == "sqlite"
+        assert [stats[key] for key in ("audits", "badges", "tracked_ips", "bytes")] == [0, 0, 0, 0]
+
+
+class TestCreateStore:
+    @pytest.mark.parametrize("spec", ["", "memory", " memory "])
+    def test_memory_is_the_default(self, spec):
+        assert isinstance(create_store(spec), MemoryStore)
+
+    def test_sqlite_path(self, tmp_path):
+        store = create_store(f"sqlite:{tmp_path / 'web.sqlite3'}", ttl=10)
+        assert isinstance(store, SqliteStore)
+        assert store.db_path == tmp_path / "web.sqlite3"
+        assert store.ttl == 10
+
+    @pytest.mark.parametrize("spec", ["sqlite:", "redis://localhost:6379", "disk"])
+    def test_invalid_spec(self, spec):
+        with pytest.raises(ValueError, match="GEO_WEB_STORE"):
+            create_store(spec)
+
+
+class TestWebAppWithSharedStore:
+    @pytest.fixture(autouse=True)
+    def _web(self):
+        pytest.importorskip("fastapi")
+        pytest.importorskip("httpx")
+
+    def test_report_and_rate_limit_use_the_store(self, tmp_path, monkeypatch):
+        from starlette.testclient import TestClient
+
+        import geo_optimizer.web.app as web_app
+
+        other_worker = SqliteStore(tmp_path / "web.sqlite3")
+        monkeypatch.setattr(web_app, "_web_store", SqliteStore(tmp_path / "web.sqlite3"))
+        monkeypatch.setattr(web_app, "_API_TOKEN", None)
+        data = web_app._audit_result_to_dict(web_app._dict_to_audit_result({"url": "https://example.com"}))
+        other_worker.set_audit("c" * 32, data)
+        for _ in range(web_app._RATE_LIMIT_MAX_REQUESTS):
+            other_worker.hit_rate_limit("testclient", web_app._RATE_LIMIT_MAX_REQUESTS)
+
+        client = TestClient(web_app.app)
+        assert client.get(f"/report/{'c' * 32}").status_code == 200
+        assert client.get("/api/audit?url=https://example.com").status_code == 429
+        store = client.get("/health").json()["store"]
+        assert (store["backend"], store["audits"], store["badges"], store["tracked_ips"]) == ("sqlite", 1, 0, 1)
+        assert store["hits"] == 1